@@ -2,8 +2,8 @@
 
 import asyncio
 from dataclasses import dataclass
-from datetime import timedelta
-from functools import cmp_to_key
+from datetime import datetime, timedelta
+from functools import cached_property, cmp_to_key
 from json import JSONDecodeError
 from typing import Any
 
@@ -45,6 +45,18 @@ class OrefAlertCoordinatorData:
     alerts: list[Any]
     active_alerts: list[Any]
 
+    @cached_property
+    def active_alerts_by_area(self) -> dict[str, datetime | None]:
+        """Return the date of the latest active alert of each area."""
+        # Active alerts are sorted by descending date, so the latest alert wins.
+        alerts_by_area = {}
+        for alert in reversed(self.active_alerts):
+            alert_date = dt_util.parse_datetime(alert["alertDate"])
+            alerts_by_area[alert["data"]] = (
+                alert_date.replace(tzinfo=IST) if alert_date is not None else None
+            )
+        return alerts_by_area
+
 
 def _sort_alerts(item1: dict[str, Any], item2: dict[str, Any]) -> int:
     """Sort by descending-order "date" and then ascending-order "name"."""
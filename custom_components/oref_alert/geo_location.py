@@ -2,40 +2,48 @@
 
 from __future__ import annotations
 
-import asyncio
 import time
 from typing import TYPE_CHECKING
 
-import homeassistant.util.dt as dt_util
-from haversine import haversine
+import numpy as np
+from haversine import Unit, haversine_vector
 from homeassistant.components.geo_location import ATTR_SOURCE, GeolocationEvent
 from homeassistant.const import (
     ATTR_DATE,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
+    EVENT_CORE_CONFIG_UPDATE,
     Platform,
     UnitOfLength,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
-from homeassistant.util import slugify
+from homeassistant.helpers import event
 
 from .const import (
     DATA_COORDINATOR,
     DOMAIN,
-    IST,
     LOCATION_ID_SUFFIX,
     OREF_ALERT_UNIQUE_ID,
 )
 from .metadata.area_info import AREA_INFO
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from datetime import datetime
 
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import OrefAlertDataUpdateCoordinator
+    from .metadata.area_info import AreaInfo
+
+CLEANUP_DELAY = 10  # Seconds to wait for a stable state before removing entities.
+AREA_INFO_KEYS = frozenset(AREA_INFO)
+AREA_INDEX = {area: index for index, area in enumerate(AREA_INFO)}
+AREA_LATS = np.array([info.lat for info in AREA_INFO.values()], dtype=np.float64)
+AREA_LONGS = np.array([info.long for info in AREA_INFO.values()], dtype=np.float64)
 
 
 async def async_setup_entry(
@@ -62,27 +70,27 @@ class OrefAlertLocationEvent(GeolocationEvent):
         }
     )
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         hass: HomeAssistant,
         area: str,
+        info: AreaInfo,
+        distance: float,
         date: datetime | None,
+        created_ts: int,
     ) -> None:
         """Initialize entity."""
         self._hass = hass
         self._attr_name = area
         self._attr_unique_id = (
             f"{OREF_ALERT_UNIQUE_ID}_{LOCATION_ID_SUFFIX}_"
-            + slugify(AREA_INFO[area]["en"])
-            + f"_{int(time.time())}"
+            + info.slug
+            + f"_{created_ts}"
         )
-        self._attr_latitude = AREA_INFO[area]["lat"]
-        self._attr_longitude = AREA_INFO[area]["long"]
+        self._attr_latitude = info.lat
+        self._attr_longitude = info.long
         self._attr_unit_of_measurement = UnitOfLength.KILOMETERS
-        self._attr_distance = haversine(
-            (hass.config.latitude, hass.config.longitude),
-            (self._attr_latitude, self._attr_longitude),
-        )
+        self._attr_distance = distance
         self._attr_extra_state_attributes = {ATTR_DATE: date}
 
     @property
@@ -107,11 +115,18 @@ class OrefAlertLocationEventManager:
         """Initialize object with defaults."""
         self._location_events: dict[str, OrefAlertLocationEvent] = {}
         self._hass = hass
+        self._home = (hass.config.latitude, hass.config.longitude)
+        self._distance_cache: dict[str, float] = {}
         self._config_entry = config_entry
         self._async_add_entities = async_add_entities
         self._coordinator: OrefAlertDataUpdateCoordinator = hass.data[DOMAIN][
             config_entry.entry_id
         ][DATA_COORDINATOR]
+        self._unsub_cleanup: Callable[[], None] | None = None
+        config_entry.async_on_unload(self._cancel_cleanup)
+        config_entry.async_on_unload(
+            hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_home_update)
+        )
         self._async_clean_start()
         self._coordinator.async_add_listener(self._async_update)
         self._async_update()
@@ -126,42 +141,71 @@ class OrefAlertLocationEventManager:
             if entry.domain == Platform.GEO_LOCATION:
                 entity_registry.async_remove(entry.entity_id)
 
-    def _alert_date(self, area: str) -> datetime | None:
-        """Return the alert time as a datetime object."""
-        for alert in self._coordinator.data.active_alerts:
-            if alert["data"] == area:
-                if (
-                    alert_date := dt_util.parse_datetime(alert["alertDate"])
-                ) is not None:
-                    return alert_date.replace(tzinfo=IST)
-                return None
-        return None
+    @callback
+    def _async_home_update(self, _: Event) -> None:
+        """Refresh the home location and drop the cached distances."""
+        self._home = (self._hass.config.latitude, self._hass.config.longitude)
+        self._distance_cache.clear()
+
+    def _distances(self, areas: list[str]) -> list[float]:
+        """Return the distances (in km) between home and the areas."""
+        if missing := [area for area in areas if area not in self._distance_cache]:
+            indices = [AREA_INDEX[area] for area in missing]
+            distances = haversine_vector(
+                [self._home] * len(missing),
+                np.stack([AREA_LATS[indices], AREA_LONGS[indices]], axis=1),
+                Unit.KILOMETERS,
+            ).tolist()
+            self._distance_cache.update(zip(missing, distances, strict=True))
+        return [self._distance_cache[area] for area in areas]
+
+    def _cancel_cleanup(self) -> None:
+        """Cancel the pending cleanup."""
+        if self._unsub_cleanup is not None:
+            self._unsub_cleanup()
+            self._unsub_cleanup = None
 
     @callback
-    async def _cleanup_entities(self) -> None:
+    def _cleanup_entities(self, _: datetime | None = None) -> None:
         """Remove entities."""
-        await asyncio.sleep(10)  # Wait for a stable state.
-        entity_registry = er.async_get(self._hass)
-        active = {alert["data"] for alert in self._coordinator.data.active_alerts}
-        areas_to_delete = set(self._location_events.keys()) - active
-        for area in areas_to_delete:
-            if (entity := self._location_events.pop(area, None)) is not None:
-                entity.async_remove_self()
-                entity_registry.async_remove(entity.entity_id)
+        self._unsub_cleanup = None
+        active = self._coordinator.data.active_alerts_by_area.keys()
+        to_remove = [
+            self._location_events.pop(area)
+            for area in self._location_events.keys() - active
+        ]
+        if not to_remove:
+            return
+        remove = er.async_get(self._hass).async_remove
+        for entity in to_remove:
+            entity.async_remove_self()
+            remove(entity.entity_id)
 
     @callback
     def _async_update(self) -> None:
         """Add and/or remove entities according to the new active alerts list."""
-        active = {alert["data"] for alert in self._coordinator.data.active_alerts}
+        alerts_by_area = self._coordinator.data.active_alerts_by_area
+        active = alerts_by_area.keys()
         exists = set(self._location_events.keys())
 
-        to_add = {
-            area: OrefAlertLocationEvent(self._hass, area, self._alert_date(area))
-            for area in active - exists
-            if area in AREA_INFO
-        }
+        new_areas = list((active - exists) & AREA_INFO_KEYS)
+        distances = self._distances(new_areas)
+
+        now = int(time.time())
+        to_add: dict[str, OrefAlertLocationEvent] = {}
+        for area, distance in zip(new_areas, distances, strict=True):
+            to_add[area] = OrefAlertLocationEvent(
+                self._hass,
+                area,
+                AREA_INFO[area],
+                distance,
+                alerts_by_area[area],
+                now,
+            )
         self._location_events.update(to_add)
         self._async_add_entities(to_add.values())
 
-        if len(exists - active):
-            self._hass.async_create_task(self._cleanup_entities())
+        if len(exists - active) and self._unsub_cleanup is None:
+            self._unsub_cleanup = event.async_call_later(
+                self._hass, CLEANUP_DELAY, self._cleanup_entities
+            )
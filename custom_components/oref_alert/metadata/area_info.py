@@ -1,1907 +1,3380 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-AREA_INFO = {
-    "אבו גוש": {"lat": 31.8068, "long": 35.1103, "en": "Abu Gosh"},
-    "אבו נוור": {"lat": 31.7621, "long": 35.2938, "en": "Abu-Nuwar"},
-    "אבו סנאן": {"lat": 32.958, "long": 35.172, "en": "Abu Snan"},
-    "אבו קרינאת": {"lat": 31.1031, "long": 34.952, "en": "Abu Qrenat"},
-    "אבו תלול": {"lat": 31.1907, "long": 34.9161, "en": "Abu Talul"},
-    "אבטליון": {"lat": 32.8358, "long": 35.3504, "en": "Avtalion"},
-    "אביאל": {"lat": 32.5313, "long": 34.9935, "en": "Aviel"},
-    "אביבים": {"lat": 33.0894, "long": 35.4703, "en": "Avivim"},
-    "אביגדור": {"lat": 31.7119, "long": 34.7404, "en": "Avigdor"},
-    "אביחיל": {"lat": 32.3507, "long": 34.8712, "en": "Avihail"},
-    "אביעזר": {"lat": 31.682, "long": 35.0188, "en": "Aviezer"},
-    "אבירים": {"lat": 33.0381, "long": 35.286, "en": "Abirim"},
-    "אבן יהודה": {"lat": 32.2766, "long": 34.8851, "en": "Even Yehuda"},
-    "אבן מנחם": {"lat": 33.0751, "long": 35.2952, "en": "Even Menachem"},
-    "אבן ספיר": {"lat": 31.7625, "long": 35.135, "en": "Even Sapir"},
-    "אבן שמואל": {"lat": 31.5764, "long": 34.763, "en": "Even Shmuel"},
-    "אבני איתן": {"lat": 32.8248, "long": 35.7658, "en": "Avnei Eitan"},
-    "אבני חפץ": {"lat": 32.2846, "long": 35.0746, "en": "Avnei Hefetz"},
-    "אבנת": {"lat": 31.679, "long": 35.4369, "en": "Avnat"},
-    "אבשלום": {"lat": 31.1954, "long": 34.3312, "en": "Avshalom"},
-    "אדורה": {"lat": 31.5522, "long": 35.0176, "en": "Adora"},
-    "אדוריים": {"lat": 31.4827, "long": 35.0436, "en": "Adorayim"},
-    "אדמית": {"lat": 33.0788, "long": 35.2095, "en": "Idmit"},
-    "אדרת": {"lat": 31.6597, "long": 34.9944, "en": "Aderet"},
-    "אודים": {"lat": 32.2669, "long": 34.847, "en": "Udim"},
-    "אודם": {"lat": 33.1934, "long": 35.7496, "en": "Odem"},
-    "אום אל פחם": {"lat": 32.5171, "long": 35.1485, "en": "umm al-Fahm"},
-    "אום אל קוטוף": {"lat": 32.4681, "long": 35.0592, "en": "Umm al-Qutuf"},
-    "אום אלג'נם": {"lat": 32.6867, "long": 35.3902, "en": "Umm al-Ghanam"},
-    "אום בטין": {"lat": 31.2694, "long": 34.8811, "en": "Umm Batin"},
-    "אופקים": {"lat": 31.3113, "long": 34.6228, "en": "Ofakim"},
-    "אור הגנוז": {"lat": 33.0052, "long": 35.4467, "en": "Or HaGanuz"},
-    "אור הנר": {"lat": 31.5562, "long": 34.6023, "en": "Or HaNer"},
-    "אור יהודה": {"lat": 32.0297, "long": 34.8562, "en": "Or Yehuda"},
-    "אור עקיבא": {"lat": 32.51, "long": 34.9204, "en": "Or Akiva"},
-    "אורה": {"lat": 31.7521, "long": 35.1502, "en": "Ora"},
-    "אורון תעשייה ומסחר": {
-        "lat": 30.9115,
-        "long": 35.0177,
-        "en": "Oron Industry and Commerce",
-    },
-    "אורות": {"lat": 31.74176, "long": 34.734758, "en": "Orot"},
-    "אורטל": {"lat": 33.0862, "long": 35.7587, "en": "Ortal"},
-    "אורים": {"lat": 31.3041, "long": 34.5249, "en": "Urim"},
-    "אורנים": {"lat": 32.7112, "long": 35.1096, "en": "Oranim"},
-    "אורנית": {"lat": 32.1319, "long": 34.9908, "en": "Oranit"},
-    "אושה": {"lat": 32.7965, "long": 35.1146, "en": "Usha"},
-    "אזור": {"lat": 32.0296, "long": 34.7996, "en": "Azor"},
-    "אזור תעשייה אלון התבור": {
-        "lat": 32.6345,
-        "long": 35.3603,
-        "en": "Alon HaTavor Industrial Zone",
-    },
-    "אזור תעשייה אפק ולב הארץ": {
-        "lat": 32.10799,
-        "long": 34.953088,
-        "en": 'Afek and Lev Ha"aretz Industrial Zone',
-    },
-    "אזור תעשייה אריאל": {
-        "lat": 32.094,
-        "long": 35.1234,
-        "en": "Ariel Industrial Park",
-    },
-    "אזור תעשייה באר טוביה": {
-        "lat": 31.7249,
-        "long": 34.751,
-        "en": "Be'er Tuvia Industrial Zone",
-    },
-    "אזור תעשייה בני יהודה": {
-        "lat": 32.8023,
-        "long": 35.7156,
-        "en": "Bnei Yehuda Industrial Zone",
-    },
-    "אזור תעשייה בר-לב": {
-        "lat": 32.9063,
-        "long": 35.1948,
-        "en": "Bar Lev Industrial Zone",
-    },
-    "אזור תעשייה בראון": {
-        "lat": 32.2488,
-        "long": 35.1681,
-        "en": "Bar On Industrial Zone",
-    },
-    "אזור תעשייה ברוש": {
-        "lat": 31.7331,
-        "long": 34.9594,
-        "en": "Brosh Industrial Zone",
-    },
-    "אזור תעשייה ברקן": {
-        "lat": 32.1051,
-        "long": 35.1199,
-        "en": "Barkan Industrial Park",
-    },
-    "אזור תעשייה גדרה": {
-        "lat": 31.7995,
-        "long": 34.7677,
-        "en": "Gedera Industrial Area",
-    },
-    "אזור תעשייה דימונה": {
-        "lat": 31.0646,
-        "long": 35.0188,
-        "en": "Dimona Industrial Zone",
-    },
-    "אזור תעשייה הדרומי אשקלון": {
-        "lat": 31.6361,
-        "long": 34.5545,
-        "en": "Ashkelon Southern Industrial Zone",
-    },
-    "אזור תעשייה הר טוב - צרעה": {
-        "lat": 31.7728,
-        "long": 34.9981,
-        "en": "Har Tuv - Tzora Industrial Zone",
-    },
-    "אזור תעשייה חבל מודיעין": {
-        "lat": 32.0131,
-        "long": 34.9595,
-        "en": "Hevel Modi'in Industrial Zone",
-    },
-    "אזור תעשייה חצור הגלילית": {
-        "lat": 32.9842,
-        "long": 35.5521,
-        "en": "Hatzor HaGlilit Industrial Zone",
-    },
-    "אזור תעשייה טירה": {"lat": 32.2267, "long": 34.9791, "en": "Tira Industrial Zone"},
-    "אזור תעשייה טמרה": {"lat": 32.833, "long": 35.1642, "en": "Tamra Industiral Park"},
-    "אזור תעשייה יקנעם עילית": {
-        "lat": 32.6639,
-        "long": 35.105,
-        "en": "Yokneam Illit Industrial Zone",
-    },
-    "אזור תעשייה כנות": {
-        "lat": 31.8013,
-        "long": 34.7591,
-        "en": "Kannot Industrial Zone",
-    },
-    "אזור תעשייה כפר יונה": {
-        "lat": 32.3191,
-        "long": 34.9103,
-        "en": "Kfar Yona Industrial Zone",
-    },
-    "אזור תעשייה כרמיאל": {
-        "lat": 32.9263,
-        "long": 35.3191,
-        "en": "Carmiel Industrial Zone",
-    },
-    "אזור תעשייה מבוא כרמל": {
-        "lat": 32.6207,
-        "long": 35.078,
-        "en": "Mevo Carmel Industrial Zone",
-    },
-    "אזור תעשייה מבואות הגלבוע": {
-        "lat": 32.5672,
-        "long": 35.2676,
-        "en": "Mevuot HaGilboa Industrial Zone",
-    },
-    "אזור תעשייה מילואות צפון": {
-        "lat": 33.0684,
-        "long": 35.1102,
-        "en": "North Miluot Industrial Zone",
-    },
-    "אזור תעשייה מישור אדומים": {
-        "lat": 31.7925,
-        "long": 35.335,
-        "en": "Mishor Edomim Industrial Zone",
-    },
-    "אזור תעשייה מיתרים": {
-        "lat": 31.3726,
-        "long": 35.0055,
-        "en": "Meitarim Industrial Zone",
-    },
-    "אזור תעשייה נ.ע.מ": {
-        "lat": 31.4138,
-        "long": 34.6149,
-        "en": "Noam Industrial Zone",
-    },
-    "אזור תעשייה ניר עציון": {
-        "lat": 32.7019,
-        "long": 34.973,
-        "en": "Nir Etzion Industrial Zone",
-    },
-    "אזור תעשייה נשר - רמלה": {
-        "lat": 31.9179,
-        "long": 34.892,
-        "en": "Nesher Industrial Zone (Ramla)",
-    },
-    "אזור תעשייה עד הלום": {
-        "lat": 31.7581,
-        "long": 34.6559,
-        "en": "Ad Halom Industrial Zone",
-    },
-    "אזור תעשייה עידן הנגב": {
-        "lat": 31.3808,
-        "long": 34.786,
-        "en": "Idan HaNegev Industrial Zone",
-    },
-    "אזור תעשייה עמק חפר": {
-        "lat": 32.4049,
-        "long": 34.8967,
-        "en": "Emek Heffer Industrial Zone",
-    },
-    "אזור תעשייה צ.ח.ר": {
-        "lat": 32.9705521,
-        "long": 35.5646455,
-        "en": "Tzahar Industrial Zone",
-    },
-    "אזור תעשייה צבאים": {
-        "lat": 32.5425,
-        "long": 35.5031,
-        "en": "Zvaim Industrial Zone",
-    },
-    "אזור תעשייה ציפורית": {
-        "lat": 32.7595,
-        "long": 35.3161,
-        "en": "Tziporit Industrial Zone",
-    },
-    "אזור תעשייה צפוני אשקלון": {
-        "lat": 31.6647,
-        "long": 34.5981,
-        "en": "Ashkelon Northern Industrial Zone",
-    },
-    "אזור תעשייה קדמת גליל": {
-        "lat": 32.7854,
-        "long": 35.4631,
-        "en": "Kidmat Galil Industrial Zone",
-    },
-    "אזור תעשייה קיסריה": {
-        "lat": 32.4865,
-        "long": 34.9464,
-        "en": "Caesarea Industrial Zone",
-    },
-    "אזור תעשייה קריית ביאליק": {
-        "lat": 32.8671,
-        "long": 35.0988,
-        "en": "Kiryat Bialik Industrial Zone",
-    },
-    "אזור תעשייה קריית גת": {
-        "lat": 31.5962,
-        "long": 34.7848,
-        "en": "Kiryat Gat - Industrial Zone",
-    },
-    "אזור תעשייה רבדים": {
-        "lat": 31.7855,
-        "long": 34.822,
-        "en": "Revadim Industrial Zone",
-    },
-    "אזור תעשייה רגבים": {
-        "lat": 32.5217,
-        "long": 35.024,
-        "en": "Regavim Industrial Zone",
-    },
-    "אזור תעשייה רגמ": {
-        "lat": 31.9255,
-        "long": 34.8975,
-        "en": "Ramla, Regional Council Gezer, Regional Council Hevel Modi'in Industrial Park",
-    },
-    "אזור תעשייה רותם": {"lat": 31.06, "long": 35.1949, "en": "Rotem Industrial Zone"},
-    "אזור תעשייה רמת דלתון": {
-        "lat": 33.0279,
-        "long": 35.4768,
-        "en": "Ramat Dalton Industrial Zone",
-    },
-    "אזור תעשייה שחורת": {
-        "lat": 29.5979,
-        "long": 34.9719,
-        "en": "Shchoret Industrial Zone",
-    },
-    "אזור תעשייה שחק": {"lat": 32.475, "long": 35.1797, "en": "Shahak industrial park"},
-    "אזור תעשייה שער בנימין": {
-        "lat": 31.8654,
-        "long": 35.2617,
-        "en": "Sha'ar Binyamin Industrial Zone",
-    },
-    "אזור תעשייה שער נעמן": {
-        "lat": 32.8805,
-        "long": 35.0976,
-        "en": "Sha'ar Na'aman Industrial Zone",
-    },
-    "אזור תעשייה תימורים": {
-        "lat": 31.7242,
-        "long": 34.7615,
-        "en": "Timorimg Industrial Zone",
-    },
-    "אזור תעשייה תרדיון": {
-        "lat": 32.8677,
-        "long": 35.2731,
-        "en": "Teradion Industrial Zone",
-    },
-    "אחווה": {"lat": 31.7429, "long": 34.7678, "en": "Achva"},
-    "אחוזם": {"lat": 31.5527, "long": 34.7701, "en": "Ahuzam"},
-    "אחוזת ברק": {"lat": 32.6431, "long": 35.3389, "en": "Ahuzat Barak"},
-    "אחיה": {"lat": 32.0605, "long": 35.3273, "en": "Achita"},
-    "אחיהוד": {"lat": 32.9074, "long": 35.1717, "en": "Achihud"},
-    "אחיטוב": {"lat": 32.3877, "long": 34.9908, "en": "Ahituv"},
-    "אחיסמך": {"lat": 31.9319, "long": 34.9086, "en": "Ahisemech"},
-    "אחיעזר": {"lat": 31.9817, "long": 34.8718, "en": "Achiezer"},
-    "איבטין": {"lat": 32.76, "long": 35.1146, "en": "Ibtin"},
-    "אייל": {"lat": 32.211823, "long": 34.979862, "en": "Eyal"},
-    "איילת השחר": {"lat": 33.0211, "long": 35.5767, "en": "Ayelet HaShachar"},
-    "איירפורט סיטי": {"lat": 31.9887, "long": 34.9123, "en": "Airport City"},
-    "אילון": {"lat": 33.0625, "long": 35.2192, "en": "Eilon"},
-    "אילות": {"lat": 29.5805, "long": 34.963, "en": "Eilot"},
-    "אילניה": {"lat": 32.7539, "long": 35.4082, "en": "Ilania"},
-    "אילת": {"lat": 29.5577, "long": 34.9519, "en": "Eilat"},
-    "אירוס": {"lat": 31.9286, "long": 34.7766, "en": "Irus"},
-    "איתמר": {"lat": 32.1739, "long": 35.308, "en": "Itamar"},
-    "איתן": {"lat": 31.5722, "long": 34.7479, "en": "Eitan"},
-    "אכסאל": {"lat": 32.6821, "long": 35.3207, "en": "Iksal"},
-    "אל סייד": {"lat": 31.2864, "long": 34.9079, "en": "AlSayid"},
-    "אל עזי": {"lat": 31.7189, "long": 34.8143, "en": "Al Azi"},
-    "אל עמארני, אל מסק": {"lat": 30.7983, "long": 35.2346, "en": "El Amrani, El Masaq"},
-    "אל עריאן": {"lat": 32.4981, "long": 35.1251, "en": "Al Arian"},
-    "אל פורעה": {"lat": 31.2198, "long": 35.1642, "en": "El For'eh"},
-    "אל רום": {"lat": 33.1805, "long": 35.7701, "en": "El Rom"},
-    "אל-ח'וואלד מערב": {"lat": 32.771, "long": 35.1363, "en": "Al Khawaled - West"},
-    "אלומה": {"lat": 31.652, "long": 34.7429, "en": "Aluma"},
-    "אלומות": {"lat": 32.7066, "long": 35.5461, "en": "Alumot"},
-    "אלון": {"lat": 31.8334, "long": 35.3536, "en": "Alon"},
-    "אלון הגליל": {"lat": 32.7569, "long": 35.2203, "en": "Alon HaGalil"},
-    "אלון מורה": {"lat": 32.2344, "long": 35.3312, "en": "Elon Moreh"},
-    "אלון שבות": {"lat": 31.6549, "long": 35.1253, "en": "Alon Shvut"},
-    "אלוני אבא": {"lat": 32.7309, "long": 35.172, "en": "Alonei Abba"},
-    "אלוני הבשן": {"lat": 33.0441, "long": 35.8385, "en": "Alonei HaBashan"},
-    "אלוני יצחק": {"lat": 32.51, "long": 35.0052, "en": "Alonei Itzhak"},
-    "אלונים": {"lat": 32.7215, "long": 35.1434, "en": "Alonim"},
-    "אלי עד": {"lat": 32.8066, "long": 35.7366, "en": "Eliad"},
-    "אליאב": {"lat": 31.5302, "long": 34.9284, "en": "Eliav"},
-    "אליכין": {"lat": 32.4077, "long": 34.925, "en": "Elyachin"},
-    "אליפז ומכרות תמנע": {
-        "lat": 29.7882,
-        "long": 35.0032,
-        "en": "Elipaz and Timna Mines",
-    },
-    "אליפלט": {"lat": 32.9478, "long": 35.5485, "en": "Elifelet"},
-    "אליקים": {"lat": 32.6333, "long": 35.0676, "en": "Elyakim"},
-    "אלישיב": {"lat": 32.3802, "long": 34.9099, "en": "Elyashiv"},
-    "אלישמע": {"lat": 32.1548, "long": 34.9305, "en": "Elishema"},
-    "אלמגור": {"lat": 32.9127, "long": 35.6023, "en": "Almagor"},
-    "אלמוג": {"lat": 31.79, "long": 35.462, "en": "Almog"},
-    "אלעד": {"lat": 32.0495, "long": 34.9507, "en": "Elad"},
-    "אלעזר": {"lat": 31.6597, "long": 35.1431, "en": "Elazar"},
-    "אלפי מנשה": {"lat": 32.1706, "long": 35.0149, "en": "Alfei Menashe"},
-    "אלקוש": {"lat": 33.0343, "long": 35.3263, "en": "Alkosh"},
-    "אלקנה": {"lat": 32.1106, "long": 35.0321, "en": "Elkana"},
-    "אמונים": {"lat": 31.7439, "long": 34.6745, "en": "Emunim"},
-    "אמירים": {"lat": 32.9374, "long": 35.4504, "en": "Amirim"},
-    "אמנון": {"lat": 32.905, "long": 35.5711, "en": "Amnon"},
-    "אמץ": {"lat": 32.3692, "long": 34.9931, "en": "Amatz"},
-    "אמציה": {"lat": 31.5312, "long": 34.9145, "en": "Amatzia"},
-    "אניעם": {"lat": 32.9566, "long": 35.7397, "en": "Aniam"},
-    "אעבלין": {"lat": 32.8218, "long": 35.1901, "en": "Ibillin"},
-    "אפיק": {"lat": 32.7794, "long": 35.703, "en": "Afik"},
-    "אפיקים": {"lat": 32.6806, "long": 35.5777, "en": "Afikim"},
-    "אפק": {"lat": 32.8383, "long": 35.1278, "en": "Afek"},
-    "אפרת": {"lat": 31.6536, "long": 35.1499, "en": "Efrat"},
-    "ארבל": {"lat": 32.8127, "long": 35.4826, "en": "Arbel"},
-    "ארגמן": {"lat": 32.1733, "long": 35.5223, "en": "Argaman"},
-    "ארז": {"lat": 31.5597, "long": 34.565, "en": "Erez"},
-    "אריאל": {"lat": 32.1046, "long": 35.1745, "en": "Ariel"},
-    "ארסוף": {"lat": 32.2128, "long": 34.816, "en": "Arsuf"},
-    "אשבול": {"lat": 31.4455, "long": 34.6667, "en": "Eshbol"},
-    "אשבל": {"lat": 32.877, "long": 35.306, "en": "Eshbal"},
-    "אשדוד - א,ב,ד,ה": {
-        "lat": 31.8047,
-        "long": 34.6469,
-        "en": "Ashdod - Alef,Bet,Dalet,Heh",
-    },
-    "אשדוד - איזור תעשייה צפוני": {
-        "lat": 31.8298,
-        "long": 34.6602,
-        "en": "Ashdod - Northern Industrial Zone And Port",
-    },
-    "אשדוד - ג,ו,ז": {
-        "lat": 31.7966,
-        "long": 34.6579,
-        "en": "Ashdod - Gimmel,Vav,Zain",
-    },
-    "אשדוד - ח,ט,י,יג,יד,טז": {
-        "lat": 31.7778,
-        "long": 34.6462,
-        "en": "Ashdod - Het,Tet,Yod,Yod Gimmel,Yod Dalet,Tet Zain",
-    },
-    "אשדוד -יא,יב,טו,יז,מרינה,סיטי": {
-        "lat": 31.7836,
-        "long": 34.6332,
-        "en": "Ashdod - Yod Alef,Yod Bet,Tet Vav,Yod Zain,Marina,City",
-    },
-    "אשדות יעקב": {"lat": 32.661, "long": 35.5798, "en": "Ashdot Yaacov"},
-    "אשחר": {"lat": 32.8851, "long": 35.2996, "en": "Eshchar"},
-    "אשכולות": {"lat": 31.3912, "long": 34.9049, "en": "Eshkolot"},
-    "אשל הנשיא": {"lat": 31.3268, "long": 34.6975, "en": "Eshel HaNassi"},
-    "אשלים": {"lat": 30.9642, "long": 34.6997, "en": "Ashalim"},
-    "אשקלון - דרום": {"lat": 31.661, "long": 34.5688, "en": "Ashkelon - South"},
-    "אשקלון - צפון": {"lat": 31.686, "long": 34.5839, "en": "Ashkelon - North"},
-    "אשרת": {"lat": 32.9716, "long": 35.1557, "en": "Oshrat"},
-    "אשתאול": {"lat": 31.7804, "long": 35.0101, "en": "Eshtaol"},
-    "אתר דודאים": {"lat": 31.3122, "long": 34.7338, "en": "Duda'im Site"},
-    "אתר ההנצחה גולני": {"lat": 32.7774, "long": 35.4103, "en": "Golani Memorial Site"},
-    "באקה אל גרבייה": {"lat": 32.4229, "long": 35.0358, "en": "bqa al-Gharbiyye"},
-    "באר אורה": {"lat": 29.7102, "long": 34.9872, "en": "Be'er Ora"},
-    "באר גנים": {"lat": 31.7004, "long": 34.6109, "en": "Be'er Ganim"},
-    "באר טוביה": {"lat": 31.7371, "long": 34.7256, "en": "Be'er Tuvia"},
-    "באר יעקב": {"lat": 31.9435, "long": 34.839, "en": "Be'er Yacov"},
-    "באר מילכה": {"lat": 30.9341, "long": 34.4056, "en": "Be'er Milka"},
-    "באר שבע - דרום": {"lat": 31.2413, "long": 34.7711, "en": "Beer Sheva - South"},
-    "באר שבע - מזרח": {"lat": 31.2345, "long": 34.8201, "en": "Beer Sheva - East"},
-    "באר שבע - מערב": {"lat": 31.2612, "long": 34.7794, "en": "Beer Sheva - West"},
-    "באר שבע - צפון": {"lat": 31.2698, "long": 34.8151, "en": "Beer Sheva - North"},
-    "בארות יצחק": {"lat": 32.042, "long": 34.9102, "en": "Be'erot Itzhak"},
-    "בארותיים": {"lat": 32.321, "long": 34.9834, "en": "Be'erotaim"},
-    "בארי": {"lat": 31.4245, "long": 34.4926, "en": "Be'eri"},
-    "בוסתן הגליל": {"lat": 32.9486, "long": 35.0807, "en": "Bustan HaGalil"},
-    "בועיינה-נוג'ידאת": {"lat": 32.8077, "long": 35.3653, "en": "Bu'eine Nujeidat"},
-    "בוקעתא": {"lat": 33.2027, "long": 35.7768, "en": "Buq'ata"},
-    "בורגתה": {"lat": 32.326, "long": 34.9638, "en": "Burgata"},
-    "בחן": {"lat": 32.3518, "long": 35.0185, "en": "Bahan"},
-    "בטחה": {"lat": 31.3339, "long": 34.6343, "en": "Bitha"},
-    "ביצרון": {"lat": 31.795, "long": 34.7293, "en": "Bitzaron"},
-    "ביר אלמכסור": {"lat": 32.7773, "long": 35.2206, "en": "Bir al-Maksur"},
-    "ביר הדאג'": {"lat": 31.0302, "long": 34.7169, "en": "Bir Hadaj"},
-    "ביריה": {"lat": 32.9781, "long": 35.5031, "en": "Biriyeh"},
-    "בית אורן": {"lat": 32.7316, "long": 35.0063, "en": "Beit Oren"},
-    "בית אל": {"lat": 31.9416, "long": 35.2227, "en": "Beit El"},
-    "בית אלעזרי": {"lat": 31.8447, "long": 34.8066, "en": "Beit Elazari"},
-    "בית אלפא וחפציבה": {
-        "lat": 32.5187,
-        "long": 35.4262,
-        "en": "Beit Alfa and Heftziba",
-    },
-    "בית אריה": {"lat": 32.0401, "long": 35.0495, "en": "Beit Arie"},
-    "בית ברל": {"lat": 32.1997, "long": 34.9261, "en": "Beit Berl"},
-    "בית ג'אן": {"lat": 32.9657, "long": 35.3813, "en": "Beit Jann"},
-    "בית גוברין": {"lat": 31.6129, "long": 34.8956, "en": "Beit Guvrin"},
-    "בית גמליאל": {"lat": 31.8561, "long": 34.7609, "en": "Beit Gamliel"},
-    "בית דגן": {"lat": 32.0018, "long": 34.8297, "en": "Beit Dagan"},
-    "בית הגדי": {"lat": 31.4228, "long": 34.6079, "en": "Beit HaGdi"},
-    "בית הלוי": {"lat": 32.3516, "long": 34.9304, "en": "Beit HaLevi"},
-    "בית הלל": {"lat": 33.2088, "long": 35.6065, "en": "Beit Hillel"},
-    "בית העלמין החדש נהריה": {
-        "lat": 33.005,
-        "long": 35.1463,
-        "en": "Nahariya Cemetery",
-    },
-    "בית העלמין החדש עכו": {"lat": 32.9146, "long": 35.1358, "en": "Akko New Cemetery"},
-    "בית העמק": {"lat": 32.971, "long": 35.1453, "en": "Beit HaEmek"},
-    "בית הערבה": {"lat": 31.8078, "long": 35.4764, "en": "Beit HaArava"},
-    "בית השיטה": {"lat": 32.5509, "long": 35.4394, "en": "Beit HaShita"},
-    "בית זית": {"lat": 31.7831, "long": 35.1611, "en": "Beit Zayit"},
-    "בית זרע": {"lat": 32.6893, "long": 35.5741, "en": "Beit Zera"},
-    'בית חג"י': {"lat": 31.4917, "long": 35.0791, "en": "Beit Hagai"},
-    "בית חורון": {"lat": 31.8799, "long": 35.1241, "en": "Beit Horon"},
-    "בית חזון": {"lat": 32.3872, "long": 34.9129, "en": "Beit Hazon"},
-    "בית חלקיה": {"lat": 31.793, "long": 34.8097, "en": "Beit Hilkia"},
-    "בית חנן": {"lat": 31.9352, "long": 34.7756, "en": "Beit Hanan"},
-    "בית חנניה": {"lat": 32.5295, "long": 34.9267, "en": "Beit Hanania"},
-    "בית חרות": {"lat": 32.3762, "long": 34.8738, "en": "Beit Herut"},
-    "בית חשמונאי": {"lat": 31.8903, "long": 34.9176, "en": "Beit Hashmonai"},
-    "בית יהושע": {"lat": 32.2621, "long": 34.8654, "en": "Beit Yehoshua"},
-    "בית יוסף": {"lat": 32.5587, "long": 35.5528, "en": "Beit Yossef"},
-    "בית ינאי": {"lat": 32.3817, "long": 34.8635, "en": "Beit Yannai"},
-    "בית יצחק - שער חפר": {
-        "lat": 32.3356,
-        "long": 34.8895,
-        "en": "Beit Yithak - Sha'ar Hefer",
-    },
-    "בית ירח": {"lat": 32.7144, "long": 35.574, "en": "Beit Yerah"},
-    "בית יתיר": {"lat": 31.3656, "long": 35.1113, "en": "Beit Yatir"},
-    "בית לחם הגלילית": {"lat": 32.7346, "long": 35.1913, "en": "Bethlehem of Galilee"},
-    "בית מאיר": {"lat": 31.7948, "long": 35.0368, "en": "Beit Meir"},
-    "בית נחמיה": {"lat": 31.9771, "long": 34.9538, "en": "Beit Nechemia"},
-    "בית ניר": {"lat": 31.6476, "long": 34.8731, "en": "Beit Nir"},
-    "בית נקופה": {"lat": 31.8044, "long": 35.1269, "en": "Beit Nekofa"},
-    "בית סוהר השרון": {"lat": 32.2408, "long": 34.8848, "en": "HaSharon Prison"},
-    "בית סוהר מגידו": {"lat": 32.5709, "long": 35.1898, "en": "Megiddo Prison"},
-    "בית סוהר נפחא": {"lat": 30.7265, "long": 34.7735, "en": "Nafha Prison"},
-    "בית סוהר צלמון": {"lat": 32.8717, "long": 35.4474, "en": "Zalmon Prison"},
-    "בית סוהר קישון": {"lat": 32.7262, "long": 35.0915, "en": "Kishon Prison"},
-    "בית סוהר שיטה וגלבוע": {
-        "lat": 32.5476,
-        "long": 35.4151,
-        "en": "Shita and Gilboa Prison",
-    },
-    "בית ספר אורט בנימינה": {"lat": 32.5498, "long": 34.955, "en": "Ort Binyamina"},
-    "בית ספר שדה מירון": {"lat": 33.0115, "long": 35.3922, "en": "Sdeh Meron School"},
-    "בית עובד": {"lat": 31.9213, "long": 34.7749, "en": "Beit Oved"},
-    "בית עוזיאל": {"lat": 31.8701, "long": 34.9049, "en": "Beit Uziel"},
-    "בית עזרא": {"lat": 31.7364, "long": 34.6575, "en": "Beit Ezra"},
-    "בית עלמין מורשה": {"lat": 32.1206, "long": 34.8549, "en": "Morasha Cemetery"},
-    "בית עלמין תל רגב": {"lat": 32.7678, "long": 35.1219, "en": "Tel Regev Cemetary"},
-    "בית עריף": {"lat": 31.9954, "long": 34.9351, "en": "Beit Arif"},
-    "בית צבי": {"lat": 32.7189, "long": 34.9697, "en": "Beit Zvi"},
-    "בית קמה": {"lat": 31.4466, "long": 34.7622, "en": "Beit Kama"},
-    "בית קשת": {"lat": 32.7184, "long": 35.395, "en": "Beit Keshet"},
-    "בית רימון": {"lat": 32.7818, "long": 35.3277, "en": "Beit Rimon"},
-    "בית שאן": {"lat": 32.4971, "long": 35.4973, "en": "Beit She'an"},
-    "בית שמש": {"lat": 31.747, "long": 34.9881, "en": "Beit Shemesh"},
-    "בית שערים": {"lat": 32.6965, "long": 35.1788, "en": "Beit Shea'rim"},
-    "בית שקמה": {"lat": 31.6377, "long": 34.6101, "en": "Beit Shikma"},
-    "ביתן אהרן": {"lat": 32.3649, "long": 34.8696, "en": "Bitan Aharon"},
-    "ביתר עילית": {"lat": 31.701, "long": 35.1119, "en": "Beitar Illit"},
-    "בלפוריה": {"lat": 32.63, "long": 35.2963, "en": "Balfuria"},
-    "בן זכאי": {"lat": 31.8572, "long": 34.7274, "en": "Ben Zakai"},
-    "בן עמי": {"lat": 33.0054, "long": 35.1222, "en": "Ben Ami"},
-    "בן שמן": {"lat": 31.9513, "long": 34.9198, "en": "Ben Shemen"},
-    "בני ברק": {"lat": 32.0849, "long": 34.8352, "en": "Bnei Brak"},
-    "בני דקלים": {"lat": 31.5172, "long": 34.917, "en": "Bnei Dkalim"},
-    "בני דרום": {"lat": 31.8209, "long": 34.6916, "en": "Bnei Darom"},
-    "בני דרור": {"lat": 32.2618, "long": 34.9018, "en": "Bnei Dror"},
-    "בני יהודה וגבעת יואב": {
-        "lat": 32.7983,
-        "long": 35.6911,
-        "en": "Bnei Yehuda and Givat Yoav",
-    },
-    "בני נצרים": {"lat": 31.1435, "long": 34.3164, "en": "Bnei Netzarim"},
-    "בני עטרות": {"lat": 32.0215, "long": 34.9101, "en": "Bnei Atarot"},
-    "בני עי''ש": {"lat": 31.7902, "long": 34.7593, "en": "Bnei Ayish"},
-    "בני ציון": {"lat": 32.2198, "long": 34.8684, "en": "Bnei Zion"},
-    "בני ראם": {"lat": 31.77, "long": 34.7905, "en": "Bnei Re'em"},
-    "בניה": {"lat": 31.8434, "long": 34.7518, "en": "Bnaya"},
-    "בנימינה": {"lat": 32.5171, "long": 34.9551, "en": "Binyamina"},
-    "בסמת טבעון": {"lat": 32.7363, "long": 35.1532, "en": "Basmat Tab'un"},
-    "בענה": {"lat": 32.9295, "long": 35.2719, "en": "Bi'ina"},
-    "בצרה": {"lat": 32.2145, "long": 34.8781, "en": "Batzra"},
-    "בצת": {"lat": 33.07, "long": 35.1326, "en": "Betzet"},
-    "בקוע": {"lat": 31.8279, "long": 34.9247, "en": "Beko'a"},
-    "בקעות": {"lat": 32.2421, "long": 35.4526, "en": "Beka'ot"},
-    "בר גיורא": {"lat": 31.7297, "long": 35.0734, "en": "Bar Giora"},
-    "בר יוחאי": {"lat": 32.9977, "long": 35.4482, "en": "Bar Yochai"},
-    "ברוכין": {"lat": 32.0822, "long": 35.0941, "en": "Brukhin"},
-    "ברור חיל": {"lat": 31.557, "long": 34.6465, "en": "Bror Hayil"},
-    "ברוש": {"lat": 31.371091, "long": 34.634933, "en": "Brosh"},
-    "ברחבי הארץ": {"lat": 31.7781, "long": 35.2164, "en": "Across the country"},
-    "ברטעה": {"lat": 32.4721, "long": 35.095, "en": "Bart'a"},
-    "ברכיה": {"lat": 31.668, "long": 34.6243, "en": "Berekhya"},
-    "ברעם": {"lat": 33.059, "long": 35.4332, "en": "Baram"},
-    "ברקאי": {"lat": 32.4761, "long": 35.031, "en": "Barkai"},
-    "ברקן": {"lat": 32.1095, "long": 35.106, "en": "Barkan"},
-    "ברקת": {"lat": 32.0183, "long": 34.9432, "en": "Bareket"},
-    "בת הדר": {"lat": 31.6481, "long": 34.5971, "en": "Bat Hadar"},
-    "בת חן": {"lat": 32.3602, "long": 34.8724, "en": "Bat Chen"},
-    "בת חפר": {"lat": 32.3337, "long": 35.0137, "en": "Bat Hefer"},
-    "בת ים": {"lat": 32.0146, "long": 34.7493, "en": "Bat-Yam"},
-    "בת עין": {"lat": 31.6577, "long": 35.1011, "en": "Bat Ayin"},
-    "בת שלמה": {"lat": 32.6003, "long": 35.0038, "en": "Bat Shlomo"},
-    "בתי מלון ים המלח": {"lat": 31.1691, "long": 35.3673, "en": "Dead Sea Hotels"},
-    "ג'דידה מכר": {"lat": 32.9287, "long": 35.1506, "en": "Jadeidi-Makr"},
-    "ג'וליס": {"lat": 32.945, "long": 35.1842, "en": "Julis"},
-    "ג'לג'וליה": {"lat": 32.1525, "long": 34.954, "en": "Jaljulia"},
-    "ג'סר א-זרקא": {"lat": 32.5363, "long": 34.9116, "en": "Jisr az-Zarqa"},
-    "ג'ש - גוש חלב": {"lat": 33.0213, "long": 35.4479, "en": "Jish (Gush Halav)"},
-    "ג'ת": {"lat": 32.3984, "long": 35.0361, "en": "Jatt"},
-    "גאולי תימן": {"lat": 32.3918, "long": 34.901, "en": "Geulei Teiman"},
-    "גאולים": {"lat": 32.2965, "long": 34.9439, "en": "Geulim"},
-    "גאליה": {"lat": 31.8856, "long": 34.7654, "en": "Ge'alya"},
-    "גבולות": {"lat": 31.2112, "long": 34.4662, "en": "Gvulot"},
-    "גבים, מכללת ספיר": {"lat": 31.5071, "long": 34.5974, "en": "Gavim, Sapir College"},
-    "גבע בנימין": {"lat": 31.85, "long": 35.2739, "en": "Geva Binyamin"},
-    "גבע כרמל": {"lat": 32.6622, "long": 34.9541, "en": "Geva Carmel"},
-    "גבעון החדשה": {"lat": 31.8481, "long": 35.1575, "en": "Givon HaHadasha"},
-    "גבעות": {"lat": 31.6789, "long": 35.1019, "en": "Gvaot"},
-    "גבעות בר": {"lat": 31.3572, "long": 34.7555, "en": "Giv'ot Bar"},
-    "גבעות גורל": {"lat": 31.4098, "long": 34.7905, "en": "Goral Hills"},
-    "גבעות עדן": {"lat": 31.6622, "long": 35.0139, "en": "Giv'ot Eden"},
-    "גבעת אבני": {"lat": 32.7754, "long": 35.4362, "en": "Giv'at Avni"},
-    "גבעת אלה": {"lat": 32.722, "long": 35.2448, "en": "Givat Ela"},
-    "גבעת אסף": {"lat": 31.9112, "long": 35.2481, "en": "Giv'at Asaf"},
-    "גבעת ברנר": {"lat": 31.8666, "long": 34.8023, "en": "Givat Brenner"},
-    "גבעת הראל וגבעת הרואה": {
-        "lat": 32.0563,
-        "long": 35.2748,
-        "en": "Giv'at Har'el and Giv'at HaRoeh",
-    },
-    "גבעת השלושה": {"lat": 32.0963, "long": 34.9206, "en": "Givat HaShlosha"},
-    "גבעת וולפסון": {"lat": 32.7202, "long": 35.0161, "en": "Givat Wolfson"},
-    "גבעת וושינגטון": {"lat": 31.8175, "long": 34.7289, "en": "Givat Washington"},
-    "גבעת זאב": {"lat": 31.8612, "long": 35.1673, "en": "Givat Ze'ev"},
-    "גבעת חביבה": {"lat": 32.457652, "long": 35.02009, "en": "Givat Haviva"},
-    "גבעת חיים איחוד": {"lat": 32.3967, "long": 34.933, "en": "Givat Haim (Ihud)"},
-    "גבעת חיים מאוחד": {"lat": 32.3921, "long": 34.9294, "en": "Givat Haim (Meuhad)"},
-    "גבעת חן": {"lat": 32.1676, "long": 34.8755, "en": "Givat Hen"},
-    "גבעת יערים": {"lat": 31.7861, "long": 35.0928, "en": "Givat Yearim"},
-    "גבעת ישעיהו": {"lat": 31.6717, "long": 34.9437, "en": "Givat Ishayahu"},
-    "גבעת כ''ח": {"lat": 32.032091, "long": 34.938796, "en": "Giv'at Ko'ah"},
-    "גבעת ניל''י": {"lat": 32.549043, "long": 35.041194, "en": "Givat Nili"},
-    "גבעת עדה": {"lat": 32.521, "long": 35.0114, "en": "Givat Ada"},
-    "גבעת עוז": {"lat": 32.5559, "long": 35.198, "en": "Givat Oz"},
-    "גבעת שמואל": {"lat": 32.0773, "long": 34.8492, "en": "Givat Shmuel"},
-    "גבעת שפירא": {"lat": 32.3576, "long": 34.8758, "en": "Givat Shapira"},
-    "גבעתי": {"lat": 31.7331, "long": 34.6795, "en": "Givati"},
-    "גבעתיים": {"lat": 32.0722, "long": 34.8089, "en": "Givatayim"},
-    "גברעם": {"lat": 31.5915, "long": 34.6122, "en": "Gvaram"},
-    "גבת": {"lat": 32.6766, "long": 35.2132, "en": "Gvat"},
-    "גדות": {"lat": 33.0182, "long": 35.6195, "en": "Gadot"},
-    "גדעונה": {"lat": 32.5499, "long": 35.3592, "en": "Gidona"},
-    "גדרה": {"lat": 31.8123, "long": 34.777, "en": "Gdera"},
-    "גונן": {"lat": 33.124, "long": 35.6462, "en": "Gonen"},
-    "גורן": {"lat": 33.0556, "long": 35.2336, "en": "Goren"},
-    "גורנות הגליל": {"lat": 33.0593, "long": 35.2497, "en": "Gornot HaGalil"},
-    "גזית": {"lat": 32.6393, "long": 35.4462, "en": "Gazit"},
-    "גזר": {"lat": 31.8761, "long": 34.9203, "en": "Gezer"},
-    "גיאה": {"lat": 31.6285, "long": 34.6027, "en": "Ge'a"},
-    "גיבתון": {"lat": 31.8883, "long": 34.7991, "en": "Gibton"},
-    "גיזו": {"lat": 31.8056, "long": 34.9397, "en": "Gizo"},
-    "גילת": {"lat": 31.3263, "long": 34.6489, "en": "Gilat"},
-    "גינוסר": {"lat": 32.8487, "long": 35.5232, "en": "Ginosar"},
-    "גינתון": {"lat": 31.9628, "long": 34.9131, "en": "Ginaton"},
-    "גיתה": {"lat": 32.9672, "long": 35.2491, "en": "Gita"},
-    "גיתית": {"lat": 32.1003, "long": 35.3954, "en": "Gitit"},
-    "גלאון": {"lat": 31.6334, "long": 34.8489, "en": "Galon"},
-    "גלגל": {"lat": 32.0004, "long": 35.4448, "en": "Gilgal"},
-    "גלעד": {"lat": 32.5575, "long": 35.0763, "en": "Gal'ed"},
-    "גמזו": {"lat": 31.9272, "long": 34.9411, "en": "Gimzo"},
-    "גן הדרום": {"lat": 31.8041, "long": 34.6999, "en": "Gan HaDarom"},
-    "גן השומרון": {"lat": 32.465, "long": 34.999, "en": "Gan HaShomron"},
-    "גן חיים": {"lat": 32.1958, "long": 34.907, "en": "Gan Haim"},
-    "גן יאשיה": {"lat": 32.3495, "long": 34.9962, "en": "Gan Yoshia"},
-    "גן יבנה": {"lat": 31.7831, "long": 34.7031, "en": "Gan Yavne"},
-    "גן נר": {"lat": 32.5287, "long": 35.3363, "en": "Gan Ner"},
-    "גן שורק": {"lat": 31.944, "long": 34.7583, "en": "Gan Sorek"},
-    "גן שלמה": {"lat": 31.8788, "long": 34.7989, "en": "Gan Shlomo"},
-    "גן שמואל": {"lat": 32.4529, "long": 34.9493, "en": "Gan Shmuel"},
-    "גנות": {"lat": 32.0182, "long": 34.8259, "en": "Ganot"},
-    "גנות הדר": {"lat": 32.3217, "long": 34.9007, "en": "Ginot Hadar"},
-    "גני הדר": {"lat": 31.8782, "long": 34.8576, "en": "Ganei Hadar"},
-    "גני חוגה": {"lat": 32.5173, "long": 35.5392, "en": "Ganey Hugga"},
-    "גני טל": {"lat": 31.7886, "long": 34.7914, "en": "Ganei Tal"},
-    "גני יוחנן": {"lat": 31.8599, "long": 34.8408, "en": "Ganei Yochanan"},
-    "גני עם": {"lat": 32.1498, "long": 34.9034, "en": "Ganei Am"},
-    "גני תקווה": {"lat": 32.0605, "long": 34.8731, "en": "Ganei Tikva"},
-    "גניגר": {"lat": 32.6634, "long": 35.2599, "en": "Genigar"},
-    "געש": {"lat": 32.2285, "long": 34.8244, "en": "Ga'ash"},
-    "געתון": {"lat": 33.0061, "long": 35.2138, "en": "Ga'aton"},
-    "גפן": {"lat": 31.7404, "long": 34.8784, "en": "Geffen"},
-    "גרופית": {"lat": 29.9416, "long": 35.0647, "en": "Grofit"},
-    "גשור": {"lat": 32.8199, "long": 35.7157, "en": "Gshur"},
-    "גשר": {"lat": 32.6212, "long": 35.5504, "en": "Gesher"},
-    "גשר הזיו": {"lat": 33.0405, "long": 35.1106, "en": "Gesher HaZiv"},
-    "גת": {"lat": 31.6278, "long": 34.7941, "en": "Gat"},
-    "גת רימון": {"lat": 32.0681, "long": 34.8814, "en": "Gat Rimon"},
-    "דבוריה": {"lat": 32.6941, "long": 35.3685, "en": "Daburiyya"},
-    "דביר": {"lat": 31.4117, "long": 34.8252, "en": "Dvir"},
-    "דברת": {"lat": 32.6467, "long": 35.3501, "en": "Dovrat"},
-    "דגניה א": {"lat": 32.7069, "long": 35.5751, "en": "Degania Alef"},
-    "דגניה ב": {"lat": 32.6991, "long": 35.5776, "en": "Degania Bet"},
-    "דוב''ב": {"lat": 33.0508, "long": 35.407747, "en": "Dovev"},
-    "דולב": {"lat": 31.9262, "long": 35.1336, "en": "Dolev"},
-    "דור": {"lat": 32.607548, "long": 34.923294, "en": "Dor"},
-    "דורות": {"lat": 31.5072, "long": 34.6457, "en": "Dorot"},
-    "דחי": {"lat": 32.6225, "long": 35.3436, "en": "Ed-Dahi"},
-    "דימונה": {"lat": 31.0694, "long": 35.0334, "en": "Dimona"},
-    "דיר אל-אסד": {"lat": 32.9344, "long": 35.2684, "en": "Deir al-Asad"},
-    "דיר חנא": {"lat": 32.8623, "long": 35.3653, "en": "Deir Hanna"},
-    "דישון": {"lat": 33.0823, "long": 35.5176, "en": "Dishon"},
-    "דליה": {"lat": 32.5892, "long": 35.077, "en": "Dalia"},
-    "דלית אל כרמל": {"lat": 32.6938, "long": 35.0554, "en": "Daliyat al-Karmel"},
-    "דלתון": {"lat": 33.0166, "long": 35.4899, "en": "Dalton"},
-    "דמיידה": {"lat": 32.815, "long": 35.2266, "en": "Dmeide"},
-    "דניאל": {"lat": 31.3109, "long": 34.5931, "en": "Daniel"},
-    "דפנה": {"lat": 33.2308, "long": 35.6383, "en": "Dafna"},
-    "דקל": {"lat": 31.196642, "long": 34.34709, "en": "Dekel"},
-    "האון": {"lat": 32.7267, "long": 35.6227, "en": "Ha'On"},
-    "הבונים": {"lat": 32.6366, "long": 34.9327, "en": "HaBonim"},
-    "הגושרים": {"lat": 33.2215, "long": 35.623, "en": "HaGoshrim"},
-    "הדר עם": {"lat": 32.3497, "long": 34.8989, "en": "Hadar Am"},
-    "הוד השרון": {"lat": 32.15, "long": 34.8839, "en": "Hod HaSharon"},
-    "הודיה": {"lat": 31.6764, "long": 34.6393, "en": "Hodaya"},
-    "הודיות": {"lat": 32.7886, "long": 35.435, "en": "Hodayot"},
-    "הושעיה": {"lat": 32.7579, "long": 35.2952, "en": "Hoshaya"},
-    "הזורעים": {"lat": 32.7481, "long": 35.4999, "en": "HaZor'im"},
-    "החותרים": {"lat": 32.7523, "long": 34.9575, "en": "HaHotrim"},
-    "היוגב": {"lat": 32.6128, "long": 35.2075, "en": "HaYogev"},
-    "היישוב היהודי חברון": {
-        "lat": 31.5247,
-        "long": 35.1073,
-        "en": "Hevron Jewish Settlement",
-    },
-    "הילה": {"lat": 33.0362, "long": 35.2446, "en": "Hila"},
-    "המעפיל": {"lat": 32.378, "long": 34.9831, "en": "HaMa'apil"},
-    "המרכז האקדמי רופין": {
-        "lat": 32.3424,
-        "long": 34.9123,
-        "en": "Ruppin Academic Center",
-    },
-    "הסוללים": {"lat": 32.7518, "long": 35.238, "en": "HaSollelim"},
-    "העוגן": {"lat": 32.3604, "long": 34.9233, "en": "HaOgen"},
-    "הר אדר": {"lat": 31.8245, "long": 35.1297, "en": "Har Adar"},
-    "הר ברכה": {"lat": 32.1933, "long": 35.2649, "en": "Har Bracha"},
-    "הר גילה": {"lat": 31.7221, "long": 35.1715, "en": "Har Gilo"},
-    "הר הנגב": {"lat": 30.6817, "long": 34.785, "en": "Har HaNegev"},
-    "הר חלוץ": {"lat": 32.9497, "long": 35.3124, "en": "Har Halutz"},
-    "הר עמשא": {"lat": 31.3427, "long": 35.1016, "en": "Har Amsha"},
-    "הראל": {"lat": 31.80944, "long": 34.94903, "en": "Harel"},
-    "הרדוף": {"lat": 32.7637, "long": 35.1747, "en": "Harduf"},
-    "הרצליה - מערב": {"lat": 32.1738, "long": 34.8104, "en": "Herzliya - West"},
-    "הרצליה - מרכז וגליל ים": {
-        "lat": 32.1678,
-        "long": 34.8413,
-        "en": "Herzeliya - Center and Glil Yam",
-    },
-    "הררית יחד": {"lat": 32.8457, "long": 35.3693, "en": "Hararit Yachad"},
-    "ואדי אל חמאם": {"lat": 32.8284, "long": 35.4917, "en": "Wadi Hamam"},
-    "ואדי אל נעם דרום": {"lat": 31.1413, "long": 34.8265, "en": "Wadi el Na'am South"},
-    "ורד יריחו": {"lat": 31.8262, "long": 35.4321, "en": "Vered Yericho"},
-    "ורדון": {"lat": 31.6638, "long": 34.7818, "en": "Vardon"},
-    "זבדיאל": {"lat": 31.6592, "long": 34.7603, "en": "Zavdiel"},
-    "זוהר": {"lat": 31.5956, "long": 34.6924, "en": "Zohar"},
-    "זיקים": {"lat": 31.6072, "long": 34.521, "en": "Zikim"},
-    "זיתן": {"lat": 31.9752, "long": 34.8917, "en": "Zeitan"},
-    "זכרון יעקב": {"lat": 32.5739, "long": 34.952, "en": "Zichron Yacov"},
-    "זכריה": {"lat": 31.7088, "long": 34.9447, "en": "Zekharia"},
-    "זמר": {"lat": 32.3657, "long": 35.0347, "en": "Zemer"},
-    "זמרת, שובה": {"lat": 31.4518, "long": 34.5467, "en": "Zimrat, Shuva"},
-    "זנוח": {"lat": 31.7338, "long": 34.9994, "en": "Zanoah"},
-    "זרועה": {"lat": 31.4591, "long": 34.6242, "en": "Zru'a"},
-    "זרזיר": {"lat": 32.7233, "long": 35.2204, "en": "Zarzir"},
-    "זרחיה": {"lat": 31.6817, "long": 34.7464, "en": "Zrahia"},
-    "זרעית": {"lat": 33.099, "long": 35.2885, "en": "Zarit"},
-    "ח'וואלד": {"lat": 32.7589, "long": 35.1584, "en": "Khawaled"},
-    "חבצלת השרון וצוקי ים": {
-        "lat": 32.3601,
-        "long": 34.8585,
-        "en": "Havatzelet HaSharon and Tzukei Yam",
-    },
-    "חג'אג'רה": {"lat": 32.741, "long": 35.2049, "en": "Hajajre"},
-    "חגור": {"lat": 32.1386, "long": 34.9476, "en": "Hagor"},
-    "חגלה": {"lat": 32.3891, "long": 34.9243, "en": "Hogla"},
-    "חד נס": {"lat": 32.9275, "long": 35.6414, "en": "Had Ness"},
-    "חדיד": {"lat": 31.9694, "long": 34.9322, "en": "Hadid"},
-    "חדרה - מזרח": {"lat": 32.4258, "long": 34.9506, "en": "Hadera - East"},
-    "חדרה - מערב": {"lat": 32.439, "long": 34.8854, "en": "Hadera - West"},
-    "חדרה - מרכז": {"lat": 32.4352, "long": 34.9209, "en": "Hadera - Center"},
-    "חדרה - נווה חיים": {"lat": 32.446, "long": 34.9049, "en": "Hadera - Neveh Haim"},
-    "חוואלד": {"lat": 32.771, "long": 35.1362, "en": "Khawaled"},
-    "חוות אירוח גורן": {"lat": 33.0488, "long": 35.2201, "en": "Goren Farm Guesthouse"},
-    "חוות גלעד": {"lat": 32.2005, "long": 35.1812, "en": "Havat Gil'ad"},
-    "חוות יאיר": {"lat": 32.1453, "long": 35.1048, "en": "Havat Yair"},
-    "חוות יזרעם": {"lat": 31.4434, "long": 34.5717, "en": "Havat Izra'am"},
-    "חוות עדן": {"lat": 32.4658, "long": 35.4866, "en": "Havat Eden"},
-    "חוות ערנדל": {"lat": 30.1149, "long": 35.1515, "en": "Ardanel Ranch"},
-    "חוות שיקמים": {"lat": 31.5113, "long": 34.6339, "en": "Havat Shikmim"},
-    "חולדה": {"lat": 31.8321, "long": 34.8815, "en": "Hulda"},
-    "חולון": {"lat": 32.0158, "long": 34.7874, "en": "Holon"},
-    "חולית": {"lat": 31.2306, "long": 34.3273, "en": "Holit"},
-    "חולתה": {"lat": 33.0529, "long": 35.6092, "en": "Hulata"},
-    "חוסן": {"lat": 32.9977, "long": 35.2987, "en": "Hossen"},
-    "חוסנייה": {"lat": 32.9006, "long": 35.3225, "en": "Hussniyya"},
-    "חוף אמנון": {"lat": 32.8912, "long": 35.5934, "en": "Amnon Beach"},
-    "חוף בצת": {"lat": 33.0801, "long": 35.1066, "en": "Betzet Beach"},
-    "חוף גולן, צאלון": {"lat": 32.8425, "long": 35.6508, "en": "Golan, Tzeelon Beach"},
-    "חוף גופרה": {"lat": 32.8042, "long": 35.6429, "en": "Gofra Beach"},
-    "חוף זיקים": {"lat": 31.6164, "long": 34.508, "en": "Zikim Beach"},
-    "חוף כורסי, לבנון, חלוקים": {
-        "lat": 32.8202,
-        "long": 35.646,
-        "en": "Kursi, Lavnun, Halukim Beach",
-    },
-    "חוף כינר, דוגה, דוגית": {
-        "lat": 32.8567,
-        "long": 35.6473,
-        "en": "Kinar, Duga, Dugit Beach",
-    },
-    "חוף ניצנים": {"lat": 31.7457, "long": 34.6015, "en": "Nitzanim Beach"},
-    "חוף סוסיתא": {"lat": 32.7897, "long": 35.6398, "en": "Susita Beach"},
-    "חוף קליה": {"lat": 31.7609, "long": 35.5027, "en": "Kalia Beach"},
-    "חופית": {"lat": 32.3861, "long": 34.8741, "en": "Hofit"},
-    "חוקוק": {"lat": 32.8786, "long": 35.4967, "en": "Hukok"},
-    "חורה": {"lat": 31.3004, "long": 34.9357, "en": "Hura"},
-    "חורפיש": {"lat": 33.0167, "long": 35.3471, "en": "Hurfeish"},
-    "חורשים": {"lat": 32.1379, "long": 34.971, "en": "Horashim"},
-    "חזון": {"lat": 32.9066, "long": 35.3953, "en": "Hazon"},
-    "חי-בר יטבתה": {
-        "lat": 29.8462,
-        "long": 35.0294,
-        "en": "Yotvata Hai Bar Nature Reserve",
-    },
-    "חיבת ציון": {"lat": 32.398, "long": 34.9119, "en": "Hibat Zion"},
-    "חיננית": {"lat": 32.4809, "long": 35.1732, "en": "Hinanit"},
-    "חיפה - כרמל, הדר ועיר תחתית": {
-        "lat": 32.8072,
-        "long": 34.9878,
-        "en": "Haifa - Carmel, Hadar and Downtown Lower City",
-    },
-    "חיפה - מערב": {"lat": 32.8087, "long": 34.9603, "en": "Haifa - West"},
-    "חיפה - מפרץ": {"lat": 32.8049, "long": 35.0521, "en": "Haifa - Bay"},
-    "חיפה - נווה שאנן ורמות כרמל": {
-        "lat": 32.7812,
-        "long": 35.0015,
-        "en": "Haifa - Ramot HaCarmel and Neveh Sha'anan",
-    },
-    "חיפה - קריית חיים ושמואל": {
-        "lat": 32.8283,
-        "long": 35.0656,
-        "en": "Haifa - Kiryat Haim & Kiryat Shmuel",
-    },
-    "חירן": {"lat": 31.3096, "long": 34.9845, "en": "Hiran"},
-    "חלמיש": {"lat": 32.0083, "long": 35.1289, "en": "Halamish"},
-    "חלץ": {"lat": 31.5779, "long": 34.6584, "en": "Heletz"},
-    "חמד": {"lat": 32.018, "long": 34.8413, "en": "Hemed"},
-    "חמדיה": {"lat": 32.5198, "long": 35.5206, "en": "Hamadia"},
-    "חמדת": {"lat": 32.252, "long": 35.5268, "en": "Hemdat"},
-    "חמרה": {"lat": 32.1997, "long": 35.4374, "en": "Hamra"},
-    "חמת גדר": {"lat": 32.6834, "long": 35.6647, "en": "Hamat gader"},
-    "חניאל": {"lat": 32.3328, "long": 34.9477, "en": "Haniel"},
-    "חניון הנתיב מהיר": {
-        "lat": 32.0022,
-        "long": 34.8421,
-        "en": "Fast Lane Parking Lot",
-    },
-    "חניתה": {"lat": 33.0876, "long": 35.1734, "en": "Hanita"},
-    "חנתון": {"lat": 32.7831, "long": 35.2451, "en": "Hanaton"},
-    "חספין": {"lat": 32.8456, "long": 35.793, "en": "Haspin"},
-    "חפץ חיים": {"lat": 31.7893, "long": 34.7997, "en": "Hafetz Haim"},
-    "חצב": {"lat": 31.7801, "long": 34.7706, "en": "Hatzav"},
-    "חצבה": {"lat": 30.7679, "long": 35.2785, "en": "Hatzeva"},
-    "חצור": {"lat": 31.773, "long": 34.7199, "en": "Hatzor"},
-    "חצור הגלילית": {"lat": 32.9804, "long": 35.5435, "en": "Hatzor HaGlilit"},
-    "חצרים": {"lat": 31.2406, "long": 34.7174, "en": "Hatzerim"},
-    "חרב לאת": {"lat": 32.4035, "long": 34.9171, "en": "Herev Le'Et"},
-    "חרוצים": {"lat": 32.2277, "long": 34.8648, "en": "Harutzim"},
-    "חרות": {"lat": 32.241, "long": 34.9141, "en": "Herut"},
-    "חריש": {"lat": 32.4619, "long": 35.0456, "en": "Harish"},
-    "חרמש": {"lat": 32.4237, "long": 35.119, "en": "Hermesh"},
-    "חרשה": {"lat": 31.9444, "long": 35.148, "en": "Horasha"},
-    "חרשים": {"lat": 32.9577, "long": 35.3282, "en": "Harashim"},
-    "חשמונאים": {"lat": 31.9326, "long": 35.0233, "en": "Hashmonaim"},
-    "טבחה": {"lat": 32.8715, "long": 35.547, "en": "Tabgha"},
-    "טבריה": {"lat": 32.7959, "long": 35.531, "en": "Tiberias"},
-    "טובא זנגריה": {"lat": 32.9662, "long": 35.592, "en": "Tuba-Zangariyye"},
-    "טורעאן": {"lat": 32.7751, "long": 35.3783, "en": "Turan"},
-    "טייבה": {"lat": 32.2669, "long": 35.0097, "en": "Tayibe"},
-    "טייבה בגלבוע": {"lat": 32.6047, "long": 35.4446, "en": "Taibe (Gilboa)"},
-    "טירה": {"lat": 32.234394, "long": 34.951488, "en": "Tira"},
-    "טירת יהודה": {"lat": 32.0148, "long": 34.9359, "en": "Tirat Yehuda"},
-    "טירת כרמל": {"lat": 32.7621, "long": 34.973, "en": "Tirat Carmel"},
-    "טירת צבי": {"lat": 32.4225, "long": 35.5283, "en": "Tirat Zvi"},
-    "טל - אל": {"lat": 32.9262, "long": 35.1785, "en": "Tal-El"},
-    "טל מנשה": {"lat": 32.4831, "long": 35.1607, "en": "Tal Menashe"},
-    "טל שחר": {"lat": 31.8044, "long": 34.9033, "en": "Tal Shachar"},
-    "טללים": {"lat": 30.9915, "long": 34.7713, "en": "Tlalim"},
-    "טלמון": {"lat": 31.9395, "long": 35.1331, "en": "Talmon"},
-    "טמרה": {"lat": 32.8522, "long": 35.2013, "en": "Tamra"},
-    "טמרה בגלבוע": {"lat": 32.6349, "long": 35.4027, "en": "Tamra (Gilboa)"},
-    "טנא עומרים": {"lat": 31.3761, "long": 34.9574, "en": "Teneh Omarim"},
-    "טפחות": {"lat": 32.8686, "long": 35.4222, "en": "Tefahot"},
-    "יבול": {"lat": 31.1895, "long": 34.319, "en": "Yevul"},
-    "יבנאל": {"lat": 32.7088, "long": 35.5038, "en": "Yavne'el"},
-    "יבנה": {"lat": 31.878, "long": 34.7394, "en": "Yavne"},
-    "יגור": {"lat": 32.7415, "long": 35.0768, "en": "Yagur"},
-    "יגל": {"lat": 31.9878, "long": 34.8803, "en": "Yagel"},
-    "יד בנימין": {"lat": 31.7967, "long": 34.8204, "en": "Yad Binyamin"},
-    "יד השמונה": {"lat": 31.8095, "long": 35.0896, "en": "Yad HaShmona"},
-    "יד חנה": {"lat": 32.3253, "long": 35.0067, "en": "Yad Hana"},
-    "יד מרדכי": {"lat": 31.587, "long": 34.5575, "en": "Yad Mordechai"},
-    "יד נתן": {"lat": 31.653, "long": 34.7049, "en": "Yad Natan"},
-    "יד רמב''ם": {"lat": 31.899841, "long": 34.900086, "en": "Yad Rambam"},
-    "יהוד מונוסון": {"lat": 32.0325, "long": 34.8872, "en": "Yehud - Monoson"},
-    "יהל": {"lat": 30.0842, "long": 35.1284, "en": "Yahel"},
-    "יובלים": {"lat": 32.8782, "long": 35.2693, "en": "Yuvalim"},
-    "יודפת": {"lat": 32.8366, "long": 35.2715, "en": "Yodfat"},
-    "יונתן": {"lat": 32.9397, "long": 35.7955, "en": "Yonatan"},
-    "יושיביה": {"lat": 31.4447, "long": 34.6088, "en": "Yoshivia"},
-    "יזרעאל": {"lat": 32.5626, "long": 35.3194, "en": "Yizre'el"},
-    "יחיעם": {"lat": 32.9961, "long": 35.2211, "en": "Yechiam"},
-    "יטבתה": {"lat": 29.8963, "long": 35.0592, "en": "Yotvata"},
-    "ייט''ב": {"lat": 31.947215, "long": 35.422375, "en": "Yitav"},
-    "יכיני": {"lat": 31.4822, "long": 34.5986, "en": "Yakhini"},
-    "ינוב": {"lat": 32.3074, "long": 34.9514, "en": "Yanuv"},
-    "ינוח ג'ת": {"lat": 32.9805, "long": 35.2552, "en": "Yanuh-Jat"},
-    "ינון": {"lat": 31.7418, "long": 34.7809, "en": "Yinon"},
-    "יסוד המעלה": {"lat": 33.0536, "long": 35.589, "en": "Yesud Hama'ala"},
-    "יסודות": {"lat": 31.8158, "long": 34.8656, "en": "Yesodot"},
-    "יסעור": {"lat": 32.9011, "long": 35.1666, "en": "Yasur"},
-    "יעד": {"lat": 32.8812, "long": 35.2406, "en": "Ya'ad"},
-    "יעף": {"lat": 32.2683, "long": 34.9674, "en": "Ya'af"},
-    "יערה": {"lat": 33.068, "long": 35.1861, "en": "Ya'ara"},
-    "יערות הכרמל": {"lat": 32.7073, "long": 35.0107, "en": "Yearot HaCarmel"},
-    "יפיע": {"lat": 32.695, "long": 35.282, "en": "Yafia"},
-    "יפית": {"lat": 32.0627, "long": 35.4743, "en": "Yafit"},
-    "יפעת": {"lat": 32.6759, "long": 35.224, "en": "Ifat"},
-    "יפתח": {"lat": 33.1283, "long": 35.552, "en": "Iftach"},
-    "יצהר": {"lat": 32.1685, "long": 35.2359, "en": "Itzhar"},
-    "יציץ": {"lat": 31.8632, "long": 34.8619, "en": "Yatzitz"},
-    "יקום": {"lat": 32.2492, "long": 34.8419, "en": "Yakum"},
-    "יקיר": {"lat": 32.1498, "long": 35.1146, "en": "Yakir"},
-    "יקנעם המושבה והזורע": {
-        "lat": 32.6559,
-        "long": 35.1152,
-        "en": "Yokneam Moshava and HaZoreah",
-    },
-    "יקנעם עילית": {"lat": 32.6602, "long": 35.1046, "en": "Yokneam Illit"},
-    "יראון": {"lat": 33.0772, "long": 35.4543, "en": "Yir'on"},
-    "ירדנה": {"lat": 32.5654, "long": 35.566, "en": "Yardena"},
-    "ירוחם": {"lat": 30.9878, "long": 34.9297, "en": "Yeruham"},
-    "ירושלים - אזור תעשייה עטרות": {
-        "lat": 31.8606,
-        "long": 35.2167,
-        "en": "Jerusalem - Atarot Industrial Zone",
-    },
-    "ירושלים - דרום": {"lat": 31.7377, "long": 35.1847, "en": "Jerusalem - South"},
-    "ירושלים - כפר עקב": {
-        "lat": 31.8749,
-        "long": 35.2175,
-        "en": "Jerusalem - Qafr 'Aqab",
-    },
-    "ירושלים - מזרח": {"lat": 31.7627, "long": 35.2403, "en": "Jerusalem - East"},
-    "ירושלים - מערב": {"lat": 31.7742, "long": 35.1727, "en": "Jerusalem - West"},
-    "ירושלים - מרכז": {"lat": 31.7781, "long": 35.2164, "en": "Jerusalem - Center"},
-    "ירושלים - צפון": {"lat": 31.8211, "long": 35.2389, "en": "Jerusalem - North"},
-    "ירחיב": {"lat": 32.1515, "long": 34.968, "en": "Yafhiv"},
-    "ירכא": {"lat": 32.9535, "long": 35.212, "en": "Yarka"},
-    "ירקונה": {"lat": 32.1445, "long": 34.8979, "en": "Yarkona"},
-    "ישובי אומן": {"lat": 32.5655, "long": 35.2384, "en": "Omen Settlements"},
-    "ישובי יעל": {"lat": 32.5521, "long": 35.3065, "en": "Yael Settlements"},
-    "ישעי": {"lat": 31.753, "long": 34.9626, "en": "Yish'i"},
-    "ישרש": {"lat": 31.9157, "long": 34.8473, "en": "Yashresh"},
-    "יתד": {"lat": 31.207, "long": 34.3261, "en": "Yated"},
-    "כאבול": {"lat": 32.87, "long": 35.2054, "en": "Kabul"},
-    "כאוכב אבו אלהיג'א": {"lat": 32.8319, "long": 35.2487, "en": "Kaukab Abu al-Hija"},
-    "כברי": {"lat": 33.021, "long": 35.147, "en": "Cabri"},
-    "כדורי": {"lat": 32.7062, "long": 35.4063, "en": "Kadoorie"},
-    "כוכב השחר": {"lat": 31.9603, "long": 35.3494, "en": "Kokhav HaShahar"},
-    "כוכב יאיר - צור יגאל": {
-        "lat": 32.2209,
-        "long": 34.9924,
-        "en": "Kokhav Ya'ir - Tzur Yigal",
-    },
-    "כוכב יעקב": {"lat": 31.8803, "long": 35.2459, "en": "Kokhav Ya'akov"},
-    "כוכב מיכאל": {"lat": 31.6315, "long": 34.6678, "en": "Kokhav Michael"},
-    "כורזים ורד הגליל": {
-        "lat": 32.9042,
-        "long": 35.5508,
-        "en": "Korazim Vered HaGalil",
-    },
-    "כושי רמון": {"lat": 30.3066, "long": 35.1346, "en": "Kushi Rimon"},
-    "כחל": {"lat": 32.8905, "long": 35.5116, "en": "Kahal"},
-    "כינרת מושבה": {"lat": 32.7238, "long": 35.5652, "en": "Moshavat Kinneret"},
-    "כינרת קבוצה": {"lat": 32.7142, "long": 35.5627, "en": "Kvutzat Kinneret"},
-    "כיסופים": {"lat": 31.3745, "long": 34.399, "en": "Kissufim"},
-    "כישור": {"lat": 32.9467, "long": 35.2502, "en": "Kishor"},
-    "כל הארץ": {"lat": 31.7781, "long": 35.2164, "en": "Entire country"},
-    "כלא דמון": {"lat": 32.7332, "long": 35.0234, "en": "Damon Priosn"},
-    "כליל": {"lat": 32.9836, "long": 35.1997, "en": "Klil"},
-    "כלנית": {"lat": 32.8753, "long": 35.454, "en": "Kalanit"},
-    "כמהין": {"lat": 30.9103, "long": 34.4307, "en": "Kmehin"},
-    "כמון": {"lat": 32.9125, "long": 35.3555, "en": "Kamon"},
-    "כנות": {"lat": 31.8022, "long": 34.7509, "en": "Kannot"},
-    "כנף": {"lat": 32.8704, "long": 35.6979, "en": "Kanaf"},
-    "כסייפה": {"lat": 31.2347, "long": 35.0681, "en": "Kuseife"},
-    "כסלון": {"lat": 31.7743, "long": 35.0482, "en": "Ksalon"},
-    "כסרא סמיע": {"lat": 32.9714, "long": 35.3116, "en": "Kisra-Sumei"},
-    "כעביה": {"lat": 32.7567, "long": 35.1865, "en": "Ka'abiyye"},
-    "כעביה טבאש": {"lat": 32.7504, "long": 35.184, "en": "Ka'abiyye Tabbash"},
-    "כפר אביב": {"lat": 31.831, "long": 34.7226, "en": "Kfar Aviv"},
-    "כפר אדומים": {"lat": 31.8272, "long": 35.3372, "en": "Kfar Edomim"},
-    "כפר אוריה": {"lat": 31.7934, "long": 34.9448, "en": "Kfar Uriah"},
-    "כפר אחים": {"lat": 31.7459, "long": 34.7559, "en": "Kfar Achim"},
-    "כפר אלדד": {"lat": 31.654, "long": 35.251, "en": "Kfar Eldad"},
-    "כפר ביאליק": {"lat": 32.8214, "long": 35.0877, "en": "Kfar Biyalik"},
-    "כפר ביל''ו": {"lat": 31.870475, "long": 34.826734, "en": "Kfar Bilu"},
-    "כפר בלום": {"lat": 33.1725, "long": 35.6079, "en": "Kfar Blum"},
-    "כפר בן נון": {"lat": 31.8617, "long": 34.9472, "en": "Kfar Bin Nun"},
-    "כפר ברא": {"lat": 32.1309, "long": 34.9701, "en": "Kafr Bara"},
-    "כפר ברוך": {"lat": 32.646, "long": 35.1931, "en": "Kfar Baruch"},
-    "כפר גדעון": {"lat": 32.6446, "long": 35.2893, "en": "Kfar Gidon"},
-    "כפר גלים": {"lat": 32.7662, "long": 34.9595, "en": "Kfar Galim"},
-    "כפר גליקסון": {"lat": 32.5058, "long": 35.0035, "en": "Kfar Glickson"},
-    "כפר גלעדי": {"lat": 33.2421, "long": 35.5741, "en": "Kfar Giladi"},
-    "כפר גמילה מלכישוע": {
-        "lat": 32.4386,
-        "long": 35.4128,
-        "en": "Mlkishua Rehabilitation Village",
-    },
-    "כפר דניאל": {"lat": 31.9335, "long": 34.9323, "en": "Kfar Daniel"},
-    "כפר האורנים": {"lat": 31.9199, "long": 35.0369, "en": "Kfar HaOranim"},
-    "כפר החורש": {"lat": 32.7015, "long": 35.273, "en": "Kfar HaHoresh"},
-    "כפר המכבי": {"lat": 32.7918, "long": 35.1148, "en": "Kfar HaMaccabi"},
-    "כפר הנגיד": {"lat": 31.8871, "long": 34.7487, "en": "Kfar HaNagid"},
-    "כפר הנוער ימין אורד": {
-        "lat": 32.7016,
-        "long": 34.9898,
-        "en": "Yemin Orde Youth Village",
-    },
-    "כפר הנוער קריית יערים": {
-        "lat": 31.8126,
-        "long": 35.1049,
-        "en": "Kiryat Ye'arim Youth Village",
-    },
-    "כפר הנוקדים": {"lat": 31.3048, "long": 35.2696, "en": "Kfar HaNokdim"},
-    "כפר הנשיא": {"lat": 32.9747, "long": 35.6023, "en": "Kfar HaNassi"},
-    "כפר הס": {"lat": 32.2477, "long": 34.9351, "en": "Kfar Hess"},
-    "כפר הרא''ה": {"lat": 32.391037, "long": 34.910917, "en": "Kfar HaRoeh"},
-    "כפר הרי''ף וצומת ראם": {
-        "lat": 31.747,
-        "long": 34.7909,
-        "en": "Kfar HaRif and Re'em Junction",
-    },
-    "כפר ויתקין": {"lat": 32.3805, "long": 34.8753, "en": "Kfar Vitkin"},
-    "כפר ורבורג": {"lat": 31.7187, "long": 34.7287, "en": "Kfar Warburg"},
-    "כפר ורדים": {"lat": 32.9951, "long": 35.2691, "en": "Kfar Vradim"},
-    "כפר זוהרים": {"lat": 31.6226, "long": 34.9257, "en": "Kfar Zoharim"},
-    "כפר זיתים": {"lat": 32.8116, "long": 35.4652, "en": "Kfar Zeitim"},
-    "כפר חב''ד": {"lat": 31.990144, "long": 34.849103, "en": "Kfar Chabad"},
-    "כפר חיטים": {"lat": 32.8, "long": 35.5033, "en": "Kfar Hittim"},
-    "כפר חיים": {"lat": 32.3539, "long": 34.9007, "en": "Kfar Haim"},
-    "כפר חנניה": {"lat": 32.916, "long": 35.4238, "en": "Kfar Hanania"},
-    "כפר חסידים": {"lat": 32.7523, "long": 35.0942, "en": "Kfar Hassidim"},
-    "כפר חרוב": {"lat": 32.7624, "long": 35.6642, "en": "Kfar Haruv"},
-    "כפר טבאש": {"lat": 32.7485, "long": 35.1707, "en": "Kafr Tabbash"},
-    "כפר טרומן": {"lat": 31.9805, "long": 34.9277, "en": "Kfar Truman"},
-    "כפר יאסיף": {"lat": 32.9531, "long": 35.1611, "en": "Kfar Yassif"},
-    "כפר ידידיה": {"lat": 32.3449, "long": 34.899, "en": "Kfar Yedidia"},
-    "כפר יהושע": {"lat": 32.6816, "long": 35.152, "en": "Kfar Yehoshua"},
-    "כפר יובל": {"lat": 33.2466, "long": 35.5964, "en": "Kfar Yuval"},
-    "כפר יונה": {"lat": 32.3177, "long": 34.9336, "en": "Kfar Yona"},
-    "כפר יחזקאל": {"lat": 32.5669, "long": 35.3609, "en": "Kfar Yechezkel"},
-    "כפר יעבץ": {"lat": 32.2739, "long": 34.9655, "en": "Kfar Yavetz"},
-    "כפר כמא": {"lat": 32.7211, "long": 35.4428, "en": "Kfar Kama"},
-    "כפר כנא": {"lat": 32.7482, "long": 35.3438, "en": "Kfar Kana"},
-    "כפר מונש": {"lat": 32.3456, "long": 34.9164, "en": "Kfar Monash"},
-    "כפר מימון ותושיה": {
-        "lat": 31.4324,
-        "long": 34.5384,
-        "en": "Kfar Maimon and Tushia",
-    },
-    "כפר מל''ל": {"lat": 32.167567, "long": 34.894744, "en": "Kafr Misr"},
-    "כפר מנדא": {"lat": 32.8124, "long": 35.2586, "en": "Kfar Manda"},
-    "כפר מנחם": {"lat": 31.7321, "long": 34.8351, "en": "Kfar Menachem"},
-    "כפר מסריק": {"lat": 32.8912, "long": 35.0984, "en": "Kfar Masaryk"},
-    "כפר מצר": {"lat": 32.6453, "long": 35.4221, "en": "Kafr Misr"},
-    "כפר מרדכי": {"lat": 31.8315, "long": 34.7566, "en": "Kfar Mordechai"},
-    "כפר נהר הירדן": {"lat": 32.7683, "long": 35.4356, "en": "Kfar Nehar HaYarden"},
-    "כפר נוער בן שמן": {
-        "lat": 31.9597,
-        "long": 34.9291,
-        "en": "Ben Shemen Youth Village",
-    },
-    "כפר נחום": {"lat": 32.8842, "long": 35.5775, "en": "Kfar Nahum"},
-    "כפר נטר": {"lat": 32.2719, "long": 34.872, "en": "Kfar Netter"},
-    "כפר סאלד": {"lat": 33.196, "long": 35.658, "en": "Kfar Szold"},
-    "כפר סבא": {"lat": 32.1782, "long": 34.9076, "en": "Kfar Saba"},
-    "כפר סילבר": {"lat": 31.673, "long": 34.6121, "en": "Kfar Silver"},
-    "כפר סירקין": {"lat": 32.0767, "long": 34.9228, "en": "Kfar Sirkin"},
-    "כפר עבודה": {"lat": 32.2557, "long": 34.9397, "en": "Kfar Avoda"},
-    "כפר עזה": {"lat": 31.4834, "long": 34.5323, "en": "Kfar Azza"},
-    "כפר עציון": {"lat": 31.6495, "long": 35.1152, "en": "Kfar Etzion"},
-    "כפר פינס": {"lat": 32.4827, "long": 35.0021, "en": "Kfar Pinnes"},
-    "כפר קאסם": {"lat": 32.1141, "long": 34.9728, "en": "Kfar Kassem"},
-    "כפר קיש": {"lat": 32.6661, "long": 35.449, "en": "Kfar Kish"},
-    "כפר קרע": {"lat": 32.5055, "long": 35.0543, "en": "Kfar Kara"},
-    "כפר רופין": {"lat": 32.4576, "long": 35.5557, "en": "Kfar Ruppin"},
-    "כפר רות": {"lat": 31.9104, "long": 35.0353, "en": "Kfar Rut"},
-    "כפר שמאי": {"lat": 32.9557, "long": 35.4579, "en": "Kfar Shamai"},
-    "כפר שמואל": {"lat": 31.8883, "long": 34.9348, "en": "Kfar Shmuel"},
-    "כפר שמריהו": {"lat": 32.1871, "long": 34.8231, "en": "Kfar Shmaryahu"},
-    "כפר תבור": {"lat": 32.6873, "long": 35.42, "en": "Kfar Tavor"},
-    "כפר תפוח": {"lat": 32.118, "long": 35.2498, "en": "Kfar Tapuach"},
-    "כפר תקווה": {"lat": 32.7013, "long": 35.115, "en": "Kfar Tikva"},
-    "כרכום": {"lat": 32.9283, "long": 35.6063, "en": "Karkom"},
-    "כרם ביבנה": {"lat": 31.817, "long": 34.7236, "en": "Kerem BeYavne"},
-    "כרם בן זמרה": {"lat": 33.0392, "long": 35.4699, "en": "Kerem Ben Zimra"},
-    "כרם מהר''ל": {"lat": 32.644325, "long": 34.99145, "en": "Kerem Maharal"},
-    "כרם רעים": {"lat": 31.9583, "long": 35.138, "en": "Kerem Reim"},
-    "כרם שלום": {"lat": 31.2283, "long": 34.2846, "en": "Kerem Shalom"},
-    "כרמי יוסף": {"lat": 31.848, "long": 34.9213, "en": "Karmei Yossef"},
-    "כרמי צור": {"lat": 31.6095, "long": 35.1013, "en": "Karmei Tzur"},
-    "כרמי קטיף": {"lat": 31.5378, "long": 34.912, "en": "Karmei Katif"},
-    "כרמיאל": {"lat": 32.9147, "long": 35.2924, "en": "Karmiel"},
-    "כרמיה": {"lat": 31.6027, "long": 34.5404, "en": "Karmia"},
-    "כרמים": {"lat": 31.3337, "long": 34.9179, "en": "Kramim"},
-    "כרמית": {"lat": 31.3322, "long": 34.8968, "en": "Carmit"},
-    "כרמל": {"lat": 31.4318, "long": 35.1828, "en": "Carmel"},
-    "לב החולה": {"lat": 33.1103, "long": 35.5819, "en": "Lev Ha-Hula"},
-    "לבון": {"lat": 32.9412, "long": 35.2865, "en": "Lavon"},
-    "לביא": {"lat": 32.7876, "long": 35.4407, "en": "Lavi"},
-    "לבנים": {"lat": 32.8638, "long": 35.4975, "en": "Livnim"},
-    "להב": {"lat": 31.3794, "long": 34.8713, "en": "Lahav"},
-    "להבות הבשן": {"lat": 33.1412, "long": 35.6479, "en": "Lehavot HaBashan"},
-    "להבות חביבה": {"lat": 32.3952, "long": 35.0118, "en": "Lehavot Haviva"},
-    "להבים": {"lat": 31.3738, "long": 34.817, "en": "Lehavim"},
-    "לוד": {"lat": 31.951, "long": 34.8881, "en": "Lod"},
-    "לוזית": {"lat": 31.6882, "long": 34.8882, "en": "Luzit"},
-    "לוחמי הגטאות": {"lat": 32.9627, "long": 35.0967, "en": "Lochamei HaGetaot"},
-    "לוטם וחמדון": {"lat": 32.8809, "long": 35.36, "en": "Lotem and Hamdon"},
-    "לוטן": {"lat": 29.9883, "long": 35.0868, "en": "Lotan"},
-    "לטרון": {"lat": 31.8369, "long": 34.9772, "en": "Latrun"},
-    "לימן": {"lat": 33.0587, "long": 35.1118, "en": "Lehman"},
-    "לכיש": {"lat": 31.5609, "long": 34.8441, "en": "Lakhish"},
-    "לפיד": {"lat": 31.917, "long": 35.0318, "en": "Lapid"},
-    "לפידות": {"lat": 32.9598, "long": 35.261, "en": "Lapidot"},
-    "לקיה": {"lat": 31.3249, "long": 34.8662, "en": "Laqiya"},
-    "מאור": {"lat": 32.4258, "long": 35.0053, "en": "Maor"},
-    "מאיר שפיה": {"lat": 32.5912, "long": 34.9711, "en": "Meir Shfeya"},
-    "מבוא ביתר": {"lat": 31.7226, "long": 35.1067, "en": "Mevo Beitar"},
-    "מבוא דותן": {"lat": 32.4208, "long": 35.1739, "en": "Mevo Dotan"},
-    "מבוא חורון": {"lat": 31.8496, "long": 35.035, "en": "Mevo Horon"},
-    "מבוא חמה": {"lat": 32.7367, "long": 35.6552, "en": "Mevo Hama"},
-    "מבוא מודיעים": {"lat": 31.9339, "long": 34.988, "en": "Mevo Modi'im"},
-    "מבואות יריחו": {"lat": 31.9074, "long": 35.4156, "en": "Mevuot Yericho"},
-    "מבועים": {"lat": 31.4494, "long": 34.655, "en": "Mabu'im"},
-    "מבטחים, עמיעוז, ישע": {
-        "lat": 31.2426,
-        "long": 34.4065,
-        "en": "Mivtahim, Ami'oz, Yesha",
-    },
-    "מבקיעים": {"lat": 31.6225, "long": 34.5774, "en": "Mavki'im"},
-    "מבשרת ציון": {"lat": 31.8041, "long": 35.1579, "en": "Mevasseret Zion"},
-    "מג'דל כרום": {"lat": 32.9201, "long": 35.2566, "en": "Majd al-Krum"},
-    "מג'דל שמס": {"lat": 33.2691, "long": 35.7721, "en": "Majdal Shams"},
-    "מגדים": {"lat": 32.7277, "long": 34.9609, "en": "Megadim"},
-    "מגדל": {"lat": 32.8395, "long": 35.4998, "en": "Migdal"},
-    "מגדל העמק": {"lat": 32.6778, "long": 35.2417, "en": "Migdal HaEmek"},
-    "מגדל עוז": {"lat": 31.6409, "long": 35.1431, "en": "Migdal Oz"},
-    "מגדל תפן": {"lat": 32.9767, "long": 35.278, "en": "Migdal Tefen"},
-    "מגדלים": {"lat": 32.0899, "long": 35.3426, "en": "Megadlim"},
-    "מגל": {"lat": 32.3856, "long": 35.0361, "en": "Magal"},
-    "מגן": {"lat": 31.2987362, "long": 34.4269827, "en": "Magen"},
-    "מגן שאול": {"lat": 32.5215, "long": 35.3064, "en": "Magen Shaul"},
-    "מגרון": {"lat": 31.874167, "long": 35.259588, "en": "Migron"},
-    "מגשימים": {"lat": 32.0444, "long": 34.8998, "en": "Magshimim"},
-    "מדרך עוז": {"lat": 32.5946, "long": 35.158, "en": "Midrach Oz"},
-    "מדרשת בן גוריון": {"lat": 30.8523, "long": 34.7834, "en": "Ben Gurion College"},
-    "מודיעין - ישפרו סנטר": {
-        "lat": 31.8898056,
-        "long": 34.9649992,
-        "en": "Modi'in - Ishpro Center",
-    },
-    "מודיעין - ליגד סנטר": {
-        "lat": 31.9211897,
-        "long": 34.9701743,
-        "en": "Modi'in - Ligad Center",
-    },
-    "מודיעין מכבים רעות": {
-        "lat": 31.8903,
-        "long": 35.0104,
-        "en": "Modi'in Maccabim Re'ut",
-    },
-    "מודיעין עילית": {"lat": 31.9325, "long": 35.0423, "en": "Modi'in Illit"},
-    "מולדת": {"lat": 32.5862, "long": 35.4389, "en": "Moledet"},
-    "מועאוויה": {"lat": 32.5319, "long": 35.1029, "en": "Mu'awiya"},
-    "מוצא עילית": {"lat": 31.7936, "long": 35.157, "en": "Motza Illit"},
-    "מוקיבלה": {"lat": 32.5151, "long": 35.2948, "en": "Muqeible"},
-    "מורן": {"lat": 32.9216, "long": 35.3948, "en": "Moran"},
-    "מורשת": {"lat": 32.8261, "long": 35.232, "en": "Moreshet"},
-    "מזור": {"lat": 32.0507, "long": 34.9314, "en": "Mazor"},
-    "מזכרת בתיה": {"lat": 31.8532, "long": 34.8424, "en": "Mazkeret Batya"},
-    "מזרע": {"lat": 32.6499, "long": 35.2864, "en": "Mizra"},
-    "מזרעה": {"lat": 32.9837, "long": 35.0989, "en": "Mazra'a"},
-    "מחולה": {"lat": 32.3653, "long": 35.516, "en": "Mehola"},
-    "מחניים": {"lat": 32.9888, "long": 35.5704, "en": "Machanaim"},
-    "מחסיה": {"lat": 31.7489, "long": 35.0073, "en": "Mahsiya"},
-    "מטווח ניר עם": {"lat": 31.5128, "long": 34.5543, "en": "Nir Am Shooting Range"},
-    "מטולה": {"lat": 33.2772, "long": 35.5782, "en": "Metulla"},
-    "מטע": {"lat": 31.7165, "long": 35.0606, "en": "Mata"},
-    "מי עמי": {"lat": 32.505, "long": 35.1464, "en": "Mei Ami"},
-    "מייסר": {"lat": 32.4452, "long": 35.0421, "en": "Meiser"},
-    "מיני ישראל - נחשון": {
-        "lat": 31.8425,
-        "long": 34.9685,
-        "en": "Mini Israel - Nachshon",
-    },
-    "מיצד": {"lat": 31.5862, "long": 35.1876, "en": "Metzad"},
-    "מיצר": {"lat": 32.7686, "long": 35.7364, "en": "Metzar"},
-    "מירב": {"lat": 32.452, "long": 35.4225, "en": "Merav"},
-    "מירון": {"lat": 32.9852, "long": 35.4416, "en": "Meron"},
-    "מישר": {"lat": 31.8159, "long": 34.7526, "en": "Meishar"},
-    "מיתר": {"lat": 31.327, "long": 34.9432, "en": "Meitar"},
-    "מכון וינגייט": {"lat": 32.263, "long": 34.837, "en": "Wingate Institute"},
-    "מכורה": {"lat": 32.1642, "long": 35.4236, "en": "Mekhora"},
-    "מכמורת": {"lat": 32.4065, "long": 34.8716, "en": "Mikhmoret"},
-    "מכמנים": {"lat": 32.9075, "long": 35.3287, "en": "Mikhmanim"},
-    "מלון אחוזת ירדן": {
-        "lat": 33.0452,
-        "long": 35.5735,
-        "en": "Yarden Estate Boutique Hotel",
-    },
-    "מלון סיקס סנסס שחרות": {
-        "lat": 29.9165,
-        "long": 35.0028,
-        "en": "Six Senses Shaharut Hotel",
-    },
-    "מלון פרא": {"lat": 33.0122, "long": 35.6514, "en": "Pereh Hotel"},
-    "מלונות ים המלח מרכז": {
-        "lat": 31.1803,
-        "long": 35.3645,
-        "en": "Dead Sea Hotels - Center",
-    },
-    "מלכיה": {"lat": 33.0986, "long": 35.5096, "en": "Malkia"},
-    "ממשית": {"lat": 31.0345, "long": 35.0478, "en": "Mamshit"},
-    "מנוחה": {"lat": 31.6562, "long": 34.7773, "en": "Menucha"},
-    "מנוף": {"lat": 32.8533, "long": 35.2374, "en": "Manof"},
-    "מנות": {"lat": 33.0387, "long": 35.1952, "en": "Manot"},
-    "מנחמיה": {"lat": 32.6643, "long": 35.5553, "en": "Menahemia"},
-    "מנחת מחניים": {"lat": 32.9781, "long": 35.572, "en": "Machanaim landing pad"},
-    "מנרה": {"lat": 33.1954, "long": 35.5437, "en": "Manara"},
-    "מנשית זבדה": {"lat": 32.7062, "long": 35.1924, "en": "Manshiya Zabda"},
-    "מסד": {"lat": 32.8442, "long": 35.4232, "en": "Massad"},
-    "מסדה": {"lat": 32.6823, "long": 35.5977, "en": "Masada"},
-    "מסילות": {"lat": 32.4974, "long": 35.4747, "en": "Messilot"},
-    "מסילת ציון": {"lat": 31.8014, "long": 35.0095, "en": "Mesillat Zion"},
-    "מסלול": {"lat": 31.3253422, "long": 34.5885811, "en": "Maslul"},
-    "מסעדה": {"lat": 33.2321, "long": 35.7556, "en": "Mas'ade"},
-    "מע'אר": {"lat": 32.8907, "long": 35.4046, "en": "Maghar"},
-    "מעברות": {"lat": 32.3642, "long": 34.9057, "en": "Ma'abarot"},
-    "מעגלים, גבעולים, מלילות": {
-        "lat": 31.392,
-        "long": 34.5943,
-        "en": "Ma'galim, Giv'olim, M'lilot",
-    },
-    "מעגן": {"lat": 32.7063, "long": 35.6006, "en": "Ma'agan"},
-    "מעגן מיכאל": {"lat": 32.5587, "long": 34.9178, "en": "Ma'agan Michael"},
-    "מעוז חיים": {"lat": 32.4941, "long": 35.5508, "en": "Maoz Haim"},
-    "מעון": {"lat": 31.4146, "long": 35.1639, "en": "Ma'on"},
-    "מעון צופיה": {"lat": 31.8557, "long": 34.7379, "en": "Maon Tzofia"},
-    "מעונה": {"lat": 33.0169, "long": 35.2636, "en": "Maona"},
-    "מעיין ברוך": {"lat": 33.2393, "long": 35.6094, "en": "Ma'ayan Baruch"},
-    "מעיין צבי": {"lat": 32.5685, "long": 34.9406, "en": "Ma'ayan Zvi"},
-    "מעיליא": {"lat": 33.0272, "long": 35.2563, "en": "Mi'ilya"},
-    "מעלה אדומים": {"lat": 31.7774, "long": 35.298, "en": "Ma'aleh Edomim"},
-    "מעלה אפרים": {"lat": 32.0713, "long": 35.4039, "en": "Ma'aleh Ephraim"},
-    "מעלה גלבוע": {"lat": 32.4761, "long": 35.4206, "en": "Ma'aleh Gilboa"},
-    "מעלה גמלא": {"lat": 32.8883, "long": 35.686, "en": "Ma'aleh Gamla"},
-    "מעלה החמישה": {"lat": 31.8174, "long": 35.1094, "en": "Ma'aleh HaHamisha"},
-    "מעלה חבר": {"lat": 31.4871, "long": 35.1651, "en": "Ma'ale Hever"},
-    "מעלה לבונה": {"lat": 32.0544, "long": 35.2395, "en": "Ma'aleh Levona"},
-    "מעלה מכמש": {"lat": 31.8791, "long": 35.3059, "en": "Ma'aleh Michmash"},
-    "מעלה עירון": {"lat": 32.5541, "long": 35.1825, "en": "Ma'aleh Iron"},
-    "מעלה עמוס": {"lat": 31.5969, "long": 35.2294, "en": "Ma'aleh Amos"},
-    "מעלה צביה": {"lat": 32.8894, "long": 35.3314, "en": "Ma'aleh Zvia"},
-    "מעלה רחבעם": {"lat": 31.6494, "long": 35.2589, "en": "Ma'ale Rekhav'am"},
-    "מעלות תרשיחא": {"lat": 33.015, "long": 35.276, "en": "Ma'a lot Tarshicha"},
-    "מענית": {"lat": 32.458, "long": 35.0266, "en": "Ma'anit"},
-    "מעש": {"lat": 32.0635, "long": 34.8926, "en": "Maas"},
-    "מפלסים": {"lat": 31.5022, "long": 34.5617, "en": "Mefalsim"},
-    "מפעל אגריגדה": {"lat": 31.8141, "long": 34.8252, "en": "Agrigada Factory"},
-    "מצדה": {"lat": 31.3114, "long": 35.3627, "en": "Massada"},
-    "מצובה": {"lat": 33.0623, "long": 35.1557, "en": "Metzuba"},
-    "מצוק עורבים": {"lat": 33.1307, "long": 35.6818, "en": "Matzok Orvim"},
-    "מצוקי דרגות": {"lat": 31.591, "long": 35.3933, "en": "Metzokei Dragot"},
-    "מצליח": {"lat": 31.9064, "long": 34.8713, "en": "Matzliach"},
-    "מצפה": {"lat": 32.79, "long": 35.5079, "en": "Mitzpeh"},
-    "מצפה אבי''ב": {"lat": 32.837951, "long": 35.201059, "en": "Mitzpeh Aviv"},
-    "מצפה אילן": {"lat": 32.4614, "long": 35.0689, "en": "Mitzpeh Ilan"},
-    "מצפה יריחו": {"lat": 31.8157, "long": 35.3954, "en": "Mitzpeh Yericho"},
-    "מצפה נטופה": {"lat": 32.8017, "long": 35.3835, "en": "Mitzpeh Netofa"},
-    "מצפה רמון": {"lat": 30.6102, "long": 34.8019, "en": "Mitzpeh Ramon"},
-    "מצפה שלם": {"lat": 31.5689, "long": 35.4004, "en": "Mitzpeh Shalem"},
-    "מצר": {"lat": 32.4402, "long": 35.0477, "en": "Metzer"},
-    "מקווה ישראל": {"lat": 32.03, "long": 34.7829, "en": "Mikveh Israel"},
-    "מרגליות": {"lat": 33.2165, "long": 35.5444, "en": "Margaliot"},
-    "מרום גולן": {"lat": 33.1326, "long": 35.7771, "en": "Merom Golan"},
-    "מרחב עם": {"lat": 30.888, "long": 34.8282, "en": "Merhav Am"},
-    "מרחביה מושב": {"lat": 32.6048, "long": 35.316, "en": "Merhavia Moshav"},
-    "מרחביה קיבוץ": {"lat": 32.6059, "long": 35.3073, "en": "Merhavia Kibbutz"},
-    "מרחצאות עין גדי": {"lat": 31.4173, "long": 35.3785, "en": "Ein Gedi Baths"},
-    "מרכז אזורי דרום השרון": {
-        "lat": 32.1336,
-        "long": 34.912,
-        "en": "Southern Sharon Regional Center",
-    },
-    "מרכז אזורי מבואות חרמון": {
-        "lat": 33.1209,
-        "long": 35.5699,
-        "en": "Mevuot Hermon Regional Council",
-    },
-    "מרכז אזורי מגילות": {
-        "lat": 31.7738,
-        "long": 35.5038,
-        "en": "Megilot Regional Center",
-    },
-    "מרכז אזורי מרום גליל": {
-        "lat": 32.998,
-        "long": 35.4415,
-        "en": "Marom HaGalil Regional Center",
-    },
-    "מרכז אזורי משגב": {
-        "lat": 32.8588,
-        "long": 35.2598,
-        "en": "Misgav Regional Center",
-    },
-    "מרכז חבר": {"lat": 32.5483, "long": 35.2661, "en": "Merkaz Hever"},
-    "מרכז ימי קיסריה": {
-        "lat": 32.5017,
-        "long": 34.8925,
-        "en": "Caesarea Marine Center",
-    },
-    "מרכז מיר''ב": {"lat": 32.64726, "long": 34.964089, "en": "Merav Center"},
-    "מרכז שפירא": {"lat": 31.6969, "long": 34.7073, "en": "Merkaz Shapira"},
-    "מרעית": {"lat": 31.2812, "long": 35.0534, "en": "Mar'it"},
-    "משאבי שדה": {"lat": 31.004, "long": 34.785, "en": "Mashabei Sadeh"},
-    "משגב דב": {"lat": 31.8191, "long": 34.7392, "en": "Misgav Dov"},
-    "משגב עם": {"lat": 33.2476, "long": 35.5485, "en": "Misgav Am"},
-    "משהד": {"lat": 32.7389, "long": 35.3225, "en": "Mashhad"},
-    "משואה": {"lat": 32.1124, "long": 35.4914, "en": "Masua"},
-    "משואות יצחק": {"lat": 31.7026, "long": 34.69, "en": "Masuot Itzhak"},
-    "משכיות": {"lat": 32.3179, "long": 35.5028, "en": "Maskiot"},
-    "משמר איילון": {"lat": 31.8725, "long": 34.9433, "en": "Mishmar Ayalon"},
-    "משמר דוד": {"lat": 31.8236, "long": 34.9007, "en": "Mishmar David"},
-    "משמר הירדן": {"lat": 33.0035, "long": 35.5983, "en": "Mishmar HaYarden"},
-    "משמר הנגב": {"lat": 31.3648, "long": 34.718, "en": "Mishmar HaNegev"},
-    "משמר העמק": {"lat": 32.6101, "long": 35.1427, "en": "Mishmar HaEmek"},
-    "משמר השבעה": {"lat": 32.0109, "long": 34.8223, "en": "Mishmar HaShiva"},
-    "משמר השרון": {"lat": 32.3563, "long": 34.9043, "en": "Mishmar HaSharon"},
-    "משמרות": {"lat": 32.4865, "long": 34.9839, "en": "Mishmarot"},
-    "משמרת": {"lat": 32.2276, "long": 34.9221, "en": "Mishmeret"},
-    "משען": {"lat": 31.6569, "long": 34.6216, "en": "Mishan"},
-    'מתחם "חנה וסע" שפיים': {
-        "lat": 32.2132,
-        "long": 34.8344,
-        "en": 'Shfayim "Haneh Ve\'sa" Compound',
-    },
-    "מתחם בני דרום": {"lat": 31.8233, "long": 34.6994, "en": "Bnei Darom Compound"},
-    "מתחם סקי גלבוע": {"lat": 32.5528, "long": 35.3352, "en": "Gilboa Ski Resort"},
-    "מתחם פי גלילות": {"lat": 32.1384, "long": 34.8045, "en": "Gelilot - Pi Compound"},
-    "מתחם צומת שוקת": {"lat": 31.3095, "long": 34.8982, "en": "Shoket Junction Center"},
-    "מתחם שביל התפוזים": {
-        "lat": 32.4597,
-        "long": 34.9407,
-        "en": "Shvil HaTapuzim Compound",
-    },
-    "מתן": {"lat": 32.1594, "long": 34.9732, "en": "Matan"},
-    "מתת": {"lat": 33.0417, "long": 35.3567, "en": "Matat"},
-    "מתתיהו": {"lat": 31.9297, "long": 35.035, "en": "Matityahu"},
-    "נאות גולן": {"lat": 32.787, "long": 35.6932, "en": "Neot Golan"},
-    "נאות הכיכר": {"lat": 30.9334, "long": 35.3781, "en": "Neot HaKikar"},
-    "נאות מרדכי": {"lat": 33.1598, "long": 35.5956, "en": "Neot Mordechai"},
-    "נאות סמדר": {"lat": 30.0491, "long": 35.0281, "en": "Neot Smadar"},
-    "נאות קדומים": {"lat": 31.9479, "long": 34.9728, "en": "Neot Kedumim"},
-    "נאעורה": {"lat": 32.6079, "long": 35.3902, "en": "Na'ura"},
-    "נבטים": {"lat": 31.2198, "long": 34.8825, "en": "Nevatim"},
-    "נבי סמואל": {"lat": 31.8329, "long": 35.1811, "en": "Nebi Samuel"},
-    "נבי שועייב": {"lat": 32.8058, "long": 35.4522, "en": "Nabi Shu'ayb"},
-    "נגבה": {"lat": 31.6625, "long": 34.6796, "en": "Negba"},
-    "נגוהות": {"lat": 31.4931, "long": 34.9833, "en": "Negohot"},
-    "נהורה": {"lat": 31.6213, "long": 34.7045, "en": "Nehora"},
-    "נהלל": {"lat": 32.6908, "long": 35.1961, "en": "Nahalal"},
-    "נהריה": {"lat": 33.0085, "long": 35.0981, "en": "Nahariya"},
-    "נוב": {"lat": 32.8329, "long": 35.7836, "en": "Nov"},
-    "נוגה": {"lat": 31.6257, "long": 34.6953, "en": "Noga"},
-    "נוה איתן": {"lat": 32.4917, "long": 35.5322, "en": "Neve Eitan"},
-    "נווה": {"lat": 31.1622, "long": 34.3298, "en": "Naveh"},
-    "נווה אור": {"lat": 32.589, "long": 35.5545, "en": "Neveh Or"},
-    "נווה אטי''ב": {"lat": 33.26202, "long": 35.740574, "en": "Neveh Ativ"},
-    "נווה אילן": {"lat": 31.8076, "long": 35.0809, "en": "Neveh Ilan"},
-    "נווה דניאל": {"lat": 31.6763, "long": 35.1433, "en": "Neveh Daniel"},
-    "נווה זוהר": {"lat": 31.1521, "long": 35.3648, "en": "Neveh Zohar"},
-    "נווה זיו": {"lat": 33.0274, "long": 35.1843, "en": "Neveh Ziv"},
-    "נווה חריף": {"lat": 30.0398, "long": 35.0365, "en": "Neveh Harif"},
-    "נווה ים": {"lat": 32.6798, "long": 34.9319, "en": "Neveh Yam"},
-    "נווה ימין": {"lat": 32.1717, "long": 34.9394, "en": "Neveh Yamin"},
-    "נווה ירק": {"lat": 32.1327, "long": 34.9255, "en": "Neveh Yarak"},
-    "נווה מבטח": {"lat": 31.8068, "long": 34.7412, "en": "Neveh Mivtach"},
-    "נווה מיכאל - רוגלית": {
-        "lat": 31.6728,
-        "long": 35.0037,
-        "en": "Neveh Michael (Rogalit)",
-    },
-    "נווה שלום": {"lat": 31.8174, "long": 34.9783, "en": "Neveh Shalom"},
-    "נועם": {"lat": 31.5686, "long": 34.7882, "en": "Noam"},
-    "נוף איילון": {"lat": 31.8712, "long": 34.9913, "en": "Noff Ayalon"},
-    "נוף הגליל": {"lat": 32.71, "long": 35.3227, "en": "Nof HaGalil"},
-    "נופי נחמיה": {"lat": 32.0982, "long": 35.2359, "en": "Nofei Nehemiah"},
-    "נופי פרת": {"lat": 31.8235, "long": 35.3199, "en": "Nofei Prat"},
-    "נופים": {"lat": 32.1555, "long": 35.0998, "en": "Nofim"},
-    "נופית": {"lat": 32.7634, "long": 35.1483, "en": "Nofit"},
-    "נופך": {"lat": 32.0437, "long": 34.9203, "en": "Nofech"},
-    "נוקדים": {"lat": 31.6458, "long": 35.2504, "en": "Nokdim"},
-    "נורדיה": {"lat": 32.3147, "long": 34.8968, "en": "Nordia"},
-    "נורית": {"lat": 32.5432, "long": 35.3558, "en": "Nurit"},
-    "נחושה": {"lat": 31.6288, "long": 34.9527, "en": "Nehusha"},
-    "נחל עוז": {"lat": 31.4727, "long": 34.4977, "en": "Nachal Oz"},
-    "נחלה": {"lat": 31.66, "long": 34.7928, "en": "Nachla"},
-    "נחליאל": {"lat": 31.9735, "long": 35.1404, "en": "Nachliel"},
-    "נחלים": {"lat": 32.0586, "long": 34.9136, "en": "Nechalim"},
-    "נחם": {"lat": 31.7665, "long": 35.0036, "en": "Naham"},
-    "נחף": {"lat": 32.9347, "long": 35.3165, "en": "Nachaf"},
-    "נחשולים": {"lat": 32.6131, "long": 34.9222, "en": "Nachsholim"},
-    "נחשון": {"lat": 31.8316, "long": 34.956, "en": "Nachshon"},
-    "נחשונים": {"lat": 32.0632, "long": 34.947, "en": "Nachshonim"},
-    "נטועה": {"lat": 33.0654, "long": 35.3234, "en": "Netua"},
-    "נטור": {"lat": 32.8541, "long": 35.7526, "en": "Natur"},
-    "נטע": {"lat": 31.4761, "long": 34.9268, "en": "Neta"},
-    "נטעים": {"lat": 31.9457, "long": 34.7751, "en": "Neta'im"},
-    "נטף": {"lat": 31.8313, "long": 35.0696, "en": "Nataf"},
-    "נילי": {"lat": 31.9623, "long": 35.0458, "en": "Nili"},
-    "נין": {"lat": 32.631, "long": 35.3494, "en": "Nin"},
-    "ניצן": {"lat": 31.7375, "long": 34.6308, "en": "Nitzan"},
-    "ניצנה": {"lat": 30.886, "long": 34.4226, "en": "Nitzana"},
-    "ניצני עוז": {"lat": 32.3061, "long": 35.0033, "en": "Nitzanei Oz"},
-    "ניצנים": {"lat": 31.7178, "long": 34.6346, "en": "Nitzanim"},
-    "ניר אליהו": {"lat": 32.1976, "long": 34.9494, "en": "Nir Eliyahu"},
-    "ניר בנים": {"lat": 31.6712, "long": 34.755, "en": "Nir Banim"},
-    "ניר גלים": {"lat": 31.8255, "long": 34.6825, "en": "Nir Galim"},
-    "ניר דוד": {"lat": 32.5041, "long": 35.4576, "en": "Nir David"},
-    "ניר ח''ן": {"lat": 31.608906, "long": 34.714282, "en": "Nir Chen"},
-    "ניר יצחק": {"lat": 31.236, "long": 34.3567, "en": "Nir Itzhak"},
-    "ניר ישראל": {"lat": 31.6922, "long": 34.6381, "en": "Nir Israel"},
-    "ניר משה": {"lat": 31.4775, "long": 34.6301, "en": "Nir Moshe"},
-    "ניר עוז": {"lat": 31.3097, "long": 34.4021, "en": "Nir Oz"},
-    "ניר עם": {"lat": 31.5184, "long": 34.5805, "en": "Nir Am"},
-    "ניר עציון": {"lat": 32.6991, "long": 34.9925, "en": "Nir Etzion"},
-    "ניר עקיבא": {"lat": 31.4699, "long": 34.6462, "en": "Nir Akiva"},
-    "ניר צבי": {"lat": 31.9544, "long": 34.8615, "en": "Nir Zvi"},
-    "נירים": {"lat": 31.3357, "long": 34.3941, "en": "Nirim"},
-    "נירית": {"lat": 32.1462, "long": 34.9848, "en": "Nirit"},
-    "נמרוד": {"lat": 33.2453, "long": 35.7516, "en": "Nimrod"},
-    "נס הרים": {"lat": 31.7442, "long": 35.0594, "en": "Ness Harim"},
-    "נס עמים": {"lat": 32.9655, "long": 35.1216, "en": "Ness Amim"},
-    "נס ציונה": {"lat": 31.9321, "long": 34.8013, "en": "Ness Ziona"},
-    "נעורים": {"lat": 32.3713, "long": 34.8614, "en": "Neurim"},
-    "נעלה": {"lat": 31.9626, "long": 35.066, "en": "Na'aleh"},
-    "נעמה": {"lat": 31.9076, "long": 35.4662, "en": "Na'ama"},
-    "נען": {"lat": 31.8832, "long": 34.8592, "en": "Na'an"},
-    "נערן": {"lat": 31.9682, "long": 35.4539, "en": "Niran"},
-    "נצר חזני": {"lat": 31.8214, "long": 34.8626, "en": "Netzer Hazani"},
-    "נצר סרני": {"lat": 31.9228, "long": 34.8212, "en": "Netzer Sireni"},
-    "נצרת": {"lat": 32.6996, "long": 35.3035, "en": "Nazareth"},
-    "נריה": {"lat": 31.954293, "long": 35.127604, "en": "Neria"},
-    "נשר": {"lat": 32.7649, "long": 35.0492, "en": "Nesher"},
-    "נתיב הגדוד": {"lat": 31.9894, "long": 35.4433, "en": "Netiv HaGdud"},
-    "נתיב הל''ה": {"lat": 31.687184, "long": 34.982523, "en": "Netiv HaLamed-Heh"},
-    "נתיב העשרה": {"lat": 31.5724, "long": 34.5393, "en": "Netiv HaAssara"},
-    "נתיב השיירה": {"lat": 32.9912, "long": 35.1307, "en": "Netiv HaShayara"},
-    "נתיבות": {"lat": 31.4232, "long": 34.5953, "en": "Netivot"},
-    "נתניה - מזרח": {"lat": 32.3001, "long": 34.8727, "en": "Netanya - East"},
-    "נתניה - מערב": {"lat": 32.3095, "long": 34.8542, "en": "Netanya - West"},
-    "סאג'ור": {"lat": 32.9431, "long": 35.3436, "en": "Sajur"},
-    "סאסא": {"lat": 33.0287, "long": 35.3946, "en": "Sassa"},
-    "סביון": {"lat": 32.0456, "long": 34.8766, "en": "Savyon"},
-    "סגולה": {"lat": 31.6695, "long": 34.7784, "en": "Sgula"},
-    "סואעד חמירה": {"lat": 32.7669, "long": 35.1682, "en": "Sawad Humeria"},
-    "סולם": {"lat": 32.6056, "long": 35.3343, "en": "Sulam"},
-    "סוסיא": {"lat": 31.3866, "long": 35.1204, "en": "Susya"},
-    "סופה": {"lat": 31.2383, "long": 34.342, "en": "Sufa"},
-    "סינמה סיטי גלילות": {"lat": 32.1473, "long": 34.8063, "en": "Cinema City Glilot"},
-    "סכנין": {"lat": 32.8642, "long": 35.2945, "en": "Sakhnin"},
-    "סלמה": {"lat": 32.8932, "long": 35.3705, "en": "Salama"},
-    "סלעית": {"lat": 32.2426, "long": 35.0513, "en": "Salit"},
-    "סמר": {"lat": 29.834, "long": 35.0222, "en": "Samar"},
-    "סנדלה": {"lat": 32.5224, "long": 35.3244, "en": "Sandala"},
-    "סנסנה": {"lat": 31.3618, "long": 34.901, "en": "Sansana"},
-    "סעד": {"lat": 31.4702, "long": 34.5344, "en": "Sa'ad"},
-    "סעווה": {"lat": 31.251, "long": 34.9528, "en": "Sa'wa"},
-    "סער": {"lat": 33.0287, "long": 35.1092, "en": "Sa'ar"},
-    "ספיר": {"lat": 30.6139, "long": 35.1845, "en": "Sapir"},
-    "ספסופה - כפר חושן": {
-        "lat": 33.0131,
-        "long": 35.4402,
-        "en": "Safsufa (Kfar Hoshen)",
-    },
-    "סתריה": {"lat": 31.8899, "long": 34.8421, "en": "Sitria"},
-    "ע'ג'ר": {"lat": 33.2728, "long": 35.6242, "en": "Ghajar"},
-    "עבדון": {"lat": 33.0488, "long": 35.1791, "en": "Avdon"},
-    "עבדת": {"lat": 30.7923, "long": 34.7687, "en": "Ovdat"},
-    "עברון": {"lat": 32.9911, "long": 35.1, "en": "Evron"},
-    "עגור": {"lat": 31.6975, "long": 34.912, "en": "Agur"},
-    "עדי": {"lat": 32.7824, "long": 35.1734, "en": "Adi"},
-    "עדי עד": {"lat": 32.0398, "long": 35.3352, "en": "Adei Ad"},
-    "עדנים": {"lat": 32.1388, "long": 34.9091, "en": "Adanim"},
-    "עוזה": {"lat": 31.593, "long": 34.7645, "en": "Uzza"},
-    "עוזייר": {"lat": 32.7906, "long": 35.3269, "en": "Uzeir"},
-    "עולש": {"lat": 32.332, "long": 34.9853, "en": "Olesh"},
-    "עומר": {"lat": 31.2643, "long": 34.8499, "en": "Omer"},
-    "עופר": {"lat": 32.6219, "long": 34.9835, "en": "Ofer"},
-    "עופרים": {"lat": 32.0186, "long": 35.0446, "en": "Ofarim"},
-    "עוצם": {"lat": 31.6377, "long": 34.7051, "en": "Otzem"},
-    "עזוז": {"lat": 30.7922, "long": 34.4724, "en": "Azuz"},
-    "עזר": {"lat": 31.7362, "long": 34.6714, "en": "Ezer"},
-    "עזריאל": {"lat": 32.2628, "long": 34.9711, "en": "Azriel"},
-    "עזריה": {"lat": 31.8905, "long": 34.9119, "en": "Azaria"},
-    "עזריקם": {"lat": 31.7517, "long": 34.6948, "en": "Azrikam"},
-    "עטרת": {"lat": 32.0012, "long": 35.177, "en": "Atteret"},
-    "עידן": {"lat": 30.8063, "long": 35.2999, "en": "Idan"},
-    "עיינות": {"lat": 31.9158, "long": 34.7681, "en": "Ayanot"},
-    "עילבון": {"lat": 32.8379, "long": 35.4, "en": "Eilabun"},
-    "עילוט": {"lat": 32.7173, "long": 35.2615, "en": "Ilut"},
-    "עין איילה": {"lat": 32.63, "long": 34.9443, "en": "Ein Ayala"},
-    "עין אל אסד": {"lat": 32.9408, "long": 35.401, "en": "Ein al-Asad"},
-    "עין אל סהלה": {"lat": 32.4903, "long": 35.1165, "en": "Ayn al-Sahla"},
-    "עין בוקק": {"lat": 31.2002, "long": 35.3625, "en": "Ein Bokek"},
-    "עין גב": {"lat": 32.7834, "long": 35.6401, "en": "Ein Gev"},
-    "עין גדי": {"lat": 31.4512, "long": 35.3836, "en": "Ein Gedi"},
-    "עין דור": {"lat": 32.6555, "long": 35.4164, "en": "Ein Dor"},
-    "עין הבשור": {"lat": 31.2809, "long": 34.4434, "en": "Ein HaBsor"},
-    "עין הוד": {"lat": 32.7003, "long": 34.9827, "en": "Ein Hod"},
-    "עין החורש": {"lat": 32.3859, "long": 34.94, "en": "Ein HaHoresh"},
-    "עין המפרץ": {"lat": 32.9026, "long": 35.093, "en": "Ein HaMifratz"},
-    "עין הנצי''ב": {"lat": 32.47071, "long": 35.501973, "en": "Ein HaNatziv"},
-    "עין העמק": {"lat": 32.6297, "long": 35.0822, "en": "Ein HaEmek"},
-    "עין השופט": {"lat": 32.5968, "long": 35.1004, "en": "Ein HaShofet"},
-    "עין השלושה": {"lat": 31.3517, "long": 34.4035, "en": "Ein HaShlosha"},
-    "עין ורד": {"lat": 32.2645, "long": 34.9307, "en": "Ein Vered"},
-    "עין זיוון": {"lat": 33.0965, "long": 35.7963, "en": "Ein Zivan"},
-    "עין חוד": {"lat": 32.6914, "long": 34.9991, "en": "Ein Chod"},
-    "עין חצבה": {"lat": 30.7972, "long": 35.2453, "en": "Ein Hatzeva"},
-    "עין חרוד": {"lat": 32.5631, "long": 35.3917, "en": "Ein Harod"},
-    "עין יהב": {"lat": 30.6588, "long": 35.2397, "en": "Ein Yahav"},
-    "עין יעקב": {"lat": 33.0093, "long": 35.229, "en": "Ein Yacov"},
-    "עין כמונים": {"lat": 32.9194, "long": 35.4301, "en": "Ein Kamonim"},
-    "עין כרמל": {"lat": 32.6779, "long": 34.9537, "en": "Ein Carmel"},
-    "עין מאהל": {"lat": 32.7243, "long": 35.3534, "en": "Ein Mahil"},
-    "עין נקובא": {"lat": 31.7939, "long": 35.1197, "en": "Ein Naqquba"},
-    "עין עירון": {"lat": 32.4844, "long": 35.0101, "en": "Ein Iron"},
-    "עין צורים": {"lat": 31.6949, "long": 34.7187, "en": "Ein Tzurim"},
-    "עין קנייא": {"lat": 33.2367, "long": 35.7313, "en": "Ein Quiniyye"},
-    "עין ראפה": {"lat": 31.7906, "long": 35.1165, "en": "Ein Rafa"},
-    "עין שמר": {"lat": 32.4619, "long": 35.0067, "en": "Ein Shemer"},
-    "עין שריד": {"lat": 32.2749, "long": 34.9342, "en": "Ein Sarid"},
-    "עין תמר": {"lat": 30.9436, "long": 35.3741, "en": "Ein Tamar"},
-    "עינבר": {"lat": 32.9097, "long": 35.4237, "en": "Inbar"},
-    "עינת": {"lat": 32.0819, "long": 34.9375, "en": "Einat"},
-    "עיר אובות": {"lat": 30.809, "long": 35.2444, "en": "Ir Ovot"},
-    "עכו": {"lat": 32.9331, "long": 35.0827, "en": "Acre"},
-    "עכו - אזור תעשייה": {
-        "lat": 32.8984,
-        "long": 35.0863,
-        "en": "Acco - Industrial Zone",
-    },
-    "עלומים": {"lat": 31.453, "long": 34.5147, "en": "Alumim"},
-    "עלי": {"lat": 32.0712, "long": 35.2669, "en": "Eli"},
-    "עלי זהב": {"lat": 32.0722, "long": 35.0641, "en": "Elei Zahav"},
-    "עלמה": {"lat": 33.0519, "long": 35.4996, "en": "Alma"},
-    "עלמון": {"lat": 31.8321, "long": 35.2968, "en": "Almon"},
-    "עמוקה": {"lat": 32.9977, "long": 35.5248, "en": "Amuka"},
-    "עמיחי": {"lat": 32.0464, "long": 35.3283, "en": "Amichai"},
-    "עמינדב": {"lat": 31.7517, "long": 35.1424, "en": "Aminadav"},
-    "עמיעד": {"lat": 32.9304, "long": 35.5405, "en": "Amiad"},
-    "עמיקם": {"lat": 32.5646, "long": 35.0203, "en": "Amikam"},
-    "עמיר": {"lat": 33.1777, "long": 35.6198, "en": "Amir"},
-    "עמנואל": {"lat": 32.1607, "long": 35.136, "en": "Immanuel"},
-    "עמקה": {"lat": 32.9777, "long": 35.1618, "en": "Amka"},
-    "ענב": {"lat": 32.2836, "long": 35.1252, "en": "Einav"},
-    "עספיא": {"lat": 32.7207, "long": 35.0591, "en": "Isfiya"},
-    "עפולה": {"lat": 32.6105, "long": 35.2879, "en": "Afula"},
-    "עפרה": {"lat": 31.9551, "long": 35.2603, "en": "Ofra"},
-    "עץ אפרים": {"lat": 32.1194, "long": 35.0464, "en": "Etz Ephraim"},
-    "עצמון - שגב": {"lat": 32.8658, "long": 35.2523, "en": "Atzmon (Segev)"},
-    "עראבה": {"lat": 32.8537, "long": 35.3372, "en": "Arraba"},
-    "ערב אל נעים": {"lat": 32.8875, "long": 35.2909, "en": "Arab Al Naim"},
-    "ערב אל עראמשה": {"lat": 33.0888, "long": 35.2288, "en": "Arab al-Aramshe"},
-    "ערד": {"lat": 31.2614, "long": 35.2149, "en": "Arad"},
-    "ערוגות": {"lat": 31.7328, "long": 34.7762, "en": "Arugot"},
-    "ערערה": {"lat": 32.4963, "long": 35.0973, "en": "Ar'ara"},
-    "ערערה בנגב": {"lat": 31.1561, "long": 35.023, "en": "Ar'ara BaNegev"},
-    "עשהאל": {"lat": 31.3735, "long": 35.0437, "en": "Asa'el"},
-    "עשרת": {"lat": 31.8249, "long": 34.7475, "en": "Asseret"},
-    "עתלית": {"lat": 32.6909, "long": 34.9429, "en": "Atlit"},
-    "עתניאל": {"lat": 31.4388, "long": 35.0282, "en": "Otniel"},
-    "פארן": {"lat": 30.3626, "long": 35.1551, "en": "Paran"},
-    "פארק תעשיות מגדל עוז": {
-        "lat": 31.641,
-        "long": 35.1515,
-        "en": "Industrial Park Migdal Oz",
-    },
-    "פארק תעשיות פלמחים": {
-        "lat": 31.9532,
-        "long": 34.7675,
-        "en": "Palmachin Industrial Park",
-    },
-    "פארק תעשייה ראם": {"lat": 31.7682, "long": 34.7552, "en": "Re'em Industrial Park"},
-    "פדואל": {"lat": 32.0625, "long": 35.0526, "en": "Paduel"},
-    "פדויים": {"lat": 31.3263, "long": 34.6121, "en": "Pduim"},
-    "פדיה": {"lat": 31.8578, "long": 34.8838, "en": "Pdaya"},
-    "פוריה כפר עבודה": {"lat": 32.7198, "long": 35.5456, "en": "Poria - Kfar Avoda"},
-    "פוריה נווה עובד": {"lat": 32.7438, "long": 35.5381, "en": "Poria - Neve Oved"},
-    "פוריה עילית": {"lat": 32.7327, "long": 35.5462, "en": "Poria Illit"},
-    "פוריידיס": {"lat": 32.5974, "long": 34.9519, "en": "Fureidis"},
-    "פורת": {"lat": 32.2771, "long": 34.9488, "en": "Porat"},
-    "פטיש": {"lat": 31.3278, "long": 34.56, "en": "Patish"},
-    "פלך": {"lat": 32.9336, "long": 35.233, "en": "Pelekh"},
-    "פלמחים": {"lat": 31.9327, "long": 34.7069, "en": "Palmachim"},
-    "פני קדם": {"lat": 31.5895, "long": 35.1951, "en": "Pnei Kedem"},
-    "פנימיית עין כרם": {
-        "lat": 31.7788,
-        "long": 35.1533,
-        "en": "Ein Kerem Boarding School",
-    },
-    "פסגות": {"lat": 31.9, "long": 35.2239, "en": "Psagot"},
-    "פסוטה": {"lat": 33.0478, "long": 35.3088, "en": "Fassuta"},
-    "פעמי תש''ז": {"lat": 31.4383, "long": 34.6921, "en": "Pa'amei Tashaz"},
-    "פצאל": {"lat": 32.0435, "long": 35.4438, "en": "Petza'el"},
-    "פקיעין": {"lat": 32.9762, "long": 35.3358, "en": "Peki'in"},
-    "פקיעין החדשה": {"lat": 32.9882, "long": 35.3158, "en": "Peki'in HaHadasha"},
-    "פרדס חנה כרכור": {"lat": 32.4763, "long": 34.9773, "en": "Pardes Hanna - Kakur"},
-    "פרדסיה": {"lat": 32.305, "long": 34.9117, "en": "Pardessiya"},
-    "פרוד": {"lat": 32.9331, "long": 35.4343, "en": "Farod"},
-    "פרי גן": {"lat": 31.222, "long": 34.3559, "en": "Pri Gan"},
-    "פתח תקווה": {"lat": 32.084, "long": 34.8878, "en": "Petach Tikva"},
-    "פתחיה": {"lat": 31.867, "long": 34.8869, "en": "Ptachia"},
-    "צאלים": {"lat": 31.2039, "long": 34.5334, "en": "Ze'elim"},
-    "צבעון": {"lat": 33.0264, "long": 35.4167, "en": "Zivon"},
-    "צובה": {"lat": 31.7844, "long": 35.118, "en": "Tzuba"},
-    "צוחר, אוהד": {"lat": 31.2364, "long": 34.4287, "en": "Zohar, Ohad"},
-    "צומת בנימינה": {"lat": 32.5173, "long": 34.929, "en": "Binyamina Junction"},
-    "צומת דבירה": {"lat": 31.4223, "long": 34.7864, "en": "Dvira Junction"},
-    "צומת האלה": {"lat": 31.6857, "long": 34.948, "en": "Ha'Ela Junction"},
-    "צומת הגוש": {"lat": 31.646, "long": 35.1305, "en": "Gush Etzion Junction"},
-    "צופים": {"lat": 32.1979, "long": 35.0107, "en": "Zufim"},
-    "צופית": {"lat": 32.1949, "long": 34.9201, "en": "Tzofit"},
-    "צופר": {"lat": 30.5594, "long": 35.1815, "en": "Tzofar"},
-    "צוקים": {"lat": 30.4916, "long": 35.1654, "en": "Tzukim"},
-    "צור הדסה": {"lat": 31.7194, "long": 35.097, "en": "Tzur Hadassa"},
-    "צור יצחק": {"lat": 32.2415, "long": 34.998, "en": "Tzur Itzhak"},
-    "צור משה": {"lat": 32.2989, "long": 34.9131, "en": "Tzur Moshe"},
-    "צור נתן": {"lat": 32.2397, "long": 35.014, "en": "Tzur Natan"},
-    "צוריאל": {"lat": 33.0065, "long": 35.3148, "en": "Tzuriel"},
-    "צורית גילון": {"lat": 32.9043, "long": 35.2322, "en": "Tzurit Gilon"},
-    "ציפורי": {"lat": 32.7467, "long": 35.2764, "en": "Tzippori"},
-    "צלפון": {"lat": 31.8056, "long": 34.9318, "en": "Tzalfon"},
-    "צמח": {"lat": 32.7027, "long": 35.586, "en": "Tsemach"},
-    "צפריה": {"lat": 32.0043, "long": 34.8547, "en": "Tzafria"},
-    "צפרירים": {"lat": 31.6596, "long": 34.9443, "en": "Tzafririm"},
-    "צפת - נוף כנרת": {
-        "lat": 32.9526,
-        "long": 35.5298,
-        "en": "Safed - Nof ha-Kinneret",
-    },
-    "צפת - עיר": {"lat": 32.9646, "long": 35.496, "en": "Safed - City"},
-    "צפת - עכברה": {"lat": 32.9415, "long": 35.4975, "en": "Safed - 'Akbara"},
-    "צרופה": {"lat": 32.6478, "long": 34.9465, "en": "Tzrufa"},
-    "צרעה": {"lat": 31.7627, "long": 34.9669, "en": "Tzora"},
-    "קבוצת גבע": {"lat": 32.5661, "long": 35.3728, "en": "Kvutzat Geva"},
-    "קבוצת יבנה": {"lat": 31.814, "long": 34.7191, "en": "Kvutzat Yavne"},
-    "קדומים": {"lat": 32.2124, "long": 35.1574, "en": "Kdumim"},
-    "קדימה צורן": {"lat": 32.2831, "long": 34.912, "en": "Qadima - Zoran"},
-    "קדיתא": {"lat": 33.006, "long": 35.4683, "en": "Kadita"},
-    "קדמה": {"lat": 31.7008, "long": 34.7749, "en": "Kedma"},
-    "קדמת צבי": {"lat": 33.0295, "long": 35.6977, "en": "Kidmat Zvi"},
-    "קדרון": {"lat": 31.8141, "long": 34.7955, "en": "Kidron"},
-    "קדרים": {"lat": 32.8989, "long": 35.4716, "en": "Kadarim"},
-    "קדש ברנע": {"lat": 30.9034, "long": 34.3967, "en": "Kadesh Barneah"},
-    "קוממיות": {"lat": 31.6626, "long": 34.7293, "en": "Kommemiut"},
-    "קורנית": {"lat": 32.8444, "long": 35.2519, "en": "Koranit"},
-    "קטורה": {"lat": 29.9709, "long": 35.0614, "en": "Ktura"},
-    "קיבוץ דן": {"lat": 33.2406, "long": 35.6523, "en": "Kibutz Dan"},
-    "קיבוץ מגידו": {"lat": 32.5785, "long": 35.1805, "en": "Kibutz Megiddo"},
-    "קידה": {"lat": 32.0514, "long": 35.3413, "en": "Kida"},
-    "קידר": {"lat": 31.7458, "long": 35.3016, "en": "Keidar"},
-    "קיסריה": {"lat": 32.519, "long": 34.9045, "en": "Caesarea"},
-    "קלחים": {"lat": 31.4498, "long": 34.6791, "en": "Klachim"},
-    "קליה": {"lat": 31.7499, "long": 35.4661, "en": "Kalia"},
-    "קלנסווה": {"lat": 32.2858, "long": 34.9815, "en": "Qalansawe"},
-    "קסר א-סר": {"lat": 31.0864, "long": 34.9979, "en": "Qasr al-Sir"},
-    "קציר": {"lat": 32.4852, "long": 35.1087, "en": "Katzir"},
-    "קצרין": {"lat": 32.991, "long": 35.6899, "en": "Katzrin"},
-    "קצרין - אזור תעשייה": {
-        "lat": 32.989259,
-        "long": 35.710742,
-        "en": "Katzrin - Industrial Zone",
-    },
-    "קריית אונו": {"lat": 32.0549, "long": 34.8589, "en": "Kiryat Ono"},
-    "קריית ארבע": {"lat": 31.534, "long": 35.1238, "en": "Kiryat Arba"},
-    "קריית אתא": {"lat": 32.8052, "long": 35.0925, "en": "Kiryat Atta"},
-    "קריית ביאליק": {"lat": 32.8322, "long": 35.0884, "en": "Kiryat Biyalik"},
-    "קריית גת, כרמי גת": {
-        "lat": 31.6196,
-        "long": 34.766,
-        "en": "Kiryat Gat, Karmei Gat",
-    },
-    "קריית חינוך מרחבים": {
-        "lat": 31.3142,
-        "long": 34.5999,
-        "en": "Merhavim Educational Campus",
-    },
-    "קריית טבעון - בית זייד": {
-        "lat": 32.7132,
-        "long": 35.1226,
-        "en": "Kiryat Tivon - Beit Zaid",
-    },
-    "קריית ים": {"lat": 32.8493, "long": 35.0689, "en": "Kiryat Yam"},
-    "קריית יערים": {"lat": 31.8028, "long": 35.0999, "en": "Kiryat Yearim"},
-    "קריית מוצקין": {"lat": 32.8382, "long": 35.0795, "en": "Kiryat Motzkin"},
-    "קריית מלאכי": {"lat": 31.7302, "long": 34.747, "en": "Kiryat Malachi"},
-    "קריית נטפים": {"lat": 32.1173, "long": 35.1121, "en": "Kiryat Netafim"},
-    "קריית ענבים": {"lat": 31.8099, "long": 35.1208, "en": "Kiryat Anavim"},
-    "קריית עקרון": {"lat": 31.8625, "long": 34.822, "en": "Kiryat Ekron"},
-    "קריית שמונה": {"lat": 33.2079, "long": 35.5702, "en": "Kiryat Shmona"},
-    "קרני שומרון": {"lat": 32.1716, "long": 35.0975, "en": "Karnei Shomron"},
-    "קשת": {"lat": 32.9804, "long": 35.8085, "en": "Keshet"},
-    "ראמה": {"lat": 32.9371, "long": 35.367, "en": "Rama"},
-    "ראס אל-עין": {"lat": 32.9157, "long": 35.3727, "en": "Ras al-ein"},
-    "ראס עלי": {"lat": 32.7729, "long": 35.1555, "en": "Ras Ali"},
-    "ראש הנקרה": {"lat": 33.0861, "long": 35.1135, "en": "Rosh HaNikra"},
-    "ראש העין": {"lat": 32.0958, "long": 34.9522, "en": "Rosh HaAyin"},
-    "ראש פינה": {"lat": 32.9704, "long": 35.5427, "en": "Rosh Pinna"},
-    "ראש צורים": {"lat": 31.6678, "long": 35.1253, "en": "Rosh Tzurim"},
-    "ראשון לציון - מזרח": {
-        "lat": 31.9723,
-        "long": 34.8066,
-        "en": "Rishon LeZion - East",
-    },
-    "ראשון לציון - מערב": {
-        "lat": 31.981,
-        "long": 34.7679,
-        "en": "Rishon LeZion - West",
-    },
-    "רבבה": {"lat": 32.1187, "long": 35.1296, "en": "Revava"},
-    "רבדים": {"lat": 31.774, "long": 34.8148, "en": "Revadim"},
-    "רביבים": {"lat": 31.0452, "long": 34.7211, "en": "Revivim"},
-    "רביד": {"lat": 32.8506, "long": 35.4641, "en": "Ravid"},
-    "רגבה": {"lat": 32.9775, "long": 35.0991, "en": "Regba"},
-    "רגבים": {"lat": 32.5234, "long": 35.034, "en": "Regavim"},
-    "רהט": {"lat": 31.4033, "long": 34.7582, "en": "Rahat"},
-    "רווחה": {"lat": 31.6487, "long": 34.7337, "en": "Revacha"},
-    "רוויה": {"lat": 32.4486, "long": 35.4731, "en": "Revaya"},
-    "רוחמה": {"lat": 31.4974, "long": 34.7052, "en": "Rochama"},
-    "רומאנה": {"lat": 32.7881, "long": 35.3112, "en": "Rumana"},
-    "רומת אל הייב": {"lat": 32.7776, "long": 35.3057, "en": "Rumat al-Heib"},
-    "רועי": {"lat": 32.2475, "long": 35.4895, "en": "Roee"},
-    "רותם": {"lat": 32.3366, "long": 35.5186, "en": "Rotem"},
-    "רחוב": {"lat": 32.4511, "long": 35.4896, "en": "Rechov"},
-    "רחובות": {"lat": 31.8928, "long": 34.8113, "en": "Rehovot"},
-    "רחלים": {"lat": 32.1025, "long": 35.2578, "en": "Rechelim"},
-    "רטורנו - גבעת שמש": {
-        "lat": 31.7759,
-        "long": 34.9474,
-        "en": "Retorno - Givat Shesh",
-    },
-    "ריחאנייה": {"lat": 33.0499, "long": 35.4871, "en": "Rehaniya"},
-    "ריחן": {"lat": 32.4688, "long": 35.1353, "en": "Reihan"},
-    "ריינה": {"lat": 32.7199, "long": 35.3177, "en": "Reineh"},
-    "רימונים": {"lat": 31.9354, "long": 35.3405, "en": "Rimonim"},
-    "רינתיה": {"lat": 32.0444, "long": 34.9285, "en": "Rinatya"},
-    "רכסים": {"lat": 32.7493, "long": 35.0996, "en": "Rechasim"},
-    "רם און": {"lat": 32.5287, "long": 35.2587, "en": "Ram On"},
-    "רמות": {"lat": 32.8504, "long": 35.6652, "en": "Ramot"},
-    "רמות השבים": {"lat": 32.1651, "long": 34.8815, "en": "Ramot HaShavim"},
-    "רמות מאיר": {"lat": 31.8744, "long": 34.8552, "en": "Ramot Meir"},
-    "רמות מנשה": {"lat": 32.5966, "long": 35.0575, "en": "Ramot Menashe"},
-    "רמות נפתלי": {"lat": 33.1024, "long": 35.5533, "en": "Ramot Naftali"},
-    "רמלה": {"lat": 31.9316, "long": 34.8729, "en": "Ramla"},
-    "רמת גן - מזרח": {"lat": 32.0529, "long": 34.8416, "en": "Ramat Gan - East"},
-    "רמת גן - מערב": {"lat": 32.0706, "long": 34.8275, "en": "Ramat Gan - West"},
-    "רמת דוד": {"lat": 32.679, "long": 35.204, "en": "Ramat David"},
-    "רמת הכובש": {"lat": 32.2183, "long": 34.9383, "en": "Ramat HaKovesh"},
-    "רמת הנדיב": {"lat": 32.5524, "long": 34.9453, "en": "Ramat HaNadiv"},
-    "רמת השופט": {"lat": 32.6094, "long": 35.0941, "en": "Ramat HaShofet"},
-    "רמת השרון": {"lat": 32.1378, "long": 34.8403, "en": "Ramat HaSharon"},
-    "רמת טראמפ": {"lat": 33.1328, "long": 35.6897, "en": "Ramat Trump"},
-    "רמת יוחנן": {"lat": 32.7935, "long": 35.1222, "en": "Ramat Yochana"},
-    "רמת ישי": {"lat": 32.704, "long": 35.166, "en": "Ramat Ishai"},
-    "רמת מגשימים": {"lat": 32.8441, "long": 35.8066, "en": "Ramat Magshimim"},
-    "רמת צבי": {"lat": 32.592, "long": 35.4145, "en": "Ramat Zvi"},
-    "רמת רזיאל": {"lat": 31.7736, "long": 35.0744, "en": "Ramat Raziel"},
-    "רנן": {"lat": 31.3387, "long": 34.6004, "en": "Renan"},
-    "רעים": {"lat": 31.3862, "long": 34.4588, "en": "Reim"},
-    "רעננה": {"lat": 32.1848, "long": 34.8713, "en": "Ra'anana"},
-    "רפטינג נהר הירדן": {"lat": 33.0257, "long": 35.628, "en": "Jordan River Rafting"},
-    "רקפת": {"lat": 32.8556, "long": 35.2642, "en": "Rakefet"},
-    "רשפון": {"lat": 32.2019, "long": 34.8247, "en": "Rishpon"},
-    "רשפים": {"lat": 32.4812, "long": 35.4788, "en": "Reshafim"},
-    "רתמים": {"lat": 31.054, "long": 34.6909, "en": "Retamim"},
-    "שאנטי במדבר": {"lat": 30.8333, "long": 34.7366, "en": "Shanti BaMidbar"},
-    "שאר ישוב": {"lat": 33.2263, "long": 35.6468, "en": "Shear Yeshuv"},
-    "שבות רחל": {"lat": 32.0545, "long": 35.3107, "en": "Shvut Rachel"},
-    "שבי דרום": {"lat": 31.4664, "long": 34.6386, "en": "Shavei Darom"},
-    "שבי ציון": {"lat": 32.9821, "long": 35.083, "en": "Shavei Zion"},
-    "שבי שומרון": {"lat": 32.2637, "long": 35.1834, "en": "Shavei Shomron"},
-    "שבלי": {"lat": 32.6863, "long": 35.4061, "en": "Shibli"},
-    "שגב שלום": {"lat": 31.1984, "long": 34.8397, "en": "Segev Shalom"},
-    "שדה אילן": {"lat": 32.7505, "long": 35.4224, "en": "Sdeh Ilan"},
-    "שדה אליהו": {"lat": 32.4419, "long": 35.5138, "en": "Sdeh Eliyahu"},
-    "שדה אליעזר": {"lat": 33.0465, "long": 35.5653, "en": "Sdeh Eliezer"},
-    "שדה בוקר": {"lat": 30.8736, "long": 34.7931, "en": "Sdeh Boker"},
-    "שדה בר": {"lat": 31.6594, "long": 35.244, "en": "Sdeh Bar"},
-    "שדה דוד": {"lat": 31.5775, "long": 34.6834, "en": "Sdeh David"},
-    "שדה ורבורג": {"lat": 32.2087, "long": 34.9033, "en": "Sdeh Warburg"},
-    "שדה יואב": {"lat": 31.6457, "long": 34.6768, "en": "Sdeh Yoav"},
-    "שדה יעקב": {"lat": 32.6976, "long": 35.1413, "en": "Sdeh Yacov"},
-    "שדה יצחק": {"lat": 32.405, "long": 34.9922, "en": "Sdeh Itzhak"},
-    "שדה משה": {"lat": 31.611, "long": 34.8004, "en": "Sdeh Moshe"},
-    "שדה נחום": {"lat": 32.5251, "long": 35.4809, "en": "Sdeh Nachum"},
-    "שדה נחמיה": {"lat": 33.1882, "long": 35.6231, "en": "Sdeh Nechemia"},
-    "שדה ניצן": {"lat": 31.23, "long": 34.4184, "en": "Sdeh Nitzan"},
-    "שדה עוזיהו": {"lat": 31.7584, "long": 34.6782, "en": "Sdeh Uziahu"},
-    "שדה צבי": {"lat": 31.4487, "long": 34.7132, "en": "Sdeh Zvi"},
-    "שדות ים": {"lat": 32.4926, "long": 34.8932, "en": "Sdot Yam"},
-    "שדות מיכה": {"lat": 31.7214, "long": 34.9207, "en": "Sdot Micha"},
-    "שדי אברהם": {"lat": 31.2114, "long": 34.3368, "en": "Sdeh Avraham"},
-    "שדי חמד": {"lat": 32.1585, "long": 34.9428, "en": "Sdei Hemed"},
-    "שדי תרומות": {"lat": 32.4409, "long": 35.4842, "en": "Sdei Trumot"},
-    "שדמה": {"lat": 31.8338, "long": 34.7401, "en": "Shdema"},
-    "שדמות דבורה": {"lat": 32.6962, "long": 35.4364, "en": "Shadmot Dvora"},
-    "שדמות מחולה": {"lat": 32.3477, "long": 35.5306, "en": "Shadmot Mechola"},
-    "שדרות, איבים": {"lat": 31.5313, "long": 34.5984, "en": "Sderot, Ibim"},
-    "שואבה": {"lat": 31.7994, "long": 35.079, "en": "Shoeva"},
-    "שובל": {"lat": 31.4137, "long": 34.7458, "en": "Shoval"},
-    "שוהם": {"lat": 31.9971, "long": 34.9469, "en": "Shoham"},
-    "שומרה": {"lat": 33.0825, "long": 35.282, "en": "Shomera"},
-    "שומריה": {"lat": 31.4322, "long": 34.8841, "en": "Shomria"},
-    "שומרת": {"lat": 32.9515, "long": 35.095, "en": "Shomrat"},
-    "שוקדה": {"lat": 31.4221, "long": 34.5244, "en": "Shokeda"},
-    "שורש": {"lat": 31.7975, "long": 35.0653, "en": "Shoresh"},
-    "שורשים": {"lat": 32.8927, "long": 35.2586, "en": "Shorashim"},
-    "שושנת העמקים": {"lat": 32.3548, "long": 34.8568, "en": "Shoshanat Ha'Amakim"},
-    "שזור": {"lat": 32.9339, "long": 35.3545, "en": "Shezor"},
-    "שחר": {"lat": 31.6184063, "long": 34.7240639, "en": "Shachar"},
-    "שחרות": {"lat": 29.9041, "long": 34.9992, "en": "Shachrut"},
-    "שיבולים": {"lat": 31.3964, "long": 34.6081, "en": "Shibolim"},
-    "שיטים": {"lat": 30.1764, "long": 35.0167, "en": "Shitim"},
-    "שייח' דנון": {"lat": 32.9938, "long": 35.1486, "en": "Sheikh Danun"},
-    "שילה": {"lat": 32.0544, "long": 35.2991, "en": "Shilo"},
-    "שילת": {"lat": 31.9212, "long": 35.0146, "en": "Shilat"},
-    "שכניה": {"lat": 32.8492, "long": 35.2467, "en": "Shekhanya"},
-    "שלווה": {"lat": 31.5647, "long": 34.7688, "en": "Shalva"},
-    "שלוחות": {"lat": 32.4726, "long": 35.4805, "en": "Shluchot"},
-    "שלומי": {"lat": 33.0726, "long": 35.1459, "en": "Shlomi"},
-    "שלומית": {"lat": 31.1697, "long": 34.3032, "en": "Shlomit"},
-    "שלפים": {"lat": 32.476, "long": 35.477, "en": "Shlafim"},
-    "שמיר": {"lat": 33.1668, "long": 35.66, "en": "Shamir"},
-    "שמעה": {"lat": 31.3873, "long": 35.0127, "en": "Shim'a"},
-    "שמשית": {"lat": 32.7325, "long": 35.2465, "en": "Shimshit"},
-    "שני ליבנה": {"lat": 31.3566, "long": 35.0699, "en": "Sheni LeYavne"},
-    "שניר": {"lat": 33.2403, "long": 35.677, "en": "Snir"},
-    "שעב": {"lat": 32.8897, "long": 35.2388, "en": "Sha'ab"},
-    "שעל": {"lat": 33.1165, "long": 35.7188, "en": "Sha'al"},
-    "שעלבים": {"lat": 31.8702, "long": 34.9843, "en": "Sha'alabim"},
-    "שער אפרים": {"lat": 32.2907, "long": 34.9994, "en": "Sha'ar Efraim"},
-    "שער הגולן": {"lat": 32.6869, "long": 35.6047, "en": "Sha'ar HaGolan"},
-    "שער הגיא": {"lat": 31.8152, "long": 35.0229, "en": "Sha’ar HaGai"},
-    "שער העמקים": {"lat": 32.7226, "long": 35.1106, "en": "Sha'ar HaAmakim"},
-    "שער מנשה": {"lat": 32.4439, "long": 35.011, "en": "Sha'ar Menashe"},
-    "שערי תקווה": {"lat": 32.1207, "long": 35.027, "en": "Sha'arei Tikva"},
-    "שפיים": {"lat": 32.2166, "long": 34.8224, "en": "Shefayim"},
-    "שפיר": {"lat": 31.6976, "long": 34.7282, "en": "Shafir"},
-    "שפר": {"lat": 32.9446, "long": 35.4378, "en": "Shefer"},
-    "שפרעם": {"lat": 32.8058, "long": 35.17, "en": "Shfaram"},
-    "שקד": {"lat": 32.4737, "long": 35.1684, "en": "Shaked"},
-    "שקף": {"lat": 31.5149, "long": 34.9373, "en": "Shekef"},
-    "שרונה": {"lat": 32.7259, "long": 35.4672, "en": "Sharona"},
-    "שריגים - לי-און": {"lat": 31.6766, "long": 34.9353, "en": "Srigim-Li On"},
-    "שריד": {"lat": 32.6631, "long": 35.2248, "en": "Sarid"},
-    "שרשרת": {"lat": 31.4048, "long": 34.6044, "en": "Sharsheret"},
-    "שתולה": {"lat": 33.0859, "long": 35.3156, "en": "Shtula"},
-    "שתולים": {"lat": 31.7737, "long": 34.6844, "en": "Shtulim"},
-    "תארבין": {"lat": 31.3574, "long": 34.7383, "en": "Tirabin"},
-    "תאשור": {"lat": 31.3717, "long": 34.6435, "en": "Ta'ashur"},
-    "תדהר": {"lat": 31.3789, "long": 34.6304, "en": "Tidhar"},
-    "תובל": {"lat": 32.9285, "long": 35.2457, "en": "Tuval"},
-    "תומר": {"lat": 32.0186, "long": 35.4398, "en": "Tomer"},
-    "תחנת רכבת כפר ברוך": {
-        "lat": 32.6476,
-        "long": 35.2086,
-        "en": "Kfar Baruch train station",
-    },
-    "תחנת רכבת כפר יהושוע": {
-        "lat": 32.6811,
-        "long": 35.1246,
-        "en": "Kfar Yehoshua Train Station",
-    },
-    "תחנת רכבת קריית מלאכי - יואב": {
-        "lat": 31.7472,
-        "long": 34.8221,
-        "en": "Kiryat Mal'akhi-Yoav train station",
-    },
-    "תחנת רכבת ראש העין": {
-        "lat": 32.1209,
-        "long": 34.9345,
-        "en": "Rosh Ha’Ayin Train Station",
-    },
-    "תימורים": {"lat": 31.7163, "long": 34.7614, "en": "Timorim"},
-    "תירוש": {"lat": 31.7503, "long": 34.8859, "en": "Tirosh"},
-    "תל אביב - דרום העיר ויפו": {
-        "lat": 32.0462,
-        "long": 34.7654,
-        "en": "Tel Aviv - South and Jaffa",
-    },
-    "תל אביב - מזרח": {"lat": 32.0578, "long": 34.7987, "en": "Tel Aviv - East"},
-    "תל אביב - מרכז העיר": {
-        "lat": 32.0798,
-        "long": 34.7772,
-        "en": "Tel Aviv - City Center",
-    },
-    "תל אביב - עבר הירקון": {
-        "lat": 32.1213,
-        "long": 34.8203,
-        "en": "Tel Aviv - Across the Yarkon",
-    },
-    "תל חי": {"lat": 33.2334, "long": 35.5827, "en": "Tel Hai"},
-    "תל יוסף": {"lat": 32.5567, "long": 35.3989, "en": "Tel Yossef"},
-    "תל יצחק": {"lat": 32.2527, "long": 34.8724, "en": "Tel Itzhak"},
-    "תל מונד": {"lat": 32.2566, "long": 34.9185, "en": "Tel Mond"},
-    "תל עדשים": {"lat": 32.6574, "long": 35.3025, "en": "Tel Adashim"},
-    "תל ערד": {"lat": 31.2837, "long": 35.1038, "en": "Tel Arad"},
-    "תל ציון": {"lat": 31.8804, "long": 35.2391, "en": "Tel Zion"},
-    "תל קציר": {"lat": 32.7064, "long": 35.6179, "en": "Tel Katzir"},
-    "תל שבע": {"lat": 31.2476, "long": 34.8612, "en": "Tel Sheva"},
-    "תל תאומים": {"lat": 32.4425, "long": 35.4964, "en": "Tel Teomim"},
-    "תלם": {"lat": 31.5631, "long": 35.0312, "en": "Telem"},
-    "תלמי אליהו": {"lat": 31.2296, "long": 34.4291, "en": "Talmei Eliyahu"},
-    "תלמי אלעזר": {"lat": 32.4472, "long": 34.975, "en": "Talmei Elazar"},
-    "תלמי ביל''ו": {"lat": 31.4381, "long": 34.6448, "en": "Talmei Bilu"},
-    "תלמי יוסף": {"lat": 31.2, "long": 34.3638, "en": "Talmei Yossef"},
-    "תלמי יחיאל": {"lat": 31.7536, "long": 34.7643, "en": "Talmei Yehiel"},
-    "תלמי יפה": {"lat": 31.6169, "long": 34.6125, "en": "Talmei Yaffe"},
-    "תלמים": {"lat": 31.5634, "long": 34.672, "en": "Tlamim"},
-    "תמרת": {"lat": 32.7038, "long": 35.2255, "en": "Timrat"},
-    "תנובות": {"lat": 32.3059, "long": 34.9626, "en": "Tnuvot"},
-    "תעוז": {"lat": 31.8013, "long": 34.972, "en": "Taoz"},
-    "תעשיון חצב": {"lat": 32.0717, "long": 34.9544, "en": "Hatzav Industrial Zone"},
-    "תעשיון צריפין": {"lat": 31.9624, "long": 34.8533, "en": "Zrifin Industrial Zone"},
-    "תפרח": {"lat": 31.3245, "long": 34.6792, "en": "Tifrach"},
-    "תקומה": {"lat": 31.4485, "long": 34.5781, "en": "Tkuma"},
-    "תקוע": {"lat": 31.6528, "long": 35.2275, "en": "Tko'a"},
-    "תרום": {"lat": 31.7833, "long": 34.9802, "en": "Tarom"},
-}
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class AreaInfo(NamedTuple):
+    """Area information."""
+
+    lat: float
+    long: float
+    en: str
+    slug: str
+
+
+AREA_INFO = MappingProxyType(
+    {
+        "אבו גוש": AreaInfo(lat=31.8068, long=35.1103, en="Abu Gosh", slug="abu_gosh"),
+        "אבו נוור": AreaInfo(
+            lat=31.7621, long=35.2938, en="Abu-Nuwar", slug="abu_nuwar"
+        ),
+        "אבו סנאן": AreaInfo(lat=32.958, long=35.172, en="Abu Snan", slug="abu_snan"),
+        "אבו קרינאת": AreaInfo(
+            lat=31.1031, long=34.952, en="Abu Qrenat", slug="abu_qrenat"
+        ),
+        "אבו תלול": AreaInfo(
+            lat=31.1907, long=34.9161, en="Abu Talul", slug="abu_talul"
+        ),
+        "אבטליון": AreaInfo(lat=32.8358, long=35.3504, en="Avtalion", slug="avtalion"),
+        "אביאל": AreaInfo(lat=32.5313, long=34.9935, en="Aviel", slug="aviel"),
+        "אביבים": AreaInfo(lat=33.0894, long=35.4703, en="Avivim", slug="avivim"),
+        "אביגדור": AreaInfo(lat=31.7119, long=34.7404, en="Avigdor", slug="avigdor"),
+        "אביחיל": AreaInfo(lat=32.3507, long=34.8712, en="Avihail", slug="avihail"),
+        "אביעזר": AreaInfo(lat=31.682, long=35.0188, en="Aviezer", slug="aviezer"),
+        "אבירים": AreaInfo(lat=33.0381, long=35.286, en="Abirim", slug="abirim"),
+        "אבן יהודה": AreaInfo(
+            lat=32.2766, long=34.8851, en="Even Yehuda", slug="even_yehuda"
+        ),
+        "אבן מנחם": AreaInfo(
+            lat=33.0751, long=35.2952, en="Even Menachem", slug="even_menachem"
+        ),
+        "אבן ספיר": AreaInfo(
+            lat=31.7625, long=35.135, en="Even Sapir", slug="even_sapir"
+        ),
+        "אבן שמואל": AreaInfo(
+            lat=31.5764, long=34.763, en="Even Shmuel", slug="even_shmuel"
+        ),
+        "אבני איתן": AreaInfo(
+            lat=32.8248, long=35.7658, en="Avnei Eitan", slug="avnei_eitan"
+        ),
+        "אבני חפץ": AreaInfo(
+            lat=32.2846, long=35.0746, en="Avnei Hefetz", slug="avnei_hefetz"
+        ),
+        "אבנת": AreaInfo(lat=31.679, long=35.4369, en="Avnat", slug="avnat"),
+        "אבשלום": AreaInfo(lat=31.1954, long=34.3312, en="Avshalom", slug="avshalom"),
+        "אדורה": AreaInfo(lat=31.5522, long=35.0176, en="Adora", slug="adora"),
+        "אדוריים": AreaInfo(lat=31.4827, long=35.0436, en="Adorayim", slug="adorayim"),
+        "אדמית": AreaInfo(lat=33.0788, long=35.2095, en="Idmit", slug="idmit"),
+        "אדרת": AreaInfo(lat=31.6597, long=34.9944, en="Aderet", slug="aderet"),
+        "אודים": AreaInfo(lat=32.2669, long=34.847, en="Udim", slug="udim"),
+        "אודם": AreaInfo(lat=33.1934, long=35.7496, en="Odem", slug="odem"),
+        "אום אל פחם": AreaInfo(
+            lat=32.5171, long=35.1485, en="umm al-Fahm", slug="umm_al_fahm"
+        ),
+        "אום אל קוטוף": AreaInfo(
+            lat=32.4681, long=35.0592, en="Umm al-Qutuf", slug="umm_al_qutuf"
+        ),
+        "אום אלג'נם": AreaInfo(
+            lat=32.6867, long=35.3902, en="Umm al-Ghanam", slug="umm_al_ghanam"
+        ),
+        "אום בטין": AreaInfo(
+            lat=31.2694, long=34.8811, en="Umm Batin", slug="umm_batin"
+        ),
+        "אופקים": AreaInfo(lat=31.3113, long=34.6228, en="Ofakim", slug="ofakim"),
+        "אור הגנוז": AreaInfo(
+            lat=33.0052, long=35.4467, en="Or HaGanuz", slug="or_haganuz"
+        ),
+        "אור הנר": AreaInfo(lat=31.5562, long=34.6023, en="Or HaNer", slug="or_haner"),
+        "אור יהודה": AreaInfo(
+            lat=32.0297, long=34.8562, en="Or Yehuda", slug="or_yehuda"
+        ),
+        "אור עקיבא": AreaInfo(lat=32.51, long=34.9204, en="Or Akiva", slug="or_akiva"),
+        "אורה": AreaInfo(lat=31.7521, long=35.1502, en="Ora", slug="ora"),
+        "אורון תעשייה ומסחר": AreaInfo(
+            lat=30.9115,
+            long=35.0177,
+            en="Oron Industry and Commerce",
+            slug="oron_industry_and_commerce",
+        ),
+        "אורות": AreaInfo(lat=31.74176, long=34.734758, en="Orot", slug="orot"),
+        "אורטל": AreaInfo(lat=33.0862, long=35.7587, en="Ortal", slug="ortal"),
+        "אורים": AreaInfo(lat=31.3041, long=34.5249, en="Urim", slug="urim"),
+        "אורנים": AreaInfo(lat=32.7112, long=35.1096, en="Oranim", slug="oranim"),
+        "אורנית": AreaInfo(lat=32.1319, long=34.9908, en="Oranit", slug="oranit"),
+        "אושה": AreaInfo(lat=32.7965, long=35.1146, en="Usha", slug="usha"),
+        "אזור": AreaInfo(lat=32.0296, long=34.7996, en="Azor", slug="azor"),
+        "אזור תעשייה אלון התבור": AreaInfo(
+            lat=32.6345,
+            long=35.3603,
+            en="Alon HaTavor Industrial Zone",
+            slug="alon_hatavor_industrial_zone",
+        ),
+        "אזור תעשייה אפק ולב הארץ": AreaInfo(
+            lat=32.10799,
+            long=34.953088,
+            en='Afek and Lev Ha"aretz Industrial Zone',
+            slug="afek_and_lev_ha_aretz_industrial_zone",
+        ),
+        "אזור תעשייה אריאל": AreaInfo(
+            lat=32.094,
+            long=35.1234,
+            en="Ariel Industrial Park",
+            slug="ariel_industrial_park",
+        ),
+        "אזור תעשייה באר טוביה": AreaInfo(
+            lat=31.7249,
+            long=34.751,
+            en="Be'er Tuvia Industrial Zone",
+            slug="be_er_tuvia_industrial_zone",
+        ),
+        "אזור תעשייה בני יהודה": AreaInfo(
+            lat=32.8023,
+            long=35.7156,
+            en="Bnei Yehuda Industrial Zone",
+            slug="bnei_yehuda_industrial_zone",
+        ),
+        "אזור תעשייה בר-לב": AreaInfo(
+            lat=32.9063,
+            long=35.1948,
+            en="Bar Lev Industrial Zone",
+            slug="bar_lev_industrial_zone",
+        ),
+        "אזור תעשייה בראון": AreaInfo(
+            lat=32.2488,
+            long=35.1681,
+            en="Bar On Industrial Zone",
+            slug="bar_on_industrial_zone",
+        ),
+        "אזור תעשייה ברוש": AreaInfo(
+            lat=31.7331,
+            long=34.9594,
+            en="Brosh Industrial Zone",
+            slug="brosh_industrial_zone",
+        ),
+        "אזור תעשייה ברקן": AreaInfo(
+            lat=32.1051,
+            long=35.1199,
+            en="Barkan Industrial Park",
+            slug="barkan_industrial_park",
+        ),
+        "אזור תעשייה גדרה": AreaInfo(
+            lat=31.7995,
+            long=34.7677,
+            en="Gedera Industrial Area",
+            slug="gedera_industrial_area",
+        ),
+        "אזור תעשייה דימונה": AreaInfo(
+            lat=31.0646,
+            long=35.0188,
+            en="Dimona Industrial Zone",
+            slug="dimona_industrial_zone",
+        ),
+        "אזור תעשייה הדרומי אשקלון": AreaInfo(
+            lat=31.6361,
+            long=34.5545,
+            en="Ashkelon Southern Industrial Zone",
+            slug="ashkelon_southern_industrial_zone",
+        ),
+        "אזור תעשייה הר טוב - צרעה": AreaInfo(
+            lat=31.7728,
+            long=34.9981,
+            en="Har Tuv - Tzora Industrial Zone",
+            slug="har_tuv_tzora_industrial_zone",
+        ),
+        "אזור תעשייה חבל מודיעין": AreaInfo(
+            lat=32.0131,
+            long=34.9595,
+            en="Hevel Modi'in Industrial Zone",
+            slug="hevel_modi_in_industrial_zone",
+        ),
+        "אזור תעשייה חצור הגלילית": AreaInfo(
+            lat=32.9842,
+            long=35.5521,
+            en="Hatzor HaGlilit Industrial Zone",
+            slug="hatzor_haglilit_industrial_zone",
+        ),
+        "אזור תעשייה טירה": AreaInfo(
+            lat=32.2267,
+            long=34.9791,
+            en="Tira Industrial Zone",
+            slug="tira_industrial_zone",
+        ),
+        "אזור תעשייה טמרה": AreaInfo(
+            lat=32.833,
+            long=35.1642,
+            en="Tamra Industiral Park",
+            slug="tamra_industiral_park",
+        ),
+        "אזור תעשייה יקנעם עילית": AreaInfo(
+            lat=32.6639,
+            long=35.105,
+            en="Yokneam Illit Industrial Zone",
+            slug="yokneam_illit_industrial_zone",
+        ),
+        "אזור תעשייה כנות": AreaInfo(
+            lat=31.8013,
+            long=34.7591,
+            en="Kannot Industrial Zone",
+            slug="kannot_industrial_zone",
+        ),
+        "אזור תעשייה כפר יונה": AreaInfo(
+            lat=32.3191,
+            long=34.9103,
+            en="Kfar Yona Industrial Zone",
+            slug="kfar_yona_industrial_zone",
+        ),
+        "אזור תעשייה כרמיאל": AreaInfo(
+            lat=32.9263,
+            long=35.3191,
+            en="Carmiel Industrial Zone",
+            slug="carmiel_industrial_zone",
+        ),
+        "אזור תעשייה מבוא כרמל": AreaInfo(
+            lat=32.6207,
+            long=35.078,
+            en="Mevo Carmel Industrial Zone",
+            slug="mevo_carmel_industrial_zone",
+        ),
+        "אזור תעשייה מבואות הגלבוע": AreaInfo(
+            lat=32.5672,
+            long=35.2676,
+            en="Mevuot HaGilboa Industrial Zone",
+            slug="mevuot_hagilboa_industrial_zone",
+        ),
+        "אזור תעשייה מילואות צפון": AreaInfo(
+            lat=33.0684,
+            long=35.1102,
+            en="North Miluot Industrial Zone",
+            slug="north_miluot_industrial_zone",
+        ),
+        "אזור תעשייה מישור אדומים": AreaInfo(
+            lat=31.7925,
+            long=35.335,
+            en="Mishor Edomim Industrial Zone",
+            slug="mishor_edomim_industrial_zone",
+        ),
+        "אזור תעשייה מיתרים": AreaInfo(
+            lat=31.3726,
+            long=35.0055,
+            en="Meitarim Industrial Zone",
+            slug="meitarim_industrial_zone",
+        ),
+        "אזור תעשייה נ.ע.מ": AreaInfo(
+            lat=31.4138,
+            long=34.6149,
+            en="Noam Industrial Zone",
+            slug="noam_industrial_zone",
+        ),
+        "אזור תעשייה ניר עציון": AreaInfo(
+            lat=32.7019,
+            long=34.973,
+            en="Nir Etzion Industrial Zone",
+            slug="nir_etzion_industrial_zone",
+        ),
+        "אזור תעשייה נשר - רמלה": AreaInfo(
+            lat=31.9179,
+            long=34.892,
+            en="Nesher Industrial Zone (Ramla)",
+            slug="nesher_industrial_zone_ramla",
+        ),
+        "אזור תעשייה עד הלום": AreaInfo(
+            lat=31.7581,
+            long=34.6559,
+            en="Ad Halom Industrial Zone",
+            slug="ad_halom_industrial_zone",
+        ),
+        "אזור תעשייה עידן הנגב": AreaInfo(
+            lat=31.3808,
+            long=34.786,
+            en="Idan HaNegev Industrial Zone",
+            slug="idan_hanegev_industrial_zone",
+        ),
+        "אזור תעשייה עמק חפר": AreaInfo(
+            lat=32.4049,
+            long=34.8967,
+            en="Emek Heffer Industrial Zone",
+            slug="emek_heffer_industrial_zone",
+        ),
+        "אזור תעשייה צ.ח.ר": AreaInfo(
+            lat=32.9705521,
+            long=35.5646455,
+            en="Tzahar Industrial Zone",
+            slug="tzahar_industrial_zone",
+        ),
+        "אזור תעשייה צבאים": AreaInfo(
+            lat=32.5425,
+            long=35.5031,
+            en="Zvaim Industrial Zone",
+            slug="zvaim_industrial_zone",
+        ),
+        "אזור תעשייה ציפורית": AreaInfo(
+            lat=32.7595,
+            long=35.3161,
+            en="Tziporit Industrial Zone",
+            slug="tziporit_industrial_zone",
+        ),
+        "אזור תעשייה צפוני אשקלון": AreaInfo(
+            lat=31.6647,
+            long=34.5981,
+            en="Ashkelon Northern Industrial Zone",
+            slug="ashkelon_northern_industrial_zone",
+        ),
+        "אזור תעשייה קדמת גליל": AreaInfo(
+            lat=32.7854,
+            long=35.4631,
+            en="Kidmat Galil Industrial Zone",
+            slug="kidmat_galil_industrial_zone",
+        ),
+        "אזור תעשייה קיסריה": AreaInfo(
+            lat=32.4865,
+            long=34.9464,
+            en="Caesarea Industrial Zone",
+            slug="caesarea_industrial_zone",
+        ),
+        "אזור תעשייה קריית ביאליק": AreaInfo(
+            lat=32.8671,
+            long=35.0988,
+            en="Kiryat Bialik Industrial Zone",
+            slug="kiryat_bialik_industrial_zone",
+        ),
+        "אזור תעשייה קריית גת": AreaInfo(
+            lat=31.5962,
+            long=34.7848,
+            en="Kiryat Gat - Industrial Zone",
+            slug="kiryat_gat_industrial_zone",
+        ),
+        "אזור תעשייה רבדים": AreaInfo(
+            lat=31.7855,
+            long=34.822,
+            en="Revadim Industrial Zone",
+            slug="revadim_industrial_zone",
+        ),
+        "אזור תעשייה רגבים": AreaInfo(
+            lat=32.5217,
+            long=35.024,
+            en="Regavim Industrial Zone",
+            slug="regavim_industrial_zone",
+        ),
+        "אזור תעשייה רגמ": AreaInfo(
+            lat=31.9255,
+            long=34.8975,
+            en="Ramla, Regional Council Gezer, Regional Council Hevel Modi'in Industrial Park",
+            slug="ramla_regional_council_gezer_regional_council_hevel_modi_in_industrial_park",
+        ),
+        "אזור תעשייה רותם": AreaInfo(
+            lat=31.06,
+            long=35.1949,
+            en="Rotem Industrial Zone",
+            slug="rotem_industrial_zone",
+        ),
+        "אזור תעשייה רמת דלתון": AreaInfo(
+            lat=33.0279,
+            long=35.4768,
+            en="Ramat Dalton Industrial Zone",
+            slug="ramat_dalton_industrial_zone",
+        ),
+        "אזור תעשייה שחורת": AreaInfo(
+            lat=29.5979,
+            long=34.9719,
+            en="Shchoret Industrial Zone",
+            slug="shchoret_industrial_zone",
+        ),
+        "אזור תעשייה שחק": AreaInfo(
+            lat=32.475,
+            long=35.1797,
+            en="Shahak industrial park",
+            slug="shahak_industrial_park",
+        ),
+        "אזור תעשייה שער בנימין": AreaInfo(
+            lat=31.8654,
+            long=35.2617,
+            en="Sha'ar Binyamin Industrial Zone",
+            slug="sha_ar_binyamin_industrial_zone",
+        ),
+        "אזור תעשייה שער נעמן": AreaInfo(
+            lat=32.8805,
+            long=35.0976,
+            en="Sha'ar Na'aman Industrial Zone",
+            slug="sha_ar_na_aman_industrial_zone",
+        ),
+        "אזור תעשייה תימורים": AreaInfo(
+            lat=31.7242,
+            long=34.7615,
+            en="Timorimg Industrial Zone",
+            slug="timorimg_industrial_zone",
+        ),
+        "אזור תעשייה תרדיון": AreaInfo(
+            lat=32.8677,
+            long=35.2731,
+            en="Teradion Industrial Zone",
+            slug="teradion_industrial_zone",
+        ),
+        "אחווה": AreaInfo(lat=31.7429, long=34.7678, en="Achva", slug="achva"),
+        "אחוזם": AreaInfo(lat=31.5527, long=34.7701, en="Ahuzam", slug="ahuzam"),
+        "אחוזת ברק": AreaInfo(
+            lat=32.6431, long=35.3389, en="Ahuzat Barak", slug="ahuzat_barak"
+        ),
+        "אחיה": AreaInfo(lat=32.0605, long=35.3273, en="Achita", slug="achita"),
+        "אחיהוד": AreaInfo(lat=32.9074, long=35.1717, en="Achihud", slug="achihud"),
+        "אחיטוב": AreaInfo(lat=32.3877, long=34.9908, en="Ahituv", slug="ahituv"),
+        "אחיסמך": AreaInfo(lat=31.9319, long=34.9086, en="Ahisemech", slug="ahisemech"),
+        "אחיעזר": AreaInfo(lat=31.9817, long=34.8718, en="Achiezer", slug="achiezer"),
+        "איבטין": AreaInfo(lat=32.76, long=35.1146, en="Ibtin", slug="ibtin"),
+        "אייל": AreaInfo(lat=32.211823, long=34.979862, en="Eyal", slug="eyal"),
+        "איילת השחר": AreaInfo(
+            lat=33.0211, long=35.5767, en="Ayelet HaShachar", slug="ayelet_hashachar"
+        ),
+        "איירפורט סיטי": AreaInfo(
+            lat=31.9887, long=34.9123, en="Airport City", slug="airport_city"
+        ),
+        "אילון": AreaInfo(lat=33.0625, long=35.2192, en="Eilon", slug="eilon"),
+        "אילות": AreaInfo(lat=29.5805, long=34.963, en="Eilot", slug="eilot"),
+        "אילניה": AreaInfo(lat=32.7539, long=35.4082, en="Ilania", slug="ilania"),
+        "אילת": AreaInfo(lat=29.5577, long=34.9519, en="Eilat", slug="eilat"),
+        "אירוס": AreaInfo(lat=31.9286, long=34.7766, en="Irus", slug="irus"),
+        "איתמר": AreaInfo(lat=32.1739, long=35.308, en="Itamar", slug="itamar"),
+        "איתן": AreaInfo(lat=31.5722, long=34.7479, en="Eitan", slug="eitan"),
+        "אכסאל": AreaInfo(lat=32.6821, long=35.3207, en="Iksal", slug="iksal"),
+        "אל סייד": AreaInfo(lat=31.2864, long=34.9079, en="AlSayid", slug="alsayid"),
+        "אל עזי": AreaInfo(lat=31.7189, long=34.8143, en="Al Azi", slug="al_azi"),
+        "אל עמארני, אל מסק": AreaInfo(
+            lat=30.7983,
+            long=35.2346,
+            en="El Amrani, El Masaq",
+            slug="el_amrani_el_masaq",
+        ),
+        "אל עריאן": AreaInfo(lat=32.4981, long=35.1251, en="Al Arian", slug="al_arian"),
+        "אל פורעה": AreaInfo(
+            lat=31.2198, long=35.1642, en="El For'eh", slug="el_for_eh"
+        ),
+        "אל רום": AreaInfo(lat=33.1805, long=35.7701, en="El Rom", slug="el_rom"),
+        "אל-ח'וואלד מערב": AreaInfo(
+            lat=32.771, long=35.1363, en="Al Khawaled - West", slug="al_khawaled_west"
+        ),
+        "אלומה": AreaInfo(lat=31.652, long=34.7429, en="Aluma", slug="aluma"),
+        "אלומות": AreaInfo(lat=32.7066, long=35.5461, en="Alumot", slug="alumot"),
+        "אלון": AreaInfo(lat=31.8334, long=35.3536, en="Alon", slug="alon"),
+        "אלון הגליל": AreaInfo(
+            lat=32.7569, long=35.2203, en="Alon HaGalil", slug="alon_hagalil"
+        ),
+        "אלון מורה": AreaInfo(
+            lat=32.2344, long=35.3312, en="Elon Moreh", slug="elon_moreh"
+        ),
+        "אלון שבות": AreaInfo(
+            lat=31.6549, long=35.1253, en="Alon Shvut", slug="alon_shvut"
+        ),
+        "אלוני אבא": AreaInfo(
+            lat=32.7309, long=35.172, en="Alonei Abba", slug="alonei_abba"
+        ),
+        "אלוני הבשן": AreaInfo(
+            lat=33.0441, long=35.8385, en="Alonei HaBashan", slug="alonei_habashan"
+        ),
+        "אלוני יצחק": AreaInfo(
+            lat=32.51, long=35.0052, en="Alonei Itzhak", slug="alonei_itzhak"
+        ),
+        "אלונים": AreaInfo(lat=32.7215, long=35.1434, en="Alonim", slug="alonim"),
+        "אלי עד": AreaInfo(lat=32.8066, long=35.7366, en="Eliad", slug="eliad"),
+        "אליאב": AreaInfo(lat=31.5302, long=34.9284, en="Eliav", slug="eliav"),
+        "אליכין": AreaInfo(lat=32.4077, long=34.925, en="Elyachin", slug="elyachin"),
+        "אליפז ומכרות תמנע": AreaInfo(
+            lat=29.7882,
+            long=35.0032,
+            en="Elipaz and Timna Mines",
+            slug="elipaz_and_timna_mines",
+        ),
+        "אליפלט": AreaInfo(lat=32.9478, long=35.5485, en="Elifelet", slug="elifelet"),
+        "אליקים": AreaInfo(lat=32.6333, long=35.0676, en="Elyakim", slug="elyakim"),
+        "אלישיב": AreaInfo(lat=32.3802, long=34.9099, en="Elyashiv", slug="elyashiv"),
+        "אלישמע": AreaInfo(lat=32.1548, long=34.9305, en="Elishema", slug="elishema"),
+        "אלמגור": AreaInfo(lat=32.9127, long=35.6023, en="Almagor", slug="almagor"),
+        "אלמוג": AreaInfo(lat=31.79, long=35.462, en="Almog", slug="almog"),
+        "אלעד": AreaInfo(lat=32.0495, long=34.9507, en="Elad", slug="elad"),
+        "אלעזר": AreaInfo(lat=31.6597, long=35.1431, en="Elazar", slug="elazar"),
+        "אלפי מנשה": AreaInfo(
+            lat=32.1706, long=35.0149, en="Alfei Menashe", slug="alfei_menashe"
+        ),
+        "אלקוש": AreaInfo(lat=33.0343, long=35.3263, en="Alkosh", slug="alkosh"),
+        "אלקנה": AreaInfo(lat=32.1106, long=35.0321, en="Elkana", slug="elkana"),
+        "אמונים": AreaInfo(lat=31.7439, long=34.6745, en="Emunim", slug="emunim"),
+        "אמירים": AreaInfo(lat=32.9374, long=35.4504, en="Amirim", slug="amirim"),
+        "אמנון": AreaInfo(lat=32.905, long=35.5711, en="Amnon", slug="amnon"),
+        "אמץ": AreaInfo(lat=32.3692, long=34.9931, en="Amatz", slug="amatz"),
+        "אמציה": AreaInfo(lat=31.5312, long=34.9145, en="Amatzia", slug="amatzia"),
+        "אניעם": AreaInfo(lat=32.9566, long=35.7397, en="Aniam", slug="aniam"),
+        "אעבלין": AreaInfo(lat=32.8218, long=35.1901, en="Ibillin", slug="ibillin"),
+        "אפיק": AreaInfo(lat=32.7794, long=35.703, en="Afik", slug="afik"),
+        "אפיקים": AreaInfo(lat=32.6806, long=35.5777, en="Afikim", slug="afikim"),
+        "אפק": AreaInfo(lat=32.8383, long=35.1278, en="Afek", slug="afek"),
+        "אפרת": AreaInfo(lat=31.6536, long=35.1499, en="Efrat", slug="efrat"),
+        "ארבל": AreaInfo(lat=32.8127, long=35.4826, en="Arbel", slug="arbel"),
+        "ארגמן": AreaInfo(lat=32.1733, long=35.5223, en="Argaman", slug="argaman"),
+        "ארז": AreaInfo(lat=31.5597, long=34.565, en="Erez", slug="erez"),
+        "אריאל": AreaInfo(lat=32.1046, long=35.1745, en="Ariel", slug="ariel"),
+        "ארסוף": AreaInfo(lat=32.2128, long=34.816, en="Arsuf", slug="arsuf"),
+        "אשבול": AreaInfo(lat=31.4455, long=34.6667, en="Eshbol", slug="eshbol"),
+        "אשבל": AreaInfo(lat=32.877, long=35.306, en="Eshbal", slug="eshbal"),
+        "אשדוד - א,ב,ד,ה": AreaInfo(
+            lat=31.8047,
+            long=34.6469,
+            en="Ashdod - Alef,Bet,Dalet,Heh",
+            slug="ashdod_alef_bet_dalet_heh",
+        ),
+        "אשדוד - איזור תעשייה צפוני": AreaInfo(
+            lat=31.8298,
+            long=34.6602,
+            en="Ashdod - Northern Industrial Zone And Port",
+            slug="ashdod_northern_industrial_zone_and_port",
+        ),
+        "אשדוד - ג,ו,ז": AreaInfo(
+            lat=31.7966,
+            long=34.6579,
+            en="Ashdod - Gimmel,Vav,Zain",
+            slug="ashdod_gimmel_vav_zain",
+        ),
+        "אשדוד - ח,ט,י,יג,יד,טז": AreaInfo(
+            lat=31.7778,
+            long=34.6462,
+            en="Ashdod - Het,Tet,Yod,Yod Gimmel,Yod Dalet,Tet Zain",
+            slug="ashdod_het_tet_yod_yod_gimmel_yod_dalet_tet_zain",
+        ),
+        "אשדוד -יא,יב,טו,יז,מרינה,סיטי": AreaInfo(
+            lat=31.7836,
+            long=34.6332,
+            en="Ashdod - Yod Alef,Yod Bet,Tet Vav,Yod Zain,Marina,City",
+            slug="ashdod_yod_alef_yod_bet_tet_vav_yod_zain_marina_city",
+        ),
+        "אשדות יעקב": AreaInfo(
+            lat=32.661, long=35.5798, en="Ashdot Yaacov", slug="ashdot_yaacov"
+        ),
+        "אשחר": AreaInfo(lat=32.8851, long=35.2996, en="Eshchar", slug="eshchar"),
+        "אשכולות": AreaInfo(lat=31.3912, long=34.9049, en="Eshkolot", slug="eshkolot"),
+        "אשל הנשיא": AreaInfo(
+            lat=31.3268, long=34.6975, en="Eshel HaNassi", slug="eshel_hanassi"
+        ),
+        "אשלים": AreaInfo(lat=30.9642, long=34.6997, en="Ashalim", slug="ashalim"),
+        "אשקלון - דרום": AreaInfo(
+            lat=31.661, long=34.5688, en="Ashkelon - South", slug="ashkelon_south"
+        ),
+        "אשקלון - צפון": AreaInfo(
+            lat=31.686, long=34.5839, en="Ashkelon - North", slug="ashkelon_north"
+        ),
+        "אשרת": AreaInfo(lat=32.9716, long=35.1557, en="Oshrat", slug="oshrat"),
+        "אשתאול": AreaInfo(lat=31.7804, long=35.0101, en="Eshtaol", slug="eshtaol"),
+        "אתר דודאים": AreaInfo(
+            lat=31.3122, long=34.7338, en="Duda'im Site", slug="duda_im_site"
+        ),
+        "אתר ההנצחה גולני": AreaInfo(
+            lat=32.7774,
+            long=35.4103,
+            en="Golani Memorial Site",
+            slug="golani_memorial_site",
+        ),
+        "באקה אל גרבייה": AreaInfo(
+            lat=32.4229, long=35.0358, en="bqa al-Gharbiyye", slug="bqa_al_gharbiyye"
+        ),
+        "באר אורה": AreaInfo(
+            lat=29.7102, long=34.9872, en="Be'er Ora", slug="be_er_ora"
+        ),
+        "באר גנים": AreaInfo(
+            lat=31.7004, long=34.6109, en="Be'er Ganim", slug="be_er_ganim"
+        ),
+        "באר טוביה": AreaInfo(
+            lat=31.7371, long=34.7256, en="Be'er Tuvia", slug="be_er_tuvia"
+        ),
+        "באר יעקב": AreaInfo(
+            lat=31.9435, long=34.839, en="Be'er Yacov", slug="be_er_yacov"
+        ),
+        "באר מילכה": AreaInfo(
+            lat=30.9341, long=34.4056, en="Be'er Milka", slug="be_er_milka"
+        ),
+        "באר שבע - דרום": AreaInfo(
+            lat=31.2413, long=34.7711, en="Beer Sheva - South", slug="beer_sheva_south"
+        ),
+        "באר שבע - מזרח": AreaInfo(
+            lat=31.2345, long=34.8201, en="Beer Sheva - East", slug="beer_sheva_east"
+        ),
+        "באר שבע - מערב": AreaInfo(
+            lat=31.2612, long=34.7794, en="Beer Sheva - West", slug="beer_sheva_west"
+        ),
+        "באר שבע - צפון": AreaInfo(
+            lat=31.2698, long=34.8151, en="Beer Sheva - North", slug="beer_sheva_north"
+        ),
+        "בארות יצחק": AreaInfo(
+            lat=32.042, long=34.9102, en="Be'erot Itzhak", slug="be_erot_itzhak"
+        ),
+        "בארותיים": AreaInfo(
+            lat=32.321, long=34.9834, en="Be'erotaim", slug="be_erotaim"
+        ),
+        "בארי": AreaInfo(lat=31.4245, long=34.4926, en="Be'eri", slug="be_eri"),
+        "בוסתן הגליל": AreaInfo(
+            lat=32.9486, long=35.0807, en="Bustan HaGalil", slug="bustan_hagalil"
+        ),
+        "בועיינה-נוג'ידאת": AreaInfo(
+            lat=32.8077, long=35.3653, en="Bu'eine Nujeidat", slug="bu_eine_nujeidat"
+        ),
+        "בוקעתא": AreaInfo(lat=33.2027, long=35.7768, en="Buq'ata", slug="buq_ata"),
+        "בורגתה": AreaInfo(lat=32.326, long=34.9638, en="Burgata", slug="burgata"),
+        "בחן": AreaInfo(lat=32.3518, long=35.0185, en="Bahan", slug="bahan"),
+        "בטחה": AreaInfo(lat=31.3339, long=34.6343, en="Bitha", slug="bitha"),
+        "ביצרון": AreaInfo(lat=31.795, long=34.7293, en="Bitzaron", slug="bitzaron"),
+        "ביר אלמכסור": AreaInfo(
+            lat=32.7773, long=35.2206, en="Bir al-Maksur", slug="bir_al_maksur"
+        ),
+        "ביר הדאג'": AreaInfo(
+            lat=31.0302, long=34.7169, en="Bir Hadaj", slug="bir_hadaj"
+        ),
+        "ביריה": AreaInfo(lat=32.9781, long=35.5031, en="Biriyeh", slug="biriyeh"),
+        "בית אורן": AreaInfo(
+            lat=32.7316, long=35.0063, en="Beit Oren", slug="beit_oren"
+        ),
+        "בית אל": AreaInfo(lat=31.9416, long=35.2227, en="Beit El", slug="beit_el"),
+        "בית אלעזרי": AreaInfo(
+            lat=31.8447, long=34.8066, en="Beit Elazari", slug="beit_elazari"
+        ),
+        "בית אלפא וחפציבה": AreaInfo(
+            lat=32.5187,
+            long=35.4262,
+            en="Beit Alfa and Heftziba",
+            slug="beit_alfa_and_heftziba",
+        ),
+        "בית אריה": AreaInfo(
+            lat=32.0401, long=35.0495, en="Beit Arie", slug="beit_arie"
+        ),
+        "בית ברל": AreaInfo(
+            lat=32.1997, long=34.9261, en="Beit Berl", slug="beit_berl"
+        ),
+        "בית ג'אן": AreaInfo(
+            lat=32.9657, long=35.3813, en="Beit Jann", slug="beit_jann"
+        ),
+        "בית גוברין": AreaInfo(
+            lat=31.6129, long=34.8956, en="Beit Guvrin", slug="beit_guvrin"
+        ),
+        "בית גמליאל": AreaInfo(
+            lat=31.8561, long=34.7609, en="Beit Gamliel", slug="beit_gamliel"
+        ),
+        "בית דגן": AreaInfo(
+            lat=32.0018, long=34.8297, en="Beit Dagan", slug="beit_dagan"
+        ),
+        "בית הגדי": AreaInfo(
+            lat=31.4228, long=34.6079, en="Beit HaGdi", slug="beit_hagdi"
+        ),
+        "בית הלוי": AreaInfo(
+            lat=32.3516, long=34.9304, en="Beit HaLevi", slug="beit_halevi"
+        ),
+        "בית הלל": AreaInfo(
+            lat=33.2088, long=35.6065, en="Beit Hillel", slug="beit_hillel"
+        ),
+        "בית העלמין החדש נהריה": AreaInfo(
+            lat=33.005, long=35.1463, en="Nahariya Cemetery", slug="nahariya_cemetery"
+        ),
+        "בית העלמין החדש עכו": AreaInfo(
+            lat=32.9146, long=35.1358, en="Akko New Cemetery", slug="akko_new_cemetery"
+        ),
+        "בית העמק": AreaInfo(
+            lat=32.971, long=35.1453, en="Beit HaEmek", slug="beit_haemek"
+        ),
+        "בית הערבה": AreaInfo(
+            lat=31.8078, long=35.4764, en="Beit HaArava", slug="beit_haarava"
+        ),
+        "בית השיטה": AreaInfo(
+            lat=32.5509, long=35.4394, en="Beit HaShita", slug="beit_hashita"
+        ),
+        "בית זית": AreaInfo(
+            lat=31.7831, long=35.1611, en="Beit Zayit", slug="beit_zayit"
+        ),
+        "בית זרע": AreaInfo(
+            lat=32.6893, long=35.5741, en="Beit Zera", slug="beit_zera"
+        ),
+        'בית חג"י': AreaInfo(
+            lat=31.4917, long=35.0791, en="Beit Hagai", slug="beit_hagai"
+        ),
+        "בית חורון": AreaInfo(
+            lat=31.8799, long=35.1241, en="Beit Horon", slug="beit_horon"
+        ),
+        "בית חזון": AreaInfo(
+            lat=32.3872, long=34.9129, en="Beit Hazon", slug="beit_hazon"
+        ),
+        "בית חלקיה": AreaInfo(
+            lat=31.793, long=34.8097, en="Beit Hilkia", slug="beit_hilkia"
+        ),
+        "בית חנן": AreaInfo(
+            lat=31.9352, long=34.7756, en="Beit Hanan", slug="beit_hanan"
+        ),
+        "בית חנניה": AreaInfo(
+            lat=32.5295, long=34.9267, en="Beit Hanania", slug="beit_hanania"
+        ),
+        "בית חרות": AreaInfo(
+            lat=32.3762, long=34.8738, en="Beit Herut", slug="beit_herut"
+        ),
+        "בית חשמונאי": AreaInfo(
+            lat=31.8903, long=34.9176, en="Beit Hashmonai", slug="beit_hashmonai"
+        ),
+        "בית יהושע": AreaInfo(
+            lat=32.2621, long=34.8654, en="Beit Yehoshua", slug="beit_yehoshua"
+        ),
+        "בית יוסף": AreaInfo(
+            lat=32.5587, long=35.5528, en="Beit Yossef", slug="beit_yossef"
+        ),
+        "בית ינאי": AreaInfo(
+            lat=32.3817, long=34.8635, en="Beit Yannai", slug="beit_yannai"
+        ),
+        "בית יצחק - שער חפר": AreaInfo(
+            lat=32.3356,
+            long=34.8895,
+            en="Beit Yithak - Sha'ar Hefer",
+            slug="beit_yithak_sha_ar_hefer",
+        ),
+        "בית ירח": AreaInfo(
+            lat=32.7144, long=35.574, en="Beit Yerah", slug="beit_yerah"
+        ),
+        "בית יתיר": AreaInfo(
+            lat=31.3656, long=35.1113, en="Beit Yatir", slug="beit_yatir"
+        ),
+        "בית לחם הגלילית": AreaInfo(
+            lat=32.7346,
+            long=35.1913,
+            en="Bethlehem of Galilee",
+            slug="bethlehem_of_galilee",
+        ),
+        "בית מאיר": AreaInfo(
+            lat=31.7948, long=35.0368, en="Beit Meir", slug="beit_meir"
+        ),
+        "בית נחמיה": AreaInfo(
+            lat=31.9771, long=34.9538, en="Beit Nechemia", slug="beit_nechemia"
+        ),
+        "בית ניר": AreaInfo(lat=31.6476, long=34.8731, en="Beit Nir", slug="beit_nir"),
+        "בית נקופה": AreaInfo(
+            lat=31.8044, long=35.1269, en="Beit Nekofa", slug="beit_nekofa"
+        ),
+        "בית סוהר השרון": AreaInfo(
+            lat=32.2408, long=34.8848, en="HaSharon Prison", slug="hasharon_prison"
+        ),
+        "בית סוהר מגידו": AreaInfo(
+            lat=32.5709, long=35.1898, en="Megiddo Prison", slug="megiddo_prison"
+        ),
+        "בית סוהר נפחא": AreaInfo(
+            lat=30.7265, long=34.7735, en="Nafha Prison", slug="nafha_prison"
+        ),
+        "בית סוהר צלמון": AreaInfo(
+            lat=32.8717, long=35.4474, en="Zalmon Prison", slug="zalmon_prison"
+        ),
+        "בית סוהר קישון": AreaInfo(
+            lat=32.7262, long=35.0915, en="Kishon Prison", slug="kishon_prison"
+        ),
+        "בית סוהר שיטה וגלבוע": AreaInfo(
+            lat=32.5476,
+            long=35.4151,
+            en="Shita and Gilboa Prison",
+            slug="shita_and_gilboa_prison",
+        ),
+        "בית ספר אורט בנימינה": AreaInfo(
+            lat=32.5498, long=34.955, en="Ort Binyamina", slug="ort_binyamina"
+        ),
+        "בית ספר שדה מירון": AreaInfo(
+            lat=33.0115, long=35.3922, en="Sdeh Meron School", slug="sdeh_meron_school"
+        ),
+        "בית עובד": AreaInfo(
+            lat=31.9213, long=34.7749, en="Beit Oved", slug="beit_oved"
+        ),
+        "בית עוזיאל": AreaInfo(
+            lat=31.8701, long=34.9049, en="Beit Uziel", slug="beit_uziel"
+        ),
+        "בית עזרא": AreaInfo(
+            lat=31.7364, long=34.6575, en="Beit Ezra", slug="beit_ezra"
+        ),
+        "בית עלמין מורשה": AreaInfo(
+            lat=32.1206, long=34.8549, en="Morasha Cemetery", slug="morasha_cemetery"
+        ),
+        "בית עלמין תל רגב": AreaInfo(
+            lat=32.7678,
+            long=35.1219,
+            en="Tel Regev Cemetary",
+            slug="tel_regev_cemetary",
+        ),
+        "בית עריף": AreaInfo(
+            lat=31.9954, long=34.9351, en="Beit Arif", slug="beit_arif"
+        ),
+        "בית צבי": AreaInfo(lat=32.7189, long=34.9697, en="Beit Zvi", slug="beit_zvi"),
+        "בית קמה": AreaInfo(
+            lat=31.4466, long=34.7622, en="Beit Kama", slug="beit_kama"
+        ),
+        "בית קשת": AreaInfo(
+            lat=32.7184, long=35.395, en="Beit Keshet", slug="beit_keshet"
+        ),
+        "בית רימון": AreaInfo(
+            lat=32.7818, long=35.3277, en="Beit Rimon", slug="beit_rimon"
+        ),
+        "בית שאן": AreaInfo(
+            lat=32.4971, long=35.4973, en="Beit She'an", slug="beit_she_an"
+        ),
+        "בית שמש": AreaInfo(
+            lat=31.747, long=34.9881, en="Beit Shemesh", slug="beit_shemesh"
+        ),
+        "בית שערים": AreaInfo(
+            lat=32.6965, long=35.1788, en="Beit Shea'rim", slug="beit_shea_rim"
+        ),
+        "בית שקמה": AreaInfo(
+            lat=31.6377, long=34.6101, en="Beit Shikma", slug="beit_shikma"
+        ),
+        "ביתן אהרן": AreaInfo(
+            lat=32.3649, long=34.8696, en="Bitan Aharon", slug="bitan_aharon"
+        ),
+        "ביתר עילית": AreaInfo(
+            lat=31.701, long=35.1119, en="Beitar Illit", slug="beitar_illit"
+        ),
+        "בלפוריה": AreaInfo(lat=32.63, long=35.2963, en="Balfuria", slug="balfuria"),
+        "בן זכאי": AreaInfo(
+            lat=31.8572, long=34.7274, en="Ben Zakai", slug="ben_zakai"
+        ),
+        "בן עמי": AreaInfo(lat=33.0054, long=35.1222, en="Ben Ami", slug="ben_ami"),
+        "בן שמן": AreaInfo(
+            lat=31.9513, long=34.9198, en="Ben Shemen", slug="ben_shemen"
+        ),
+        "בני ברק": AreaInfo(
+            lat=32.0849, long=34.8352, en="Bnei Brak", slug="bnei_brak"
+        ),
+        "בני דקלים": AreaInfo(
+            lat=31.5172, long=34.917, en="Bnei Dkalim", slug="bnei_dkalim"
+        ),
+        "בני דרום": AreaInfo(
+            lat=31.8209, long=34.6916, en="Bnei Darom", slug="bnei_darom"
+        ),
+        "בני דרור": AreaInfo(
+            lat=32.2618, long=34.9018, en="Bnei Dror", slug="bnei_dror"
+        ),
+        "בני יהודה וגבעת יואב": AreaInfo(
+            lat=32.7983,
+            long=35.6911,
+            en="Bnei Yehuda and Givat Yoav",
+            slug="bnei_yehuda_and_givat_yoav",
+        ),
+        "בני נצרים": AreaInfo(
+            lat=31.1435, long=34.3164, en="Bnei Netzarim", slug="bnei_netzarim"
+        ),
+        "בני עטרות": AreaInfo(
+            lat=32.0215, long=34.9101, en="Bnei Atarot", slug="bnei_atarot"
+        ),
+        "בני עי''ש": AreaInfo(
+            lat=31.7902, long=34.7593, en="Bnei Ayish", slug="bnei_ayish"
+        ),
+        "בני ציון": AreaInfo(
+            lat=32.2198, long=34.8684, en="Bnei Zion", slug="bnei_zion"
+        ),
+        "בני ראם": AreaInfo(
+            lat=31.77, long=34.7905, en="Bnei Re'em", slug="bnei_re_em"
+        ),
+        "בניה": AreaInfo(lat=31.8434, long=34.7518, en="Bnaya", slug="bnaya"),
+        "בנימינה": AreaInfo(
+            lat=32.5171, long=34.9551, en="Binyamina", slug="binyamina"
+        ),
+        "בסמת טבעון": AreaInfo(
+            lat=32.7363, long=35.1532, en="Basmat Tab'un", slug="basmat_tab_un"
+        ),
+        "בענה": AreaInfo(lat=32.9295, long=35.2719, en="Bi'ina", slug="bi_ina"),
+        "בצרה": AreaInfo(lat=32.2145, long=34.8781, en="Batzra", slug="batzra"),
+        "בצת": AreaInfo(lat=33.07, long=35.1326, en="Betzet", slug="betzet"),
+        "בקוע": AreaInfo(lat=31.8279, long=34.9247, en="Beko'a", slug="beko_a"),
+        "בקעות": AreaInfo(lat=32.2421, long=35.4526, en="Beka'ot", slug="beka_ot"),
+        "בר גיורא": AreaInfo(
+            lat=31.7297, long=35.0734, en="Bar Giora", slug="bar_giora"
+        ),
+        "בר יוחאי": AreaInfo(
+            lat=32.9977, long=35.4482, en="Bar Yochai", slug="bar_yochai"
+        ),
+        "ברוכין": AreaInfo(lat=32.0822, long=35.0941, en="Brukhin", slug="brukhin"),
+        "ברור חיל": AreaInfo(
+            lat=31.557, long=34.6465, en="Bror Hayil", slug="bror_hayil"
+        ),
+        "ברוש": AreaInfo(lat=31.371091, long=34.634933, en="Brosh", slug="brosh"),
+        "ברחבי הארץ": AreaInfo(
+            lat=31.7781,
+            long=35.2164,
+            en="Across the country",
+            slug="across_the_country",
+        ),
+        "ברטעה": AreaInfo(lat=32.4721, long=35.095, en="Bart'a", slug="bart_a"),
+        "ברכיה": AreaInfo(lat=31.668, long=34.6243, en="Berekhya", slug="berekhya"),
+        "ברעם": AreaInfo(lat=33.059, long=35.4332, en="Baram", slug="baram"),
+        "ברקאי": AreaInfo(lat=32.4761, long=35.031, en="Barkai", slug="barkai"),
+        "ברקן": AreaInfo(lat=32.1095, long=35.106, en="Barkan", slug="barkan"),
+        "ברקת": AreaInfo(lat=32.0183, long=34.9432, en="Bareket", slug="bareket"),
+        "בת הדר": AreaInfo(lat=31.6481, long=34.5971, en="Bat Hadar", slug="bat_hadar"),
+        "בת חן": AreaInfo(lat=32.3602, long=34.8724, en="Bat Chen", slug="bat_chen"),
+        "בת חפר": AreaInfo(lat=32.3337, long=35.0137, en="Bat Hefer", slug="bat_hefer"),
+        "בת ים": AreaInfo(lat=32.0146, long=34.7493, en="Bat-Yam", slug="bat_yam"),
+        "בת עין": AreaInfo(lat=31.6577, long=35.1011, en="Bat Ayin", slug="bat_ayin"),
+        "בת שלמה": AreaInfo(
+            lat=32.6003, long=35.0038, en="Bat Shlomo", slug="bat_shlomo"
+        ),
+        "בתי מלון ים המלח": AreaInfo(
+            lat=31.1691, long=35.3673, en="Dead Sea Hotels", slug="dead_sea_hotels"
+        ),
+        "ג'דידה מכר": AreaInfo(
+            lat=32.9287, long=35.1506, en="Jadeidi-Makr", slug="jadeidi_makr"
+        ),
+        "ג'וליס": AreaInfo(lat=32.945, long=35.1842, en="Julis", slug="julis"),
+        "ג'לג'וליה": AreaInfo(lat=32.1525, long=34.954, en="Jaljulia", slug="jaljulia"),
+        "ג'סר א-זרקא": AreaInfo(
+            lat=32.5363, long=34.9116, en="Jisr az-Zarqa", slug="jisr_az_zarqa"
+        ),
+        "ג'ש - גוש חלב": AreaInfo(
+            lat=33.0213, long=35.4479, en="Jish (Gush Halav)", slug="jish_gush_halav"
+        ),
+        "ג'ת": AreaInfo(lat=32.3984, long=35.0361, en="Jatt", slug="jatt"),
+        "גאולי תימן": AreaInfo(
+            lat=32.3918, long=34.901, en="Geulei Teiman", slug="geulei_teiman"
+        ),
+        "גאולים": AreaInfo(lat=32.2965, long=34.9439, en="Geulim", slug="geulim"),
+        "גאליה": AreaInfo(lat=31.8856, long=34.7654, en="Ge'alya", slug="ge_alya"),
+        "גבולות": AreaInfo(lat=31.2112, long=34.4662, en="Gvulot", slug="gvulot"),
+        "גבים, מכללת ספיר": AreaInfo(
+            lat=31.5071,
+            long=34.5974,
+            en="Gavim, Sapir College",
+            slug="gavim_sapir_college",
+        ),
+        "גבע בנימין": AreaInfo(
+            lat=31.85, long=35.2739, en="Geva Binyamin", slug="geva_binyamin"
+        ),
+        "גבע כרמל": AreaInfo(
+            lat=32.6622, long=34.9541, en="Geva Carmel", slug="geva_carmel"
+        ),
+        "גבעון החדשה": AreaInfo(
+            lat=31.8481, long=35.1575, en="Givon HaHadasha", slug="givon_hahadasha"
+        ),
+        "גבעות": AreaInfo(lat=31.6789, long=35.1019, en="Gvaot", slug="gvaot"),
+        "גבעות בר": AreaInfo(
+            lat=31.3572, long=34.7555, en="Giv'ot Bar", slug="giv_ot_bar"
+        ),
+        "גבעות גורל": AreaInfo(
+            lat=31.4098, long=34.7905, en="Goral Hills", slug="goral_hills"
+        ),
+        "גבעות עדן": AreaInfo(
+            lat=31.6622, long=35.0139, en="Giv'ot Eden", slug="giv_ot_eden"
+        ),
+        "גבעת אבני": AreaInfo(
+            lat=32.7754, long=35.4362, en="Giv'at Avni", slug="giv_at_avni"
+        ),
+        "גבעת אלה": AreaInfo(
+            lat=32.722, long=35.2448, en="Givat Ela", slug="givat_ela"
+        ),
+        "גבעת אסף": AreaInfo(
+            lat=31.9112, long=35.2481, en="Giv'at Asaf", slug="giv_at_asaf"
+        ),
+        "גבעת ברנר": AreaInfo(
+            lat=31.8666, long=34.8023, en="Givat Brenner", slug="givat_brenner"
+        ),
+        "גבעת הראל וגבעת הרואה": AreaInfo(
+            lat=32.0563,
+            long=35.2748,
+            en="Giv'at Har'el and Giv'at HaRoeh",
+            slug="giv_at_har_el_and_giv_at_haroeh",
+        ),
+        "גבעת השלושה": AreaInfo(
+            lat=32.0963, long=34.9206, en="Givat HaShlosha", slug="givat_hashlosha"
+        ),
+        "גבעת וולפסון": AreaInfo(
+            lat=32.7202, long=35.0161, en="Givat Wolfson", slug="givat_wolfson"
+        ),
+        "גבעת וושינגטון": AreaInfo(
+            lat=31.8175, long=34.7289, en="Givat Washington", slug="givat_washington"
+        ),
+        "גבעת זאב": AreaInfo(
+            lat=31.8612, long=35.1673, en="Givat Ze'ev", slug="givat_ze_ev"
+        ),
+        "גבעת חביבה": AreaInfo(
+            lat=32.457652, long=35.02009, en="Givat Haviva", slug="givat_haviva"
+        ),
+        "גבעת חיים איחוד": AreaInfo(
+            lat=32.3967, long=34.933, en="Givat Haim (Ihud)", slug="givat_haim_ihud"
+        ),
+        "גבעת חיים מאוחד": AreaInfo(
+            lat=32.3921,
+            long=34.9294,
+            en="Givat Haim (Meuhad)",
+            slug="givat_haim_meuhad",
+        ),
+        "גבעת חן": AreaInfo(
+            lat=32.1676, long=34.8755, en="Givat Hen", slug="givat_hen"
+        ),
+        "גבעת יערים": AreaInfo(
+            lat=31.7861, long=35.0928, en="Givat Yearim", slug="givat_yearim"
+        ),
+        "גבעת ישעיהו": AreaInfo(
+            lat=31.6717, long=34.9437, en="Givat Ishayahu", slug="givat_ishayahu"
+        ),
+        "גבעת כ''ח": AreaInfo(
+            lat=32.032091, long=34.938796, en="Giv'at Ko'ah", slug="giv_at_ko_ah"
+        ),
+        "גבעת ניל''י": AreaInfo(
+            lat=32.549043, long=35.041194, en="Givat Nili", slug="givat_nili"
+        ),
+        "גבעת עדה": AreaInfo(
+            lat=32.521, long=35.0114, en="Givat Ada", slug="givat_ada"
+        ),
+        "גבעת עוז": AreaInfo(lat=32.5559, long=35.198, en="Givat Oz", slug="givat_oz"),
+        "גבעת שמואל": AreaInfo(
+            lat=32.0773, long=34.8492, en="Givat Shmuel", slug="givat_shmuel"
+        ),
+        "גבעת שפירא": AreaInfo(
+            lat=32.3576, long=34.8758, en="Givat Shapira", slug="givat_shapira"
+        ),
+        "גבעתי": AreaInfo(lat=31.7331, long=34.6795, en="Givati", slug="givati"),
+        "גבעתיים": AreaInfo(
+            lat=32.0722, long=34.8089, en="Givatayim", slug="givatayim"
+        ),
+        "גברעם": AreaInfo(lat=31.5915, long=34.6122, en="Gvaram", slug="gvaram"),
+        "גבת": AreaInfo(lat=32.6766, long=35.2132, en="Gvat", slug="gvat"),
+        "גדות": AreaInfo(lat=33.0182, long=35.6195, en="Gadot", slug="gadot"),
+        "גדעונה": AreaInfo(lat=32.5499, long=35.3592, en="Gidona", slug="gidona"),
+        "גדרה": AreaInfo(lat=31.8123, long=34.777, en="Gdera", slug="gdera"),
+        "גונן": AreaInfo(lat=33.124, long=35.6462, en="Gonen", slug="gonen"),
+        "גורן": AreaInfo(lat=33.0556, long=35.2336, en="Goren", slug="goren"),
+        "גורנות הגליל": AreaInfo(
+            lat=33.0593, long=35.2497, en="Gornot HaGalil", slug="gornot_hagalil"
+        ),
+        "גזית": AreaInfo(lat=32.6393, long=35.4462, en="Gazit", slug="gazit"),
+        "גזר": AreaInfo(lat=31.8761, long=34.9203, en="Gezer", slug="gezer"),
+        "גיאה": AreaInfo(lat=31.6285, long=34.6027, en="Ge'a", slug="ge_a"),
+        "גיבתון": AreaInfo(lat=31.8883, long=34.7991, en="Gibton", slug="gibton"),
+        "גיזו": AreaInfo(lat=31.8056, long=34.9397, en="Gizo", slug="gizo"),
+        "גילת": AreaInfo(lat=31.3263, long=34.6489, en="Gilat", slug="gilat"),
+        "גינוסר": AreaInfo(lat=32.8487, long=35.5232, en="Ginosar", slug="ginosar"),
+        "גינתון": AreaInfo(lat=31.9628, long=34.9131, en="Ginaton", slug="ginaton"),
+        "גיתה": AreaInfo(lat=32.9672, long=35.2491, en="Gita", slug="gita"),
+        "גיתית": AreaInfo(lat=32.1003, long=35.3954, en="Gitit", slug="gitit"),
+        "גלאון": AreaInfo(lat=31.6334, long=34.8489, en="Galon", slug="galon"),
+        "גלגל": AreaInfo(lat=32.0004, long=35.4448, en="Gilgal", slug="gilgal"),
+        "גלעד": AreaInfo(lat=32.5575, long=35.0763, en="Gal'ed", slug="gal_ed"),
+        "גמזו": AreaInfo(lat=31.9272, long=34.9411, en="Gimzo", slug="gimzo"),
+        "גן הדרום": AreaInfo(
+            lat=31.8041, long=34.6999, en="Gan HaDarom", slug="gan_hadarom"
+        ),
+        "גן השומרון": AreaInfo(
+            lat=32.465, long=34.999, en="Gan HaShomron", slug="gan_hashomron"
+        ),
+        "גן חיים": AreaInfo(lat=32.1958, long=34.907, en="Gan Haim", slug="gan_haim"),
+        "גן יאשיה": AreaInfo(
+            lat=32.3495, long=34.9962, en="Gan Yoshia", slug="gan_yoshia"
+        ),
+        "גן יבנה": AreaInfo(
+            lat=31.7831, long=34.7031, en="Gan Yavne", slug="gan_yavne"
+        ),
+        "גן נר": AreaInfo(lat=32.5287, long=35.3363, en="Gan Ner", slug="gan_ner"),
+        "גן שורק": AreaInfo(lat=31.944, long=34.7583, en="Gan Sorek", slug="gan_sorek"),
+        "גן שלמה": AreaInfo(
+            lat=31.8788, long=34.7989, en="Gan Shlomo", slug="gan_shlomo"
+        ),
+        "גן שמואל": AreaInfo(
+            lat=32.4529, long=34.9493, en="Gan Shmuel", slug="gan_shmuel"
+        ),
+        "גנות": AreaInfo(lat=32.0182, long=34.8259, en="Ganot", slug="ganot"),
+        "גנות הדר": AreaInfo(
+            lat=32.3217, long=34.9007, en="Ginot Hadar", slug="ginot_hadar"
+        ),
+        "גני הדר": AreaInfo(
+            lat=31.8782, long=34.8576, en="Ganei Hadar", slug="ganei_hadar"
+        ),
+        "גני חוגה": AreaInfo(
+            lat=32.5173, long=35.5392, en="Ganey Hugga", slug="ganey_hugga"
+        ),
+        "גני טל": AreaInfo(lat=31.7886, long=34.7914, en="Ganei Tal", slug="ganei_tal"),
+        "גני יוחנן": AreaInfo(
+            lat=31.8599, long=34.8408, en="Ganei Yochanan", slug="ganei_yochanan"
+        ),
+        "גני עם": AreaInfo(lat=32.1498, long=34.9034, en="Ganei Am", slug="ganei_am"),
+        "גני תקווה": AreaInfo(
+            lat=32.0605, long=34.8731, en="Ganei Tikva", slug="ganei_tikva"
+        ),
+        "גניגר": AreaInfo(lat=32.6634, long=35.2599, en="Genigar", slug="genigar"),
+        "געש": AreaInfo(lat=32.2285, long=34.8244, en="Ga'ash", slug="ga_ash"),
+        "געתון": AreaInfo(lat=33.0061, long=35.2138, en="Ga'aton", slug="ga_aton"),
+        "גפן": AreaInfo(lat=31.7404, long=34.8784, en="Geffen", slug="geffen"),
+        "גרופית": AreaInfo(lat=29.9416, long=35.0647, en="Grofit", slug="grofit"),
+        "גשור": AreaInfo(lat=32.8199, long=35.7157, en="Gshur", slug="gshur"),
+        "גשר": AreaInfo(lat=32.6212, long=35.5504, en="Gesher", slug="gesher"),
+        "גשר הזיו": AreaInfo(
+            lat=33.0405, long=35.1106, en="Gesher HaZiv", slug="gesher_haziv"
+        ),
+        "גת": AreaInfo(lat=31.6278, long=34.7941, en="Gat", slug="gat"),
+        "גת רימון": AreaInfo(
+            lat=32.0681, long=34.8814, en="Gat Rimon", slug="gat_rimon"
+        ),
+        "דבוריה": AreaInfo(lat=32.6941, long=35.3685, en="Daburiyya", slug="daburiyya"),
+        "דביר": AreaInfo(lat=31.4117, long=34.8252, en="Dvir", slug="dvir"),
+        "דברת": AreaInfo(lat=32.6467, long=35.3501, en="Dovrat", slug="dovrat"),
+        "דגניה א": AreaInfo(
+            lat=32.7069, long=35.5751, en="Degania Alef", slug="degania_alef"
+        ),
+        "דגניה ב": AreaInfo(
+            lat=32.6991, long=35.5776, en="Degania Bet", slug="degania_bet"
+        ),
+        "דוב''ב": AreaInfo(lat=33.0508, long=35.407747, en="Dovev", slug="dovev"),
+        "דולב": AreaInfo(lat=31.9262, long=35.1336, en="Dolev", slug="dolev"),
+        "דור": AreaInfo(lat=32.607548, long=34.923294, en="Dor", slug="dor"),
+        "דורות": AreaInfo(lat=31.5072, long=34.6457, en="Dorot", slug="dorot"),
+        "דחי": AreaInfo(lat=32.6225, long=35.3436, en="Ed-Dahi", slug="ed_dahi"),
+        "דימונה": AreaInfo(lat=31.0694, long=35.0334, en="Dimona", slug="dimona"),
+        "דיר אל-אסד": AreaInfo(
+            lat=32.9344, long=35.2684, en="Deir al-Asad", slug="deir_al_asad"
+        ),
+        "דיר חנא": AreaInfo(
+            lat=32.8623, long=35.3653, en="Deir Hanna", slug="deir_hanna"
+        ),
+        "דישון": AreaInfo(lat=33.0823, long=35.5176, en="Dishon", slug="dishon"),
+        "דליה": AreaInfo(lat=32.5892, long=35.077, en="Dalia", slug="dalia"),
+        "דלית אל כרמל": AreaInfo(
+            lat=32.6938, long=35.0554, en="Daliyat al-Karmel", slug="daliyat_al_karmel"
+        ),
+        "דלתון": AreaInfo(lat=33.0166, long=35.4899, en="Dalton", slug="dalton"),
+        "דמיידה": AreaInfo(lat=32.815, long=35.2266, en="Dmeide", slug="dmeide"),
+        "דניאל": AreaInfo(lat=31.3109, long=34.5931, en="Daniel", slug="daniel"),
+        "דפנה": AreaInfo(lat=33.2308, long=35.6383, en="Dafna", slug="dafna"),
+        "דקל": AreaInfo(lat=31.196642, long=34.34709, en="Dekel", slug="dekel"),
+        "האון": AreaInfo(lat=32.7267, long=35.6227, en="Ha'On", slug="ha_on"),
+        "הבונים": AreaInfo(lat=32.6366, long=34.9327, en="HaBonim", slug="habonim"),
+        "הגושרים": AreaInfo(lat=33.2215, long=35.623, en="HaGoshrim", slug="hagoshrim"),
+        "הדר עם": AreaInfo(lat=32.3497, long=34.8989, en="Hadar Am", slug="hadar_am"),
+        "הוד השרון": AreaInfo(
+            lat=32.15, long=34.8839, en="Hod HaSharon", slug="hod_hasharon"
+        ),
+        "הודיה": AreaInfo(lat=31.6764, long=34.6393, en="Hodaya", slug="hodaya"),
+        "הודיות": AreaInfo(lat=32.7886, long=35.435, en="Hodayot", slug="hodayot"),
+        "הושעיה": AreaInfo(lat=32.7579, long=35.2952, en="Hoshaya", slug="hoshaya"),
+        "הזורעים": AreaInfo(lat=32.7481, long=35.4999, en="HaZor'im", slug="hazor_im"),
+        "החותרים": AreaInfo(lat=32.7523, long=34.9575, en="HaHotrim", slug="hahotrim"),
+        "היוגב": AreaInfo(lat=32.6128, long=35.2075, en="HaYogev", slug="hayogev"),
+        "היישוב היהודי חברון": AreaInfo(
+            lat=31.5247,
+            long=35.1073,
+            en="Hevron Jewish Settlement",
+            slug="hevron_jewish_settlement",
+        ),
+        "הילה": AreaInfo(lat=33.0362, long=35.2446, en="Hila", slug="hila"),
+        "המעפיל": AreaInfo(lat=32.378, long=34.9831, en="HaMa'apil", slug="hama_apil"),
+        "המרכז האקדמי רופין": AreaInfo(
+            lat=32.3424,
+            long=34.9123,
+            en="Ruppin Academic Center",
+            slug="ruppin_academic_center",
+        ),
+        "הסוללים": AreaInfo(
+            lat=32.7518, long=35.238, en="HaSollelim", slug="hasollelim"
+        ),
+        "העוגן": AreaInfo(lat=32.3604, long=34.9233, en="HaOgen", slug="haogen"),
+        "הר אדר": AreaInfo(lat=31.8245, long=35.1297, en="Har Adar", slug="har_adar"),
+        "הר ברכה": AreaInfo(
+            lat=32.1933, long=35.2649, en="Har Bracha", slug="har_bracha"
+        ),
+        "הר גילה": AreaInfo(lat=31.7221, long=35.1715, en="Har Gilo", slug="har_gilo"),
+        "הר הנגב": AreaInfo(
+            lat=30.6817, long=34.785, en="Har HaNegev", slug="har_hanegev"
+        ),
+        "הר חלוץ": AreaInfo(
+            lat=32.9497, long=35.3124, en="Har Halutz", slug="har_halutz"
+        ),
+        "הר עמשא": AreaInfo(
+            lat=31.3427, long=35.1016, en="Har Amsha", slug="har_amsha"
+        ),
+        "הראל": AreaInfo(lat=31.80944, long=34.94903, en="Harel", slug="harel"),
+        "הרדוף": AreaInfo(lat=32.7637, long=35.1747, en="Harduf", slug="harduf"),
+        "הרצליה - מערב": AreaInfo(
+            lat=32.1738, long=34.8104, en="Herzliya - West", slug="herzliya_west"
+        ),
+        "הרצליה - מרכז וגליל ים": AreaInfo(
+            lat=32.1678,
+            long=34.8413,
+            en="Herzeliya - Center and Glil Yam",
+            slug="herzeliya_center_and_glil_yam",
+        ),
+        "הררית יחד": AreaInfo(
+            lat=32.8457, long=35.3693, en="Hararit Yachad", slug="hararit_yachad"
+        ),
+        "ואדי אל חמאם": AreaInfo(
+            lat=32.8284, long=35.4917, en="Wadi Hamam", slug="wadi_hamam"
+        ),
+        "ואדי אל נעם דרום": AreaInfo(
+            lat=31.1413,
+            long=34.8265,
+            en="Wadi el Na'am South",
+            slug="wadi_el_na_am_south",
+        ),
+        "ורד יריחו": AreaInfo(
+            lat=31.8262, long=35.4321, en="Vered Yericho", slug="vered_yericho"
+        ),
+        "ורדון": AreaInfo(lat=31.6638, long=34.7818, en="Vardon", slug="vardon"),
+        "זבדיאל": AreaInfo(lat=31.6592, long=34.7603, en="Zavdiel", slug="zavdiel"),
+        "זוהר": AreaInfo(lat=31.5956, long=34.6924, en="Zohar", slug="zohar"),
+        "זיקים": AreaInfo(lat=31.6072, long=34.521, en="Zikim", slug="zikim"),
+        "זיתן": AreaInfo(lat=31.9752, long=34.8917, en="Zeitan", slug="zeitan"),
+        "זכרון יעקב": AreaInfo(
+            lat=32.5739, long=34.952, en="Zichron Yacov", slug="zichron_yacov"
+        ),
+        "זכריה": AreaInfo(lat=31.7088, long=34.9447, en="Zekharia", slug="zekharia"),
+        "זמר": AreaInfo(lat=32.3657, long=35.0347, en="Zemer", slug="zemer"),
+        "זמרת, שובה": AreaInfo(
+            lat=31.4518, long=34.5467, en="Zimrat, Shuva", slug="zimrat_shuva"
+        ),
+        "זנוח": AreaInfo(lat=31.7338, long=34.9994, en="Zanoah", slug="zanoah"),
+        "זרועה": AreaInfo(lat=31.4591, long=34.6242, en="Zru'a", slug="zru_a"),
+        "זרזיר": AreaInfo(lat=32.7233, long=35.2204, en="Zarzir", slug="zarzir"),
+        "זרחיה": AreaInfo(lat=31.6817, long=34.7464, en="Zrahia", slug="zrahia"),
+        "זרעית": AreaInfo(lat=33.099, long=35.2885, en="Zarit", slug="zarit"),
+        "ח'וואלד": AreaInfo(lat=32.7589, long=35.1584, en="Khawaled", slug="khawaled"),
+        "חבצלת השרון וצוקי ים": AreaInfo(
+            lat=32.3601,
+            long=34.8585,
+            en="Havatzelet HaSharon and Tzukei Yam",
+            slug="havatzelet_hasharon_and_tzukei_yam",
+        ),
+        "חג'אג'רה": AreaInfo(lat=32.741, long=35.2049, en="Hajajre", slug="hajajre"),
+        "חגור": AreaInfo(lat=32.1386, long=34.9476, en="Hagor", slug="hagor"),
+        "חגלה": AreaInfo(lat=32.3891, long=34.9243, en="Hogla", slug="hogla"),
+        "חד נס": AreaInfo(lat=32.9275, long=35.6414, en="Had Ness", slug="had_ness"),
+        "חדיד": AreaInfo(lat=31.9694, long=34.9322, en="Hadid", slug="hadid"),
+        "חדרה - מזרח": AreaInfo(
+            lat=32.4258, long=34.9506, en="Hadera - East", slug="hadera_east"
+        ),
+        "חדרה - מערב": AreaInfo(
+            lat=32.439, long=34.8854, en="Hadera - West", slug="hadera_west"
+        ),
+        "חדרה - מרכז": AreaInfo(
+            lat=32.4352, long=34.9209, en="Hadera - Center", slug="hadera_center"
+        ),
+        "חדרה - נווה חיים": AreaInfo(
+            lat=32.446, long=34.9049, en="Hadera - Neveh Haim", slug="hadera_neveh_haim"
+        ),
+        "חוואלד": AreaInfo(lat=32.771, long=35.1362, en="Khawaled", slug="khawaled"),
+        "חוות אירוח גורן": AreaInfo(
+            lat=33.0488,
+            long=35.2201,
+            en="Goren Farm Guesthouse",
+            slug="goren_farm_guesthouse",
+        ),
+        "חוות גלעד": AreaInfo(
+            lat=32.2005, long=35.1812, en="Havat Gil'ad", slug="havat_gil_ad"
+        ),
+        "חוות יאיר": AreaInfo(
+            lat=32.1453, long=35.1048, en="Havat Yair", slug="havat_yair"
+        ),
+        "חוות יזרעם": AreaInfo(
+            lat=31.4434, long=34.5717, en="Havat Izra'am", slug="havat_izra_am"
+        ),
+        "חוות עדן": AreaInfo(
+            lat=32.4658, long=35.4866, en="Havat Eden", slug="havat_eden"
+        ),
+        "חוות ערנדל": AreaInfo(
+            lat=30.1149, long=35.1515, en="Ardanel Ranch", slug="ardanel_ranch"
+        ),
+        "חוות שיקמים": AreaInfo(
+            lat=31.5113, long=34.6339, en="Havat Shikmim", slug="havat_shikmim"
+        ),
+        "חולדה": AreaInfo(lat=31.8321, long=34.8815, en="Hulda", slug="hulda"),
+        "חולון": AreaInfo(lat=32.0158, long=34.7874, en="Holon", slug="holon"),
+        "חולית": AreaInfo(lat=31.2306, long=34.3273, en="Holit", slug="holit"),
+        "חולתה": AreaInfo(lat=33.0529, long=35.6092, en="Hulata", slug="hulata"),
+        "חוסן": AreaInfo(lat=32.9977, long=35.2987, en="Hossen", slug="hossen"),
+        "חוסנייה": AreaInfo(
+            lat=32.9006, long=35.3225, en="Hussniyya", slug="hussniyya"
+        ),
+        "חוף אמנון": AreaInfo(
+            lat=32.8912, long=35.5934, en="Amnon Beach", slug="amnon_beach"
+        ),
+        "חוף בצת": AreaInfo(
+            lat=33.0801, long=35.1066, en="Betzet Beach", slug="betzet_beach"
+        ),
+        "חוף גולן, צאלון": AreaInfo(
+            lat=32.8425,
+            long=35.6508,
+            en="Golan, Tzeelon Beach",
+            slug="golan_tzeelon_beach",
+        ),
+        "חוף גופרה": AreaInfo(
+            lat=32.8042, long=35.6429, en="Gofra Beach", slug="gofra_beach"
+        ),
+        "חוף זיקים": AreaInfo(
+            lat=31.6164, long=34.508, en="Zikim Beach", slug="zikim_beach"
+        ),
+        "חוף כורסי, לבנון, חלוקים": AreaInfo(
+            lat=32.8202,
+            long=35.646,
+            en="Kursi, Lavnun, Halukim Beach",
+            slug="kursi_lavnun_halukim_beach",
+        ),
+        "חוף כינר, דוגה, דוגית": AreaInfo(
+            lat=32.8567,
+            long=35.6473,
+            en="Kinar, Duga, Dugit Beach",
+            slug="kinar_duga_dugit_beach",
+        ),
+        "חוף ניצנים": AreaInfo(
+            lat=31.7457, long=34.6015, en="Nitzanim Beach", slug="nitzanim_beach"
+        ),
+        "חוף סוסיתא": AreaInfo(
+            lat=32.7897, long=35.6398, en="Susita Beach", slug="susita_beach"
+        ),
+        "חוף קליה": AreaInfo(
+            lat=31.7609, long=35.5027, en="Kalia Beach", slug="kalia_beach"
+        ),
+        "חופית": AreaInfo(lat=32.3861, long=34.8741, en="Hofit", slug="hofit"),
+        "חוקוק": AreaInfo(lat=32.8786, long=35.4967, en="Hukok", slug="hukok"),
+        "חורה": AreaInfo(lat=31.3004, long=34.9357, en="Hura", slug="hura"),
+        "חורפיש": AreaInfo(lat=33.0167, long=35.3471, en="Hurfeish", slug="hurfeish"),
+        "חורשים": AreaInfo(lat=32.1379, long=34.971, en="Horashim", slug="horashim"),
+        "חזון": AreaInfo(lat=32.9066, long=35.3953, en="Hazon", slug="hazon"),
+        "חי-בר יטבתה": AreaInfo(
+            lat=29.8462,
+            long=35.0294,
+            en="Yotvata Hai Bar Nature Reserve",
+            slug="yotvata_hai_bar_nature_reserve",
+        ),
+        "חיבת ציון": AreaInfo(
+            lat=32.398, long=34.9119, en="Hibat Zion", slug="hibat_zion"
+        ),
+        "חיננית": AreaInfo(lat=32.4809, long=35.1732, en="Hinanit", slug="hinanit"),
+        "חיפה - כרמל, הדר ועיר תחתית": AreaInfo(
+            lat=32.8072,
+            long=34.9878,
+            en="Haifa - Carmel, Hadar and Downtown Lower City",
+            slug="haifa_carmel_hadar_and_downtown_lower_city",
+        ),
+        "חיפה - מערב": AreaInfo(
+            lat=32.8087, long=34.9603, en="Haifa - West", slug="haifa_west"
+        ),
+        "חיפה - מפרץ": AreaInfo(
+            lat=32.8049, long=35.0521, en="Haifa - Bay", slug="haifa_bay"
+        ),
+        "חיפה - נווה שאנן ורמות כרמל": AreaInfo(
+            lat=32.7812,
+            long=35.0015,
+            en="Haifa - Ramot HaCarmel and Neveh Sha'anan",
+            slug="haifa_ramot_hacarmel_and_neveh_sha_anan",
+        ),
+        "חיפה - קריית חיים ושמואל": AreaInfo(
+            lat=32.8283,
+            long=35.0656,
+            en="Haifa - Kiryat Haim & Kiryat Shmuel",
+            slug="haifa_kiryat_haim_kiryat_shmuel",
+        ),
+        "חירן": AreaInfo(lat=31.3096, long=34.9845, en="Hiran", slug="hiran"),
+        "חלמיש": AreaInfo(lat=32.0083, long=35.1289, en="Halamish", slug="halamish"),
+        "חלץ": AreaInfo(lat=31.5779, long=34.6584, en="Heletz", slug="heletz"),
+        "חמד": AreaInfo(lat=32.018, long=34.8413, en="Hemed", slug="hemed"),
+        "חמדיה": AreaInfo(lat=32.5198, long=35.5206, en="Hamadia", slug="hamadia"),
+        "חמדת": AreaInfo(lat=32.252, long=35.5268, en="Hemdat", slug="hemdat"),
+        "חמרה": AreaInfo(lat=32.1997, long=35.4374, en="Hamra", slug="hamra"),
+        "חמת גדר": AreaInfo(
+            lat=32.6834, long=35.6647, en="Hamat gader", slug="hamat_gader"
+        ),
+        "חניאל": AreaInfo(lat=32.3328, long=34.9477, en="Haniel", slug="haniel"),
+        "חניון הנתיב מהיר": AreaInfo(
+            lat=32.0022,
+            long=34.8421,
+            en="Fast Lane Parking Lot",
+            slug="fast_lane_parking_lot",
+        ),
+        "חניתה": AreaInfo(lat=33.0876, long=35.1734, en="Hanita", slug="hanita"),
+        "חנתון": AreaInfo(lat=32.7831, long=35.2451, en="Hanaton", slug="hanaton"),
+        "חספין": AreaInfo(lat=32.8456, long=35.793, en="Haspin", slug="haspin"),
+        "חפץ חיים": AreaInfo(
+            lat=31.7893, long=34.7997, en="Hafetz Haim", slug="hafetz_haim"
+        ),
+        "חצב": AreaInfo(lat=31.7801, long=34.7706, en="Hatzav", slug="hatzav"),
+        "חצבה": AreaInfo(lat=30.7679, long=35.2785, en="Hatzeva", slug="hatzeva"),
+        "חצור": AreaInfo(lat=31.773, long=34.7199, en="Hatzor", slug="hatzor"),
+        "חצור הגלילית": AreaInfo(
+            lat=32.9804, long=35.5435, en="Hatzor HaGlilit", slug="hatzor_haglilit"
+        ),
+        "חצרים": AreaInfo(lat=31.2406, long=34.7174, en="Hatzerim", slug="hatzerim"),
+        "חרב לאת": AreaInfo(
+            lat=32.4035, long=34.9171, en="Herev Le'Et", slug="herev_le_et"
+        ),
+        "חרוצים": AreaInfo(lat=32.2277, long=34.8648, en="Harutzim", slug="harutzim"),
+        "חרות": AreaInfo(lat=32.241, long=34.9141, en="Herut", slug="herut"),
+        "חריש": AreaInfo(lat=32.4619, long=35.0456, en="Harish", slug="harish"),
+        "חרמש": AreaInfo(lat=32.4237, long=35.119, en="Hermesh", slug="hermesh"),
+        "חרשה": AreaInfo(lat=31.9444, long=35.148, en="Horasha", slug="horasha"),
+        "חרשים": AreaInfo(lat=32.9577, long=35.3282, en="Harashim", slug="harashim"),
+        "חשמונאים": AreaInfo(
+            lat=31.9326, long=35.0233, en="Hashmonaim", slug="hashmonaim"
+        ),
+        "טבחה": AreaInfo(lat=32.8715, long=35.547, en="Tabgha", slug="tabgha"),
+        "טבריה": AreaInfo(lat=32.7959, long=35.531, en="Tiberias", slug="tiberias"),
+        "טובא זנגריה": AreaInfo(
+            lat=32.9662, long=35.592, en="Tuba-Zangariyye", slug="tuba_zangariyye"
+        ),
+        "טורעאן": AreaInfo(lat=32.7751, long=35.3783, en="Turan", slug="turan"),
+        "טייבה": AreaInfo(lat=32.2669, long=35.0097, en="Tayibe", slug="tayibe"),
+        "טייבה בגלבוע": AreaInfo(
+            lat=32.6047, long=35.4446, en="Taibe (Gilboa)", slug="taibe_gilboa"
+        ),
+        "טירה": AreaInfo(lat=32.234394, long=34.951488, en="Tira", slug="tira"),
+        "טירת יהודה": AreaInfo(
+            lat=32.0148, long=34.9359, en="Tirat Yehuda", slug="tirat_yehuda"
+        ),
+        "טירת כרמל": AreaInfo(
+            lat=32.7621, long=34.973, en="Tirat Carmel", slug="tirat_carmel"
+        ),
+        "טירת צבי": AreaInfo(
+            lat=32.4225, long=35.5283, en="Tirat Zvi", slug="tirat_zvi"
+        ),
+        "טל - אל": AreaInfo(lat=32.9262, long=35.1785, en="Tal-El", slug="tal_el"),
+        "טל מנשה": AreaInfo(
+            lat=32.4831, long=35.1607, en="Tal Menashe", slug="tal_menashe"
+        ),
+        "טל שחר": AreaInfo(
+            lat=31.8044, long=34.9033, en="Tal Shachar", slug="tal_shachar"
+        ),
+        "טללים": AreaInfo(lat=30.9915, long=34.7713, en="Tlalim", slug="tlalim"),
+        "טלמון": AreaInfo(lat=31.9395, long=35.1331, en="Talmon", slug="talmon"),
+        "טמרה": AreaInfo(lat=32.8522, long=35.2013, en="Tamra", slug="tamra"),
+        "טמרה בגלבוע": AreaInfo(
+            lat=32.6349, long=35.4027, en="Tamra (Gilboa)", slug="tamra_gilboa"
+        ),
+        "טנא עומרים": AreaInfo(
+            lat=31.3761, long=34.9574, en="Teneh Omarim", slug="teneh_omarim"
+        ),
+        "טפחות": AreaInfo(lat=32.8686, long=35.4222, en="Tefahot", slug="tefahot"),
+        "יבול": AreaInfo(lat=31.1895, long=34.319, en="Yevul", slug="yevul"),
+        "יבנאל": AreaInfo(lat=32.7088, long=35.5038, en="Yavne'el", slug="yavne_el"),
+        "יבנה": AreaInfo(lat=31.878, long=34.7394, en="Yavne", slug="yavne"),
+        "יגור": AreaInfo(lat=32.7415, long=35.0768, en="Yagur", slug="yagur"),
+        "יגל": AreaInfo(lat=31.9878, long=34.8803, en="Yagel", slug="yagel"),
+        "יד בנימין": AreaInfo(
+            lat=31.7967, long=34.8204, en="Yad Binyamin", slug="yad_binyamin"
+        ),
+        "יד השמונה": AreaInfo(
+            lat=31.8095, long=35.0896, en="Yad HaShmona", slug="yad_hashmona"
+        ),
+        "יד חנה": AreaInfo(lat=32.3253, long=35.0067, en="Yad Hana", slug="yad_hana"),
+        "יד מרדכי": AreaInfo(
+            lat=31.587, long=34.5575, en="Yad Mordechai", slug="yad_mordechai"
+        ),
+        "יד נתן": AreaInfo(lat=31.653, long=34.7049, en="Yad Natan", slug="yad_natan"),
+        "יד רמב''ם": AreaInfo(
+            lat=31.899841, long=34.900086, en="Yad Rambam", slug="yad_rambam"
+        ),
+        "יהוד מונוסון": AreaInfo(
+            lat=32.0325, long=34.8872, en="Yehud - Monoson", slug="yehud_monoson"
+        ),
+        "יהל": AreaInfo(lat=30.0842, long=35.1284, en="Yahel", slug="yahel"),
+        "יובלים": AreaInfo(lat=32.8782, long=35.2693, en="Yuvalim", slug="yuvalim"),
+        "יודפת": AreaInfo(lat=32.8366, long=35.2715, en="Yodfat", slug="yodfat"),
+        "יונתן": AreaInfo(lat=32.9397, long=35.7955, en="Yonatan", slug="yonatan"),
+        "יושיביה": AreaInfo(lat=31.4447, long=34.6088, en="Yoshivia", slug="yoshivia"),
+        "יזרעאל": AreaInfo(lat=32.5626, long=35.3194, en="Yizre'el", slug="yizre_el"),
+        "יחיעם": AreaInfo(lat=32.9961, long=35.2211, en="Yechiam", slug="yechiam"),
+        "יטבתה": AreaInfo(lat=29.8963, long=35.0592, en="Yotvata", slug="yotvata"),
+        "ייט''ב": AreaInfo(lat=31.947215, long=35.422375, en="Yitav", slug="yitav"),
+        "יכיני": AreaInfo(lat=31.4822, long=34.5986, en="Yakhini", slug="yakhini"),
+        "ינוב": AreaInfo(lat=32.3074, long=34.9514, en="Yanuv", slug="yanuv"),
+        "ינוח ג'ת": AreaInfo(
+            lat=32.9805, long=35.2552, en="Yanuh-Jat", slug="yanuh_jat"
+        ),
+        "ינון": AreaInfo(lat=31.7418, long=34.7809, en="Yinon", slug="yinon"),
+        "יסוד המעלה": AreaInfo(
+            lat=33.0536, long=35.589, en="Yesud Hama'ala", slug="yesud_hama_ala"
+        ),
+        "יסודות": AreaInfo(lat=31.8158, long=34.8656, en="Yesodot", slug="yesodot"),
+        "יסעור": AreaInfo(lat=32.9011, long=35.1666, en="Yasur", slug="yasur"),
+        "יעד": AreaInfo(lat=32.8812, long=35.2406, en="Ya'ad", slug="ya_ad"),
+        "יעף": AreaInfo(lat=32.2683, long=34.9674, en="Ya'af", slug="ya_af"),
+        "יערה": AreaInfo(lat=33.068, long=35.1861, en="Ya'ara", slug="ya_ara"),
+        "יערות הכרמל": AreaInfo(
+            lat=32.7073, long=35.0107, en="Yearot HaCarmel", slug="yearot_hacarmel"
+        ),
+        "יפיע": AreaInfo(lat=32.695, long=35.282, en="Yafia", slug="yafia"),
+        "יפית": AreaInfo(lat=32.0627, long=35.4743, en="Yafit", slug="yafit"),
+        "יפעת": AreaInfo(lat=32.6759, long=35.224, en="Ifat", slug="ifat"),
+        "יפתח": AreaInfo(lat=33.1283, long=35.552, en="Iftach", slug="iftach"),
+        "יצהר": AreaInfo(lat=32.1685, long=35.2359, en="Itzhar", slug="itzhar"),
+        "יציץ": AreaInfo(lat=31.8632, long=34.8619, en="Yatzitz", slug="yatzitz"),
+        "יקום": AreaInfo(lat=32.2492, long=34.8419, en="Yakum", slug="yakum"),
+        "יקיר": AreaInfo(lat=32.1498, long=35.1146, en="Yakir", slug="yakir"),
+        "יקנעם המושבה והזורע": AreaInfo(
+            lat=32.6559,
+            long=35.1152,
+            en="Yokneam Moshava and HaZoreah",
+            slug="yokneam_moshava_and_hazoreah",
+        ),
+        "יקנעם עילית": AreaInfo(
+            lat=32.6602, long=35.1046, en="Yokneam Illit", slug="yokneam_illit"
+        ),
+        "יראון": AreaInfo(lat=33.0772, long=35.4543, en="Yir'on", slug="yir_on"),
+        "ירדנה": AreaInfo(lat=32.5654, long=35.566, en="Yardena", slug="yardena"),
+        "ירוחם": AreaInfo(lat=30.9878, long=34.9297, en="Yeruham", slug="yeruham"),
+        "ירושלים - אזור תעשייה עטרות": AreaInfo(
+            lat=31.8606,
+            long=35.2167,
+            en="Jerusalem - Atarot Industrial Zone",
+            slug="jerusalem_atarot_industrial_zone",
+        ),
+        "ירושלים - דרום": AreaInfo(
+            lat=31.7377, long=35.1847, en="Jerusalem - South", slug="jerusalem_south"
+        ),
+        "ירושלים - כפר עקב": AreaInfo(
+            lat=31.8749,
+            long=35.2175,
+            en="Jerusalem - Qafr 'Aqab",
+            slug="jerusalem_qafr_aqab",
+        ),
+        "ירושלים - מזרח": AreaInfo(
+            lat=31.7627, long=35.2403, en="Jerusalem - East", slug="jerusalem_east"
+        ),
+        "ירושלים - מערב": AreaInfo(
+            lat=31.7742, long=35.1727, en="Jerusalem - West", slug="jerusalem_west"
+        ),
+        "ירושלים - מרכז": AreaInfo(
+            lat=31.7781, long=35.2164, en="Jerusalem - Center", slug="jerusalem_center"
+        ),
+        "ירושלים - צפון": AreaInfo(
+            lat=31.8211, long=35.2389, en="Jerusalem - North", slug="jerusalem_north"
+        ),
+        "ירחיב": AreaInfo(lat=32.1515, long=34.968, en="Yafhiv", slug="yafhiv"),
+        "ירכא": AreaInfo(lat=32.9535, long=35.212, en="Yarka", slug="yarka"),
+        "ירקונה": AreaInfo(lat=32.1445, long=34.8979, en="Yarkona", slug="yarkona"),
+        "ישובי אומן": AreaInfo(
+            lat=32.5655, long=35.2384, en="Omen Settlements", slug="omen_settlements"
+        ),
+        "ישובי יעל": AreaInfo(
+            lat=32.5521, long=35.3065, en="Yael Settlements", slug="yael_settlements"
+        ),
+        "ישעי": AreaInfo(lat=31.753, long=34.9626, en="Yish'i", slug="yish_i"),
+        "ישרש": AreaInfo(lat=31.9157, long=34.8473, en="Yashresh", slug="yashresh"),
+        "יתד": AreaInfo(lat=31.207, long=34.3261, en="Yated", slug="yated"),
+        "כאבול": AreaInfo(lat=32.87, long=35.2054, en="Kabul", slug="kabul"),
+        "כאוכב אבו אלהיג'א": AreaInfo(
+            lat=32.8319,
+            long=35.2487,
+            en="Kaukab Abu al-Hija",
+            slug="kaukab_abu_al_hija",
+        ),
+        "כברי": AreaInfo(lat=33.021, long=35.147, en="Cabri", slug="cabri"),
+        "כדורי": AreaInfo(lat=32.7062, long=35.4063, en="Kadoorie", slug="kadoorie"),
+        "כוכב השחר": AreaInfo(
+            lat=31.9603, long=35.3494, en="Kokhav HaShahar", slug="kokhav_hashahar"
+        ),
+        "כוכב יאיר - צור יגאל": AreaInfo(
+            lat=32.2209,
+            long=34.9924,
+            en="Kokhav Ya'ir - Tzur Yigal",
+            slug="kokhav_ya_ir_tzur_yigal",
+        ),
+        "כוכב יעקב": AreaInfo(
+            lat=31.8803, long=35.2459, en="Kokhav Ya'akov", slug="kokhav_ya_akov"
+        ),
+        "כוכב מיכאל": AreaInfo(
+            lat=31.6315, long=34.6678, en="Kokhav Michael", slug="kokhav_michael"
+        ),
+        "כורזים ורד הגליל": AreaInfo(
+            lat=32.9042,
+            long=35.5508,
+            en="Korazim Vered HaGalil",
+            slug="korazim_vered_hagalil",
+        ),
+        "כושי רמון": AreaInfo(
+            lat=30.3066, long=35.1346, en="Kushi Rimon", slug="kushi_rimon"
+        ),
+        "כחל": AreaInfo(lat=32.8905, long=35.5116, en="Kahal", slug="kahal"),
+        "כינרת מושבה": AreaInfo(
+            lat=32.7238, long=35.5652, en="Moshavat Kinneret", slug="moshavat_kinneret"
+        ),
+        "כינרת קבוצה": AreaInfo(
+            lat=32.7142, long=35.5627, en="Kvutzat Kinneret", slug="kvutzat_kinneret"
+        ),
+        "כיסופים": AreaInfo(lat=31.3745, long=34.399, en="Kissufim", slug="kissufim"),
+        "כישור": AreaInfo(lat=32.9467, long=35.2502, en="Kishor", slug="kishor"),
+        "כל הארץ": AreaInfo(
+            lat=31.7781, long=35.2164, en="Entire country", slug="entire_country"
+        ),
+        "כלא דמון": AreaInfo(
+            lat=32.7332, long=35.0234, en="Damon Priosn", slug="damon_priosn"
+        ),
+        "כליל": AreaInfo(lat=32.9836, long=35.1997, en="Klil", slug="klil"),
+        "כלנית": AreaInfo(lat=32.8753, long=35.454, en="Kalanit", slug="kalanit"),
+        "כמהין": AreaInfo(lat=30.9103, long=34.4307, en="Kmehin", slug="kmehin"),
+        "כמון": AreaInfo(lat=32.9125, long=35.3555, en="Kamon", slug="kamon"),
+        "כנות": AreaInfo(lat=31.8022, long=34.7509, en="Kannot", slug="kannot"),
+        "כנף": AreaInfo(lat=32.8704, long=35.6979, en="Kanaf", slug="kanaf"),
+        "כסייפה": AreaInfo(lat=31.2347, long=35.0681, en="Kuseife", slug="kuseife"),
+        "כסלון": AreaInfo(lat=31.7743, long=35.0482, en="Ksalon", slug="ksalon"),
+        "כסרא סמיע": AreaInfo(
+            lat=32.9714, long=35.3116, en="Kisra-Sumei", slug="kisra_sumei"
+        ),
+        "כעביה": AreaInfo(lat=32.7567, long=35.1865, en="Ka'abiyye", slug="ka_abiyye"),
+        "כעביה טבאש": AreaInfo(
+            lat=32.7504, long=35.184, en="Ka'abiyye Tabbash", slug="ka_abiyye_tabbash"
+        ),
+        "כפר אביב": AreaInfo(
+            lat=31.831, long=34.7226, en="Kfar Aviv", slug="kfar_aviv"
+        ),
+        "כפר אדומים": AreaInfo(
+            lat=31.8272, long=35.3372, en="Kfar Edomim", slug="kfar_edomim"
+        ),
+        "כפר אוריה": AreaInfo(
+            lat=31.7934, long=34.9448, en="Kfar Uriah", slug="kfar_uriah"
+        ),
+        "כפר אחים": AreaInfo(
+            lat=31.7459, long=34.7559, en="Kfar Achim", slug="kfar_achim"
+        ),
+        "כפר אלדד": AreaInfo(
+            lat=31.654, long=35.251, en="Kfar Eldad", slug="kfar_eldad"
+        ),
+        "כפר ביאליק": AreaInfo(
+            lat=32.8214, long=35.0877, en="Kfar Biyalik", slug="kfar_biyalik"
+        ),
+        "כפר ביל''ו": AreaInfo(
+            lat=31.870475, long=34.826734, en="Kfar Bilu", slug="kfar_bilu"
+        ),
+        "כפר בלום": AreaInfo(
+            lat=33.1725, long=35.6079, en="Kfar Blum", slug="kfar_blum"
+        ),
+        "כפר בן נון": AreaInfo(
+            lat=31.8617, long=34.9472, en="Kfar Bin Nun", slug="kfar_bin_nun"
+        ),
+        "כפר ברא": AreaInfo(
+            lat=32.1309, long=34.9701, en="Kafr Bara", slug="kafr_bara"
+        ),
+        "כפר ברוך": AreaInfo(
+            lat=32.646, long=35.1931, en="Kfar Baruch", slug="kfar_baruch"
+        ),
+        "כפר גדעון": AreaInfo(
+            lat=32.6446, long=35.2893, en="Kfar Gidon", slug="kfar_gidon"
+        ),
+        "כפר גלים": AreaInfo(
+            lat=32.7662, long=34.9595, en="Kfar Galim", slug="kfar_galim"
+        ),
+        "כפר גליקסון": AreaInfo(
+            lat=32.5058, long=35.0035, en="Kfar Glickson", slug="kfar_glickson"
+        ),
+        "כפר גלעדי": AreaInfo(
+            lat=33.2421, long=35.5741, en="Kfar Giladi", slug="kfar_giladi"
+        ),
+        "כפר גמילה מלכישוע": AreaInfo(
+            lat=32.4386,
+            long=35.4128,
+            en="Mlkishua Rehabilitation Village",
+            slug="mlkishua_rehabilitation_village",
+        ),
+        "כפר דניאל": AreaInfo(
+            lat=31.9335, long=34.9323, en="Kfar Daniel", slug="kfar_daniel"
+        ),
+        "כפר האורנים": AreaInfo(
+            lat=31.9199, long=35.0369, en="Kfar HaOranim", slug="kfar_haoranim"
+        ),
+        "כפר החורש": AreaInfo(
+            lat=32.7015, long=35.273, en="Kfar HaHoresh", slug="kfar_hahoresh"
+        ),
+        "כפר המכבי": AreaInfo(
+            lat=32.7918, long=35.1148, en="Kfar HaMaccabi", slug="kfar_hamaccabi"
+        ),
+        "כפר הנגיד": AreaInfo(
+            lat=31.8871, long=34.7487, en="Kfar HaNagid", slug="kfar_hanagid"
+        ),
+        "כפר הנוער ימין אורד": AreaInfo(
+            lat=32.7016,
+            long=34.9898,
+            en="Yemin Orde Youth Village",
+            slug="yemin_orde_youth_village",
+        ),
+        "כפר הנוער קריית יערים": AreaInfo(
+            lat=31.8126,
+            long=35.1049,
+            en="Kiryat Ye'arim Youth Village",
+            slug="kiryat_ye_arim_youth_village",
+        ),
+        "כפר הנוקדים": AreaInfo(
+            lat=31.3048, long=35.2696, en="Kfar HaNokdim", slug="kfar_hanokdim"
+        ),
+        "כפר הנשיא": AreaInfo(
+            lat=32.9747, long=35.6023, en="Kfar HaNassi", slug="kfar_hanassi"
+        ),
+        "כפר הס": AreaInfo(lat=32.2477, long=34.9351, en="Kfar Hess", slug="kfar_hess"),
+        "כפר הרא''ה": AreaInfo(
+            lat=32.391037, long=34.910917, en="Kfar HaRoeh", slug="kfar_haroeh"
+        ),
+        "כפר הרי''ף וצומת ראם": AreaInfo(
+            lat=31.747,
+            long=34.7909,
+            en="Kfar HaRif and Re'em Junction",
+            slug="kfar_harif_and_re_em_junction",
+        ),
+        "כפר ויתקין": AreaInfo(
+            lat=32.3805, long=34.8753, en="Kfar Vitkin", slug="kfar_vitkin"
+        ),
+        "כפר ורבורג": AreaInfo(
+            lat=31.7187, long=34.7287, en="Kfar Warburg", slug="kfar_warburg"
+        ),
+        "כפר ורדים": AreaInfo(
+            lat=32.9951, long=35.2691, en="Kfar Vradim", slug="kfar_vradim"
+        ),
+        "כפר זוהרים": AreaInfo(
+            lat=31.6226, long=34.9257, en="Kfar Zoharim", slug="kfar_zoharim"
+        ),
+        "כפר זיתים": AreaInfo(
+            lat=32.8116, long=35.4652, en="Kfar Zeitim", slug="kfar_zeitim"
+        ),
+        "כפר חב''ד": AreaInfo(
+            lat=31.990144, long=34.849103, en="Kfar Chabad", slug="kfar_chabad"
+        ),
+        "כפר חיטים": AreaInfo(
+            lat=32.8, long=35.5033, en="Kfar Hittim", slug="kfar_hittim"
+        ),
+        "כפר חיים": AreaInfo(
+            lat=32.3539, long=34.9007, en="Kfar Haim", slug="kfar_haim"
+        ),
+        "כפר חנניה": AreaInfo(
+            lat=32.916, long=35.4238, en="Kfar Hanania", slug="kfar_hanania"
+        ),
+        "כפר חסידים": AreaInfo(
+            lat=32.7523, long=35.0942, en="Kfar Hassidim", slug="kfar_hassidim"
+        ),
+        "כפר חרוב": AreaInfo(
+            lat=32.7624, long=35.6642, en="Kfar Haruv", slug="kfar_haruv"
+        ),
+        "כפר טבאש": AreaInfo(
+            lat=32.7485, long=35.1707, en="Kafr Tabbash", slug="kafr_tabbash"
+        ),
+        "כפר טרומן": AreaInfo(
+            lat=31.9805, long=34.9277, en="Kfar Truman", slug="kfar_truman"
+        ),
+        "כפר יאסיף": AreaInfo(
+            lat=32.9531, long=35.1611, en="Kfar Yassif", slug="kfar_yassif"
+        ),
+        "כפר ידידיה": AreaInfo(
+            lat=32.3449, long=34.899, en="Kfar Yedidia", slug="kfar_yedidia"
+        ),
+        "כפר יהושע": AreaInfo(
+            lat=32.6816, long=35.152, en="Kfar Yehoshua", slug="kfar_yehoshua"
+        ),
+        "כפר יובל": AreaInfo(
+            lat=33.2466, long=35.5964, en="Kfar Yuval", slug="kfar_yuval"
+        ),
+        "כפר יונה": AreaInfo(
+            lat=32.3177, long=34.9336, en="Kfar Yona", slug="kfar_yona"
+        ),
+        "כפר יחזקאל": AreaInfo(
+            lat=32.5669, long=35.3609, en="Kfar Yechezkel", slug="kfar_yechezkel"
+        ),
+        "כפר יעבץ": AreaInfo(
+            lat=32.2739, long=34.9655, en="Kfar Yavetz", slug="kfar_yavetz"
+        ),
+        "כפר כמא": AreaInfo(
+            lat=32.7211, long=35.4428, en="Kfar Kama", slug="kfar_kama"
+        ),
+        "כפר כנא": AreaInfo(
+            lat=32.7482, long=35.3438, en="Kfar Kana", slug="kfar_kana"
+        ),
+        "כפר מונש": AreaInfo(
+            lat=32.3456, long=34.9164, en="Kfar Monash", slug="kfar_monash"
+        ),
+        "כפר מימון ותושיה": AreaInfo(
+            lat=31.4324,
+            long=34.5384,
+            en="Kfar Maimon and Tushia",
+            slug="kfar_maimon_and_tushia",
+        ),
+        "כפר מל''ל": AreaInfo(
+            lat=32.167567, long=34.894744, en="Kafr Misr", slug="kafr_misr"
+        ),
+        "כפר מנדא": AreaInfo(
+            lat=32.8124, long=35.2586, en="Kfar Manda", slug="kfar_manda"
+        ),
+        "כפר מנחם": AreaInfo(
+            lat=31.7321, long=34.8351, en="Kfar Menachem", slug="kfar_menachem"
+        ),
+        "כפר מסריק": AreaInfo(
+            lat=32.8912, long=35.0984, en="Kfar Masaryk", slug="kfar_masaryk"
+        ),
+        "כפר מצר": AreaInfo(
+            lat=32.6453, long=35.4221, en="Kafr Misr", slug="kafr_misr"
+        ),
+        "כפר מרדכי": AreaInfo(
+            lat=31.8315, long=34.7566, en="Kfar Mordechai", slug="kfar_mordechai"
+        ),
+        "כפר נהר הירדן": AreaInfo(
+            lat=32.7683,
+            long=35.4356,
+            en="Kfar Nehar HaYarden",
+            slug="kfar_nehar_hayarden",
+        ),
+        "כפר נוער בן שמן": AreaInfo(
+            lat=31.9597,
+            long=34.9291,
+            en="Ben Shemen Youth Village",
+            slug="ben_shemen_youth_village",
+        ),
+        "כפר נחום": AreaInfo(
+            lat=32.8842, long=35.5775, en="Kfar Nahum", slug="kfar_nahum"
+        ),
+        "כפר נטר": AreaInfo(
+            lat=32.2719, long=34.872, en="Kfar Netter", slug="kfar_netter"
+        ),
+        "כפר סאלד": AreaInfo(
+            lat=33.196, long=35.658, en="Kfar Szold", slug="kfar_szold"
+        ),
+        "כפר סבא": AreaInfo(
+            lat=32.1782, long=34.9076, en="Kfar Saba", slug="kfar_saba"
+        ),
+        "כפר סילבר": AreaInfo(
+            lat=31.673, long=34.6121, en="Kfar Silver", slug="kfar_silver"
+        ),
+        "כפר סירקין": AreaInfo(
+            lat=32.0767, long=34.9228, en="Kfar Sirkin", slug="kfar_sirkin"
+        ),
+        "כפר עבודה": AreaInfo(
+            lat=32.2557, long=34.9397, en="Kfar Avoda", slug="kfar_avoda"
+        ),
+        "כפר עזה": AreaInfo(
+            lat=31.4834, long=34.5323, en="Kfar Azza", slug="kfar_azza"
+        ),
+        "כפר עציון": AreaInfo(
+            lat=31.6495, long=35.1152, en="Kfar Etzion", slug="kfar_etzion"
+        ),
+        "כפר פינס": AreaInfo(
+            lat=32.4827, long=35.0021, en="Kfar Pinnes", slug="kfar_pinnes"
+        ),
+        "כפר קאסם": AreaInfo(
+            lat=32.1141, long=34.9728, en="Kfar Kassem", slug="kfar_kassem"
+        ),
+        "כפר קיש": AreaInfo(lat=32.6661, long=35.449, en="Kfar Kish", slug="kfar_kish"),
+        "כפר קרע": AreaInfo(
+            lat=32.5055, long=35.0543, en="Kfar Kara", slug="kfar_kara"
+        ),
+        "כפר רופין": AreaInfo(
+            lat=32.4576, long=35.5557, en="Kfar Ruppin", slug="kfar_ruppin"
+        ),
+        "כפר רות": AreaInfo(lat=31.9104, long=35.0353, en="Kfar Rut", slug="kfar_rut"),
+        "כפר שמאי": AreaInfo(
+            lat=32.9557, long=35.4579, en="Kfar Shamai", slug="kfar_shamai"
+        ),
+        "כפר שמואל": AreaInfo(
+            lat=31.8883, long=34.9348, en="Kfar Shmuel", slug="kfar_shmuel"
+        ),
+        "כפר שמריהו": AreaInfo(
+            lat=32.1871, long=34.8231, en="Kfar Shmaryahu", slug="kfar_shmaryahu"
+        ),
+        "כפר תבור": AreaInfo(
+            lat=32.6873, long=35.42, en="Kfar Tavor", slug="kfar_tavor"
+        ),
+        "כפר תפוח": AreaInfo(
+            lat=32.118, long=35.2498, en="Kfar Tapuach", slug="kfar_tapuach"
+        ),
+        "כפר תקווה": AreaInfo(
+            lat=32.7013, long=35.115, en="Kfar Tikva", slug="kfar_tikva"
+        ),
+        "כרכום": AreaInfo(lat=32.9283, long=35.6063, en="Karkom", slug="karkom"),
+        "כרם ביבנה": AreaInfo(
+            lat=31.817, long=34.7236, en="Kerem BeYavne", slug="kerem_beyavne"
+        ),
+        "כרם בן זמרה": AreaInfo(
+            lat=33.0392, long=35.4699, en="Kerem Ben Zimra", slug="kerem_ben_zimra"
+        ),
+        "כרם מהר''ל": AreaInfo(
+            lat=32.644325, long=34.99145, en="Kerem Maharal", slug="kerem_maharal"
+        ),
+        "כרם רעים": AreaInfo(
+            lat=31.9583, long=35.138, en="Kerem Reim", slug="kerem_reim"
+        ),
+        "כרם שלום": AreaInfo(
+            lat=31.2283, long=34.2846, en="Kerem Shalom", slug="kerem_shalom"
+        ),
+        "כרמי יוסף": AreaInfo(
+            lat=31.848, long=34.9213, en="Karmei Yossef", slug="karmei_yossef"
+        ),
+        "כרמי צור": AreaInfo(
+            lat=31.6095, long=35.1013, en="Karmei Tzur", slug="karmei_tzur"
+        ),
+        "כרמי קטיף": AreaInfo(
+            lat=31.5378, long=34.912, en="Karmei Katif", slug="karmei_katif"
+        ),
+        "כרמיאל": AreaInfo(lat=32.9147, long=35.2924, en="Karmiel", slug="karmiel"),
+        "כרמיה": AreaInfo(lat=31.6027, long=34.5404, en="Karmia", slug="karmia"),
+        "כרמים": AreaInfo(lat=31.3337, long=34.9179, en="Kramim", slug="kramim"),
+        "כרמית": AreaInfo(lat=31.3322, long=34.8968, en="Carmit", slug="carmit"),
+        "כרמל": AreaInfo(lat=31.4318, long=35.1828, en="Carmel", slug="carmel"),
+        "לב החולה": AreaInfo(
+            lat=33.1103, long=35.5819, en="Lev Ha-Hula", slug="lev_ha_hula"
+        ),
+        "לבון": AreaInfo(lat=32.9412, long=35.2865, en="Lavon", slug="lavon"),
+        "לביא": AreaInfo(lat=32.7876, long=35.4407, en="Lavi", slug="lavi"),
+        "לבנים": AreaInfo(lat=32.8638, long=35.4975, en="Livnim", slug="livnim"),
+        "להב": AreaInfo(lat=31.3794, long=34.8713, en="Lahav", slug="lahav"),
+        "להבות הבשן": AreaInfo(
+            lat=33.1412, long=35.6479, en="Lehavot HaBashan", slug="lehavot_habashan"
+        ),
+        "להבות חביבה": AreaInfo(
+            lat=32.3952, long=35.0118, en="Lehavot Haviva", slug="lehavot_haviva"
+        ),
+        "להבים": AreaInfo(lat=31.3738, long=34.817, en="Lehavim", slug="lehavim"),
+        "לוד": AreaInfo(lat=31.951, long=34.8881, en="Lod", slug="lod"),
+        "לוזית": AreaInfo(lat=31.6882, long=34.8882, en="Luzit", slug="luzit"),
+        "לוחמי הגטאות": AreaInfo(
+            lat=32.9627, long=35.0967, en="Lochamei HaGetaot", slug="lochamei_hagetaot"
+        ),
+        "לוטם וחמדון": AreaInfo(
+            lat=32.8809, long=35.36, en="Lotem and Hamdon", slug="lotem_and_hamdon"
+        ),
+        "לוטן": AreaInfo(lat=29.9883, long=35.0868, en="Lotan", slug="lotan"),
+        "לטרון": AreaInfo(lat=31.8369, long=34.9772, en="Latrun", slug="latrun"),
+        "לימן": AreaInfo(lat=33.0587, long=35.1118, en="Lehman", slug="lehman"),
+        "לכיש": AreaInfo(lat=31.5609, long=34.8441, en="Lakhish", slug="lakhish"),
+        "לפיד": AreaInfo(lat=31.917, long=35.0318, en="Lapid", slug="lapid"),
+        "לפידות": AreaInfo(lat=32.9598, long=35.261, en="Lapidot", slug="lapidot"),
+        "לקיה": AreaInfo(lat=31.3249, long=34.8662, en="Laqiya", slug="laqiya"),
+        "מאור": AreaInfo(lat=32.4258, long=35.0053, en="Maor", slug="maor"),
+        "מאיר שפיה": AreaInfo(
+            lat=32.5912, long=34.9711, en="Meir Shfeya", slug="meir_shfeya"
+        ),
+        "מבוא ביתר": AreaInfo(
+            lat=31.7226, long=35.1067, en="Mevo Beitar", slug="mevo_beitar"
+        ),
+        "מבוא דותן": AreaInfo(
+            lat=32.4208, long=35.1739, en="Mevo Dotan", slug="mevo_dotan"
+        ),
+        "מבוא חורון": AreaInfo(
+            lat=31.8496, long=35.035, en="Mevo Horon", slug="mevo_horon"
+        ),
+        "מבוא חמה": AreaInfo(
+            lat=32.7367, long=35.6552, en="Mevo Hama", slug="mevo_hama"
+        ),
+        "מבוא מודיעים": AreaInfo(
+            lat=31.9339, long=34.988, en="Mevo Modi'im", slug="mevo_modi_im"
+        ),
+        "מבואות יריחו": AreaInfo(
+            lat=31.9074, long=35.4156, en="Mevuot Yericho", slug="mevuot_yericho"
+        ),
+        "מבועים": AreaInfo(lat=31.4494, long=34.655, en="Mabu'im", slug="mabu_im"),
+        "מבטחים, עמיעוז, ישע": AreaInfo(
+            lat=31.2426,
+            long=34.4065,
+            en="Mivtahim, Ami'oz, Yesha",
+            slug="mivtahim_ami_oz_yesha",
+        ),
+        "מבקיעים": AreaInfo(lat=31.6225, long=34.5774, en="Mavki'im", slug="mavki_im"),
+        "מבשרת ציון": AreaInfo(
+            lat=31.8041, long=35.1579, en="Mevasseret Zion", slug="mevasseret_zion"
+        ),
+        "מג'דל כרום": AreaInfo(
+            lat=32.9201, long=35.2566, en="Majd al-Krum", slug="majd_al_krum"
+        ),
+        "מג'דל שמס": AreaInfo(
+            lat=33.2691, long=35.7721, en="Majdal Shams", slug="majdal_shams"
+        ),
+        "מגדים": AreaInfo(lat=32.7277, long=34.9609, en="Megadim", slug="megadim"),
+        "מגדל": AreaInfo(lat=32.8395, long=35.4998, en="Migdal", slug="migdal"),
+        "מגדל העמק": AreaInfo(
+            lat=32.6778, long=35.2417, en="Migdal HaEmek", slug="migdal_haemek"
+        ),
+        "מגדל עוז": AreaInfo(
+            lat=31.6409, long=35.1431, en="Migdal Oz", slug="migdal_oz"
+        ),
+        "מגדל תפן": AreaInfo(
+            lat=32.9767, long=35.278, en="Migdal Tefen", slug="migdal_tefen"
+        ),
+        "מגדלים": AreaInfo(lat=32.0899, long=35.3426, en="Megadlim", slug="megadlim"),
+        "מגל": AreaInfo(lat=32.3856, long=35.0361, en="Magal", slug="magal"),
+        "מגן": AreaInfo(lat=31.2987362, long=34.4269827, en="Magen", slug="magen"),
+        "מגן שאול": AreaInfo(
+            lat=32.5215, long=35.3064, en="Magen Shaul", slug="magen_shaul"
+        ),
+        "מגרון": AreaInfo(lat=31.874167, long=35.259588, en="Migron", slug="migron"),
+        "מגשימים": AreaInfo(
+            lat=32.0444, long=34.8998, en="Magshimim", slug="magshimim"
+        ),
+        "מדרך עוז": AreaInfo(
+            lat=32.5946, long=35.158, en="Midrach Oz", slug="midrach_oz"
+        ),
+        "מדרשת בן גוריון": AreaInfo(
+            lat=30.8523,
+            long=34.7834,
+            en="Ben Gurion College",
+            slug="ben_gurion_college",
+        ),
+        "מודיעין - ישפרו סנטר": AreaInfo(
+            lat=31.8898056,
+            long=34.9649992,
+            en="Modi'in - Ishpro Center",
+            slug="modi_in_ishpro_center",
+        ),
+        "מודיעין - ליגד סנטר": AreaInfo(
+            lat=31.9211897,
+            long=34.9701743,
+            en="Modi'in - Ligad Center",
+            slug="modi_in_ligad_center",
+        ),
+        "מודיעין מכבים רעות": AreaInfo(
+            lat=31.8903,
+            long=35.0104,
+            en="Modi'in Maccabim Re'ut",
+            slug="modi_in_maccabim_re_ut",
+        ),
+        "מודיעין עילית": AreaInfo(
+            lat=31.9325, long=35.0423, en="Modi'in Illit", slug="modi_in_illit"
+        ),
+        "מולדת": AreaInfo(lat=32.5862, long=35.4389, en="Moledet", slug="moledet"),
+        "מועאוויה": AreaInfo(lat=32.5319, long=35.1029, en="Mu'awiya", slug="mu_awiya"),
+        "מוצא עילית": AreaInfo(
+            lat=31.7936, long=35.157, en="Motza Illit", slug="motza_illit"
+        ),
+        "מוקיבלה": AreaInfo(lat=32.5151, long=35.2948, en="Muqeible", slug="muqeible"),
+        "מורן": AreaInfo(lat=32.9216, long=35.3948, en="Moran", slug="moran"),
+        "מורשת": AreaInfo(lat=32.8261, long=35.232, en="Moreshet", slug="moreshet"),
+        "מזור": AreaInfo(lat=32.0507, long=34.9314, en="Mazor", slug="mazor"),
+        "מזכרת בתיה": AreaInfo(
+            lat=31.8532, long=34.8424, en="Mazkeret Batya", slug="mazkeret_batya"
+        ),
+        "מזרע": AreaInfo(lat=32.6499, long=35.2864, en="Mizra", slug="mizra"),
+        "מזרעה": AreaInfo(lat=32.9837, long=35.0989, en="Mazra'a", slug="mazra_a"),
+        "מחולה": AreaInfo(lat=32.3653, long=35.516, en="Mehola", slug="mehola"),
+        "מחניים": AreaInfo(lat=32.9888, long=35.5704, en="Machanaim", slug="machanaim"),
+        "מחסיה": AreaInfo(lat=31.7489, long=35.0073, en="Mahsiya", slug="mahsiya"),
+        "מטווח ניר עם": AreaInfo(
+            lat=31.5128,
+            long=34.5543,
+            en="Nir Am Shooting Range",
+            slug="nir_am_shooting_range",
+        ),
+        "מטולה": AreaInfo(lat=33.2772, long=35.5782, en="Metulla", slug="metulla"),
+        "מטע": AreaInfo(lat=31.7165, long=35.0606, en="Mata", slug="mata"),
+        "מי עמי": AreaInfo(lat=32.505, long=35.1464, en="Mei Ami", slug="mei_ami"),
+        "מייסר": AreaInfo(lat=32.4452, long=35.0421, en="Meiser", slug="meiser"),
+        "מיני ישראל - נחשון": AreaInfo(
+            lat=31.8425,
+            long=34.9685,
+            en="Mini Israel - Nachshon",
+            slug="mini_israel_nachshon",
+        ),
+        "מיצד": AreaInfo(lat=31.5862, long=35.1876, en="Metzad", slug="metzad"),
+        "מיצר": AreaInfo(lat=32.7686, long=35.7364, en="Metzar", slug="metzar"),
+        "מירב": AreaInfo(lat=32.452, long=35.4225, en="Merav", slug="merav"),
+        "מירון": AreaInfo(lat=32.9852, long=35.4416, en="Meron", slug="meron"),
+        "מישר": AreaInfo(lat=31.8159, long=34.7526, en="Meishar", slug="meishar"),
+        "מיתר": AreaInfo(lat=31.327, long=34.9432, en="Meitar", slug="meitar"),
+        "מכון וינגייט": AreaInfo(
+            lat=32.263, long=34.837, en="Wingate Institute", slug="wingate_institute"
+        ),
+        "מכורה": AreaInfo(lat=32.1642, long=35.4236, en="Mekhora", slug="mekhora"),
+        "מכמורת": AreaInfo(lat=32.4065, long=34.8716, en="Mikhmoret", slug="mikhmoret"),
+        "מכמנים": AreaInfo(lat=32.9075, long=35.3287, en="Mikhmanim", slug="mikhmanim"),
+        "מלון אחוזת ירדן": AreaInfo(
+            lat=33.0452,
+            long=35.5735,
+            en="Yarden Estate Boutique Hotel",
+            slug="yarden_estate_boutique_hotel",
+        ),
+        "מלון סיקס סנסס שחרות": AreaInfo(
+            lat=29.9165,
+            long=35.0028,
+            en="Six Senses Shaharut Hotel",
+            slug="six_senses_shaharut_hotel",
+        ),
+        "מלון פרא": AreaInfo(
+            lat=33.0122, long=35.6514, en="Pereh Hotel", slug="pereh_hotel"
+        ),
+        "מלונות ים המלח מרכז": AreaInfo(
+            lat=31.1803,
+            long=35.3645,
+            en="Dead Sea Hotels - Center",
+            slug="dead_sea_hotels_center",
+        ),
+        "מלכיה": AreaInfo(lat=33.0986, long=35.5096, en="Malkia", slug="malkia"),
+        "ממשית": AreaInfo(lat=31.0345, long=35.0478, en="Mamshit", slug="mamshit"),
+        "מנוחה": AreaInfo(lat=31.6562, long=34.7773, en="Menucha", slug="menucha"),
+        "מנוף": AreaInfo(lat=32.8533, long=35.2374, en="Manof", slug="manof"),
+        "מנות": AreaInfo(lat=33.0387, long=35.1952, en="Manot", slug="manot"),
+        "מנחמיה": AreaInfo(lat=32.6643, long=35.5553, en="Menahemia", slug="menahemia"),
+        "מנחת מחניים": AreaInfo(
+            lat=32.9781,
+            long=35.572,
+            en="Machanaim landing pad",
+            slug="machanaim_landing_pad",
+        ),
+        "מנרה": AreaInfo(lat=33.1954, long=35.5437, en="Manara", slug="manara"),
+        "מנשית זבדה": AreaInfo(
+            lat=32.7062, long=35.1924, en="Manshiya Zabda", slug="manshiya_zabda"
+        ),
+        "מסד": AreaInfo(lat=32.8442, long=35.4232, en="Massad", slug="massad"),
+        "מסדה": AreaInfo(lat=32.6823, long=35.5977, en="Masada", slug="masada"),
+        "מסילות": AreaInfo(lat=32.4974, long=35.4747, en="Messilot", slug="messilot"),
+        "מסילת ציון": AreaInfo(
+            lat=31.8014, long=35.0095, en="Mesillat Zion", slug="mesillat_zion"
+        ),
+        "מסלול": AreaInfo(lat=31.3253422, long=34.5885811, en="Maslul", slug="maslul"),
+        "מסעדה": AreaInfo(lat=33.2321, long=35.7556, en="Mas'ade", slug="mas_ade"),
+        "מע'אר": AreaInfo(lat=32.8907, long=35.4046, en="Maghar", slug="maghar"),
+        "מעברות": AreaInfo(lat=32.3642, long=34.9057, en="Ma'abarot", slug="ma_abarot"),
+        "מעגלים, גבעולים, מלילות": AreaInfo(
+            lat=31.392,
+            long=34.5943,
+            en="Ma'galim, Giv'olim, M'lilot",
+            slug="ma_galim_giv_olim_m_lilot",
+        ),
+        "מעגן": AreaInfo(lat=32.7063, long=35.6006, en="Ma'agan", slug="ma_agan"),
+        "מעגן מיכאל": AreaInfo(
+            lat=32.5587, long=34.9178, en="Ma'agan Michael", slug="ma_agan_michael"
+        ),
+        "מעוז חיים": AreaInfo(
+            lat=32.4941, long=35.5508, en="Maoz Haim", slug="maoz_haim"
+        ),
+        "מעון": AreaInfo(lat=31.4146, long=35.1639, en="Ma'on", slug="ma_on"),
+        "מעון צופיה": AreaInfo(
+            lat=31.8557, long=34.7379, en="Maon Tzofia", slug="maon_tzofia"
+        ),
+        "מעונה": AreaInfo(lat=33.0169, long=35.2636, en="Maona", slug="maona"),
+        "מעיין ברוך": AreaInfo(
+            lat=33.2393, long=35.6094, en="Ma'ayan Baruch", slug="ma_ayan_baruch"
+        ),
+        "מעיין צבי": AreaInfo(
+            lat=32.5685, long=34.9406, en="Ma'ayan Zvi", slug="ma_ayan_zvi"
+        ),
+        "מעיליא": AreaInfo(lat=33.0272, long=35.2563, en="Mi'ilya", slug="mi_ilya"),
+        "מעלה אדומים": AreaInfo(
+            lat=31.7774, long=35.298, en="Ma'aleh Edomim", slug="ma_aleh_edomim"
+        ),
+        "מעלה אפרים": AreaInfo(
+            lat=32.0713, long=35.4039, en="Ma'aleh Ephraim", slug="ma_aleh_ephraim"
+        ),
+        "מעלה גלבוע": AreaInfo(
+            lat=32.4761, long=35.4206, en="Ma'aleh Gilboa", slug="ma_aleh_gilboa"
+        ),
+        "מעלה גמלא": AreaInfo(
+            lat=32.8883, long=35.686, en="Ma'aleh Gamla", slug="ma_aleh_gamla"
+        ),
+        "מעלה החמישה": AreaInfo(
+            lat=31.8174, long=35.1094, en="Ma'aleh HaHamisha", slug="ma_aleh_hahamisha"
+        ),
+        "מעלה חבר": AreaInfo(
+            lat=31.4871, long=35.1651, en="Ma'ale Hever", slug="ma_ale_hever"
+        ),
+        "מעלה לבונה": AreaInfo(
+            lat=32.0544, long=35.2395, en="Ma'aleh Levona", slug="ma_aleh_levona"
+        ),
+        "מעלה מכמש": AreaInfo(
+            lat=31.8791, long=35.3059, en="Ma'aleh Michmash", slug="ma_aleh_michmash"
+        ),
+        "מעלה עירון": AreaInfo(
+            lat=32.5541, long=35.1825, en="Ma'aleh Iron", slug="ma_aleh_iron"
+        ),
+        "מעלה עמוס": AreaInfo(
+            lat=31.5969, long=35.2294, en="Ma'aleh Amos", slug="ma_aleh_amos"
+        ),
+        "מעלה צביה": AreaInfo(
+            lat=32.8894, long=35.3314, en="Ma'aleh Zvia", slug="ma_aleh_zvia"
+        ),
+        "מעלה רחבעם": AreaInfo(
+            lat=31.6494, long=35.2589, en="Ma'ale Rekhav'am", slug="ma_ale_rekhav_am"
+        ),
+        "מעלות תרשיחא": AreaInfo(
+            lat=33.015, long=35.276, en="Ma'a lot Tarshicha", slug="ma_a_lot_tarshicha"
+        ),
+        "מענית": AreaInfo(lat=32.458, long=35.0266, en="Ma'anit", slug="ma_anit"),
+        "מעש": AreaInfo(lat=32.0635, long=34.8926, en="Maas", slug="maas"),
+        "מפלסים": AreaInfo(lat=31.5022, long=34.5617, en="Mefalsim", slug="mefalsim"),
+        "מפעל אגריגדה": AreaInfo(
+            lat=31.8141, long=34.8252, en="Agrigada Factory", slug="agrigada_factory"
+        ),
+        "מצדה": AreaInfo(lat=31.3114, long=35.3627, en="Massada", slug="massada"),
+        "מצובה": AreaInfo(lat=33.0623, long=35.1557, en="Metzuba", slug="metzuba"),
+        "מצוק עורבים": AreaInfo(
+            lat=33.1307, long=35.6818, en="Matzok Orvim", slug="matzok_orvim"
+        ),
+        "מצוקי דרגות": AreaInfo(
+            lat=31.591, long=35.3933, en="Metzokei Dragot", slug="metzokei_dragot"
+        ),
+        "מצליח": AreaInfo(lat=31.9064, long=34.8713, en="Matzliach", slug="matzliach"),
+        "מצפה": AreaInfo(lat=32.79, long=35.5079, en="Mitzpeh", slug="mitzpeh"),
+        "מצפה אבי''ב": AreaInfo(
+            lat=32.837951, long=35.201059, en="Mitzpeh Aviv", slug="mitzpeh_aviv"
+        ),
+        "מצפה אילן": AreaInfo(
+            lat=32.4614, long=35.0689, en="Mitzpeh Ilan", slug="mitzpeh_ilan"
+        ),
+        "מצפה יריחו": AreaInfo(
+            lat=31.8157, long=35.3954, en="Mitzpeh Yericho", slug="mitzpeh_yericho"
+        ),
+        "מצפה נטופה": AreaInfo(
+            lat=32.8017, long=35.3835, en="Mitzpeh Netofa", slug="mitzpeh_netofa"
+        ),
+        "מצפה רמון": AreaInfo(
+            lat=30.6102, long=34.8019, en="Mitzpeh Ramon", slug="mitzpeh_ramon"
+        ),
+        "מצפה שלם": AreaInfo(
+            lat=31.5689, long=35.4004, en="Mitzpeh Shalem", slug="mitzpeh_shalem"
+        ),
+        "מצר": AreaInfo(lat=32.4402, long=35.0477, en="Metzer", slug="metzer"),
+        "מקווה ישראל": AreaInfo(
+            lat=32.03, long=34.7829, en="Mikveh Israel", slug="mikveh_israel"
+        ),
+        "מרגליות": AreaInfo(
+            lat=33.2165, long=35.5444, en="Margaliot", slug="margaliot"
+        ),
+        "מרום גולן": AreaInfo(
+            lat=33.1326, long=35.7771, en="Merom Golan", slug="merom_golan"
+        ),
+        "מרחב עם": AreaInfo(lat=30.888, long=34.8282, en="Merhav Am", slug="merhav_am"),
+        "מרחביה מושב": AreaInfo(
+            lat=32.6048, long=35.316, en="Merhavia Moshav", slug="merhavia_moshav"
+        ),
+        "מרחביה קיבוץ": AreaInfo(
+            lat=32.6059, long=35.3073, en="Merhavia Kibbutz", slug="merhavia_kibbutz"
+        ),
+        "מרחצאות עין גדי": AreaInfo(
+            lat=31.4173, long=35.3785, en="Ein Gedi Baths", slug="ein_gedi_baths"
+        ),
+        "מרכז אזורי דרום השרון": AreaInfo(
+            lat=32.1336,
+            long=34.912,
+            en="Southern Sharon Regional Center",
+            slug="southern_sharon_regional_center",
+        ),
+        "מרכז אזורי מבואות חרמון": AreaInfo(
+            lat=33.1209,
+            long=35.5699,
+            en="Mevuot Hermon Regional Council",
+            slug="mevuot_hermon_regional_council",
+        ),
+        "מרכז אזורי מגילות": AreaInfo(
+            lat=31.7738,
+            long=35.5038,
+            en="Megilot Regional Center",
+            slug="megilot_regional_center",
+        ),
+        "מרכז אזורי מרום גליל": AreaInfo(
+            lat=32.998,
+            long=35.4415,
+            en="Marom HaGalil Regional Center",
+            slug="marom_hagalil_regional_center",
+        ),
+        "מרכז אזורי משגב": AreaInfo(
+            lat=32.8588,
+            long=35.2598,
+            en="Misgav Regional Center",
+            slug="misgav_regional_center",
+        ),
+        "מרכז חבר": AreaInfo(
+            lat=32.5483, long=35.2661, en="Merkaz Hever", slug="merkaz_hever"
+        ),
+        "מרכז ימי קיסריה": AreaInfo(
+            lat=32.5017,
+            long=34.8925,
+            en="Caesarea Marine Center",
+            slug="caesarea_marine_center",
+        ),
+        "מרכז מיר''ב": AreaInfo(
+            lat=32.64726, long=34.964089, en="Merav Center", slug="merav_center"
+        ),
+        "מרכז שפירא": AreaInfo(
+            lat=31.6969, long=34.7073, en="Merkaz Shapira", slug="merkaz_shapira"
+        ),
+        "מרעית": AreaInfo(lat=31.2812, long=35.0534, en="Mar'it", slug="mar_it"),
+        "משאבי שדה": AreaInfo(
+            lat=31.004, long=34.785, en="Mashabei Sadeh", slug="mashabei_sadeh"
+        ),
+        "משגב דב": AreaInfo(
+            lat=31.8191, long=34.7392, en="Misgav Dov", slug="misgav_dov"
+        ),
+        "משגב עם": AreaInfo(
+            lat=33.2476, long=35.5485, en="Misgav Am", slug="misgav_am"
+        ),
+        "משהד": AreaInfo(lat=32.7389, long=35.3225, en="Mashhad", slug="mashhad"),
+        "משואה": AreaInfo(lat=32.1124, long=35.4914, en="Masua", slug="masua"),
+        "משואות יצחק": AreaInfo(
+            lat=31.7026, long=34.69, en="Masuot Itzhak", slug="masuot_itzhak"
+        ),
+        "משכיות": AreaInfo(lat=32.3179, long=35.5028, en="Maskiot", slug="maskiot"),
+        "משמר איילון": AreaInfo(
+            lat=31.8725, long=34.9433, en="Mishmar Ayalon", slug="mishmar_ayalon"
+        ),
+        "משמר דוד": AreaInfo(
+            lat=31.8236, long=34.9007, en="Mishmar David", slug="mishmar_david"
+        ),
+        "משמר הירדן": AreaInfo(
+            lat=33.0035, long=35.5983, en="Mishmar HaYarden", slug="mishmar_hayarden"
+        ),
+        "משמר הנגב": AreaInfo(
+            lat=31.3648, long=34.718, en="Mishmar HaNegev", slug="mishmar_hanegev"
+        ),
+        "משמר העמק": AreaInfo(
+            lat=32.6101, long=35.1427, en="Mishmar HaEmek", slug="mishmar_haemek"
+        ),
+        "משמר השבעה": AreaInfo(
+            lat=32.0109, long=34.8223, en="Mishmar HaShiva", slug="mishmar_hashiva"
+        ),
+        "משמר השרון": AreaInfo(
+            lat=32.3563, long=34.9043, en="Mishmar HaSharon", slug="mishmar_hasharon"
+        ),
+        "משמרות": AreaInfo(lat=32.4865, long=34.9839, en="Mishmarot", slug="mishmarot"),
+        "משמרת": AreaInfo(lat=32.2276, long=34.9221, en="Mishmeret", slug="mishmeret"),
+        "משען": AreaInfo(lat=31.6569, long=34.6216, en="Mishan", slug="mishan"),
+        'מתחם "חנה וסע" שפיים': AreaInfo(
+            lat=32.2132,
+            long=34.8344,
+            en='Shfayim "Haneh Ve\'sa" Compound',
+            slug="shfayim_haneh_ve_sa_compound",
+        ),
+        "מתחם בני דרום": AreaInfo(
+            lat=31.8233,
+            long=34.6994,
+            en="Bnei Darom Compound",
+            slug="bnei_darom_compound",
+        ),
+        "מתחם סקי גלבוע": AreaInfo(
+            lat=32.5528, long=35.3352, en="Gilboa Ski Resort", slug="gilboa_ski_resort"
+        ),
+        "מתחם פי גלילות": AreaInfo(
+            lat=32.1384,
+            long=34.8045,
+            en="Gelilot - Pi Compound",
+            slug="gelilot_pi_compound",
+        ),
+        "מתחם צומת שוקת": AreaInfo(
+            lat=31.3095,
+            long=34.8982,
+            en="Shoket Junction Center",
+            slug="shoket_junction_center",
+        ),
+        "מתחם שביל התפוזים": AreaInfo(
+            lat=32.4597,
+            long=34.9407,
+            en="Shvil HaTapuzim Compound",
+            slug="shvil_hatapuzim_compound",
+        ),
+        "מתן": AreaInfo(lat=32.1594, long=34.9732, en="Matan", slug="matan"),
+        "מתת": AreaInfo(lat=33.0417, long=35.3567, en="Matat", slug="matat"),
+        "מתתיהו": AreaInfo(lat=31.9297, long=35.035, en="Matityahu", slug="matityahu"),
+        "נאות גולן": AreaInfo(
+            lat=32.787, long=35.6932, en="Neot Golan", slug="neot_golan"
+        ),
+        "נאות הכיכר": AreaInfo(
+            lat=30.9334, long=35.3781, en="Neot HaKikar", slug="neot_hakikar"
+        ),
+        "נאות מרדכי": AreaInfo(
+            lat=33.1598, long=35.5956, en="Neot Mordechai", slug="neot_mordechai"
+        ),
+        "נאות סמדר": AreaInfo(
+            lat=30.0491, long=35.0281, en="Neot Smadar", slug="neot_smadar"
+        ),
+        "נאות קדומים": AreaInfo(
+            lat=31.9479, long=34.9728, en="Neot Kedumim", slug="neot_kedumim"
+        ),
+        "נאעורה": AreaInfo(lat=32.6079, long=35.3902, en="Na'ura", slug="na_ura"),
+        "נבטים": AreaInfo(lat=31.2198, long=34.8825, en="Nevatim", slug="nevatim"),
+        "נבי סמואל": AreaInfo(
+            lat=31.8329, long=35.1811, en="Nebi Samuel", slug="nebi_samuel"
+        ),
+        "נבי שועייב": AreaInfo(
+            lat=32.8058, long=35.4522, en="Nabi Shu'ayb", slug="nabi_shu_ayb"
+        ),
+        "נגבה": AreaInfo(lat=31.6625, long=34.6796, en="Negba", slug="negba"),
+        "נגוהות": AreaInfo(lat=31.4931, long=34.9833, en="Negohot", slug="negohot"),
+        "נהורה": AreaInfo(lat=31.6213, long=34.7045, en="Nehora", slug="nehora"),
+        "נהלל": AreaInfo(lat=32.6908, long=35.1961, en="Nahalal", slug="nahalal"),
+        "נהריה": AreaInfo(lat=33.0085, long=35.0981, en="Nahariya", slug="nahariya"),
+        "נוב": AreaInfo(lat=32.8329, long=35.7836, en="Nov", slug="nov"),
+        "נוגה": AreaInfo(lat=31.6257, long=34.6953, en="Noga", slug="noga"),
+        "נוה איתן": AreaInfo(
+            lat=32.4917, long=35.5322, en="Neve Eitan", slug="neve_eitan"
+        ),
+        "נווה": AreaInfo(lat=31.1622, long=34.3298, en="Naveh", slug="naveh"),
+        "נווה אור": AreaInfo(lat=32.589, long=35.5545, en="Neveh Or", slug="neveh_or"),
+        "נווה אטי''ב": AreaInfo(
+            lat=33.26202, long=35.740574, en="Neveh Ativ", slug="neveh_ativ"
+        ),
+        "נווה אילן": AreaInfo(
+            lat=31.8076, long=35.0809, en="Neveh Ilan", slug="neveh_ilan"
+        ),
+        "נווה דניאל": AreaInfo(
+            lat=31.6763, long=35.1433, en="Neveh Daniel", slug="neveh_daniel"
+        ),
+        "נווה זוהר": AreaInfo(
+            lat=31.1521, long=35.3648, en="Neveh Zohar", slug="neveh_zohar"
+        ),
+        "נווה זיו": AreaInfo(
+            lat=33.0274, long=35.1843, en="Neveh Ziv", slug="neveh_ziv"
+        ),
+        "נווה חריף": AreaInfo(
+            lat=30.0398, long=35.0365, en="Neveh Harif", slug="neveh_harif"
+        ),
+        "נווה ים": AreaInfo(
+            lat=32.6798, long=34.9319, en="Neveh Yam", slug="neveh_yam"
+        ),
+        "נווה ימין": AreaInfo(
+            lat=32.1717, long=34.9394, en="Neveh Yamin", slug="neveh_yamin"
+        ),
+        "נווה ירק": AreaInfo(
+            lat=32.1327, long=34.9255, en="Neveh Yarak", slug="neveh_yarak"
+        ),
+        "נווה מבטח": AreaInfo(
+            lat=31.8068, long=34.7412, en="Neveh Mivtach", slug="neveh_mivtach"
+        ),
+        "נווה מיכאל - רוגלית": AreaInfo(
+            lat=31.6728,
+            long=35.0037,
+            en="Neveh Michael (Rogalit)",
+            slug="neveh_michael_rogalit",
+        ),
+        "נווה שלום": AreaInfo(
+            lat=31.8174, long=34.9783, en="Neveh Shalom", slug="neveh_shalom"
+        ),
+        "נועם": AreaInfo(lat=31.5686, long=34.7882, en="Noam", slug="noam"),
+        "נוף איילון": AreaInfo(
+            lat=31.8712, long=34.9913, en="Noff Ayalon", slug="noff_ayalon"
+        ),
+        "נוף הגליל": AreaInfo(
+            lat=32.71, long=35.3227, en="Nof HaGalil", slug="nof_hagalil"
+        ),
+        "נופי נחמיה": AreaInfo(
+            lat=32.0982, long=35.2359, en="Nofei Nehemiah", slug="nofei_nehemiah"
+        ),
+        "נופי פרת": AreaInfo(
+            lat=31.8235, long=35.3199, en="Nofei Prat", slug="nofei_prat"
+        ),
+        "נופים": AreaInfo(lat=32.1555, long=35.0998, en="Nofim", slug="nofim"),
+        "נופית": AreaInfo(lat=32.7634, long=35.1483, en="Nofit", slug="nofit"),
+        "נופך": AreaInfo(lat=32.0437, long=34.9203, en="Nofech", slug="nofech"),
+        "נוקדים": AreaInfo(lat=31.6458, long=35.2504, en="Nokdim", slug="nokdim"),
+        "נורדיה": AreaInfo(lat=32.3147, long=34.8968, en="Nordia", slug="nordia"),
+        "נורית": AreaInfo(lat=32.5432, long=35.3558, en="Nurit", slug="nurit"),
+        "נחושה": AreaInfo(lat=31.6288, long=34.9527, en="Nehusha", slug="nehusha"),
+        "נחל עוז": AreaInfo(
+            lat=31.4727, long=34.4977, en="Nachal Oz", slug="nachal_oz"
+        ),
+        "נחלה": AreaInfo(lat=31.66, long=34.7928, en="Nachla", slug="nachla"),
+        "נחליאל": AreaInfo(lat=31.9735, long=35.1404, en="Nachliel", slug="nachliel"),
+        "נחלים": AreaInfo(lat=32.0586, long=34.9136, en="Nechalim", slug="nechalim"),
+        "נחם": AreaInfo(lat=31.7665, long=35.0036, en="Naham", slug="naham"),
+        "נחף": AreaInfo(lat=32.9347, long=35.3165, en="Nachaf", slug="nachaf"),
+        "נחשולים": AreaInfo(
+            lat=32.6131, long=34.9222, en="Nachsholim", slug="nachsholim"
+        ),
+        "נחשון": AreaInfo(lat=31.8316, long=34.956, en="Nachshon", slug="nachshon"),
+        "נחשונים": AreaInfo(
+            lat=32.0632, long=34.947, en="Nachshonim", slug="nachshonim"
+        ),
+        "נטועה": AreaInfo(lat=33.0654, long=35.3234, en="Netua", slug="netua"),
+        "נטור": AreaInfo(lat=32.8541, long=35.7526, en="Natur", slug="natur"),
+        "נטע": AreaInfo(lat=31.4761, long=34.9268, en="Neta", slug="neta"),
+        "נטעים": AreaInfo(lat=31.9457, long=34.7751, en="Neta'im", slug="neta_im"),
+        "נטף": AreaInfo(lat=31.8313, long=35.0696, en="Nataf", slug="nataf"),
+        "נילי": AreaInfo(lat=31.9623, long=35.0458, en="Nili", slug="nili"),
+        "נין": AreaInfo(lat=32.631, long=35.3494, en="Nin", slug="nin"),
+        "ניצן": AreaInfo(lat=31.7375, long=34.6308, en="Nitzan", slug="nitzan"),
+        "ניצנה": AreaInfo(lat=30.886, long=34.4226, en="Nitzana", slug="nitzana"),
+        "ניצני עוז": AreaInfo(
+            lat=32.3061, long=35.0033, en="Nitzanei Oz", slug="nitzanei_oz"
+        ),
+        "ניצנים": AreaInfo(lat=31.7178, long=34.6346, en="Nitzanim", slug="nitzanim"),
+        "ניר אליהו": AreaInfo(
+            lat=32.1976, long=34.9494, en="Nir Eliyahu", slug="nir_eliyahu"
+        ),
+        "ניר בנים": AreaInfo(
+            lat=31.6712, long=34.755, en="Nir Banim", slug="nir_banim"
+        ),
+        "ניר גלים": AreaInfo(
+            lat=31.8255, long=34.6825, en="Nir Galim", slug="nir_galim"
+        ),
+        "ניר דוד": AreaInfo(
+            lat=32.5041, long=35.4576, en="Nir David", slug="nir_david"
+        ),
+        "ניר ח''ן": AreaInfo(
+            lat=31.608906, long=34.714282, en="Nir Chen", slug="nir_chen"
+        ),
+        "ניר יצחק": AreaInfo(
+            lat=31.236, long=34.3567, en="Nir Itzhak", slug="nir_itzhak"
+        ),
+        "ניר ישראל": AreaInfo(
+            lat=31.6922, long=34.6381, en="Nir Israel", slug="nir_israel"
+        ),
+        "ניר משה": AreaInfo(
+            lat=31.4775, long=34.6301, en="Nir Moshe", slug="nir_moshe"
+        ),
+        "ניר עוז": AreaInfo(lat=31.3097, long=34.4021, en="Nir Oz", slug="nir_oz"),
+        "ניר עם": AreaInfo(lat=31.5184, long=34.5805, en="Nir Am", slug="nir_am"),
+        "ניר עציון": AreaInfo(
+            lat=32.6991, long=34.9925, en="Nir Etzion", slug="nir_etzion"
+        ),
+        "ניר עקיבא": AreaInfo(
+            lat=31.4699, long=34.6462, en="Nir Akiva", slug="nir_akiva"
+        ),
+        "ניר צבי": AreaInfo(lat=31.9544, long=34.8615, en="Nir Zvi", slug="nir_zvi"),
+        "נירים": AreaInfo(lat=31.3357, long=34.3941, en="Nirim", slug="nirim"),
+        "נירית": AreaInfo(lat=32.1462, long=34.9848, en="Nirit", slug="nirit"),
+        "נמרוד": AreaInfo(lat=33.2453, long=35.7516, en="Nimrod", slug="nimrod"),
+        "נס הרים": AreaInfo(
+            lat=31.7442, long=35.0594, en="Ness Harim", slug="ness_harim"
+        ),
+        "נס עמים": AreaInfo(
+            lat=32.9655, long=35.1216, en="Ness Amim", slug="ness_amim"
+        ),
+        "נס ציונה": AreaInfo(
+            lat=31.9321, long=34.8013, en="Ness Ziona", slug="ness_ziona"
+        ),
+        "נעורים": AreaInfo(lat=32.3713, long=34.8614, en="Neurim", slug="neurim"),
+        "נעלה": AreaInfo(lat=31.9626, long=35.066, en="Na'aleh", slug="na_aleh"),
+        "נעמה": AreaInfo(lat=31.9076, long=35.4662, en="Na'ama", slug="na_ama"),
+        "נען": AreaInfo(lat=31.8832, long=34.8592, en="Na'an", slug="na_an"),
+        "נערן": AreaInfo(lat=31.9682, long=35.4539, en="Niran", slug="niran"),
+        "נצר חזני": AreaInfo(
+            lat=31.8214, long=34.8626, en="Netzer Hazani", slug="netzer_hazani"
+        ),
+        "נצר סרני": AreaInfo(
+            lat=31.9228, long=34.8212, en="Netzer Sireni", slug="netzer_sireni"
+        ),
+        "נצרת": AreaInfo(lat=32.6996, long=35.3035, en="Nazareth", slug="nazareth"),
+        "נריה": AreaInfo(lat=31.954293, long=35.127604, en="Neria", slug="neria"),
+        "נשר": AreaInfo(lat=32.7649, long=35.0492, en="Nesher", slug="nesher"),
+        "נתיב הגדוד": AreaInfo(
+            lat=31.9894, long=35.4433, en="Netiv HaGdud", slug="netiv_hagdud"
+        ),
+        "נתיב הל''ה": AreaInfo(
+            lat=31.687184,
+            long=34.982523,
+            en="Netiv HaLamed-Heh",
+            slug="netiv_halamed_heh",
+        ),
+        "נתיב העשרה": AreaInfo(
+            lat=31.5724, long=34.5393, en="Netiv HaAssara", slug="netiv_haassara"
+        ),
+        "נתיב השיירה": AreaInfo(
+            lat=32.9912, long=35.1307, en="Netiv HaShayara", slug="netiv_hashayara"
+        ),
+        "נתיבות": AreaInfo(lat=31.4232, long=34.5953, en="Netivot", slug="netivot"),
+        "נתניה - מזרח": AreaInfo(
+            lat=32.3001, long=34.8727, en="Netanya - East", slug="netanya_east"
+        ),
+        "נתניה - מערב": AreaInfo(
+            lat=32.3095, long=34.8542, en="Netanya - West", slug="netanya_west"
+        ),
+        "סאג'ור": AreaInfo(lat=32.9431, long=35.3436, en="Sajur", slug="sajur"),
+        "סאסא": AreaInfo(lat=33.0287, long=35.3946, en="Sassa", slug="sassa"),
+        "סביון": AreaInfo(lat=32.0456, long=34.8766, en="Savyon", slug="savyon"),
+        "סגולה": AreaInfo(lat=31.6695, long=34.7784, en="Sgula", slug="sgula"),
+        "סואעד חמירה": AreaInfo(
+            lat=32.7669, long=35.1682, en="Sawad Humeria", slug="sawad_humeria"
+        ),
+        "סולם": AreaInfo(lat=32.6056, long=35.3343, en="Sulam", slug="sulam"),
+        "סוסיא": AreaInfo(lat=31.3866, long=35.1204, en="Susya", slug="susya"),
+        "סופה": AreaInfo(lat=31.2383, long=34.342, en="Sufa", slug="sufa"),
+        "סינמה סיטי גלילות": AreaInfo(
+            lat=32.1473,
+            long=34.8063,
+            en="Cinema City Glilot",
+            slug="cinema_city_glilot",
+        ),
+        "סכנין": AreaInfo(lat=32.8642, long=35.2945, en="Sakhnin", slug="sakhnin"),
+        "סלמה": AreaInfo(lat=32.8932, long=35.3705, en="Salama", slug="salama"),
+        "סלעית": AreaInfo(lat=32.2426, long=35.0513, en="Salit", slug="salit"),
+        "סמר": AreaInfo(lat=29.834, long=35.0222, en="Samar", slug="samar"),
+        "סנדלה": AreaInfo(lat=32.5224, long=35.3244, en="Sandala", slug="sandala"),
+        "סנסנה": AreaInfo(lat=31.3618, long=34.901, en="Sansana", slug="sansana"),
+        "סעד": AreaInfo(lat=31.4702, long=34.5344, en="Sa'ad", slug="sa_ad"),
+        "סעווה": AreaInfo(lat=31.251, long=34.9528, en="Sa'wa", slug="sa_wa"),
+        "סער": AreaInfo(lat=33.0287, long=35.1092, en="Sa'ar", slug="sa_ar"),
+        "ספיר": AreaInfo(lat=30.6139, long=35.1845, en="Sapir", slug="sapir"),
+        "ספסופה - כפר חושן": AreaInfo(
+            lat=33.0131,
+            long=35.4402,
+            en="Safsufa (Kfar Hoshen)",
+            slug="safsufa_kfar_hoshen",
+        ),
+        "סתריה": AreaInfo(lat=31.8899, long=34.8421, en="Sitria", slug="sitria"),
+        "ע'ג'ר": AreaInfo(lat=33.2728, long=35.6242, en="Ghajar", slug="ghajar"),
+        "עבדון": AreaInfo(lat=33.0488, long=35.1791, en="Avdon", slug="avdon"),
+        "עבדת": AreaInfo(lat=30.7923, long=34.7687, en="Ovdat", slug="ovdat"),
+        "עברון": AreaInfo(lat=32.9911, long=35.1, en="Evron", slug="evron"),
+        "עגור": AreaInfo(lat=31.6975, long=34.912, en="Agur", slug="agur"),
+        "עדי": AreaInfo(lat=32.7824, long=35.1734, en="Adi", slug="adi"),
+        "עדי עד": AreaInfo(lat=32.0398, long=35.3352, en="Adei Ad", slug="adei_ad"),
+        "עדנים": AreaInfo(lat=32.1388, long=34.9091, en="Adanim", slug="adanim"),
+        "עוזה": AreaInfo(lat=31.593, long=34.7645, en="Uzza", slug="uzza"),
+        "עוזייר": AreaInfo(lat=32.7906, long=35.3269, en="Uzeir", slug="uzeir"),
+        "עולש": AreaInfo(lat=32.332, long=34.9853, en="Olesh", slug="olesh"),
+        "עומר": AreaInfo(lat=31.2643, long=34.8499, en="Omer", slug="omer"),
+        "עופר": AreaInfo(lat=32.6219, long=34.9835, en="Ofer", slug="ofer"),
+        "עופרים": AreaInfo(lat=32.0186, long=35.0446, en="Ofarim", slug="ofarim"),
+        "עוצם": AreaInfo(lat=31.6377, long=34.7051, en="Otzem", slug="otzem"),
+        "עזוז": AreaInfo(lat=30.7922, long=34.4724, en="Azuz", slug="azuz"),
+        "עזר": AreaInfo(lat=31.7362, long=34.6714, en="Ezer", slug="ezer"),
+        "עזריאל": AreaInfo(lat=32.2628, long=34.9711, en="Azriel", slug="azriel"),
+        "עזריה": AreaInfo(lat=31.8905, long=34.9119, en="Azaria", slug="azaria"),
+        "עזריקם": AreaInfo(lat=31.7517, long=34.6948, en="Azrikam", slug="azrikam"),
+        "עטרת": AreaInfo(lat=32.0012, long=35.177, en="Atteret", slug="atteret"),
+        "עידן": AreaInfo(lat=30.8063, long=35.2999, en="Idan", slug="idan"),
+        "עיינות": AreaInfo(lat=31.9158, long=34.7681, en="Ayanot", slug="ayanot"),
+        "עילבון": AreaInfo(lat=32.8379, long=35.4, en="Eilabun", slug="eilabun"),
+        "עילוט": AreaInfo(lat=32.7173, long=35.2615, en="Ilut", slug="ilut"),
+        "עין איילה": AreaInfo(
+            lat=32.63, long=34.9443, en="Ein Ayala", slug="ein_ayala"
+        ),
+        "עין אל אסד": AreaInfo(
+            lat=32.9408, long=35.401, en="Ein al-Asad", slug="ein_al_asad"
+        ),
+        "עין אל סהלה": AreaInfo(
+            lat=32.4903, long=35.1165, en="Ayn al-Sahla", slug="ayn_al_sahla"
+        ),
+        "עין בוקק": AreaInfo(
+            lat=31.2002, long=35.3625, en="Ein Bokek", slug="ein_bokek"
+        ),
+        "עין גב": AreaInfo(lat=32.7834, long=35.6401, en="Ein Gev", slug="ein_gev"),
+        "עין גדי": AreaInfo(lat=31.4512, long=35.3836, en="Ein Gedi", slug="ein_gedi"),
+        "עין דור": AreaInfo(lat=32.6555, long=35.4164, en="Ein Dor", slug="ein_dor"),
+        "עין הבשור": AreaInfo(
+            lat=31.2809, long=34.4434, en="Ein HaBsor", slug="ein_habsor"
+        ),
+        "עין הוד": AreaInfo(lat=32.7003, long=34.9827, en="Ein Hod", slug="ein_hod"),
+        "עין החורש": AreaInfo(
+            lat=32.3859, long=34.94, en="Ein HaHoresh", slug="ein_hahoresh"
+        ),
+        "עין המפרץ": AreaInfo(
+            lat=32.9026, long=35.093, en="Ein HaMifratz", slug="ein_hamifratz"
+        ),
+        "עין הנצי''ב": AreaInfo(
+            lat=32.47071, long=35.501973, en="Ein HaNatziv", slug="ein_hanatziv"
+        ),
+        "עין העמק": AreaInfo(
+            lat=32.6297, long=35.0822, en="Ein HaEmek", slug="ein_haemek"
+        ),
+        "עין השופט": AreaInfo(
+            lat=32.5968, long=35.1004, en="Ein HaShofet", slug="ein_hashofet"
+        ),
+        "עין השלושה": AreaInfo(
+            lat=31.3517, long=34.4035, en="Ein HaShlosha", slug="ein_hashlosha"
+        ),
+        "עין ורד": AreaInfo(
+            lat=32.2645, long=34.9307, en="Ein Vered", slug="ein_vered"
+        ),
+        "עין זיוון": AreaInfo(
+            lat=33.0965, long=35.7963, en="Ein Zivan", slug="ein_zivan"
+        ),
+        "עין חוד": AreaInfo(lat=32.6914, long=34.9991, en="Ein Chod", slug="ein_chod"),
+        "עין חצבה": AreaInfo(
+            lat=30.7972, long=35.2453, en="Ein Hatzeva", slug="ein_hatzeva"
+        ),
+        "עין חרוד": AreaInfo(
+            lat=32.5631, long=35.3917, en="Ein Harod", slug="ein_harod"
+        ),
+        "עין יהב": AreaInfo(
+            lat=30.6588, long=35.2397, en="Ein Yahav", slug="ein_yahav"
+        ),
+        "עין יעקב": AreaInfo(
+            lat=33.0093, long=35.229, en="Ein Yacov", slug="ein_yacov"
+        ),
+        "עין כמונים": AreaInfo(
+            lat=32.9194, long=35.4301, en="Ein Kamonim", slug="ein_kamonim"
+        ),
+        "עין כרמל": AreaInfo(
+            lat=32.6779, long=34.9537, en="Ein Carmel", slug="ein_carmel"
+        ),
+        "עין מאהל": AreaInfo(
+            lat=32.7243, long=35.3534, en="Ein Mahil", slug="ein_mahil"
+        ),
+        "עין נקובא": AreaInfo(
+            lat=31.7939, long=35.1197, en="Ein Naqquba", slug="ein_naqquba"
+        ),
+        "עין עירון": AreaInfo(
+            lat=32.4844, long=35.0101, en="Ein Iron", slug="ein_iron"
+        ),
+        "עין צורים": AreaInfo(
+            lat=31.6949, long=34.7187, en="Ein Tzurim", slug="ein_tzurim"
+        ),
+        "עין קנייא": AreaInfo(
+            lat=33.2367, long=35.7313, en="Ein Quiniyye", slug="ein_quiniyye"
+        ),
+        "עין ראפה": AreaInfo(lat=31.7906, long=35.1165, en="Ein Rafa", slug="ein_rafa"),
+        "עין שמר": AreaInfo(
+            lat=32.4619, long=35.0067, en="Ein Shemer", slug="ein_shemer"
+        ),
+        "עין שריד": AreaInfo(
+            lat=32.2749, long=34.9342, en="Ein Sarid", slug="ein_sarid"
+        ),
+        "עין תמר": AreaInfo(
+            lat=30.9436, long=35.3741, en="Ein Tamar", slug="ein_tamar"
+        ),
+        "עינבר": AreaInfo(lat=32.9097, long=35.4237, en="Inbar", slug="inbar"),
+        "עינת": AreaInfo(lat=32.0819, long=34.9375, en="Einat", slug="einat"),
+        "עיר אובות": AreaInfo(lat=30.809, long=35.2444, en="Ir Ovot", slug="ir_ovot"),
+        "עכו": AreaInfo(lat=32.9331, long=35.0827, en="Acre", slug="acre"),
+        "עכו - אזור תעשייה": AreaInfo(
+            lat=32.8984,
+            long=35.0863,
+            en="Acco - Industrial Zone",
+            slug="acco_industrial_zone",
+        ),
+        "עלומים": AreaInfo(lat=31.453, long=34.5147, en="Alumim", slug="alumim"),
+        "עלי": AreaInfo(lat=32.0712, long=35.2669, en="Eli", slug="eli"),
+        "עלי זהב": AreaInfo(
+            lat=32.0722, long=35.0641, en="Elei Zahav", slug="elei_zahav"
+        ),
+        "עלמה": AreaInfo(lat=33.0519, long=35.4996, en="Alma", slug="alma"),
+        "עלמון": AreaInfo(lat=31.8321, long=35.2968, en="Almon", slug="almon"),
+        "עמוקה": AreaInfo(lat=32.9977, long=35.5248, en="Amuka", slug="amuka"),
+        "עמיחי": AreaInfo(lat=32.0464, long=35.3283, en="Amichai", slug="amichai"),
+        "עמינדב": AreaInfo(lat=31.7517, long=35.1424, en="Aminadav", slug="aminadav"),
+        "עמיעד": AreaInfo(lat=32.9304, long=35.5405, en="Amiad", slug="amiad"),
+        "עמיקם": AreaInfo(lat=32.5646, long=35.0203, en="Amikam", slug="amikam"),
+        "עמיר": AreaInfo(lat=33.1777, long=35.6198, en="Amir", slug="amir"),
+        "עמנואל": AreaInfo(lat=32.1607, long=35.136, en="Immanuel", slug="immanuel"),
+        "עמקה": AreaInfo(lat=32.9777, long=35.1618, en="Amka", slug="amka"),
+        "ענב": AreaInfo(lat=32.2836, long=35.1252, en="Einav", slug="einav"),
+        "עספיא": AreaInfo(lat=32.7207, long=35.0591, en="Isfiya", slug="isfiya"),
+        "עפולה": AreaInfo(lat=32.6105, long=35.2879, en="Afula", slug="afula"),
+        "עפרה": AreaInfo(lat=31.9551, long=35.2603, en="Ofra", slug="ofra"),
+        "עץ אפרים": AreaInfo(
+            lat=32.1194, long=35.0464, en="Etz Ephraim", slug="etz_ephraim"
+        ),
+        "עצמון - שגב": AreaInfo(
+            lat=32.8658, long=35.2523, en="Atzmon (Segev)", slug="atzmon_segev"
+        ),
+        "עראבה": AreaInfo(lat=32.8537, long=35.3372, en="Arraba", slug="arraba"),
+        "ערב אל נעים": AreaInfo(
+            lat=32.8875, long=35.2909, en="Arab Al Naim", slug="arab_al_naim"
+        ),
+        "ערב אל עראמשה": AreaInfo(
+            lat=33.0888, long=35.2288, en="Arab al-Aramshe", slug="arab_al_aramshe"
+        ),
+        "ערד": AreaInfo(lat=31.2614, long=35.2149, en="Arad", slug="arad"),
+        "ערוגות": AreaInfo(lat=31.7328, long=34.7762, en="Arugot", slug="arugot"),
+        "ערערה": AreaInfo(lat=32.4963, long=35.0973, en="Ar'ara", slug="ar_ara"),
+        "ערערה בנגב": AreaInfo(
+            lat=31.1561, long=35.023, en="Ar'ara BaNegev", slug="ar_ara_banegev"
+        ),
+        "עשהאל": AreaInfo(lat=31.3735, long=35.0437, en="Asa'el", slug="asa_el"),
+        "עשרת": AreaInfo(lat=31.8249, long=34.7475, en="Asseret", slug="asseret"),
+        "עתלית": AreaInfo(lat=32.6909, long=34.9429, en="Atlit", slug="atlit"),
+        "עתניאל": AreaInfo(lat=31.4388, long=35.0282, en="Otniel", slug="otniel"),
+        "פארן": AreaInfo(lat=30.3626, long=35.1551, en="Paran", slug="paran"),
+        "פארק תעשיות מגדל עוז": AreaInfo(
+            lat=31.641,
+            long=35.1515,
+            en="Industrial Park Migdal Oz",
+            slug="industrial_park_migdal_oz",
+        ),
+        "פארק תעשיות פלמחים": AreaInfo(
+            lat=31.9532,
+            long=34.7675,
+            en="Palmachin Industrial Park",
+            slug="palmachin_industrial_park",
+        ),
+        "פארק תעשייה ראם": AreaInfo(
+            lat=31.7682,
+            long=34.7552,
+            en="Re'em Industrial Park",
+            slug="re_em_industrial_park",
+        ),
+        "פדואל": AreaInfo(lat=32.0625, long=35.0526, en="Paduel", slug="paduel"),
+        "פדויים": AreaInfo(lat=31.3263, long=34.6121, en="Pduim", slug="pduim"),
+        "פדיה": AreaInfo(lat=31.8578, long=34.8838, en="Pdaya", slug="pdaya"),
+        "פוריה כפר עבודה": AreaInfo(
+            lat=32.7198, long=35.5456, en="Poria - Kfar Avoda", slug="poria_kfar_avoda"
+        ),
+        "פוריה נווה עובד": AreaInfo(
+            lat=32.7438, long=35.5381, en="Poria - Neve Oved", slug="poria_neve_oved"
+        ),
+        "פוריה עילית": AreaInfo(
+            lat=32.7327, long=35.5462, en="Poria Illit", slug="poria_illit"
+        ),
+        "פוריידיס": AreaInfo(lat=32.5974, long=34.9519, en="Fureidis", slug="fureidis"),
+        "פורת": AreaInfo(lat=32.2771, long=34.9488, en="Porat", slug="porat"),
+        "פטיש": AreaInfo(lat=31.3278, long=34.56, en="Patish", slug="patish"),
+        "פלך": AreaInfo(lat=32.9336, long=35.233, en="Pelekh", slug="pelekh"),
+        "פלמחים": AreaInfo(lat=31.9327, long=34.7069, en="Palmachim", slug="palmachim"),
+        "פני קדם": AreaInfo(
+            lat=31.5895, long=35.1951, en="Pnei Kedem", slug="pnei_kedem"
+        ),
+        "פנימיית עין כרם": AreaInfo(
+            lat=31.7788,
+            long=35.1533,
+            en="Ein Kerem Boarding School",
+            slug="ein_kerem_boarding_school",
+        ),
+        "פסגות": AreaInfo(lat=31.9, long=35.2239, en="Psagot", slug="psagot"),
+        "פסוטה": AreaInfo(lat=33.0478, long=35.3088, en="Fassuta", slug="fassuta"),
+        "פעמי תש''ז": AreaInfo(
+            lat=31.4383, long=34.6921, en="Pa'amei Tashaz", slug="pa_amei_tashaz"
+        ),
+        "פצאל": AreaInfo(lat=32.0435, long=35.4438, en="Petza'el", slug="petza_el"),
+        "פקיעין": AreaInfo(lat=32.9762, long=35.3358, en="Peki'in", slug="peki_in"),
+        "פקיעין החדשה": AreaInfo(
+            lat=32.9882, long=35.3158, en="Peki'in HaHadasha", slug="peki_in_hahadasha"
+        ),
+        "פרדס חנה כרכור": AreaInfo(
+            lat=32.4763,
+            long=34.9773,
+            en="Pardes Hanna - Kakur",
+            slug="pardes_hanna_kakur",
+        ),
+        "פרדסיה": AreaInfo(
+            lat=32.305, long=34.9117, en="Pardessiya", slug="pardessiya"
+        ),
+        "פרוד": AreaInfo(lat=32.9331, long=35.4343, en="Farod", slug="farod"),
+        "פרי גן": AreaInfo(lat=31.222, long=34.3559, en="Pri Gan", slug="pri_gan"),
+        "פתח תקווה": AreaInfo(
+            lat=32.084, long=34.8878, en="Petach Tikva", slug="petach_tikva"
+        ),
+        "פתחיה": AreaInfo(lat=31.867, long=34.8869, en="Ptachia", slug="ptachia"),
+        "צאלים": AreaInfo(lat=31.2039, long=34.5334, en="Ze'elim", slug="ze_elim"),
+        "צבעון": AreaInfo(lat=33.0264, long=35.4167, en="Zivon", slug="zivon"),
+        "צובה": AreaInfo(lat=31.7844, long=35.118, en="Tzuba", slug="tzuba"),
+        "צוחר, אוהד": AreaInfo(
+            lat=31.2364, long=34.4287, en="Zohar, Ohad", slug="zohar_ohad"
+        ),
+        "צומת בנימינה": AreaInfo(
+            lat=32.5173, long=34.929, en="Binyamina Junction", slug="binyamina_junction"
+        ),
+        "צומת דבירה": AreaInfo(
+            lat=31.4223, long=34.7864, en="Dvira Junction", slug="dvira_junction"
+        ),
+        "צומת האלה": AreaInfo(
+            lat=31.6857, long=34.948, en="Ha'Ela Junction", slug="ha_ela_junction"
+        ),
+        "צומת הגוש": AreaInfo(
+            lat=31.646,
+            long=35.1305,
+            en="Gush Etzion Junction",
+            slug="gush_etzion_junction",
+        ),
+        "צופים": AreaInfo(lat=32.1979, long=35.0107, en="Zufim", slug="zufim"),
+        "צופית": AreaInfo(lat=32.1949, long=34.9201, en="Tzofit", slug="tzofit"),
+        "צופר": AreaInfo(lat=30.5594, long=35.1815, en="Tzofar", slug="tzofar"),
+        "צוקים": AreaInfo(lat=30.4916, long=35.1654, en="Tzukim", slug="tzukim"),
+        "צור הדסה": AreaInfo(
+            lat=31.7194, long=35.097, en="Tzur Hadassa", slug="tzur_hadassa"
+        ),
+        "צור יצחק": AreaInfo(
+            lat=32.2415, long=34.998, en="Tzur Itzhak", slug="tzur_itzhak"
+        ),
+        "צור משה": AreaInfo(
+            lat=32.2989, long=34.9131, en="Tzur Moshe", slug="tzur_moshe"
+        ),
+        "צור נתן": AreaInfo(
+            lat=32.2397, long=35.014, en="Tzur Natan", slug="tzur_natan"
+        ),
+        "צוריאל": AreaInfo(lat=33.0065, long=35.3148, en="Tzuriel", slug="tzuriel"),
+        "צורית גילון": AreaInfo(
+            lat=32.9043, long=35.2322, en="Tzurit Gilon", slug="tzurit_gilon"
+        ),
+        "ציפורי": AreaInfo(lat=32.7467, long=35.2764, en="Tzippori", slug="tzippori"),
+        "צלפון": AreaInfo(lat=31.8056, long=34.9318, en="Tzalfon", slug="tzalfon"),
+        "צמח": AreaInfo(lat=32.7027, long=35.586, en="Tsemach", slug="tsemach"),
+        "צפריה": AreaInfo(lat=32.0043, long=34.8547, en="Tzafria", slug="tzafria"),
+        "צפרירים": AreaInfo(
+            lat=31.6596, long=34.9443, en="Tzafririm", slug="tzafririm"
+        ),
+        "צפת - נוף כנרת": AreaInfo(
+            lat=32.9526,
+            long=35.5298,
+            en="Safed - Nof ha-Kinneret",
+            slug="safed_nof_ha_kinneret",
+        ),
+        "צפת - עיר": AreaInfo(
+            lat=32.9646, long=35.496, en="Safed - City", slug="safed_city"
+        ),
+        "צפת - עכברה": AreaInfo(
+            lat=32.9415, long=35.4975, en="Safed - 'Akbara", slug="safed_akbara"
+        ),
+        "צרופה": AreaInfo(lat=32.6478, long=34.9465, en="Tzrufa", slug="tzrufa"),
+        "צרעה": AreaInfo(lat=31.7627, long=34.9669, en="Tzora", slug="tzora"),
+        "קבוצת גבע": AreaInfo(
+            lat=32.5661, long=35.3728, en="Kvutzat Geva", slug="kvutzat_geva"
+        ),
+        "קבוצת יבנה": AreaInfo(
+            lat=31.814, long=34.7191, en="Kvutzat Yavne", slug="kvutzat_yavne"
+        ),
+        "קדומים": AreaInfo(lat=32.2124, long=35.1574, en="Kdumim", slug="kdumim"),
+        "קדימה צורן": AreaInfo(
+            lat=32.2831, long=34.912, en="Qadima - Zoran", slug="qadima_zoran"
+        ),
+        "קדיתא": AreaInfo(lat=33.006, long=35.4683, en="Kadita", slug="kadita"),
+        "קדמה": AreaInfo(lat=31.7008, long=34.7749, en="Kedma", slug="kedma"),
+        "קדמת צבי": AreaInfo(
+            lat=33.0295, long=35.6977, en="Kidmat Zvi", slug="kidmat_zvi"
+        ),
+        "קדרון": AreaInfo(lat=31.8141, long=34.7955, en="Kidron", slug="kidron"),
+        "קדרים": AreaInfo(lat=32.8989, long=35.4716, en="Kadarim", slug="kadarim"),
+        "קדש ברנע": AreaInfo(
+            lat=30.9034, long=34.3967, en="Kadesh Barneah", slug="kadesh_barneah"
+        ),
+        "קוממיות": AreaInfo(
+            lat=31.6626, long=34.7293, en="Kommemiut", slug="kommemiut"
+        ),
+        "קורנית": AreaInfo(lat=32.8444, long=35.2519, en="Koranit", slug="koranit"),
+        "קטורה": AreaInfo(lat=29.9709, long=35.0614, en="Ktura", slug="ktura"),
+        "קיבוץ דן": AreaInfo(
+            lat=33.2406, long=35.6523, en="Kibutz Dan", slug="kibutz_dan"
+        ),
+        "קיבוץ מגידו": AreaInfo(
+            lat=32.5785, long=35.1805, en="Kibutz Megiddo", slug="kibutz_megiddo"
+        ),
+        "קידה": AreaInfo(lat=32.0514, long=35.3413, en="Kida", slug="kida"),
+        "קידר": AreaInfo(lat=31.7458, long=35.3016, en="Keidar", slug="keidar"),
+        "קיסריה": AreaInfo(lat=32.519, long=34.9045, en="Caesarea", slug="caesarea"),
+        "קלחים": AreaInfo(lat=31.4498, long=34.6791, en="Klachim", slug="klachim"),
+        "קליה": AreaInfo(lat=31.7499, long=35.4661, en="Kalia", slug="kalia"),
+        "קלנסווה": AreaInfo(
+            lat=32.2858, long=34.9815, en="Qalansawe", slug="qalansawe"
+        ),
+        "קסר א-סר": AreaInfo(
+            lat=31.0864, long=34.9979, en="Qasr al-Sir", slug="qasr_al_sir"
+        ),
+        "קציר": AreaInfo(lat=32.4852, long=35.1087, en="Katzir", slug="katzir"),
+        "קצרין": AreaInfo(lat=32.991, long=35.6899, en="Katzrin", slug="katzrin"),
+        "קצרין - אזור תעשייה": AreaInfo(
+            lat=32.989259,
+            long=35.710742,
+            en="Katzrin - Industrial Zone",
+            slug="katzrin_industrial_zone",
+        ),
+        "קריית אונו": AreaInfo(
+            lat=32.0549, long=34.8589, en="Kiryat Ono", slug="kiryat_ono"
+        ),
+        "קריית ארבע": AreaInfo(
+            lat=31.534, long=35.1238, en="Kiryat Arba", slug="kiryat_arba"
+        ),
+        "קריית אתא": AreaInfo(
+            lat=32.8052, long=35.0925, en="Kiryat Atta", slug="kiryat_atta"
+        ),
+        "קריית ביאליק": AreaInfo(
+            lat=32.8322, long=35.0884, en="Kiryat Biyalik", slug="kiryat_biyalik"
+        ),
+        "קריית גת, כרמי גת": AreaInfo(
+            lat=31.6196,
+            long=34.766,
+            en="Kiryat Gat, Karmei Gat",
+            slug="kiryat_gat_karmei_gat",
+        ),
+        "קריית חינוך מרחבים": AreaInfo(
+            lat=31.3142,
+            long=34.5999,
+            en="Merhavim Educational Campus",
+            slug="merhavim_educational_campus",
+        ),
+        "קריית טבעון - בית זייד": AreaInfo(
+            lat=32.7132,
+            long=35.1226,
+            en="Kiryat Tivon - Beit Zaid",
+            slug="kiryat_tivon_beit_zaid",
+        ),
+        "קריית ים": AreaInfo(
+            lat=32.8493, long=35.0689, en="Kiryat Yam", slug="kiryat_yam"
+        ),
+        "קריית יערים": AreaInfo(
+            lat=31.8028, long=35.0999, en="Kiryat Yearim", slug="kiryat_yearim"
+        ),
+        "קריית מוצקין": AreaInfo(
+            lat=32.8382, long=35.0795, en="Kiryat Motzkin", slug="kiryat_motzkin"
+        ),
+        "קריית מלאכי": AreaInfo(
+            lat=31.7302, long=34.747, en="Kiryat Malachi", slug="kiryat_malachi"
+        ),
+        "קריית נטפים": AreaInfo(
+            lat=32.1173, long=35.1121, en="Kiryat Netafim", slug="kiryat_netafim"
+        ),
+        "קריית ענבים": AreaInfo(
+            lat=31.8099, long=35.1208, en="Kiryat Anavim", slug="kiryat_anavim"
+        ),
+        "קריית עקרון": AreaInfo(
+            lat=31.8625, long=34.822, en="Kiryat Ekron", slug="kiryat_ekron"
+        ),
+        "קריית שמונה": AreaInfo(
+            lat=33.2079, long=35.5702, en="Kiryat Shmona", slug="kiryat_shmona"
+        ),
+        "קרני שומרון": AreaInfo(
+            lat=32.1716, long=35.0975, en="Karnei Shomron", slug="karnei_shomron"
+        ),
+        "קשת": AreaInfo(lat=32.9804, long=35.8085, en="Keshet", slug="keshet"),
+        "ראמה": AreaInfo(lat=32.9371, long=35.367, en="Rama", slug="rama"),
+        "ראס אל-עין": AreaInfo(
+            lat=32.9157, long=35.3727, en="Ras al-ein", slug="ras_al_ein"
+        ),
+        "ראס עלי": AreaInfo(lat=32.7729, long=35.1555, en="Ras Ali", slug="ras_ali"),
+        "ראש הנקרה": AreaInfo(
+            lat=33.0861, long=35.1135, en="Rosh HaNikra", slug="rosh_hanikra"
+        ),
+        "ראש העין": AreaInfo(
+            lat=32.0958, long=34.9522, en="Rosh HaAyin", slug="rosh_haayin"
+        ),
+        "ראש פינה": AreaInfo(
+            lat=32.9704, long=35.5427, en="Rosh Pinna", slug="rosh_pinna"
+        ),
+        "ראש צורים": AreaInfo(
+            lat=31.6678, long=35.1253, en="Rosh Tzurim", slug="rosh_tzurim"
+        ),
+        "ראשון לציון - מזרח": AreaInfo(
+            lat=31.9723,
+            long=34.8066,
+            en="Rishon LeZion - East",
+            slug="rishon_lezion_east",
+        ),
+        "ראשון לציון - מערב": AreaInfo(
+            lat=31.981,
+            long=34.7679,
+            en="Rishon LeZion - West",
+            slug="rishon_lezion_west",
+        ),
+        "רבבה": AreaInfo(lat=32.1187, long=35.1296, en="Revava", slug="revava"),
+        "רבדים": AreaInfo(lat=31.774, long=34.8148, en="Revadim", slug="revadim"),
+        "רביבים": AreaInfo(lat=31.0452, long=34.7211, en="Revivim", slug="revivim"),
+        "רביד": AreaInfo(lat=32.8506, long=35.4641, en="Ravid", slug="ravid"),
+        "רגבה": AreaInfo(lat=32.9775, long=35.0991, en="Regba", slug="regba"),
+        "רגבים": AreaInfo(lat=32.5234, long=35.034, en="Regavim", slug="regavim"),
+        "רהט": AreaInfo(lat=31.4033, long=34.7582, en="Rahat", slug="rahat"),
+        "רווחה": AreaInfo(lat=31.6487, long=34.7337, en="Revacha", slug="revacha"),
+        "רוויה": AreaInfo(lat=32.4486, long=35.4731, en="Revaya", slug="revaya"),
+        "רוחמה": AreaInfo(lat=31.4974, long=34.7052, en="Rochama", slug="rochama"),
+        "רומאנה": AreaInfo(lat=32.7881, long=35.3112, en="Rumana", slug="rumana"),
+        "רומת אל הייב": AreaInfo(
+            lat=32.7776, long=35.3057, en="Rumat al-Heib", slug="rumat_al_heib"
+        ),
+        "רועי": AreaInfo(lat=32.2475, long=35.4895, en="Roee", slug="roee"),
+        "רותם": AreaInfo(lat=32.3366, long=35.5186, en="Rotem", slug="rotem"),
+        "רחוב": AreaInfo(lat=32.4511, long=35.4896, en="Rechov", slug="rechov"),
+        "רחובות": AreaInfo(lat=31.8928, long=34.8113, en="Rehovot", slug="rehovot"),
+        "רחלים": AreaInfo(lat=32.1025, long=35.2578, en="Rechelim", slug="rechelim"),
+        "רטורנו - גבעת שמש": AreaInfo(
+            lat=31.7759,
+            long=34.9474,
+            en="Retorno - Givat Shesh",
+            slug="retorno_givat_shesh",
+        ),
+        "ריחאנייה": AreaInfo(lat=33.0499, long=35.4871, en="Rehaniya", slug="rehaniya"),
+        "ריחן": AreaInfo(lat=32.4688, long=35.1353, en="Reihan", slug="reihan"),
+        "ריינה": AreaInfo(lat=32.7199, long=35.3177, en="Reineh", slug="reineh"),
+        "רימונים": AreaInfo(lat=31.9354, long=35.3405, en="Rimonim", slug="rimonim"),
+        "רינתיה": AreaInfo(lat=32.0444, long=34.9285, en="Rinatya", slug="rinatya"),
+        "רכסים": AreaInfo(lat=32.7493, long=35.0996, en="Rechasim", slug="rechasim"),
+        "רם און": AreaInfo(lat=32.5287, long=35.2587, en="Ram On", slug="ram_on"),
+        "רמות": AreaInfo(lat=32.8504, long=35.6652, en="Ramot", slug="ramot"),
+        "רמות השבים": AreaInfo(
+            lat=32.1651, long=34.8815, en="Ramot HaShavim", slug="ramot_hashavim"
+        ),
+        "רמות מאיר": AreaInfo(
+            lat=31.8744, long=34.8552, en="Ramot Meir", slug="ramot_meir"
+        ),
+        "רמות מנשה": AreaInfo(
+            lat=32.5966, long=35.0575, en="Ramot Menashe", slug="ramot_menashe"
+        ),
+        "רמות נפתלי": AreaInfo(
+            lat=33.1024, long=35.5533, en="Ramot Naftali", slug="ramot_naftali"
+        ),
+        "רמלה": AreaInfo(lat=31.9316, long=34.8729, en="Ramla", slug="ramla"),
+        "רמת גן - מזרח": AreaInfo(
+            lat=32.0529, long=34.8416, en="Ramat Gan - East", slug="ramat_gan_east"
+        ),
+        "רמת גן - מערב": AreaInfo(
+            lat=32.0706, long=34.8275, en="Ramat Gan - West", slug="ramat_gan_west"
+        ),
+        "רמת דוד": AreaInfo(
+            lat=32.679, long=35.204, en="Ramat David", slug="ramat_david"
+        ),
+        "רמת הכובש": AreaInfo(
+            lat=32.2183, long=34.9383, en="Ramat HaKovesh", slug="ramat_hakovesh"
+        ),
+        "רמת הנדיב": AreaInfo(
+            lat=32.5524, long=34.9453, en="Ramat HaNadiv", slug="ramat_hanadiv"
+        ),
+        "רמת השופט": AreaInfo(
+            lat=32.6094, long=35.0941, en="Ramat HaShofet", slug="ramat_hashofet"
+        ),
+        "רמת השרון": AreaInfo(
+            lat=32.1378, long=34.8403, en="Ramat HaSharon", slug="ramat_hasharon"
+        ),
+        "רמת טראמפ": AreaInfo(
+            lat=33.1328, long=35.6897, en="Ramat Trump", slug="ramat_trump"
+        ),
+        "רמת יוחנן": AreaInfo(
+            lat=32.7935, long=35.1222, en="Ramat Yochana", slug="ramat_yochana"
+        ),
+        "רמת ישי": AreaInfo(
+            lat=32.704, long=35.166, en="Ramat Ishai", slug="ramat_ishai"
+        ),
+        "רמת מגשימים": AreaInfo(
+            lat=32.8441, long=35.8066, en="Ramat Magshimim", slug="ramat_magshimim"
+        ),
+        "רמת צבי": AreaInfo(lat=32.592, long=35.4145, en="Ramat Zvi", slug="ramat_zvi"),
+        "רמת רזיאל": AreaInfo(
+            lat=31.7736, long=35.0744, en="Ramat Raziel", slug="ramat_raziel"
+        ),
+        "רנן": AreaInfo(lat=31.3387, long=34.6004, en="Renan", slug="renan"),
+        "רעים": AreaInfo(lat=31.3862, long=34.4588, en="Reim", slug="reim"),
+        "רעננה": AreaInfo(lat=32.1848, long=34.8713, en="Ra'anana", slug="ra_anana"),
+        "רפטינג נהר הירדן": AreaInfo(
+            lat=33.0257,
+            long=35.628,
+            en="Jordan River Rafting",
+            slug="jordan_river_rafting",
+        ),
+        "רקפת": AreaInfo(lat=32.8556, long=35.2642, en="Rakefet", slug="rakefet"),
+        "רשפון": AreaInfo(lat=32.2019, long=34.8247, en="Rishpon", slug="rishpon"),
+        "רשפים": AreaInfo(lat=32.4812, long=35.4788, en="Reshafim", slug="reshafim"),
+        "רתמים": AreaInfo(lat=31.054, long=34.6909, en="Retamim", slug="retamim"),
+        "שאנטי במדבר": AreaInfo(
+            lat=30.8333, long=34.7366, en="Shanti BaMidbar", slug="shanti_bamidbar"
+        ),
+        "שאר ישוב": AreaInfo(
+            lat=33.2263, long=35.6468, en="Shear Yeshuv", slug="shear_yeshuv"
+        ),
+        "שבות רחל": AreaInfo(
+            lat=32.0545, long=35.3107, en="Shvut Rachel", slug="shvut_rachel"
+        ),
+        "שבי דרום": AreaInfo(
+            lat=31.4664, long=34.6386, en="Shavei Darom", slug="shavei_darom"
+        ),
+        "שבי ציון": AreaInfo(
+            lat=32.9821, long=35.083, en="Shavei Zion", slug="shavei_zion"
+        ),
+        "שבי שומרון": AreaInfo(
+            lat=32.2637, long=35.1834, en="Shavei Shomron", slug="shavei_shomron"
+        ),
+        "שבלי": AreaInfo(lat=32.6863, long=35.4061, en="Shibli", slug="shibli"),
+        "שגב שלום": AreaInfo(
+            lat=31.1984, long=34.8397, en="Segev Shalom", slug="segev_shalom"
+        ),
+        "שדה אילן": AreaInfo(
+            lat=32.7505, long=35.4224, en="Sdeh Ilan", slug="sdeh_ilan"
+        ),
+        "שדה אליהו": AreaInfo(
+            lat=32.4419, long=35.5138, en="Sdeh Eliyahu", slug="sdeh_eliyahu"
+        ),
+        "שדה אליעזר": AreaInfo(
+            lat=33.0465, long=35.5653, en="Sdeh Eliezer", slug="sdeh_eliezer"
+        ),
+        "שדה בוקר": AreaInfo(
+            lat=30.8736, long=34.7931, en="Sdeh Boker", slug="sdeh_boker"
+        ),
+        "שדה בר": AreaInfo(lat=31.6594, long=35.244, en="Sdeh Bar", slug="sdeh_bar"),
+        "שדה דוד": AreaInfo(
+            lat=31.5775, long=34.6834, en="Sdeh David", slug="sdeh_david"
+        ),
+        "שדה ורבורג": AreaInfo(
+            lat=32.2087, long=34.9033, en="Sdeh Warburg", slug="sdeh_warburg"
+        ),
+        "שדה יואב": AreaInfo(
+            lat=31.6457, long=34.6768, en="Sdeh Yoav", slug="sdeh_yoav"
+        ),
+        "שדה יעקב": AreaInfo(
+            lat=32.6976, long=35.1413, en="Sdeh Yacov", slug="sdeh_yacov"
+        ),
+        "שדה יצחק": AreaInfo(
+            lat=32.405, long=34.9922, en="Sdeh Itzhak", slug="sdeh_itzhak"
+        ),
+        "שדה משה": AreaInfo(
+            lat=31.611, long=34.8004, en="Sdeh Moshe", slug="sdeh_moshe"
+        ),
+        "שדה נחום": AreaInfo(
+            lat=32.5251, long=35.4809, en="Sdeh Nachum", slug="sdeh_nachum"
+        ),
+        "שדה נחמיה": AreaInfo(
+            lat=33.1882, long=35.6231, en="Sdeh Nechemia", slug="sdeh_nechemia"
+        ),
+        "שדה ניצן": AreaInfo(
+            lat=31.23, long=34.4184, en="Sdeh Nitzan", slug="sdeh_nitzan"
+        ),
+        "שדה עוזיהו": AreaInfo(
+            lat=31.7584, long=34.6782, en="Sdeh Uziahu", slug="sdeh_uziahu"
+        ),
+        "שדה צבי": AreaInfo(lat=31.4487, long=34.7132, en="Sdeh Zvi", slug="sdeh_zvi"),
+        "שדות ים": AreaInfo(lat=32.4926, long=34.8932, en="Sdot Yam", slug="sdot_yam"),
+        "שדות מיכה": AreaInfo(
+            lat=31.7214, long=34.9207, en="Sdot Micha", slug="sdot_micha"
+        ),
+        "שדי אברהם": AreaInfo(
+            lat=31.2114, long=34.3368, en="Sdeh Avraham", slug="sdeh_avraham"
+        ),
+        "שדי חמד": AreaInfo(
+            lat=32.1585, long=34.9428, en="Sdei Hemed", slug="sdei_hemed"
+        ),
+        "שדי תרומות": AreaInfo(
+            lat=32.4409, long=35.4842, en="Sdei Trumot", slug="sdei_trumot"
+        ),
+        "שדמה": AreaInfo(lat=31.8338, long=34.7401, en="Shdema", slug="shdema"),
+        "שדמות דבורה": AreaInfo(
+            lat=32.6962, long=35.4364, en="Shadmot Dvora", slug="shadmot_dvora"
+        ),
+        "שדמות מחולה": AreaInfo(
+            lat=32.3477, long=35.5306, en="Shadmot Mechola", slug="shadmot_mechola"
+        ),
+        "שדרות, איבים": AreaInfo(
+            lat=31.5313, long=34.5984, en="Sderot, Ibim", slug="sderot_ibim"
+        ),
+        "שואבה": AreaInfo(lat=31.7994, long=35.079, en="Shoeva", slug="shoeva"),
+        "שובל": AreaInfo(lat=31.4137, long=34.7458, en="Shoval", slug="shoval"),
+        "שוהם": AreaInfo(lat=31.9971, long=34.9469, en="Shoham", slug="shoham"),
+        "שומרה": AreaInfo(lat=33.0825, long=35.282, en="Shomera", slug="shomera"),
+        "שומריה": AreaInfo(lat=31.4322, long=34.8841, en="Shomria", slug="shomria"),
+        "שומרת": AreaInfo(lat=32.9515, long=35.095, en="Shomrat", slug="shomrat"),
+        "שוקדה": AreaInfo(lat=31.4221, long=34.5244, en="Shokeda", slug="shokeda"),
+        "שורש": AreaInfo(lat=31.7975, long=35.0653, en="Shoresh", slug="shoresh"),
+        "שורשים": AreaInfo(lat=32.8927, long=35.2586, en="Shorashim", slug="shorashim"),
+        "שושנת העמקים": AreaInfo(
+            lat=32.3548,
+            long=34.8568,
+            en="Shoshanat Ha'Amakim",
+            slug="shoshanat_ha_amakim",
+        ),
+        "שזור": AreaInfo(lat=32.9339, long=35.3545, en="Shezor", slug="shezor"),
+        "שחר": AreaInfo(lat=31.6184063, long=34.7240639, en="Shachar", slug="shachar"),
+        "שחרות": AreaInfo(lat=29.9041, long=34.9992, en="Shachrut", slug="shachrut"),
+        "שיבולים": AreaInfo(lat=31.3964, long=34.6081, en="Shibolim", slug="shibolim"),
+        "שיטים": AreaInfo(lat=30.1764, long=35.0167, en="Shitim", slug="shitim"),
+        "שייח' דנון": AreaInfo(
+            lat=32.9938, long=35.1486, en="Sheikh Danun", slug="sheikh_danun"
+        ),
+        "שילה": AreaInfo(lat=32.0544, long=35.2991, en="Shilo", slug="shilo"),
+        "שילת": AreaInfo(lat=31.9212, long=35.0146, en="Shilat", slug="shilat"),
+        "שכניה": AreaInfo(lat=32.8492, long=35.2467, en="Shekhanya", slug="shekhanya"),
+        "שלווה": AreaInfo(lat=31.5647, long=34.7688, en="Shalva", slug="shalva"),
+        "שלוחות": AreaInfo(lat=32.4726, long=35.4805, en="Shluchot", slug="shluchot"),
+        "שלומי": AreaInfo(lat=33.0726, long=35.1459, en="Shlomi", slug="shlomi"),
+        "שלומית": AreaInfo(lat=31.1697, long=34.3032, en="Shlomit", slug="shlomit"),
+        "שלפים": AreaInfo(lat=32.476, long=35.477, en="Shlafim", slug="shlafim"),
+        "שמיר": AreaInfo(lat=33.1668, long=35.66, en="Shamir", slug="shamir"),
+        "שמעה": AreaInfo(lat=31.3873, long=35.0127, en="Shim'a", slug="shim_a"),
+        "שמשית": AreaInfo(lat=32.7325, long=35.2465, en="Shimshit", slug="shimshit"),
+        "שני ליבנה": AreaInfo(
+            lat=31.3566, long=35.0699, en="Sheni LeYavne", slug="sheni_leyavne"
+        ),
+        "שניר": AreaInfo(lat=33.2403, long=35.677, en="Snir", slug="snir"),
+        "שעב": AreaInfo(lat=32.8897, long=35.2388, en="Sha'ab", slug="sha_ab"),
+        "שעל": AreaInfo(lat=33.1165, long=35.7188, en="Sha'al", slug="sha_al"),
+        "שעלבים": AreaInfo(
+            lat=31.8702, long=34.9843, en="Sha'alabim", slug="sha_alabim"
+        ),
+        "שער אפרים": AreaInfo(
+            lat=32.2907, long=34.9994, en="Sha'ar Efraim", slug="sha_ar_efraim"
+        ),
+        "שער הגולן": AreaInfo(
+            lat=32.6869, long=35.6047, en="Sha'ar HaGolan", slug="sha_ar_hagolan"
+        ),
+        "שער הגיא": AreaInfo(
+            lat=31.8152, long=35.0229, en="Sha’ar HaGai", slug="shaar_hagai"
+        ),
+        "שער העמקים": AreaInfo(
+            lat=32.7226, long=35.1106, en="Sha'ar HaAmakim", slug="sha_ar_haamakim"
+        ),
+        "שער מנשה": AreaInfo(
+            lat=32.4439, long=35.011, en="Sha'ar Menashe", slug="sha_ar_menashe"
+        ),
+        "שערי תקווה": AreaInfo(
+            lat=32.1207, long=35.027, en="Sha'arei Tikva", slug="sha_arei_tikva"
+        ),
+        "שפיים": AreaInfo(lat=32.2166, long=34.8224, en="Shefayim", slug="shefayim"),
+        "שפיר": AreaInfo(lat=31.6976, long=34.7282, en="Shafir", slug="shafir"),
+        "שפר": AreaInfo(lat=32.9446, long=35.4378, en="Shefer", slug="shefer"),
+        "שפרעם": AreaInfo(lat=32.8058, long=35.17, en="Shfaram", slug="shfaram"),
+        "שקד": AreaInfo(lat=32.4737, long=35.1684, en="Shaked", slug="shaked"),
+        "שקף": AreaInfo(lat=31.5149, long=34.9373, en="Shekef", slug="shekef"),
+        "שרונה": AreaInfo(lat=32.7259, long=35.4672, en="Sharona", slug="sharona"),
+        "שריגים - לי-און": AreaInfo(
+            lat=31.6766, long=34.9353, en="Srigim-Li On", slug="srigim_li_on"
+        ),
+        "שריד": AreaInfo(lat=32.6631, long=35.2248, en="Sarid", slug="sarid"),
+        "שרשרת": AreaInfo(
+            lat=31.4048, long=34.6044, en="Sharsheret", slug="sharsheret"
+        ),
+        "שתולה": AreaInfo(lat=33.0859, long=35.3156, en="Shtula", slug="shtula"),
+        "שתולים": AreaInfo(lat=31.7737, long=34.6844, en="Shtulim", slug="shtulim"),
+        "תארבין": AreaInfo(lat=31.3574, long=34.7383, en="Tirabin", slug="tirabin"),
+        "תאשור": AreaInfo(lat=31.3717, long=34.6435, en="Ta'ashur", slug="ta_ashur"),
+        "תדהר": AreaInfo(lat=31.3789, long=34.6304, en="Tidhar", slug="tidhar"),
+        "תובל": AreaInfo(lat=32.9285, long=35.2457, en="Tuval", slug="tuval"),
+        "תומר": AreaInfo(lat=32.0186, long=35.4398, en="Tomer", slug="tomer"),
+        "תחנת רכבת כפר ברוך": AreaInfo(
+            lat=32.6476,
+            long=35.2086,
+            en="Kfar Baruch train station",
+            slug="kfar_baruch_train_station",
+        ),
+        "תחנת רכבת כפר יהושוע": AreaInfo(
+            lat=32.6811,
+            long=35.1246,
+            en="Kfar Yehoshua Train Station",
+            slug="kfar_yehoshua_train_station",
+        ),
+        "תחנת רכבת קריית מלאכי - יואב": AreaInfo(
+            lat=31.7472,
+            long=34.8221,
+            en="Kiryat Mal'akhi-Yoav train station",
+            slug="kiryat_mal_akhi_yoav_train_station",
+        ),
+        "תחנת רכבת ראש העין": AreaInfo(
+            lat=32.1209,
+            long=34.9345,
+            en="Rosh Ha’Ayin Train Station",
+            slug="rosh_haayin_train_station",
+        ),
+        "תימורים": AreaInfo(lat=31.7163, long=34.7614, en="Timorim", slug="timorim"),
+        "תירוש": AreaInfo(lat=31.7503, long=34.8859, en="Tirosh", slug="tirosh"),
+        "תל אביב - דרום העיר ויפו": AreaInfo(
+            lat=32.0462,
+            long=34.7654,
+            en="Tel Aviv - South and Jaffa",
+            slug="tel_aviv_south_and_jaffa",
+        ),
+        "תל אביב - מזרח": AreaInfo(
+            lat=32.0578, long=34.7987, en="Tel Aviv - East", slug="tel_aviv_east"
+        ),
+        "תל אביב - מרכז העיר": AreaInfo(
+            lat=32.0798,
+            long=34.7772,
+            en="Tel Aviv - City Center",
+            slug="tel_aviv_city_center",
+        ),
+        "תל אביב - עבר הירקון": AreaInfo(
+            lat=32.1213,
+            long=34.8203,
+            en="Tel Aviv - Across the Yarkon",
+            slug="tel_aviv_across_the_yarkon",
+        ),
+        "תל חי": AreaInfo(lat=33.2334, long=35.5827, en="Tel Hai", slug="tel_hai"),
+        "תל יוסף": AreaInfo(
+            lat=32.5567, long=35.3989, en="Tel Yossef", slug="tel_yossef"
+        ),
+        "תל יצחק": AreaInfo(
+            lat=32.2527, long=34.8724, en="Tel Itzhak", slug="tel_itzhak"
+        ),
+        "תל מונד": AreaInfo(lat=32.2566, long=34.9185, en="Tel Mond", slug="tel_mond"),
+        "תל עדשים": AreaInfo(
+            lat=32.6574, long=35.3025, en="Tel Adashim", slug="tel_adashim"
+        ),
+        "תל ערד": AreaInfo(lat=31.2837, long=35.1038, en="Tel Arad", slug="tel_arad"),
+        "תל ציון": AreaInfo(lat=31.8804, long=35.2391, en="Tel Zion", slug="tel_zion"),
+        "תל קציר": AreaInfo(
+            lat=32.7064, long=35.6179, en="Tel Katzir", slug="tel_katzir"
+        ),
+        "תל שבע": AreaInfo(lat=31.2476, long=34.8612, en="Tel Sheva", slug="tel_sheva"),
+        "תל תאומים": AreaInfo(
+            lat=32.4425, long=35.4964, en="Tel Teomim", slug="tel_teomim"
+        ),
+        "תלם": AreaInfo(lat=31.5631, long=35.0312, en="Telem", slug="telem"),
+        "תלמי אליהו": AreaInfo(
+            lat=31.2296, long=34.4291, en="Talmei Eliyahu", slug="talmei_eliyahu"
+        ),
+        "תלמי אלעזר": AreaInfo(
+            lat=32.4472, long=34.975, en="Talmei Elazar", slug="talmei_elazar"
+        ),
+        "תלמי ביל''ו": AreaInfo(
+            lat=31.4381, long=34.6448, en="Talmei Bilu", slug="talmei_bilu"
+        ),
+        "תלמי יוסף": AreaInfo(
+            lat=31.2, long=34.3638, en="Talmei Yossef", slug="talmei_yossef"
+        ),
+        "תלמי יחיאל": AreaInfo(
+            lat=31.7536, long=34.7643, en="Talmei Yehiel", slug="talmei_yehiel"
+        ),
+        "תלמי יפה": AreaInfo(
+            lat=31.6169, long=34.6125, en="Talmei Yaffe", slug="talmei_yaffe"
+        ),
+        "תלמים": AreaInfo(lat=31.5634, long=34.672, en="Tlamim", slug="tlamim"),
+        "תמרת": AreaInfo(lat=32.7038, long=35.2255, en="Timrat", slug="timrat"),
+        "תנובות": AreaInfo(lat=32.3059, long=34.9626, en="Tnuvot", slug="tnuvot"),
+        "תעוז": AreaInfo(lat=31.8013, long=34.972, en="Taoz", slug="taoz"),
+        "תעשיון חצב": AreaInfo(
+            lat=32.0717,
+            long=34.9544,
+            en="Hatzav Industrial Zone",
+            slug="hatzav_industrial_zone",
+        ),
+        "תעשיון צריפין": AreaInfo(
+            lat=31.9624,
+            long=34.8533,
+            en="Zrifin Industrial Zone",
+            slug="zrifin_industrial_zone",
+        ),
+        "תפרח": AreaInfo(lat=31.3245, long=34.6792, en="Tifrach", slug="tifrach"),
+        "תקומה": AreaInfo(lat=31.4485, long=34.5781, en="Tkuma", slug="tkuma"),
+        "תקוע": AreaInfo(lat=31.6528, long=35.2275, en="Tko'a", slug="tko_a"),
+        "תרום": AreaInfo(lat=31.7833, long=34.9802, en="Tarom", slug="tarom"),
+    }
+)
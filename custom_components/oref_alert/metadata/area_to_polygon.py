@@ -1,19 +1,16 @@
 """Helper for loading area to polygon map."""
 
-import json
 import zipfile
 from pathlib import Path
 
+from homeassistant.util.json import json_loads
 from shapely.geometry import Point, Polygon
 
 
 def _load_area_to_polygon() -> dict[str, list[list[float]]]:
     """Return the map of area to list of tuples with (lat, long) coordinates."""
-    with (
-        zipfile.ZipFile(Path(__file__).with_suffix(".json.zip")) as zip_file,
-        zip_file.open(f"{Path(__file__).stem}.json") as json_file,
-    ):
-        return json.load(json_file)
+    with zipfile.ZipFile(Path(__file__).with_suffix(".json.zip")) as zip_file:
+        return json_loads(zip_file.read(f"{Path(__file__).stem}.json"))  # type: ignore[reportReturnType]
 
 
 def find_area(lat: float, long: float) -> str | None:
@@ -1,1427 +1,1429 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-AREAS = {
-    "אבו גוש",
-    "אבו נוור",
-    "אבו סנאן",
-    "אבו קרינאת",
-    "אבו תלול",
-    "אבטליון",
-    "אביאל",
-    "אביבים",
-    "אביגדור",
-    "אביחיל",
-    "אביעזר",
-    "אבירים",
-    "אבן יהודה",
-    "אבן מנחם",
-    "אבן ספיר",
-    "אבן שמואל",
-    "אבני איתן",
-    "אבני חפץ",
-    "אבנת",
-    "אבשלום",
-    "אדורה",
-    "אדוריים",
-    "אדמית",
-    "אדרת",
-    "אודים",
-    "אודם",
-    "אום אל פחם",
-    "אום אל קוטוף",
-    "אום אלג'נם",
-    "אום בטין",
-    "אופקים",
-    "אור הגנוז",
-    "אור הנר",
-    "אור יהודה",
-    "אור עקיבא",
-    "אורה",
-    "אורון תעשייה ומסחר",
-    "אורות",
-    "אורטל",
-    "אורים",
-    "אורנים",
-    "אורנית",
-    "אושה",
-    "אזור",
-    "אזור תעשייה אלון התבור",
-    "אזור תעשייה אפק ולב הארץ",
-    "אזור תעשייה אריאל",
-    "אזור תעשייה באר טוביה",
-    "אזור תעשייה בני יהודה",
-    "אזור תעשייה בר-לב",
-    "אזור תעשייה בראון",
-    "אזור תעשייה ברוש",
-    "אזור תעשייה ברקן",
-    "אזור תעשייה גדרה",
-    "אזור תעשייה דימונה",
-    "אזור תעשייה הדרומי אשקלון",
-    "אזור תעשייה הר טוב - צרעה",
-    "אזור תעשייה חבל מודיעין",
-    "אזור תעשייה חצור הגלילית",
-    "אזור תעשייה טירה",
-    "אזור תעשייה טמרה",
-    "אזור תעשייה יקנעם עילית",
-    "אזור תעשייה כנות",
-    "אזור תעשייה כפר יונה",
-    "אזור תעשייה כרמיאל",
-    "אזור תעשייה מבוא כרמל",
-    "אזור תעשייה מבואות הגלבוע",
-    "אזור תעשייה מילואות צפון",
-    "אזור תעשייה מישור אדומים",
-    "אזור תעשייה מיתרים",
-    "אזור תעשייה נ.ע.מ",
-    "אזור תעשייה ניר עציון",
-    "אזור תעשייה נשר - רמלה",
-    "אזור תעשייה עד הלום",
-    "אזור תעשייה עידן הנגב",
-    "אזור תעשייה עמק חפר",
-    "אזור תעשייה צ.ח.ר",
-    "אזור תעשייה צבאים",
-    "אזור תעשייה ציפורית",
-    "אזור תעשייה צפוני אשקלון",
-    "אזור תעשייה קדמת גליל",
-    "אזור תעשייה קיסריה",
-    "אזור תעשייה קריית ביאליק",
-    "אזור תעשייה קריית גת",
-    "אזור תעשייה רבדים",
-    "אזור תעשייה רגבים",
-    "אזור תעשייה רגמ",
-    "אזור תעשייה רותם",
-    "אזור תעשייה רמת דלתון",
-    "אזור תעשייה שחורת",
-    "אזור תעשייה שחק",
-    "אזור תעשייה שער בנימין",
-    "אזור תעשייה שער נעמן",
-    "אזור תעשייה תימורים",
-    "אזור תעשייה תרדיון",
-    "אחווה",
-    "אחוזם",
-    "אחוזת ברק",
-    "אחיה",
-    "אחיהוד",
-    "אחיטוב",
-    "אחיסמך",
-    "אחיעזר",
-    "איבטין",
-    "אייל",
-    "איילת השחר",
-    "איירפורט סיטי",
-    "אילון",
-    "אילות",
-    "אילניה",
-    "אילת",
-    "אירוס",
-    "איתמר",
-    "איתן",
-    "אכסאל",
-    "אל סייד",
-    "אל עזי",
-    "אל עמארני, אל מסק",
-    "אל עריאן",
-    "אל פורעה",
-    "אל רום",
-    "אל-ח'וואלד מערב",
-    "אלומה",
-    "אלומות",
-    "אלון",
-    "אלון הגליל",
-    "אלון מורה",
-    "אלון שבות",
-    "אלוני אבא",
-    "אלוני הבשן",
-    "אלוני יצחק",
-    "אלונים",
-    "אלי עד",
-    "אליאב",
-    "אליכין",
-    "אליפז ומכרות תמנע",
-    "אליפלט",
-    "אליקים",
-    "אלישיב",
-    "אלישמע",
-    "אלמגור",
-    "אלמוג",
-    "אלעד",
-    "אלעזר",
-    "אלפי מנשה",
-    "אלקוש",
-    "אלקנה",
-    "אמונים",
-    "אמירים",
-    "אמנון",
-    "אמץ",
-    "אמציה",
-    "אניעם",
-    "אעבלין",
-    "אפיק",
-    "אפיקים",
-    "אפק",
-    "אפרת",
-    "ארבל",
-    "ארגמן",
-    "ארז",
-    "אריאל",
-    "ארסוף",
-    "אשבול",
-    "אשבל",
-    "אשדוד - א,ב,ד,ה",
-    "אשדוד - איזור תעשייה צפוני",
-    "אשדוד - ג,ו,ז",
-    "אשדוד - ח,ט,י,יג,יד,טז",
-    "אשדוד -יא,יב,טו,יז,מרינה,סיטי",
-    "אשדות יעקב",
-    "אשחר",
-    "אשכולות",
-    "אשל הנשיא",
-    "אשלים",
-    "אשקלון - דרום",
-    "אשקלון - צפון",
-    "אשרת",
-    "אשתאול",
-    "אתר דודאים",
-    "אתר ההנצחה גולני",
-    "באקה אל גרבייה",
-    "באר אורה",
-    "באר גנים",
-    "באר טוביה",
-    "באר יעקב",
-    "באר מילכה",
-    "באר שבע - דרום",
-    "באר שבע - מזרח",
-    "באר שבע - מערב",
-    "באר שבע - צפון",
-    "בארות יצחק",
-    "בארותיים",
-    "בארי",
-    "בוסתן הגליל",
-    "בועיינה-נוג'ידאת",
-    "בוקעתא",
-    "בורגתה",
-    "בחן",
-    "בטחה",
-    "ביצרון",
-    "ביר אלמכסור",
-    "ביר הדאג'",
-    "ביריה",
-    "בית אורן",
-    "בית אל",
-    "בית אלעזרי",
-    "בית אלפא וחפציבה",
-    "בית אריה",
-    "בית ברל",
-    "בית ג'אן",
-    "בית גוברין",
-    "בית גמליאל",
-    "בית דגן",
-    "בית הגדי",
-    "בית הלוי",
-    "בית הלל",
-    "בית העלמין החדש נהריה",
-    "בית העלמין החדש עכו",
-    "בית העמק",
-    "בית הערבה",
-    "בית השיטה",
-    "בית זית",
-    "בית זרע",
-    'בית חג"י',
-    "בית חורון",
-    "בית חזון",
-    "בית חלקיה",
-    "בית חנן",
-    "בית חנניה",
-    "בית חרות",
-    "בית חשמונאי",
-    "בית יהושע",
-    "בית יוסף",
-    "בית ינאי",
-    "בית יצחק - שער חפר",
-    "בית ירח",
-    "בית יתיר",
-    "בית לחם הגלילית",
-    "בית מאיר",
-    "בית נחמיה",
-    "בית ניר",
-    "בית נקופה",
-    "בית סוהר השרון",
-    "בית סוהר מגידו",
-    "בית סוהר נפחא",
-    "בית סוהר צלמון",
-    "בית סוהר קישון",
-    "בית סוהר שיטה וגלבוע",
-    "בית ספר אורט בנימינה",
-    "בית ספר שדה מירון",
-    "בית עובד",
-    "בית עוזיאל",
-    "בית עזרא",
-    "בית עלמין מורשה",
-    "בית עלמין תל רגב",
-    "בית עריף",
-    "בית צבי",
-    "בית קמה",
-    "בית קשת",
-    "בית רימון",
-    "בית שאן",
-    "בית שמש",
-    "בית שערים",
-    "בית שקמה",
-    "ביתן אהרן",
-    "ביתר עילית",
-    "בלפוריה",
-    "בן זכאי",
-    "בן עמי",
-    "בן שמן",
-    "בני ברק",
-    "בני דקלים",
-    "בני דרום",
-    "בני דרור",
-    "בני יהודה וגבעת יואב",
-    "בני נצרים",
-    "בני עטרות",
-    "בני עי''ש",
-    "בני ציון",
-    "בני ראם",
-    "בניה",
-    "בנימינה",
-    "בסמת טבעון",
-    "בענה",
-    "בצרה",
-    "בצת",
-    "בקוע",
-    "בקעות",
-    "בר גיורא",
-    "בר יוחאי",
-    "ברוכין",
-    "ברור חיל",
-    "ברוש",
-    "ברחבי הארץ",
-    "ברטעה",
-    "ברכיה",
-    "ברעם",
-    "ברקאי",
-    "ברקן",
-    "ברקת",
-    "בת הדר",
-    "בת חן",
-    "בת חפר",
-    "בת ים",
-    "בת עין",
-    "בת שלמה",
-    "בתי מלון ים המלח",
-    "ג'דידה מכר",
-    "ג'וליס",
-    "ג'לג'וליה",
-    "ג'סר א-זרקא",
-    "ג'ש - גוש חלב",
-    "ג'ת",
-    "גאולי תימן",
-    "גאולים",
-    "גאליה",
-    "גבולות",
-    "גבים, מכללת ספיר",
-    "גבע בנימין",
-    "גבע כרמל",
-    "גבעון החדשה",
-    "גבעות",
-    "גבעות בר",
-    "גבעות גורל",
-    "גבעות עדן",
-    "גבעת אבני",
-    "גבעת אלה",
-    "גבעת אסף",
-    "גבעת ברנר",
-    "גבעת הראל וגבעת הרואה",
-    "גבעת השלושה",
-    "גבעת וולפסון",
-    "גבעת וושינגטון",
-    "גבעת זאב",
-    "גבעת חביבה",
-    "גבעת חיים איחוד",
-    "גבעת חיים מאוחד",
-    "גבעת חן",
-    "גבעת יערים",
-    "גבעת ישעיהו",
-    "גבעת כ''ח",
-    "גבעת ניל''י",
-    "גבעת עדה",
-    "גבעת עוז",
-    "גבעת שמואל",
-    "גבעת שפירא",
-    "גבעתי",
-    "גבעתיים",
-    "גברעם",
-    "גבת",
-    "גדות",
-    "גדעונה",
-    "גדרה",
-    "גונן",
-    "גורן",
-    "גורנות הגליל",
-    "גזית",
-    "גזר",
-    "גיאה",
-    "גיבתון",
-    "גיזו",
-    "גילת",
-    "גינוסר",
-    "גינתון",
-    "גיתה",
-    "גיתית",
-    "גלאון",
-    "גלגל",
-    "גלעד",
-    "גמזו",
-    "גן הדרום",
-    "גן השומרון",
-    "גן חיים",
-    "גן יאשיה",
-    "גן יבנה",
-    "גן נר",
-    "גן שורק",
-    "גן שלמה",
-    "גן שמואל",
-    "גנות",
-    "גנות הדר",
-    "גני הדר",
-    "גני חוגה",
-    "גני טל",
-    "גני יוחנן",
-    "גני עם",
-    "גני תקווה",
-    "גניגר",
-    "געש",
-    "געתון",
-    "גפן",
-    "גרופית",
-    "גשור",
-    "גשר",
-    "גשר הזיו",
-    "גת",
-    "גת רימון",
-    "דבוריה",
-    "דביר",
-    "דברת",
-    "דגניה א",
-    "דגניה ב",
-    "דוב''ב",
-    "דולב",
-    "דור",
-    "דורות",
-    "דחי",
-    "דימונה",
-    "דיר אל-אסד",
-    "דיר חנא",
-    "דישון",
-    "דליה",
-    "דלית אל כרמל",
-    "דלתון",
-    "דמיידה",
-    "דניאל",
-    "דפנה",
-    "דקל",
-    "האון",
-    "הבונים",
-    "הגושרים",
-    "הדר עם",
-    "הוד השרון",
-    "הודיה",
-    "הודיות",
-    "הושעיה",
-    "הזורעים",
-    "החותרים",
-    "היוגב",
-    "היישוב היהודי חברון",
-    "הילה",
-    "המעפיל",
-    "המרכז האקדמי רופין",
-    "הסוללים",
-    "העוגן",
-    "הר אדר",
-    "הר ברכה",
-    "הר גילה",
-    "הר הנגב",
-    "הר חלוץ",
-    "הר עמשא",
-    "הראל",
-    "הרדוף",
-    "הרצליה - מערב",
-    "הרצליה - מרכז וגליל ים",
-    "הררית יחד",
-    "ואדי אל חמאם",
-    "ואדי אל נעם דרום",
-    "ורד יריחו",
-    "ורדון",
-    "זבדיאל",
-    "זוהר",
-    "זיקים",
-    "זיתן",
-    "זכרון יעקב",
-    "זכריה",
-    "זמר",
-    "זמרת, שובה",
-    "זנוח",
-    "זרועה",
-    "זרזיר",
-    "זרחיה",
-    "זרעית",
-    "ח'וואלד",
-    "חבצלת השרון וצוקי ים",
-    "חג'אג'רה",
-    "חגור",
-    "חגלה",
-    "חד נס",
-    "חדיד",
-    "חדרה - מזרח",
-    "חדרה - מערב",
-    "חדרה - מרכז",
-    "חדרה - נווה חיים",
-    "חוואלד",
-    "חוות אירוח גורן",
-    "חוות גלעד",
-    "חוות יאיר",
-    "חוות יזרעם",
-    "חוות עדן",
-    "חוות ערנדל",
-    "חוות שיקמים",
-    "חולדה",
-    "חולון",
-    "חולית",
-    "חולתה",
-    "חוסן",
-    "חוסנייה",
-    "חוף אמנון",
-    "חוף בצת",
-    "חוף גולן, צאלון",
-    "חוף גופרה",
-    "חוף זיקים",
-    "חוף כורסי, לבנון, חלוקים",
-    "חוף כינר, דוגה, דוגית",
-    "חוף ניצנים",
-    "חוף סוסיתא",
-    "חוף קליה",
-    "חופית",
-    "חוקוק",
-    "חורה",
-    "חורפיש",
-    "חורשים",
-    "חזון",
-    "חי-בר יטבתה",
-    "חיבת ציון",
-    "חיננית",
-    "חיפה - כרמל, הדר ועיר תחתית",
-    "חיפה - מערב",
-    "חיפה - מפרץ",
-    "חיפה - נווה שאנן ורמות כרמל",
-    "חיפה - קריית חיים ושמואל",
-    "חירן",
-    "חלמיש",
-    "חלץ",
-    "חמד",
-    "חמדיה",
-    "חמדת",
-    "חמרה",
-    "חמת גדר",
-    "חניאל",
-    "חניון הנתיב מהיר",
-    "חניתה",
-    "חנתון",
-    "חספין",
-    "חפץ חיים",
-    "חצב",
-    "חצבה",
-    "חצור",
-    "חצור הגלילית",
-    "חצרים",
-    "חרב לאת",
-    "חרוצים",
-    "חרות",
-    "חריש",
-    "חרמש",
-    "חרשה",
-    "חרשים",
-    "חשמונאים",
-    "טבחה",
-    "טבריה",
-    "טובא זנגריה",
-    "טורעאן",
-    "טייבה",
-    "טייבה בגלבוע",
-    "טירה",
-    "טירת יהודה",
-    "טירת כרמל",
-    "טירת צבי",
-    "טל - אל",
-    "טל מנשה",
-    "טל שחר",
-    "טללים",
-    "טלמון",
-    "טמרה",
-    "טמרה בגלבוע",
-    "טנא עומרים",
-    "טפחות",
-    "יבול",
-    "יבנאל",
-    "יבנה",
-    "יגור",
-    "יגל",
-    "יד בנימין",
-    "יד השמונה",
-    "יד חנה",
-    "יד מרדכי",
-    "יד נתן",
-    "יד רמב''ם",
-    "יהוד מונוסון",
-    "יהל",
-    "יובלים",
-    "יודפת",
-    "יונתן",
-    "יושיביה",
-    "יזרעאל",
-    "יחיעם",
-    "יטבתה",
-    "ייט''ב",
-    "יכיני",
-    "ינוב",
-    "ינוח ג'ת",
-    "ינון",
-    "יסוד המעלה",
-    "יסודות",
-    "יסעור",
-    "יעד",
-    "יעף",
-    "יערה",
-    "יערות הכרמל",
-    "יפיע",
-    "יפית",
-    "יפעת",
-    "יפתח",
-    "יצהר",
-    "יציץ",
-    "יקום",
-    "יקיר",
-    "יקנעם המושבה והזורע",
-    "יקנעם עילית",
-    "יראון",
-    "ירדנה",
-    "ירוחם",
-    "ירושלים - אזור תעשייה עטרות",
-    "ירושלים - דרום",
-    "ירושלים - כפר עקב",
-    "ירושלים - מזרח",
-    "ירושלים - מערב",
-    "ירושלים - מרכז",
-    "ירושלים - צפון",
-    "ירחיב",
-    "ירכא",
-    "ירקונה",
-    "ישובי אומן",
-    "ישובי יעל",
-    "ישעי",
-    "ישרש",
-    "יתד",
-    "כאבול",
-    "כאוכב אבו אלהיג'א",
-    "כברי",
-    "כדורי",
-    "כוכב השחר",
-    "כוכב יאיר - צור יגאל",
-    "כוכב יעקב",
-    "כוכב מיכאל",
-    "כורזים ורד הגליל",
-    "כושי רמון",
-    "כחל",
-    "כינרת מושבה",
-    "כינרת קבוצה",
-    "כיסופים",
-    "כישור",
-    "כל הארץ",
-    "כלא דמון",
-    "כליל",
-    "כלנית",
-    "כמהין",
-    "כמון",
-    "כנות",
-    "כנף",
-    "כסייפה",
-    "כסלון",
-    "כסרא סמיע",
-    "כעביה",
-    "כעביה טבאש",
-    "כפר אביב",
-    "כפר אדומים",
-    "כפר אוריה",
-    "כפר אחים",
-    "כפר אלדד",
-    "כפר ביאליק",
-    "כפר ביל''ו",
-    "כפר בלום",
-    "כפר בן נון",
-    "כפר ברא",
-    "כפר ברוך",
-    "כפר גדעון",
-    "כפר גלים",
-    "כפר גליקסון",
-    "כפר גלעדי",
-    "כפר גמילה מלכישוע",
-    "כפר דניאל",
-    "כפר האורנים",
-    "כפר החורש",
-    "כפר המכבי",
-    "כפר הנגיד",
-    "כפר הנוער ימין אורד",
-    "כפר הנוער קריית יערים",
-    "כפר הנוקדים",
-    "כפר הנשיא",
-    "כפר הס",
-    "כפר הרא''ה",
-    "כפר הרי''ף וצומת ראם",
-    "כפר ויתקין",
-    "כפר ורבורג",
-    "כפר ורדים",
-    "כפר זוהרים",
-    "כפר זיתים",
-    "כפר חב''ד",
-    "כפר חיטים",
-    "כפר חיים",
-    "כפר חנניה",
-    "כפר חסידים",
-    "כפר חרוב",
-    "כפר טבאש",
-    "כפר טרומן",
-    "כפר יאסיף",
-    "כפר ידידיה",
-    "כפר יהושע",
-    "כפר יובל",
-    "כפר יונה",
-    "כפר יחזקאל",
-    "כפר יעבץ",
-    "כפר כמא",
-    "כפר כנא",
-    "כפר מונש",
-    "כפר מימון ותושיה",
-    "כפר מל''ל",
-    "כפר מנדא",
-    "כפר מנחם",
-    "כפר מסריק",
-    "כפר מצר",
-    "כפר מרדכי",
-    "כפר נהר הירדן",
-    "כפר נוער בן שמן",
-    "כפר נחום",
-    "כפר נטר",
-    "כפר סאלד",
-    "כפר סבא",
-    "כפר סילבר",
-    "כפר סירקין",
-    "כפר עבודה",
-    "כפר עזה",
-    "כפר עציון",
-    "כפר פינס",
-    "כפר קאסם",
-    "כפר קיש",
-    "כפר קרע",
-    "כפר רופין",
-    "כפר רות",
-    "כפר שמאי",
-    "כפר שמואל",
-    "כפר שמריהו",
-    "כפר תבור",
-    "כפר תפוח",
-    "כפר תקווה",
-    "כרכום",
-    "כרם ביבנה",
-    "כרם בן זמרה",
-    "כרם מהר''ל",
-    "כרם רעים",
-    "כרם שלום",
-    "כרמי יוסף",
-    "כרמי צור",
-    "כרמי קטיף",
-    "כרמיאל",
-    "כרמיה",
-    "כרמים",
-    "כרמית",
-    "כרמל",
-    "לב החולה",
-    "לבון",
-    "לביא",
-    "לבנים",
-    "להב",
-    "להבות הבשן",
-    "להבות חביבה",
-    "להבים",
-    "לוד",
-    "לוזית",
-    "לוחמי הגטאות",
-    "לוטם וחמדון",
-    "לוטן",
-    "לטרון",
-    "לימן",
-    "לכיש",
-    "לפיד",
-    "לפידות",
-    "לקיה",
-    "מאור",
-    "מאיר שפיה",
-    "מבוא ביתר",
-    "מבוא דותן",
-    "מבוא חורון",
-    "מבוא חמה",
-    "מבוא מודיעים",
-    "מבואות יריחו",
-    "מבועים",
-    "מבטחים, עמיעוז, ישע",
-    "מבקיעים",
-    "מבשרת ציון",
-    "מג'דל כרום",
-    "מג'דל שמס",
-    "מגדים",
-    "מגדל",
-    "מגדל העמק",
-    "מגדל עוז",
-    "מגדל תפן",
-    "מגדלים",
-    "מגל",
-    "מגן",
-    "מגן שאול",
-    "מגרון",
-    "מגשימים",
-    "מדרך עוז",
-    "מדרשת בן גוריון",
-    "מודיעין - ישפרו סנטר",
-    "מודיעין - ליגד סנטר",
-    "מודיעין מכבים רעות",
-    "מודיעין עילית",
-    "מולדת",
-    "מועאוויה",
-    "מוצא עילית",
-    "מוקיבלה",
-    "מורן",
-    "מורשת",
-    "מזור",
-    "מזכרת בתיה",
-    "מזרע",
-    "מזרעה",
-    "מחולה",
-    "מחניים",
-    "מחסיה",
-    "מטווח ניר עם",
-    "מטולה",
-    "מטע",
-    "מי עמי",
-    "מייסר",
-    "מיני ישראל - נחשון",
-    "מיצד",
-    "מיצר",
-    "מירב",
-    "מירון",
-    "מישר",
-    "מיתר",
-    "מכון וינגייט",
-    "מכורה",
-    "מכמורת",
-    "מכמנים",
-    "מלון אחוזת ירדן",
-    "מלון סיקס סנסס שחרות",
-    "מלון פרא",
-    "מלונות ים המלח מרכז",
-    "מלכיה",
-    "ממשית",
-    "מנוחה",
-    "מנוף",
-    "מנות",
-    "מנחמיה",
-    "מנחת מחניים",
-    "מנרה",
-    "מנשית זבדה",
-    "מסד",
-    "מסדה",
-    "מסילות",
-    "מסילת ציון",
-    "מסלול",
-    "מסעדה",
-    "מע'אר",
-    "מעברות",
-    "מעגלים, גבעולים, מלילות",
-    "מעגן",
-    "מעגן מיכאל",
-    "מעוז חיים",
-    "מעון",
-    "מעון צופיה",
-    "מעונה",
-    "מעיין ברוך",
-    "מעיין צבי",
-    "מעיליא",
-    "מעלה אדומים",
-    "מעלה אפרים",
-    "מעלה גלבוע",
-    "מעלה גמלא",
-    "מעלה החמישה",
-    "מעלה חבר",
-    "מעלה לבונה",
-    "מעלה מכמש",
-    "מעלה עירון",
-    "מעלה עמוס",
-    "מעלה צביה",
-    "מעלה רחבעם",
-    "מעלות תרשיחא",
-    "מענית",
-    "מעש",
-    "מפלסים",
-    "מפעל אגריגדה",
-    "מצדה",
-    "מצובה",
-    "מצוק עורבים",
-    "מצוקי דרגות",
-    "מצליח",
-    "מצפה",
-    "מצפה אבי''ב",
-    "מצפה אילן",
-    "מצפה יריחו",
-    "מצפה נטופה",
-    "מצפה רמון",
-    "מצפה שלם",
-    "מצר",
-    "מקווה ישראל",
-    "מרגליות",
-    "מרום גולן",
-    "מרחב עם",
-    "מרחביה מושב",
-    "מרחביה קיבוץ",
-    "מרחצאות עין גדי",
-    "מרכז אזורי דרום השרון",
-    "מרכז אזורי מבואות חרמון",
-    "מרכז אזורי מגילות",
-    "מרכז אזורי מרום גליל",
-    "מרכז אזורי משגב",
-    "מרכז חבר",
-    "מרכז ימי קיסריה",
-    "מרכז מיר''ב",
-    "מרכז שפירא",
-    "מרעית",
-    "משאבי שדה",
-    "משגב דב",
-    "משגב עם",
-    "משהד",
-    "משואה",
-    "משואות יצחק",
-    "משכיות",
-    "משמר איילון",
-    "משמר דוד",
-    "משמר הירדן",
-    "משמר הנגב",
-    "משמר העמק",
-    "משמר השבעה",
-    "משמר השרון",
-    "משמרות",
-    "משמרת",
-    "משען",
-    'מתחם "חנה וסע" שפיים',
-    "מתחם בני דרום",
-    "מתחם סקי גלבוע",
-    "מתחם פי גלילות",
-    "מתחם צומת שוקת",
-    "מתחם שביל התפוזים",
-    "מתן",
-    "מתת",
-    "מתתיהו",
-    "נאות גולן",
-    "נאות הכיכר",
-    "נאות מרדכי",
-    "נאות סמדר",
-    "נאות קדומים",
-    "נאעורה",
-    "נבטים",
-    "נבי סמואל",
-    "נבי שועייב",
-    "נגבה",
-    "נגוהות",
-    "נהורה",
-    "נהלל",
-    "נהריה",
-    "נוב",
-    "נוגה",
-    "נוה איתן",
-    "נווה",
-    "נווה אור",
-    "נווה אטי''ב",
-    "נווה אילן",
-    "נווה דניאל",
-    "נווה זוהר",
-    "נווה זיו",
-    "נווה חריף",
-    "נווה ים",
-    "נווה ימין",
-    "נווה ירק",
-    "נווה מבטח",
-    "נווה מיכאל - רוגלית",
-    "נווה שלום",
-    "נועם",
-    "נוף איילון",
-    "נוף הגליל",
-    "נופי נחמיה",
-    "נופי פרת",
-    "נופים",
-    "נופית",
-    "נופך",
-    "נוקדים",
-    "נורדיה",
-    "נורית",
-    "נחושה",
-    "נחל עוז",
-    "נחלה",
-    "נחליאל",
-    "נחלים",
-    "נחם",
-    "נחף",
-    "נחשולים",
-    "נחשון",
-    "נחשונים",
-    "נטועה",
-    "נטור",
-    "נטע",
-    "נטעים",
-    "נטף",
-    "נילי",
-    "נין",
-    "ניצן",
-    "ניצנה",
-    "ניצני עוז",
-    "ניצנים",
-    "ניר אליהו",
-    "ניר בנים",
-    "ניר גלים",
-    "ניר דוד",
-    "ניר ח''ן",
-    "ניר יצחק",
-    "ניר ישראל",
-    "ניר משה",
-    "ניר עוז",
-    "ניר עם",
-    "ניר עציון",
-    "ניר עקיבא",
-    "ניר צבי",
-    "נירים",
-    "נירית",
-    "נמרוד",
-    "נס הרים",
-    "נס עמים",
-    "נס ציונה",
-    "נעורים",
-    "נעלה",
-    "נעמה",
-    "נען",
-    "נערן",
-    "נצר חזני",
-    "נצר סרני",
-    "נצרת",
-    "נריה",
-    "נשר",
-    "נתיב הגדוד",
-    "נתיב הל''ה",
-    "נתיב העשרה",
-    "נתיב השיירה",
-    "נתיבות",
-    "נתניה - מזרח",
-    "נתניה - מערב",
-    "סאג'ור",
-    "סאסא",
-    "סביון",
-    "סגולה",
-    "סואעד חמירה",
-    "סולם",
-    "סוסיא",
-    "סופה",
-    "סינמה סיטי גלילות",
-    "סכנין",
-    "סלמה",
-    "סלעית",
-    "סמר",
-    "סנדלה",
-    "סנסנה",
-    "סעד",
-    "סעווה",
-    "סער",
-    "ספיר",
-    "ספסופה - כפר חושן",
-    "סתריה",
-    "ע'ג'ר",
-    "עבדון",
-    "עבדת",
-    "עברון",
-    "עגור",
-    "עדי",
-    "עדי עד",
-    "עדנים",
-    "עוזה",
-    "עוזייר",
-    "עולש",
-    "עומר",
-    "עופר",
-    "עופרים",
-    "עוצם",
-    "עזוז",
-    "עזר",
-    "עזריאל",
-    "עזריה",
-    "עזריקם",
-    "עטרת",
-    "עידן",
-    "עיינות",
-    "עילבון",
-    "עילוט",
-    "עין איילה",
-    "עין אל אסד",
-    "עין אל סהלה",
-    "עין בוקק",
-    "עין גב",
-    "עין גדי",
-    "עין דור",
-    "עין הבשור",
-    "עין הוד",
-    "עין החורש",
-    "עין המפרץ",
-    "עין הנצי''ב",
-    "עין העמק",
-    "עין השופט",
-    "עין השלושה",
-    "עין ורד",
-    "עין זיוון",
-    "עין חוד",
-    "עין חצבה",
-    "עין חרוד",
-    "עין יהב",
-    "עין יעקב",
-    "עין כמונים",
-    "עין כרמל",
-    "עין מאהל",
-    "עין נקובא",
-    "עין עירון",
-    "עין צורים",
-    "עין קנייא",
-    "עין ראפה",
-    "עין שמר",
-    "עין שריד",
-    "עין תמר",
-    "עינבר",
-    "עינת",
-    "עיר אובות",
-    "עכו",
-    "עכו - אזור תעשייה",
-    "עלומים",
-    "עלי",
-    "עלי זהב",
-    "עלמה",
-    "עלמון",
-    "עמוקה",
-    "עמיחי",
-    "עמינדב",
-    "עמיעד",
-    "עמיקם",
-    "עמיר",
-    "עמנואל",
-    "עמקה",
-    "ענב",
-    "עספיא",
-    "עפולה",
-    "עפרה",
-    "עץ אפרים",
-    "עצמון - שגב",
-    "עראבה",
-    "ערב אל נעים",
-    "ערב אל עראמשה",
-    "ערד",
-    "ערוגות",
-    "ערערה",
-    "ערערה בנגב",
-    "עשהאל",
-    "עשרת",
-    "עתלית",
-    "עתניאל",
-    "פארן",
-    "פארק תעשיות מגדל עוז",
-    "פארק תעשיות פלמחים",
-    "פארק תעשייה ראם",
-    "פדואל",
-    "פדויים",
-    "פדיה",
-    "פוריה כפר עבודה",
-    "פוריה נווה עובד",
-    "פוריה עילית",
-    "פוריידיס",
-    "פורת",
-    "פטיש",
-    "פלך",
-    "פלמחים",
-    "פני קדם",
-    "פנימיית עין כרם",
-    "פסגות",
-    "פסוטה",
-    "פעמי תש''ז",
-    "פצאל",
-    "פקיעין",
-    "פקיעין החדשה",
-    "פרדס חנה כרכור",
-    "פרדסיה",
-    "פרוד",
-    "פרי גן",
-    "פתח תקווה",
-    "פתחיה",
-    "צאלים",
-    "צבעון",
-    "צובה",
-    "צוחר, אוהד",
-    "צומת בנימינה",
-    "צומת דבירה",
-    "צומת האלה",
-    "צומת הגוש",
-    "צופים",
-    "צופית",
-    "צופר",
-    "צוקים",
-    "צור הדסה",
-    "צור יצחק",
-    "צור משה",
-    "צור נתן",
-    "צוריאל",
-    "צורית גילון",
-    "ציפורי",
-    "צלפון",
-    "צמח",
-    "צפריה",
-    "צפרירים",
-    "צפת - נוף כנרת",
-    "צפת - עיר",
-    "צפת - עכברה",
-    "צרופה",
-    "צרעה",
-    "קבוצת גבע",
-    "קבוצת יבנה",
-    "קדומים",
-    "קדימה צורן",
-    "קדיתא",
-    "קדמה",
-    "קדמת צבי",
-    "קדרון",
-    "קדרים",
-    "קדש ברנע",
-    "קוממיות",
-    "קורנית",
-    "קטורה",
-    "קיבוץ דן",
-    "קיבוץ מגידו",
-    "קידה",
-    "קידר",
-    "קיסריה",
-    "קלחים",
-    "קליה",
-    "קלנסווה",
-    "קסר א-סר",
-    "קציר",
-    "קצרין",
-    "קצרין - אזור תעשייה",
-    "קריית אונו",
-    "קריית ארבע",
-    "קריית אתא",
-    "קריית ביאליק",
-    "קריית גת, כרמי גת",
-    "קריית חינוך מרחבים",
-    "קריית טבעון - בית זייד",
-    "קריית ים",
-    "קריית יערים",
-    "קריית מוצקין",
-    "קריית מלאכי",
-    "קריית נטפים",
-    "קריית ענבים",
-    "קריית עקרון",
-    "קריית שמונה",
-    "קרני שומרון",
-    "קשת",
-    "ראמה",
-    "ראס אל-עין",
-    "ראס עלי",
-    "ראש הנקרה",
-    "ראש העין",
-    "ראש פינה",
-    "ראש צורים",
-    "ראשון לציון - מזרח",
-    "ראשון לציון - מערב",
-    "רבבה",
-    "רבדים",
-    "רביבים",
-    "רביד",
-    "רגבה",
-    "רגבים",
-    "רהט",
-    "רווחה",
-    "רוויה",
-    "רוחמה",
-    "רומאנה",
-    "רומת אל הייב",
-    "רועי",
-    "רותם",
-    "רחוב",
-    "רחובות",
-    "רחלים",
-    "רטורנו - גבעת שמש",
-    "ריחאנייה",
-    "ריחן",
-    "ריינה",
-    "רימונים",
-    "רינתיה",
-    "רכסים",
-    "רם און",
-    "רמות",
-    "רמות השבים",
-    "רמות מאיר",
-    "רמות מנשה",
-    "רמות נפתלי",
-    "רמלה",
-    "רמת גן - מזרח",
-    "רמת גן - מערב",
-    "רמת דוד",
-    "רמת הכובש",
-    "רמת הנדיב",
-    "רמת השופט",
-    "רמת השרון",
-    "רמת טראמפ",
-    "רמת יוחנן",
-    "רמת ישי",
-    "רמת מגשימים",
-    "רמת צבי",
-    "רמת רזיאל",
-    "רנן",
-    "רעים",
-    "רעננה",
-    "רפטינג נהר הירדן",
-    "רקפת",
-    "רשפון",
-    "רשפים",
-    "רתמים",
-    "שאנטי במדבר",
-    "שאר ישוב",
-    "שבות רחל",
-    "שבי דרום",
-    "שבי ציון",
-    "שבי שומרון",
-    "שבלי",
-    "שגב שלום",
-    "שדה אילן",
-    "שדה אליהו",
-    "שדה אליעזר",
-    "שדה בוקר",
-    "שדה בר",
-    "שדה דוד",
-    "שדה ורבורג",
-    "שדה יואב",
-    "שדה יעקב",
-    "שדה יצחק",
-    "שדה משה",
-    "שדה נחום",
-    "שדה נחמיה",
-    "שדה ניצן",
-    "שדה עוזיהו",
-    "שדה צבי",
-    "שדות ים",
-    "שדות מיכה",
-    "שדי אברהם",
-    "שדי חמד",
-    "שדי תרומות",
-    "שדמה",
-    "שדמות דבורה",
-    "שדמות מחולה",
-    "שדרות, איבים",
-    "שואבה",
-    "שובל",
-    "שוהם",
-    "שומרה",
-    "שומריה",
-    "שומרת",
-    "שוקדה",
-    "שורש",
-    "שורשים",
-    "שושנת העמקים",
-    "שזור",
-    "שחר",
-    "שחרות",
-    "שיבולים",
-    "שיטים",
-    "שייח' דנון",
-    "שילה",
-    "שילת",
-    "שכניה",
-    "שלווה",
-    "שלוחות",
-    "שלומי",
-    "שלומית",
-    "שלפים",
-    "שמיר",
-    "שמעה",
-    "שמשית",
-    "שני ליבנה",
-    "שניר",
-    "שעב",
-    "שעל",
-    "שעלבים",
-    "שער אפרים",
-    "שער הגולן",
-    "שער הגיא",
-    "שער העמקים",
-    "שער מנשה",
-    "שערי תקווה",
-    "שפיים",
-    "שפיר",
-    "שפר",
-    "שפרעם",
-    "שקד",
-    "שקף",
-    "שרונה",
-    "שריגים - לי-און",
-    "שריד",
-    "שרשרת",
-    "שתולה",
-    "שתולים",
-    "תארבין",
-    "תאשור",
-    "תדהר",
-    "תובל",
-    "תומר",
-    "תחנת רכבת כפר ברוך",
-    "תחנת רכבת כפר יהושוע",
-    "תחנת רכבת קריית מלאכי - יואב",
-    "תחנת רכבת ראש העין",
-    "תימורים",
-    "תירוש",
-    "תל אביב - דרום העיר ויפו",
-    "תל אביב - מזרח",
-    "תל אביב - מרכז העיר",
-    "תל אביב - עבר הירקון",
-    "תל חי",
-    "תל יוסף",
-    "תל יצחק",
-    "תל מונד",
-    "תל עדשים",
-    "תל ערד",
-    "תל ציון",
-    "תל קציר",
-    "תל שבע",
-    "תל תאומים",
-    "תלם",
-    "תלמי אליהו",
-    "תלמי אלעזר",
-    "תלמי ביל''ו",
-    "תלמי יוסף",
-    "תלמי יחיאל",
-    "תלמי יפה",
-    "תלמים",
-    "תמרת",
-    "תנובות",
-    "תעוז",
-    "תעשיון חצב",
-    "תעשיון צריפין",
-    "תפרח",
-    "תקומה",
-    "תקוע",
-    "תרום",
-}
+AREAS = frozenset(
+    (
+        "אבו גוש",
+        "אבו נוור",
+        "אבו סנאן",
+        "אבו קרינאת",
+        "אבו תלול",
+        "אבטליון",
+        "אביאל",
+        "אביבים",
+        "אביגדור",
+        "אביחיל",
+        "אביעזר",
+        "אבירים",
+        "אבן יהודה",
+        "אבן מנחם",
+        "אבן ספיר",
+        "אבן שמואל",
+        "אבני איתן",
+        "אבני חפץ",
+        "אבנת",
+        "אבשלום",
+        "אדורה",
+        "אדוריים",
+        "אדמית",
+        "אדרת",
+        "אודים",
+        "אודם",
+        "אום אל פחם",
+        "אום אל קוטוף",
+        "אום אלג'נם",
+        "אום בטין",
+        "אופקים",
+        "אור הגנוז",
+        "אור הנר",
+        "אור יהודה",
+        "אור עקיבא",
+        "אורה",
+        "אורון תעשייה ומסחר",
+        "אורות",
+        "אורטל",
+        "אורים",
+        "אורנים",
+        "אורנית",
+        "אושה",
+        "אזור",
+        "אזור תעשייה אלון התבור",
+        "אזור תעשייה אפק ולב הארץ",
+        "אזור תעשייה אריאל",
+        "אזור תעשייה באר טוביה",
+        "אזור תעשייה בני יהודה",
+        "אזור תעשייה בר-לב",
+        "אזור תעשייה בראון",
+        "אזור תעשייה ברוש",
+        "אזור תעשייה ברקן",
+        "אזור תעשייה גדרה",
+        "אזור תעשייה דימונה",
+        "אזור תעשייה הדרומי אשקלון",
+        "אזור תעשייה הר טוב - צרעה",
+        "אזור תעשייה חבל מודיעין",
+        "אזור תעשייה חצור הגלילית",
+        "אזור תעשייה טירה",
+        "אזור תעשייה טמרה",
+        "אזור תעשייה יקנעם עילית",
+        "אזור תעשייה כנות",
+        "אזור תעשייה כפר יונה",
+        "אזור תעשייה כרמיאל",
+        "אזור תעשייה מבוא כרמל",
+        "אזור תעשייה מבואות הגלבוע",
+        "אזור תעשייה מילואות צפון",
+        "אזור תעשייה מישור אדומים",
+        "אזור תעשייה מיתרים",
+        "אזור תעשייה נ.ע.מ",
+        "אזור תעשייה ניר עציון",
+        "אזור תעשייה נשר - רמלה",
+        "אזור תעשייה עד הלום",
+        "אזור תעשייה עידן הנגב",
+        "אזור תעשייה עמק חפר",
+        "אזור תעשייה צ.ח.ר",
+        "אזור תעשייה צבאים",
+        "אזור תעשייה ציפורית",
+        "אזור תעשייה צפוני אשקלון",
+        "אזור תעשייה קדמת גליל",
+        "אזור תעשייה קיסריה",
+        "אזור תעשייה קריית ביאליק",
+        "אזור תעשייה קריית גת",
+        "אזור תעשייה רבדים",
+        "אזור תעשייה רגבים",
+        "אזור תעשייה רגמ",
+        "אזור תעשייה רותם",
+        "אזור תעשייה רמת דלתון",
+        "אזור תעשייה שחורת",
+        "אזור תעשייה שחק",
+        "אזור תעשייה שער בנימין",
+        "אזור תעשייה שער נעמן",
+        "אזור תעשייה תימורים",
+        "אזור תעשייה תרדיון",
+        "אחווה",
+        "אחוזם",
+        "אחוזת ברק",
+        "אחיה",
+        "אחיהוד",
+        "אחיטוב",
+        "אחיסמך",
+        "אחיעזר",
+        "איבטין",
+        "אייל",
+        "איילת השחר",
+        "איירפורט סיטי",
+        "אילון",
+        "אילות",
+        "אילניה",
+        "אילת",
+        "אירוס",
+        "איתמר",
+        "איתן",
+        "אכסאל",
+        "אל סייד",
+        "אל עזי",
+        "אל עמארני, אל מסק",
+        "אל עריאן",
+        "אל פורעה",
+        "אל רום",
+        "אל-ח'וואלד מערב",
+        "אלומה",
+        "אלומות",
+        "אלון",
+        "אלון הגליל",
+        "אלון מורה",
+        "אלון שבות",
+        "אלוני אבא",
+        "אלוני הבשן",
+        "אלוני יצחק",
+        "אלונים",
+        "אלי עד",
+        "אליאב",
+        "אליכין",
+        "אליפז ומכרות תמנע",
+        "אליפלט",
+        "אליקים",
+        "אלישיב",
+        "אלישמע",
+        "אלמגור",
+        "אלמוג",
+        "אלעד",
+        "אלעזר",
+        "אלפי מנשה",
+        "אלקוש",
+        "אלקנה",
+        "אמונים",
+        "אמירים",
+        "אמנון",
+        "אמץ",
+        "אמציה",
+        "אניעם",
+        "אעבלין",
+        "אפיק",
+        "אפיקים",
+        "אפק",
+        "אפרת",
+        "ארבל",
+        "ארגמן",
+        "ארז",
+        "אריאל",
+        "ארסוף",
+        "אשבול",
+        "אשבל",
+        "אשדוד - א,ב,ד,ה",
+        "אשדוד - איזור תעשייה צפוני",
+        "אשדוד - ג,ו,ז",
+        "אשדוד - ח,ט,י,יג,יד,טז",
+        "אשדוד -יא,יב,טו,יז,מרינה,סיטי",
+        "אשדות יעקב",
+        "אשחר",
+        "אשכולות",
+        "אשל הנשיא",
+        "אשלים",
+        "אשקלון - דרום",
+        "אשקלון - צפון",
+        "אשרת",
+        "אשתאול",
+        "אתר דודאים",
+        "אתר ההנצחה גולני",
+        "באקה אל גרבייה",
+        "באר אורה",
+        "באר גנים",
+        "באר טוביה",
+        "באר יעקב",
+        "באר מילכה",
+        "באר שבע - דרום",
+        "באר שבע - מזרח",
+        "באר שבע - מערב",
+        "באר שבע - צפון",
+        "בארות יצחק",
+        "בארותיים",
+        "בארי",
+        "בוסתן הגליל",
+        "בועיינה-נוג'ידאת",
+        "בוקעתא",
+        "בורגתה",
+        "בחן",
+        "בטחה",
+        "ביצרון",
+        "ביר אלמכסור",
+        "ביר הדאג'",
+        "ביריה",
+        "בית אורן",
+        "בית אל",
+        "בית אלעזרי",
+        "בית אלפא וחפציבה",
+        "בית אריה",
+        "בית ברל",
+        "בית ג'אן",
+        "בית גוברין",
+        "בית גמליאל",
+        "בית דגן",
+        "בית הגדי",
+        "בית הלוי",
+        "בית הלל",
+        "בית העלמין החדש נהריה",
+        "בית העלמין החדש עכו",
+        "בית העמק",
+        "בית הערבה",
+        "בית השיטה",
+        "בית זית",
+        "בית זרע",
+        'בית חג"י',
+        "בית חורון",
+        "בית חזון",
+        "בית חלקיה",
+        "בית חנן",
+        "בית חנניה",
+        "בית חרות",
+        "בית חשמונאי",
+        "בית יהושע",
+        "בית יוסף",
+        "בית ינאי",
+        "בית יצחק - שער חפר",
+        "בית ירח",
+        "בית יתיר",
+        "בית לחם הגלילית",
+        "בית מאיר",
+        "בית נחמיה",
+        "בית ניר",
+        "בית נקופה",
+        "בית סוהר השרון",
+        "בית סוהר מגידו",
+        "בית סוהר נפחא",
+        "בית סוהר צלמון",
+        "בית סוהר קישון",
+        "בית סוהר שיטה וגלבוע",
+        "בית ספר אורט בנימינה",
+        "בית ספר שדה מירון",
+        "בית עובד",
+        "בית עוזיאל",
+        "בית עזרא",
+        "בית עלמין מורשה",
+        "בית עלמין תל רגב",
+        "בית עריף",
+        "בית צבי",
+        "בית קמה",
+        "בית קשת",
+        "בית רימון",
+        "בית שאן",
+        "בית שמש",
+        "בית שערים",
+        "בית שקמה",
+        "ביתן אהרן",
+        "ביתר עילית",
+        "בלפוריה",
+        "בן זכאי",
+        "בן עמי",
+        "בן שמן",
+        "בני ברק",
+        "בני דקלים",
+        "בני דרום",
+        "בני דרור",
+        "בני יהודה וגבעת יואב",
+        "בני נצרים",
+        "בני עטרות",
+        "בני עי''ש",
+        "בני ציון",
+        "בני ראם",
+        "בניה",
+        "בנימינה",
+        "בסמת טבעון",
+        "בענה",
+        "בצרה",
+        "בצת",
+        "בקוע",
+        "בקעות",
+        "בר גיורא",
+        "בר יוחאי",
+        "ברוכין",
+        "ברור חיל",
+        "ברוש",
+        "ברחבי הארץ",
+        "ברטעה",
+        "ברכיה",
+        "ברעם",
+        "ברקאי",
+        "ברקן",
+        "ברקת",
+        "בת הדר",
+        "בת חן",
+        "בת חפר",
+        "בת ים",
+        "בת עין",
+        "בת שלמה",
+        "בתי מלון ים המלח",
+        "ג'דידה מכר",
+        "ג'וליס",
+        "ג'לג'וליה",
+        "ג'סר א-זרקא",
+        "ג'ש - גוש חלב",
+        "ג'ת",
+        "גאולי תימן",
+        "גאולים",
+        "גאליה",
+        "גבולות",
+        "גבים, מכללת ספיר",
+        "גבע בנימין",
+        "גבע כרמל",
+        "גבעון החדשה",
+        "גבעות",
+        "גבעות בר",
+        "גבעות גורל",
+        "גבעות עדן",
+        "גבעת אבני",
+        "גבעת אלה",
+        "גבעת אסף",
+        "גבעת ברנר",
+        "גבעת הראל וגבעת הרואה",
+        "גבעת השלושה",
+        "גבעת וולפסון",
+        "גבעת וושינגטון",
+        "גבעת זאב",
+        "גבעת חביבה",
+        "גבעת חיים איחוד",
+        "גבעת חיים מאוחד",
+        "גבעת חן",
+        "גבעת יערים",
+        "גבעת ישעיהו",
+        "גבעת כ''ח",
+        "גבעת ניל''י",
+        "גבעת עדה",
+        "גבעת עוז",
+        "גבעת שמואל",
+        "גבעת שפירא",
+        "גבעתי",
+        "גבעתיים",
+        "גברעם",
+        "גבת",
+        "גדות",
+        "גדעונה",
+        "גדרה",
+        "גונן",
+        "גורן",
+        "גורנות הגליל",
+        "גזית",
+        "גזר",
+        "גיאה",
+        "גיבתון",
+        "גיזו",
+        "גילת",
+        "גינוסר",
+        "גינתון",
+        "גיתה",
+        "גיתית",
+        "גלאון",
+        "גלגל",
+        "גלעד",
+        "גמזו",
+        "גן הדרום",
+        "גן השומרון",
+        "גן חיים",
+        "גן יאשיה",
+        "גן יבנה",
+        "גן נר",
+        "גן שורק",
+        "גן שלמה",
+        "גן שמואל",
+        "גנות",
+        "גנות הדר",
+        "גני הדר",
+        "גני חוגה",
+        "גני טל",
+        "גני יוחנן",
+        "גני עם",
+        "גני תקווה",
+        "גניגר",
+        "געש",
+        "געתון",
+        "גפן",
+        "גרופית",
+        "גשור",
+        "גשר",
+        "גשר הזיו",
+        "גת",
+        "גת רימון",
+        "דבוריה",
+        "דביר",
+        "דברת",
+        "דגניה א",
+        "דגניה ב",
+        "דוב''ב",
+        "דולב",
+        "דור",
+        "דורות",
+        "דחי",
+        "דימונה",
+        "דיר אל-אסד",
+        "דיר חנא",
+        "דישון",
+        "דליה",
+        "דלית אל כרמל",
+        "דלתון",
+        "דמיידה",
+        "דניאל",
+        "דפנה",
+        "דקל",
+        "האון",
+        "הבונים",
+        "הגושרים",
+        "הדר עם",
+        "הוד השרון",
+        "הודיה",
+        "הודיות",
+        "הושעיה",
+        "הזורעים",
+        "החותרים",
+        "היוגב",
+        "היישוב היהודי חברון",
+        "הילה",
+        "המעפיל",
+        "המרכז האקדמי רופין",
+        "הסוללים",
+        "העוגן",
+        "הר אדר",
+        "הר ברכה",
+        "הר גילה",
+        "הר הנגב",
+        "הר חלוץ",
+        "הר עמשא",
+        "הראל",
+        "הרדוף",
+        "הרצליה - מערב",
+        "הרצליה - מרכז וגליל ים",
+        "הררית יחד",
+        "ואדי אל חמאם",
+        "ואדי אל נעם דרום",
+        "ורד יריחו",
+        "ורדון",
+        "זבדיאל",
+        "זוהר",
+        "זיקים",
+        "זיתן",
+        "זכרון יעקב",
+        "זכריה",
+        "זמר",
+        "זמרת, שובה",
+        "זנוח",
+        "זרועה",
+        "זרזיר",
+        "זרחיה",
+        "זרעית",
+        "ח'וואלד",
+        "חבצלת השרון וצוקי ים",
+        "חג'אג'רה",
+        "חגור",
+        "חגלה",
+        "חד נס",
+        "חדיד",
+        "חדרה - מזרח",
+        "חדרה - מערב",
+        "חדרה - מרכז",
+        "חדרה - נווה חיים",
+        "חוואלד",
+        "חוות אירוח גורן",
+        "חוות גלעד",
+        "חוות יאיר",
+        "חוות יזרעם",
+        "חוות עדן",
+        "חוות ערנדל",
+        "חוות שיקמים",
+        "חולדה",
+        "חולון",
+        "חולית",
+        "חולתה",
+        "חוסן",
+        "חוסנייה",
+        "חוף אמנון",
+        "חוף בצת",
+        "חוף גולן, צאלון",
+        "חוף גופרה",
+        "חוף זיקים",
+        "חוף כורסי, לבנון, חלוקים",
+        "חוף כינר, דוגה, דוגית",
+        "חוף ניצנים",
+        "חוף סוסיתא",
+        "חוף קליה",
+        "חופית",
+        "חוקוק",
+        "חורה",
+        "חורפיש",
+        "חורשים",
+        "חזון",
+        "חי-בר יטבתה",
+        "חיבת ציון",
+        "חיננית",
+        "חיפה - כרמל, הדר ועיר תחתית",
+        "חיפה - מערב",
+        "חיפה - מפרץ",
+        "חיפה - נווה שאנן ורמות כרמל",
+        "חיפה - קריית חיים ושמואל",
+        "חירן",
+        "חלמיש",
+        "חלץ",
+        "חמד",
+        "חמדיה",
+        "חמדת",
+        "חמרה",
+        "חמת גדר",
+        "חניאל",
+        "חניון הנתיב מהיר",
+        "חניתה",
+        "חנתון",
+        "חספין",
+        "חפץ חיים",
+        "חצב",
+        "חצבה",
+        "חצור",
+        "חצור הגלילית",
+        "חצרים",
+        "חרב לאת",
+        "חרוצים",
+        "חרות",
+        "חריש",
+        "חרמש",
+        "חרשה",
+        "חרשים",
+        "חשמונאים",
+        "טבחה",
+        "טבריה",
+        "טובא זנגריה",
+        "טורעאן",
+        "טייבה",
+        "טייבה בגלבוע",
+        "טירה",
+        "טירת יהודה",
+        "טירת כרמל",
+        "טירת צבי",
+        "טל - אל",
+        "טל מנשה",
+        "טל שחר",
+        "טללים",
+        "טלמון",
+        "טמרה",
+        "טמרה בגלבוע",
+        "טנא עומרים",
+        "טפחות",
+        "יבול",
+        "יבנאל",
+        "יבנה",
+        "יגור",
+        "יגל",
+        "יד בנימין",
+        "יד השמונה",
+        "יד חנה",
+        "יד מרדכי",
+        "יד נתן",
+        "יד רמב''ם",
+        "יהוד מונוסון",
+        "יהל",
+        "יובלים",
+        "יודפת",
+        "יונתן",
+        "יושיביה",
+        "יזרעאל",
+        "יחיעם",
+        "יטבתה",
+        "ייט''ב",
+        "יכיני",
+        "ינוב",
+        "ינוח ג'ת",
+        "ינון",
+        "יסוד המעלה",
+        "יסודות",
+        "יסעור",
+        "יעד",
+        "יעף",
+        "יערה",
+        "יערות הכרמל",
+        "יפיע",
+        "יפית",
+        "יפעת",
+        "יפתח",
+        "יצהר",
+        "יציץ",
+        "יקום",
+        "יקיר",
+        "יקנעם המושבה והזורע",
+        "יקנעם עילית",
+        "יראון",
+        "ירדנה",
+        "ירוחם",
+        "ירושלים - אזור תעשייה עטרות",
+        "ירושלים - דרום",
+        "ירושלים - כפר עקב",
+        "ירושלים - מזרח",
+        "ירושלים - מערב",
+        "ירושלים - מרכז",
+        "ירושלים - צפון",
+        "ירחיב",
+        "ירכא",
+        "ירקונה",
+        "ישובי אומן",
+        "ישובי יעל",
+        "ישעי",
+        "ישרש",
+        "יתד",
+        "כאבול",
+        "כאוכב אבו אלהיג'א",
+        "כברי",
+        "כדורי",
+        "כוכב השחר",
+        "כוכב יאיר - צור יגאל",
+        "כוכב יעקב",
+        "כוכב מיכאל",
+        "כורזים ורד הגליל",
+        "כושי רמון",
+        "כחל",
+        "כינרת מושבה",
+        "כינרת קבוצה",
+        "כיסופים",
+        "כישור",
+        "כל הארץ",
+        "כלא דמון",
+        "כליל",
+        "כלנית",
+        "כמהין",
+        "כמון",
+        "כנות",
+        "כנף",
+        "כסייפה",
+        "כסלון",
+        "כסרא סמיע",
+        "כעביה",
+        "כעביה טבאש",
+        "כפר אביב",
+        "כפר אדומים",
+        "כפר אוריה",
+        "כפר אחים",
+        "כפר אלדד",
+        "כפר ביאליק",
+        "כפר ביל''ו",
+        "כפר בלום",
+        "כפר בן נון",
+        "כפר ברא",
+        "כפר ברוך",
+        "כפר גדעון",
+        "כפר גלים",
+        "כפר גליקסון",
+        "כפר גלעדי",
+        "כפר גמילה מלכישוע",
+        "כפר דניאל",
+        "כפר האורנים",
+        "כפר החורש",
+        "כפר המכבי",
+        "כפר הנגיד",
+        "כפר הנוער ימין אורד",
+        "כפר הנוער קריית יערים",
+        "כפר הנוקדים",
+        "כפר הנשיא",
+        "כפר הס",
+        "כפר הרא''ה",
+        "כפר הרי''ף וצומת ראם",
+        "כפר ויתקין",
+        "כפר ורבורג",
+        "כפר ורדים",
+        "כפר זוהרים",
+        "כפר זיתים",
+        "כפר חב''ד",
+        "כפר חיטים",
+        "כפר חיים",
+        "כפר חנניה",
+        "כפר חסידים",
+        "כפר חרוב",
+        "כפר טבאש",
+        "כפר טרומן",
+        "כפר יאסיף",
+        "כפר ידידיה",
+        "כפר יהושע",
+        "כפר יובל",
+        "כפר יונה",
+        "כפר יחזקאל",
+        "כפר יעבץ",
+        "כפר כמא",
+        "כפר כנא",
+        "כפר מונש",
+        "כפר מימון ותושיה",
+        "כפר מל''ל",
+        "כפר מנדא",
+        "כפר מנחם",
+        "כפר מסריק",
+        "כפר מצר",
+        "כפר מרדכי",
+        "כפר נהר הירדן",
+        "כפר נוער בן שמן",
+        "כפר נחום",
+        "כפר נטר",
+        "כפר סאלד",
+        "כפר סבא",
+        "כפר סילבר",
+        "כפר סירקין",
+        "כפר עבודה",
+        "כפר עזה",
+        "כפר עציון",
+        "כפר פינס",
+        "כפר קאסם",
+        "כפר קיש",
+        "כפר קרע",
+        "כפר רופין",
+        "כפר רות",
+        "כפר שמאי",
+        "כפר שמואל",
+        "כפר שמריהו",
+        "כפר תבור",
+        "כפר תפוח",
+        "כפר תקווה",
+        "כרכום",
+        "כרם ביבנה",
+        "כרם בן זמרה",
+        "כרם מהר''ל",
+        "כרם רעים",
+        "כרם שלום",
+        "כרמי יוסף",
+        "כרמי צור",
+        "כרמי קטיף",
+        "כרמיאל",
+        "כרמיה",
+        "כרמים",
+        "כרמית",
+        "כרמל",
+        "לב החולה",
+        "לבון",
+        "לביא",
+        "לבנים",
+        "להב",
+        "להבות הבשן",
+        "להבות חביבה",
+        "להבים",
+        "לוד",
+        "לוזית",
+        "לוחמי הגטאות",
+        "לוטם וחמדון",
+        "לוטן",
+        "לטרון",
+        "לימן",
+        "לכיש",
+        "לפיד",
+        "לפידות",
+        "לקיה",
+        "מאור",
+        "מאיר שפיה",
+        "מבוא ביתר",
+        "מבוא דותן",
+        "מבוא חורון",
+        "מבוא חמה",
+        "מבוא מודיעים",
+        "מבואות יריחו",
+        "מבועים",
+        "מבטחים, עמיעוז, ישע",
+        "מבקיעים",
+        "מבשרת ציון",
+        "מג'דל כרום",
+        "מג'דל שמס",
+        "מגדים",
+        "מגדל",
+        "מגדל העמק",
+        "מגדל עוז",
+        "מגדל תפן",
+        "מגדלים",
+        "מגל",
+        "מגן",
+        "מגן שאול",
+        "מגרון",
+        "מגשימים",
+        "מדרך עוז",
+        "מדרשת בן גוריון",
+        "מודיעין - ישפרו סנטר",
+        "מודיעין - ליגד סנטר",
+        "מודיעין מכבים רעות",
+        "מודיעין עילית",
+        "מולדת",
+        "מועאוויה",
+        "מוצא עילית",
+        "מוקיבלה",
+        "מורן",
+        "מורשת",
+        "מזור",
+        "מזכרת בתיה",
+        "מזרע",
+        "מזרעה",
+        "מחולה",
+        "מחניים",
+        "מחסיה",
+        "מטווח ניר עם",
+        "מטולה",
+        "מטע",
+        "מי עמי",
+        "מייסר",
+        "מיני ישראל - נחשון",
+        "מיצד",
+        "מיצר",
+        "מירב",
+        "מירון",
+        "מישר",
+        "מיתר",
+        "מכון וינגייט",
+        "מכורה",
+        "מכמורת",
+        "מכמנים",
+        "מלון אחוזת ירדן",
+        "מלון סיקס סנסס שחרות",
+        "מלון פרא",
+        "מלונות ים המלח מרכז",
+        "מלכיה",
+        "ממשית",
+        "מנוחה",
+        "מנוף",
+        "מנות",
+        "מנחמיה",
+        "מנחת מחניים",
+        "מנרה",
+        "מנשית זבדה",
+        "מסד",
+        "מסדה",
+        "מסילות",
+        "מסילת ציון",
+        "מסלול",
+        "מסעדה",
+        "מע'אר",
+        "מעברות",
+        "מעגלים, גבעולים, מלילות",
+        "מעגן",
+        "מעגן מיכאל",
+        "מעוז חיים",
+        "מעון",
+        "מעון צופיה",
+        "מעונה",
+        "מעיין ברוך",
+        "מעיין צבי",
+        "מעיליא",
+        "מעלה אדומים",
+        "מעלה אפרים",
+        "מעלה גלבוע",
+        "מעלה גמלא",
+        "מעלה החמישה",
+        "מעלה חבר",
+        "מעלה לבונה",
+        "מעלה מכמש",
+        "מעלה עירון",
+        "מעלה עמוס",
+        "מעלה צביה",
+        "מעלה רחבעם",
+        "מעלות תרשיחא",
+        "מענית",
+        "מעש",
+        "מפלסים",
+        "מפעל אגריגדה",
+        "מצדה",
+        "מצובה",
+        "מצוק עורבים",
+        "מצוקי דרגות",
+        "מצליח",
+        "מצפה",
+        "מצפה אבי''ב",
+        "מצפה אילן",
+        "מצפה יריחו",
+        "מצפה נטופה",
+        "מצפה רמון",
+        "מצפה שלם",
+        "מצר",
+        "מקווה ישראל",
+        "מרגליות",
+        "מרום גולן",
+        "מרחב עם",
+        "מרחביה מושב",
+        "מרחביה קיבוץ",
+        "מרחצאות עין גדי",
+        "מרכז אזורי דרום השרון",
+        "מרכז אזורי מבואות חרמון",
+        "מרכז אזורי מגילות",
+        "מרכז אזורי מרום גליל",
+        "מרכז אזורי משגב",
+        "מרכז חבר",
+        "מרכז ימי קיסריה",
+        "מרכז מיר''ב",
+        "מרכז שפירא",
+        "מרעית",
+        "משאבי שדה",
+        "משגב דב",
+        "משגב עם",
+        "משהד",
+        "משואה",
+        "משואות יצחק",
+        "משכיות",
+        "משמר איילון",
+        "משמר דוד",
+        "משמר הירדן",
+        "משמר הנגב",
+        "משמר העמק",
+        "משמר השבעה",
+        "משמר השרון",
+        "משמרות",
+        "משמרת",
+        "משען",
+        'מתחם "חנה וסע" שפיים',
+        "מתחם בני דרום",
+        "מתחם סקי גלבוע",
+        "מתחם פי גלילות",
+        "מתחם צומת שוקת",
+        "מתחם שביל התפוזים",
+        "מתן",
+        "מתת",
+        "מתתיהו",
+        "נאות גולן",
+        "נאות הכיכר",
+        "נאות מרדכי",
+        "נאות סמדר",
+        "נאות קדומים",
+        "נאעורה",
+        "נבטים",
+        "נבי סמואל",
+        "נבי שועייב",
+        "נגבה",
+        "נגוהות",
+        "נהורה",
+        "נהלל",
+        "נהריה",
+        "נוב",
+        "נוגה",
+        "נוה איתן",
+        "נווה",
+        "נווה אור",
+        "נווה אטי''ב",
+        "נווה אילן",
+        "נווה דניאל",
+        "נווה זוהר",
+        "נווה זיו",
+        "נווה חריף",
+        "נווה ים",
+        "נווה ימין",
+        "נווה ירק",
+        "נווה מבטח",
+        "נווה מיכאל - רוגלית",
+        "נווה שלום",
+        "נועם",
+        "נוף איילון",
+        "נוף הגליל",
+        "נופי נחמיה",
+        "נופי פרת",
+        "נופים",
+        "נופית",
+        "נופך",
+        "נוקדים",
+        "נורדיה",
+        "נורית",
+        "נחושה",
+        "נחל עוז",
+        "נחלה",
+        "נחליאל",
+        "נחלים",
+        "נחם",
+        "נחף",
+        "נחשולים",
+        "נחשון",
+        "נחשונים",
+        "נטועה",
+        "נטור",
+        "נטע",
+        "נטעים",
+        "נטף",
+        "נילי",
+        "נין",
+        "ניצן",
+        "ניצנה",
+        "ניצני עוז",
+        "ניצנים",
+        "ניר אליהו",
+        "ניר בנים",
+        "ניר גלים",
+        "ניר דוד",
+        "ניר ח''ן",
+        "ניר יצחק",
+        "ניר ישראל",
+        "ניר משה",
+        "ניר עוז",
+        "ניר עם",
+        "ניר עציון",
+        "ניר עקיבא",
+        "ניר צבי",
+        "נירים",
+        "נירית",
+        "נמרוד",
+        "נס הרים",
+        "נס עמים",
+        "נס ציונה",
+        "נעורים",
+        "נעלה",
+        "נעמה",
+        "נען",
+        "נערן",
+        "נצר חזני",
+        "נצר סרני",
+        "נצרת",
+        "נריה",
+        "נשר",
+        "נתיב הגדוד",
+        "נתיב הל''ה",
+        "נתיב העשרה",
+        "נתיב השיירה",
+        "נתיבות",
+        "נתניה - מזרח",
+        "נתניה - מערב",
+        "סאג'ור",
+        "סאסא",
+        "סביון",
+        "סגולה",
+        "סואעד חמירה",
+        "סולם",
+        "סוסיא",
+        "סופה",
+        "סינמה סיטי גלילות",
+        "סכנין",
+        "סלמה",
+        "סלעית",
+        "סמר",
+        "סנדלה",
+        "סנסנה",
+        "סעד",
+        "סעווה",
+        "סער",
+        "ספיר",
+        "ספסופה - כפר חושן",
+        "סתריה",
+        "ע'ג'ר",
+        "עבדון",
+        "עבדת",
+        "עברון",
+        "עגור",
+        "עדי",
+        "עדי עד",
+        "עדנים",
+        "עוזה",
+        "עוזייר",
+        "עולש",
+        "עומר",
+        "עופר",
+        "עופרים",
+        "עוצם",
+        "עזוז",
+        "עזר",
+        "עזריאל",
+        "עזריה",
+        "עזריקם",
+        "עטרת",
+        "עידן",
+        "עיינות",
+        "עילבון",
+        "עילוט",
+        "עין איילה",
+        "עין אל אסד",
+        "עין אל סהלה",
+        "עין בוקק",
+        "עין גב",
+        "עין גדי",
+        "עין דור",
+        "עין הבשור",
+        "עין הוד",
+        "עין החורש",
+        "עין המפרץ",
+        "עין הנצי''ב",
+        "עין העמק",
+        "עין השופט",
+        "עין השלושה",
+        "עין ורד",
+        "עין זיוון",
+        "עין חוד",
+        "עין חצבה",
+        "עין חרוד",
+        "עין יהב",
+        "עין יעקב",
+        "עין כמונים",
+        "עין כרמל",
+        "עין מאהל",
+        "עין נקובא",
+        "עין עירון",
+        "עין צורים",
+        "עין קנייא",
+        "עין ראפה",
+        "עין שמר",
+        "עין שריד",
+        "עין תמר",
+        "עינבר",
+        "עינת",
+        "עיר אובות",
+        "עכו",
+        "עכו - אזור תעשייה",
+        "עלומים",
+        "עלי",
+        "עלי זהב",
+        "עלמה",
+        "עלמון",
+        "עמוקה",
+        "עמיחי",
+        "עמינדב",
+        "עמיעד",
+        "עמיקם",
+        "עמיר",
+        "עמנואל",
+        "עמקה",
+        "ענב",
+        "עספיא",
+        "עפולה",
+        "עפרה",
+        "עץ אפרים",
+        "עצמון - שגב",
+        "עראבה",
+        "ערב אל נעים",
+        "ערב אל עראמשה",
+        "ערד",
+        "ערוגות",
+        "ערערה",
+        "ערערה בנגב",
+        "עשהאל",
+        "עשרת",
+        "עתלית",
+        "עתניאל",
+        "פארן",
+        "פארק תעשיות מגדל עוז",
+        "פארק תעשיות פלמחים",
+        "פארק תעשייה ראם",
+        "פדואל",
+        "פדויים",
+        "פדיה",
+        "פוריה כפר עבודה",
+        "פוריה נווה עובד",
+        "פוריה עילית",
+        "פוריידיס",
+        "פורת",
+        "פטיש",
+        "פלך",
+        "פלמחים",
+        "פני קדם",
+        "פנימיית עין כרם",
+        "פסגות",
+        "פסוטה",
+        "פעמי תש''ז",
+        "פצאל",
+        "פקיעין",
+        "פקיעין החדשה",
+        "פרדס חנה כרכור",
+        "פרדסיה",
+        "פרוד",
+        "פרי גן",
+        "פתח תקווה",
+        "פתחיה",
+        "צאלים",
+        "צבעון",
+        "צובה",
+        "צוחר, אוהד",
+        "צומת בנימינה",
+        "צומת דבירה",
+        "צומת האלה",
+        "צומת הגוש",
+        "צופים",
+        "צופית",
+        "צופר",
+        "צוקים",
+        "צור הדסה",
+        "צור יצחק",
+        "צור משה",
+        "צור נתן",
+        "צוריאל",
+        "צורית גילון",
+        "ציפורי",
+        "צלפון",
+        "צמח",
+        "צפריה",
+        "צפרירים",
+        "צפת - נוף כנרת",
+        "צפת - עיר",
+        "צפת - עכברה",
+        "צרופה",
+        "צרעה",
+        "קבוצת גבע",
+        "קבוצת יבנה",
+        "קדומים",
+        "קדימה צורן",
+        "קדיתא",
+        "קדמה",
+        "קדמת צבי",
+        "קדרון",
+        "קדרים",
+        "קדש ברנע",
+        "קוממיות",
+        "קורנית",
+        "קטורה",
+        "קיבוץ דן",
+        "קיבוץ מגידו",
+        "קידה",
+        "קידר",
+        "קיסריה",
+        "קלחים",
+        "קליה",
+        "קלנסווה",
+        "קסר א-סר",
+        "קציר",
+        "קצרין",
+        "קצרין - אזור תעשייה",
+        "קריית אונו",
+        "קריית ארבע",
+        "קריית אתא",
+        "קריית ביאליק",
+        "קריית גת, כרמי גת",
+        "קריית חינוך מרחבים",
+        "קריית טבעון - בית זייד",
+        "קריית ים",
+        "קריית יערים",
+        "קריית מוצקין",
+        "קריית מלאכי",
+        "קריית נטפים",
+        "קריית ענבים",
+        "קריית עקרון",
+        "קריית שמונה",
+        "קרני שומרון",
+        "קשת",
+        "ראמה",
+        "ראס אל-עין",
+        "ראס עלי",
+        "ראש הנקרה",
+        "ראש העין",
+        "ראש פינה",
+        "ראש צורים",
+        "ראשון לציון - מזרח",
+        "ראשון לציון - מערב",
+        "רבבה",
+        "רבדים",
+        "רביבים",
+        "רביד",
+        "רגבה",
+        "רגבים",
+        "רהט",
+        "רווחה",
+        "רוויה",
+        "רוחמה",
+        "רומאנה",
+        "רומת אל הייב",
+        "רועי",
+        "רותם",
+        "רחוב",
+        "רחובות",
+        "רחלים",
+        "רטורנו - גבעת שמש",
+        "ריחאנייה",
+        "ריחן",
+        "ריינה",
+        "רימונים",
+        "רינתיה",
+        "רכסים",
+        "רם און",
+        "רמות",
+        "רמות השבים",
+        "רמות מאיר",
+        "רמות מנשה",
+        "רמות נפתלי",
+        "רמלה",
+        "רמת גן - מזרח",
+        "רמת גן - מערב",
+        "רמת דוד",
+        "רמת הכובש",
+        "רמת הנדיב",
+        "רמת השופט",
+        "רמת השרון",
+        "רמת טראמפ",
+        "רמת יוחנן",
+        "רמת ישי",
+        "רמת מגשימים",
+        "רמת צבי",
+        "רמת רזיאל",
+        "רנן",
+        "רעים",
+        "רעננה",
+        "רפטינג נהר הירדן",
+        "רקפת",
+        "רשפון",
+        "רשפים",
+        "רתמים",
+        "שאנטי במדבר",
+        "שאר ישוב",
+        "שבות רחל",
+        "שבי דרום",
+        "שבי ציון",
+        "שבי שומרון",
+        "שבלי",
+        "שגב שלום",
+        "שדה אילן",
+        "שדה אליהו",
+        "שדה אליעזר",
+        "שדה בוקר",
+        "שדה בר",
+        "שדה דוד",
+        "שדה ורבורג",
+        "שדה יואב",
+        "שדה יעקב",
+        "שדה יצחק",
+        "שדה משה",
+        "שדה נחום",
+        "שדה נחמיה",
+        "שדה ניצן",
+        "שדה עוזיהו",
+        "שדה צבי",
+        "שדות ים",
+        "שדות מיכה",
+        "שדי אברהם",
+        "שדי חמד",
+        "שדי תרומות",
+        "שדמה",
+        "שדמות דבורה",
+        "שדמות מחולה",
+        "שדרות, איבים",
+        "שואבה",
+        "שובל",
+        "שוהם",
+        "שומרה",
+        "שומריה",
+        "שומרת",
+        "שוקדה",
+        "שורש",
+        "שורשים",
+        "שושנת העמקים",
+        "שזור",
+        "שחר",
+        "שחרות",
+        "שיבולים",
+        "שיטים",
+        "שייח' דנון",
+        "שילה",
+        "שילת",
+        "שכניה",
+        "שלווה",
+        "שלוחות",
+        "שלומי",
+        "שלומית",
+        "שלפים",
+        "שמיר",
+        "שמעה",
+        "שמשית",
+        "שני ליבנה",
+        "שניר",
+        "שעב",
+        "שעל",
+        "שעלבים",
+        "שער אפרים",
+        "שער הגולן",
+        "שער הגיא",
+        "שער העמקים",
+        "שער מנשה",
+        "שערי תקווה",
+        "שפיים",
+        "שפיר",
+        "שפר",
+        "שפרעם",
+        "שקד",
+        "שקף",
+        "שרונה",
+        "שריגים - לי-און",
+        "שריד",
+        "שרשרת",
+        "שתולה",
+        "שתולים",
+        "תארבין",
+        "תאשור",
+        "תדהר",
+        "תובל",
+        "תומר",
+        "תחנת רכבת כפר ברוך",
+        "תחנת רכבת כפר יהושוע",
+        "תחנת רכבת קריית מלאכי - יואב",
+        "תחנת רכבת ראש העין",
+        "תימורים",
+        "תירוש",
+        "תל אביב - דרום העיר ויפו",
+        "תל אביב - מזרח",
+        "תל אביב - מרכז העיר",
+        "תל אביב - עבר הירקון",
+        "תל חי",
+        "תל יוסף",
+        "תל יצחק",
+        "תל מונד",
+        "תל עדשים",
+        "תל ערד",
+        "תל ציון",
+        "תל קציר",
+        "תל שבע",
+        "תל תאומים",
+        "תלם",
+        "תלמי אליהו",
+        "תלמי אלעזר",
+        "תלמי ביל''ו",
+        "תלמי יוסף",
+        "תלמי יחיאל",
+        "תלמי יפה",
+        "תלמים",
+        "תמרת",
+        "תנובות",
+        "תעוז",
+        "תעשיון חצב",
+        "תעשיון צריפין",
+        "תפרח",
+        "תקומה",
+        "תקוע",
+        "תרום",
+    )
+)
@@ -2,14 +2,23 @@
 """Generate the metadata files."""
 
 import argparse
+import bisect
+import codecs
+import hashlib
+import inspect
 import json
 import subprocess
 import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+import orjson
 import requests
 import yaml
+from homeassistant.util import slugify
 
 RELATIVE_OUTPUT_DIRECTORY = "custom_components/oref_alert/metadata/"
 AREAS_OUTPUT = "areas.py"
@@ -21,6 +30,7 @@ AREA_TO_POLYGON_OUTPUT = "area_to_polygon.json"
 AREA_INFO_OUTPUT = "area_info.py"
 SERVICES_YAML = "custom_components/oref_alert/services.yaml"
 TEST_AREAS_FIXTURE = "tests/fixtures/GetCitiesMix.json"
+VALIDATORS_FILE = "scripts/.etags.json"
 CITIES_MIX_URL = "https://alerts-history.oref.org.il/Shared/Ajax/GetCitiesMix.aspx"
 DISTRICTS_URL = "https://alerts-history.oref.org.il/Shared/Ajax/GetDistricts.aspx"
 TZEVAADOM_VERSIONS_URL = "https://api.tzevaadom.co.il/lists-versions"
@@ -30,6 +40,11 @@ CITY_ALL_AREAS_SUFFIX = " - כל האזורים"
 # "Hadera all areas" is listed with this typo:
 CITY_ALL_AREAS_SUFFIX_TYPO = " כל - האזורים"
 DISTRICT_PREFIX = "מחוז "
+FETCH_WORKERS = 4
+# The tzevaadom data URLs embed the versions, so these cover all the sources.
+CONDITIONAL_URLS = (CITIES_MIX_URL, DISTRICTS_URL, TZEVAADOM_VERSIONS_URL)
+# Pairs of response validator header and the matching conditional request header.
+VALIDATOR_HEADERS = (("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since"))
 
 MISSING_CITIES = {
     "ברחבי הארץ": {"lat": 31.7781, "long": 35.2164, "en": "Across the country"},
@@ -58,16 +73,44 @@ MISSING_CITIES = {
 }
 
 
+class AreaInfo(NamedTuple):
+    """Area information."""
+
+    lat: float
+    long: float
+    en: str
+    slug: str
+
+
+# Header of the generated AREA_INFO file, embedding the AreaInfo definition.
+AREA_INFO_PREAMBLE = (
+    "from types import MappingProxyType\n"
+    "from typing import NamedTuple\n\n\n"
+    f"{inspect.getsource(AreaInfo)}\n\n"
+)
+
+
 class OrefMetadata:
     """Copy Oref metadata."""
 
     def __init__(self) -> None:
         """Initialize the object."""
         self.proxy = None
+        self.force = False
         self._read_args()
         self._root_directory = Path(__file__).parent.parent
         self._output_directory = self._root_directory / RELATIVE_OUTPUT_DIRECTORY
-        self._cities_mix: list[Any] = self._fetch_url_json(CITIES_MIX_URL)
+        self._session = requests.Session()
+        # Passed per request, so it overrides proxies from the environment.
+        self._proxies = {"https": self.proxy} if self.proxy else None
+        self._generator_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+        self._validators: dict[str, dict[str, str]] = self._load_validators()
+        # Full replies received during the up-to-date check, reused when fetching.
+        self._responses: dict[str, requests.Response] = {}
+
+    def _process(self) -> None:
+        """Fetch the sources and build the metadata."""
+        self._fetch_sources()
         self._backend_areas: list[str] = self._get_areas()
         self._areas_no_group = list(
             filter(
@@ -78,14 +121,10 @@ class OrefMetadata:
         self._city_to_areas: dict[str, list[str]] = self._city_to_areas_map()
         self._area_to_migun_time: dict[str, int] = self._area_to_migun_time_map()
         self._district_to_areas = self._district_to_areas_map()
-        self._areas_and_groups = (
-            self._areas_no_group
-            + list(self._city_to_areas.keys())
-            + list(self._district_to_areas.keys())
+        self._areas_and_groups = sorted(
+            [*self._areas_no_group, *self._city_to_areas, *self._district_to_areas]
         )
-        self._areas_and_groups.sort()
         assert len(self._areas_and_groups) == len(set(self._areas_and_groups))
-        self._tzeva_cities, self._tzeva_polygons = self._get_tzevaadom_data()
         self._area_to_polygon = self._get_area_to_polygon()
         self._area_info = self._get_area_info()
 
@@ -93,19 +132,118 @@ class OrefMetadata:
         """Read program arguments."""
         parser = argparse.ArgumentParser()
         parser.add_argument("--proxy")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="regenerate even if the upstream sources are unchanged",
+        )
         parser.parse_args(namespace=self)
 
+    def _load_validators(self) -> dict[str, dict[str, str]]:
+        """Load the cache validators (ETag, Last-Modified) of the last run."""
+        try:
+            with (self._root_directory / VALIDATORS_FILE).open(
+                encoding="utf-8"
+            ) as sidecar:
+                state = json.load(sidecar)
+        except FileNotFoundError:
+            return {}
+        # Validators are only meaningful for outputs of the same generator.
+        if state.get("generator") != self._generator_hash:
+            return {}
+        return state.get("validators", {})
+
+    def _save_validators(self) -> None:
+        """Save the cache validators for the next run."""
+        with (self._root_directory / VALIDATORS_FILE).open(
+            "w", encoding="utf-8"
+        ) as sidecar:
+            json.dump(
+                {"generator": self._generator_hash, "validators": self._validators},
+                sidecar,
+                indent=2,
+            )
+
+    def _outputs(self) -> list[Path]:
+        """Return the paths of all generated files."""
+        return [
+            *(
+                self._output_directory / file_name
+                for file_name in (
+                    AREAS_AND_GROUPS_OUTPUT,
+                    CITY_ALL_AREAS_OUTPUT,
+                    AREA_TO_MIGUN_TIME_OUTPUT,
+                    DISTRICT_TO_AREAS_OUTPUT,
+                    AREAS_OUTPUT,
+                    AREA_INFO_OUTPUT,
+                    f"{AREA_TO_POLYGON_OUTPUT}.zip",
+                )
+            ),
+            self._root_directory / SERVICES_YAML,
+            self._root_directory / TEST_AREAS_FIXTURE,
+        ]
+
+    def _is_not_modified(self, url: str) -> bool:
+        """Check if URL content was not modified since the last run."""
+        validators = self._validators[url]
+        headers = {
+            condition: validators[header]
+            for header, condition in VALIDATOR_HEADERS
+            if header in validators
+        }
+        response = self._session.get(
+            url, headers=headers, proxies=self._proxies, timeout=15
+        )
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return True
+        self._responses[url] = response
+        return False
+
+    def is_up_to_date(self) -> bool:
+        """Check if the outputs exist and no source changed since the last run."""
+        if not all(self._validators.get(url) for url in CONDITIONAL_URLS):
+            return False
+        if not all(output.exists() for output in self._outputs()):
+            return False
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            return all(list(executor.map(self._is_not_modified, CONDITIONAL_URLS)))
+
     def _fetch_url_json(self, url: str) -> Any:
         """Fetch URL and return JSON reply."""
-        return requests.get(
-            url,
-            proxies={"https": self.proxy} if self.proxy else None,
-            timeout=15,
-        ).json()
+        response = self._responses.pop(url, None)
+        if response is None:
+            response = self._session.get(url, proxies=self._proxies, timeout=15)
+        if url in CONDITIONAL_URLS:
+            self._validators[url] = {
+                header: response.headers[header]
+                for header, _ in VALIDATOR_HEADERS
+                if header in response.headers
+            }
+        # orjson rejects a UTF-8 BOM, which requests' json() silently skips.
+        return orjson.loads(response.content.removeprefix(codecs.BOM_UTF8))
+
+    def _fetch_sources(self) -> None:
+        """Fetch all upstream sources, concurrently where possible."""
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            versions = executor.submit(self._fetch_url_json, TZEVAADOM_VERSIONS_URL)
+            cities_mix = executor.submit(self._fetch_url_json, CITIES_MIX_URL)
+            districts = executor.submit(self._fetch_url_json, DISTRICTS_URL)
+            tzeva_cities = executor.submit(
+                self._fetch_url_json,
+                f"{TZEVAADOM_CITIES_URL}{versions.result()['cities']}",
+            )
+            tzeva_polygons = executor.submit(
+                self._fetch_url_json,
+                f"{TZEVAADOM_POLYGONS_URL}{versions.result()['polygons']}",
+            )
+            self._cities_mix: list[Any] = cities_mix.result()
+            self._districts: list[Any] = districts.result()
+            self._tzeva_cities: dict[str, Any] = tzeva_cities.result()["cities"]
+            self._tzeva_polygons: dict[str, Any] = tzeva_polygons.result()
 
     def _get_areas(self) -> list[str]:
         """Return the list of areas."""
-        areas = list(
+        return sorted(
             {
                 area["label_he"].replace(
                     CITY_ALL_AREAS_SUFFIX_TYPO, CITY_ALL_AREAS_SUFFIX
@@ -113,31 +251,27 @@ class OrefMetadata:
                 for area in self._cities_mix
             }
         )
-        areas.sort()
-        return areas
 
     def _get_cities_with_all_areas(self) -> list[str]:
         """Return the list of cities with 'all area'."""
-        cities = [
+        return sorted(
             area.replace(CITY_ALL_AREAS_SUFFIX, "")
             for area in filter(
                 lambda area: area.endswith(CITY_ALL_AREAS_SUFFIX), self._backend_areas
             )
-        ]
-        cities.sort()
-        return cities
+        )
 
     def _city_to_areas_map(self) -> dict[str, list[str]]:
         """Build the map between cities and their sub areas."""
         city_to_areas = {}
+        areas = self._areas_no_group
         for city in self._get_cities_with_all_areas():
             city_areas = []
-            for area in self._areas_no_group:
-                if area.startswith(city):
-                    assert area in self._areas_no_group
-                    city_areas.append(area)
-            city_areas = list(set(city_areas))
-            city_areas.sort()
+            # Areas sharing the city prefix are adjacent in the sorted list.
+            index = bisect.bisect_left(areas, city)
+            while index < len(areas) and areas[index].startswith(city):
+                city_areas.append(areas[index])
+                index += 1
             city_to_areas[city + CITY_ALL_AREAS_SUFFIX] = city_areas
         return city_to_areas
 
@@ -153,58 +287,40 @@ class OrefMetadata:
 
     def _get_districts(self) -> list:
         """Return the list of districts."""
-        districts = self._fetch_url_json(DISTRICTS_URL)
         return list(
             filter(
                 lambda area: area["value"] is not None
                 and area["label"] not in ["כל הארץ", "ברחבי הארץ"],
-                districts,
+                self._districts,
             )
         )
 
     def _district_to_areas_map(self) -> dict[str, list[str]]:
         """Build the map between districts and their areas."""
-        districts = self._get_districts()
+        areas_no_group = frozenset(self._areas_no_group)
+        district_areas: defaultdict[str, list[str]] = defaultdict(list)
+        for area in self._get_districts():
+            areas = district_areas[area["areaname"]]
+            if area["label_he"] in areas_no_group:
+                assert area["label_he"] not in self._city_to_areas
+                areas.append(area["label_he"])
         district_to_areas = {}
-        district_names = list({district["areaname"] for district in districts})
-        district_names.sort()
-        for district in district_names:
-            district_areas = []
-            for area in districts:
-                if (
-                    area["areaname"] == district
-                    and area["label_he"] in self._areas_no_group
-                ):
-                    assert area["label_he"] not in self._city_to_areas
-                    district_areas.append(area["label_he"])
-            district_areas = list(set(district_areas))
-            district_areas.sort()
-            district_to_areas[DISTRICT_PREFIX + district] = district_areas
+        for district in sorted(district_areas):
+            district_to_areas[DISTRICT_PREFIX + district] = sorted(
+                set(district_areas[district])
+            )
         return district_to_areas
 
-    def _get_tzevaadom_data(self) -> tuple[Any, Any]:
-        """Get tzevaadom metadata content."""
-        versions = self._fetch_url_json(TZEVAADOM_VERSIONS_URL)
-        return (
-            self._fetch_url_json(f"{TZEVAADOM_CITIES_URL}{versions['cities']}")[
-                "cities"
-            ],
-            self._fetch_url_json(f"{TZEVAADOM_POLYGONS_URL}{versions['polygons']}"),
-        )
-
     def _get_area_to_polygon(self) -> dict[str, list[list[float]]]:
         """Get area polygons from tzevaadom."""
-        city_list = list(
-            set(self._tzeva_cities.keys()).intersection(set(self._areas_no_group))
-        )
-        city_list.sort()
+        city_list = sorted(self._tzeva_cities.keys() & set(self._areas_no_group))
         return {
             city: self._tzeva_polygons[str(self._tzeva_cities[city]["id"])]
             for city in city_list
             if str(self._tzeva_cities[city]["id"]) in self._tzeva_polygons
         }
 
-    def _get_area_info(self) -> dict[str, list[list[float]]]:
+    def _get_area_info(self) -> dict[str, AreaInfo]:
         """Get area additional information from tzevaadom."""
         areas = {}
         assert (
@@ -219,36 +335,42 @@ class OrefMetadata:
             )
         ) == 0
         for area in self._areas_no_group:
-            if area in self._tzeva_cities:
-                areas[area] = {
+            info = (
+                {
                     "lat": self._tzeva_cities[area]["lat"],
                     "long": self._tzeva_cities[area]["lng"],
                     "en": self._tzeva_cities[area]["en"],
                 }
-            else:
-                areas[area] = MISSING_CITIES[area]
+                if area in self._tzeva_cities
+                else MISSING_CITIES[area]
+            )
+            areas[area] = AreaInfo(**info, slug=slugify(info["en"]))
         return areas
 
     def generate(self) -> None:
         """Generate the output files."""
+        self._process()
+        generated_files = []
+        preambles = {AREA_INFO_OUTPUT: AREA_INFO_PREAMBLE}
         for file_name, variable_name, variable_data in (
             (AREAS_AND_GROUPS_OUTPUT, "AREAS_AND_GROUPS", self._areas_and_groups),
             (CITY_ALL_AREAS_OUTPUT, "CITY_ALL_AREAS", self._city_to_areas),
             (AREA_TO_MIGUN_TIME_OUTPUT, "AREA_TO_MIGUN_TIME", self._area_to_migun_time),
             (DISTRICT_TO_AREAS_OUTPUT, "DISTRICT_AREAS", self._district_to_areas),
-            (
-                AREAS_OUTPUT,
-                "AREAS",
-                str(self._areas_no_group).replace("[", "{").replace("]", "}"),
-            ),
-            (AREA_INFO_OUTPUT, "AREA_INFO", self._area_info),
+            (AREAS_OUTPUT, "AREAS", f"frozenset({tuple(self._areas_no_group)!r})"),
+            (AREA_INFO_OUTPUT, "AREA_INFO", f"MappingProxyType({self._area_info})"),
         ):
             with (self._output_directory / file_name).open(
                 "w",
                 encoding="utf-8",
             ) as output:
                 output.write('"""GENERATED FILE. DO NOT EDIT MANUALLY."""\n\n')
+                output.write(preambles.get(file_name, ""))
                 output.write(f"{variable_name} = {variable_data}")
+            generated_files.append(self._output_directory / file_name)
+
+        # Format in the background while the rest of the files are written.
+        ruff_format = subprocess.Popen(["ruff", "format", *generated_files])  # noqa: S603, S607
 
         with (self._root_directory / SERVICES_YAML).open(
             encoding="utf-8",
@@ -266,33 +388,34 @@ class OrefMetadata:
         ) as output:
             yaml.dump(services, output, sort_keys=False, indent=2, allow_unicode=True)
 
-        with (
-            zipfile.ZipFile(
-                f"{self._output_directory / AREA_TO_POLYGON_OUTPUT}.zip",
-            ) as zip_file,
-            zip_file.open(AREA_TO_POLYGON_OUTPUT) as json_file,
-        ):
-            previous_area_to_polygon = json.load(json_file)
+        # Compare the serialized bytes to avoid parsing the previous file.
+        area_to_polygon = orjson.dumps(self._area_to_polygon)
+        with zipfile.ZipFile(
+            f"{self._output_directory / AREA_TO_POLYGON_OUTPUT}.zip",
+        ) as zip_file:
+            previous_area_to_polygon = zip_file.read(AREA_TO_POLYGON_OUTPUT)
 
-        if self._area_to_polygon != previous_area_to_polygon:
+        if area_to_polygon != previous_area_to_polygon:
             with zipfile.ZipFile(
                 f"{self._output_directory / AREA_TO_POLYGON_OUTPUT}.zip",
                 "w",
                 compression=zipfile.ZIP_DEFLATED,
                 compresslevel=9,
             ) as zip_file:
-                zip_file.writestr(
-                    AREA_TO_POLYGON_OUTPUT,
-                    json.dumps(self._area_to_polygon, ensure_ascii=False),
-                )
+                zip_file.writestr(AREA_TO_POLYGON_OUTPUT, area_to_polygon)
 
         with (self._root_directory / TEST_AREAS_FIXTURE).open(
             "w", encoding="utf-8"
         ) as fixture:
             json.dump(self._cities_mix, fixture, ensure_ascii=False)
 
-        subprocess.run(["ruff", "format", self._output_directory], check=False)  # noqa: S603, S607
+        ruff_format.wait()
+        self._save_validators()
 
 
 if __name__ == "__main__":
-    OrefMetadata().generate()
+    metadata = OrefMetadata()
+    if not metadata.force and metadata.is_up_to_date():
+        print("Sources are unchanged, use --force to regenerate.")  # noqa: T201
+    else:
+        metadata.generate()
@@ -116,6 +116,22 @@ async def test_active_alerts(
     assert coordinator.data.active_alerts == [active_alert]
 
 
+async def test_active_alerts_by_area(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test active alerts by area mapping."""
+    freezer.move_to("2023-10-07 06:30:00+03:00")
+    mock_urls(aioclient_mock, None, "multi_alerts_history.json")
+    coordinator = OrefAlertDataUpdateCoordinator(hass, DEFAULT_CONFIG_ENTRY)
+    await coordinator.async_config_entry_first_refresh()
+    assert coordinator.data.active_alerts_by_area == {
+        "בארי": dt_util.parse_datetime("2023-10-07 06:30:00+03:00"),
+        "נחל עוז": dt_util.parse_datetime("2023-10-07 06:28:00+03:00"),
+    }
+
+
 async def test_real_time_timestamp(
     hass: HomeAssistant,
     aioclient_mock: AiohttpClientMocker,
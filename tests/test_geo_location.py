@@ -12,6 +12,7 @@ from homeassistant.const import (
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     CONF_SOURCE,
+    EVENT_CORE_CONFIG_UPDATE,
     Platform,
 )
 from homeassistant.helpers import entity_registry as er
@@ -109,6 +110,10 @@ async def test_add_remove(
     freezer.tick(timedelta(minutes=10))
     async_fire_time_changed(hass)
     await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(hass.states.async_all(Platform.GEO_LOCATION)) == 1
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
     assert len(hass.states.async_all(Platform.GEO_LOCATION)) == 0
     assert (
         len(er.async_entries_for_config_entry(entity_registry, config_id)) == base_count
@@ -116,6 +121,37 @@ async def test_add_remove(
     await async_shutdown(hass, config_id)
 
 
+async def test_home_update(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test distance is recomputed after the home location changes."""
+    hass.config.latitude = 32.072
+    hass.config.longitude = 34.879
+    freezer.move_to("2023-10-07 06:30:00+03:00")
+    mock_urls(aioclient_mock, None, "single_alert_history.json")
+    config_id = await async_setup(hass, {CONF_POLL_INTERVAL: 1})
+    assert hass.states.async_all(Platform.GEO_LOCATION)[0].state == "80.7"
+    hass.config.latitude = 32.0853
+    hass.config.longitude = 34.7818
+    hass.bus.async_fire(EVENT_CORE_CONFIG_UPDATE)
+    await hass.async_block_till_done()
+    mock_urls(aioclient_mock, None, None)
+    for seconds in (1, 10):
+        freezer.tick(timedelta(seconds=seconds))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(hass.states.async_all(Platform.GEO_LOCATION)) == 0
+    mock_urls(aioclient_mock, None, "single_alert_history.json")
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(hass.states.async_all(Platform.GEO_LOCATION)) == 1
+    assert hass.states.async_all(Platform.GEO_LOCATION)[0].state == "78.4"
+    await async_shutdown(hass, config_id)
+
+
 async def test_clean_start(
     hass: HomeAssistant,
     aioclient_mock: AiohttpClientMocker,